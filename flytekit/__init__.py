@@ -131,31 +131,92 @@ Core Modules
 """
 
 
-import flytekit.plugins  # This will be deprecated, these are the old plugins, the new plugins live in plugins/
-from flytekit.core.base_sql_task import SQLTask
-from flytekit.core.base_task import SecurityContext, TaskMetadata, kwtypes
-from flytekit.core.condition import conditional
-from flytekit.core.container_task import ContainerTask
-from flytekit.core.context_manager import ExecutionParameters, FlyteContext
-from flytekit.core.dynamic_workflow_task import dynamic
-from flytekit.core.launch_plan import LaunchPlan
-from flytekit.core.map_task import map_task
-from flytekit.core.notification import Email, PagerDuty, Slack
-from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask
-from flytekit.core.reference import get_reference_entity
-from flytekit.core.reference_entity import LaunchPlanReference, TaskReference, WorkflowReference
-from flytekit.core.resources import Resources
-from flytekit.core.schedule import CronSchedule, FixedRate
-from flytekit.core.task import Secret, reference_task, task
-from flytekit.core.workflow import ImperativeWorkflow as Workflow
-from flytekit.core.workflow import WorkflowFailurePolicy, reference_workflow, workflow
+import importlib as _importlib
+import typing as _typing
+
 from flytekit.loggers import logger
-from flytekit.types import schema
 
 __version__ = "0.0.0+develop"
 
-
-def current_context() -> ExecutionParameters:
+# The public API is imported on first use, so that importing flytekit (which every task container does before it
+# resolves the task) only pays for the parts the task needs: a task on ints and strings never imports pandas, the
+# admin client or the legacy SDK engine. Maps each name to the module it lives in, and its name there if different.
+_LAZY_ATTRIBUTES = {
+    "SQLTask": "flytekit.core.base_sql_task",
+    "SecurityContext": "flytekit.core.base_task",
+    "TaskMetadata": "flytekit.core.base_task",
+    "kwtypes": "flytekit.core.base_task",
+    "conditional": "flytekit.core.condition",
+    "ContainerTask": "flytekit.core.container_task",
+    "ExecutionParameters": "flytekit.core.context_manager",
+    "FlyteContext": "flytekit.core.context_manager",
+    "dynamic": "flytekit.core.dynamic_workflow_task",
+    "LaunchPlan": "flytekit.core.launch_plan",
+    "map_task": "flytekit.core.map_task",
+    "Email": "flytekit.core.notification",
+    "PagerDuty": "flytekit.core.notification",
+    "Slack": "flytekit.core.notification",
+    "PythonFunctionTask": "flytekit.core.python_function_task",
+    "PythonInstanceTask": "flytekit.core.python_function_task",
+    "get_reference_entity": "flytekit.core.reference",
+    "LaunchPlanReference": "flytekit.core.reference_entity",
+    "TaskReference": "flytekit.core.reference_entity",
+    "WorkflowReference": "flytekit.core.reference_entity",
+    "Resources": "flytekit.core.resources",
+    "CronSchedule": "flytekit.core.schedule",
+    "FixedRate": "flytekit.core.schedule",
+    "Secret": "flytekit.core.task",
+    "reference_task": "flytekit.core.task",
+    "task": "flytekit.core.task",
+    "Workflow": ("flytekit.core.workflow", "ImperativeWorkflow"),
+    "WorkflowFailurePolicy": "flytekit.core.workflow",
+    "reference_workflow": "flytekit.core.workflow",
+    "workflow": "flytekit.core.workflow",
+    # This will be deprecated, these are the old plugins, the new plugins live in plugins/
+    "plugins": None,
+    "schema": ("flytekit.types", "schema"),
+}
+
+if _typing.TYPE_CHECKING:
+    import flytekit.plugins  # noqa: F401
+    from flytekit.core.base_sql_task import SQLTask  # noqa: F401
+    from flytekit.core.base_task import SecurityContext, TaskMetadata, kwtypes  # noqa: F401
+    from flytekit.core.condition import conditional  # noqa: F401
+    from flytekit.core.container_task import ContainerTask  # noqa: F401
+    from flytekit.core.context_manager import ExecutionParameters, FlyteContext
+    from flytekit.core.dynamic_workflow_task import dynamic  # noqa: F401
+    from flytekit.core.launch_plan import LaunchPlan  # noqa: F401
+    from flytekit.core.map_task import map_task  # noqa: F401
+    from flytekit.core.notification import Email, PagerDuty, Slack  # noqa: F401
+    from flytekit.core.python_function_task import PythonFunctionTask, PythonInstanceTask  # noqa: F401
+    from flytekit.core.reference import get_reference_entity  # noqa: F401
+    from flytekit.core.reference_entity import LaunchPlanReference, TaskReference, WorkflowReference  # noqa: F401
+    from flytekit.core.resources import Resources  # noqa: F401
+    from flytekit.core.schedule import CronSchedule, FixedRate  # noqa: F401
+    from flytekit.core.task import Secret, reference_task, task  # noqa: F401
+    from flytekit.core.workflow import ImperativeWorkflow as Workflow  # noqa: F401
+    from flytekit.core.workflow import WorkflowFailurePolicy, reference_workflow, workflow  # noqa: F401
+    from flytekit.types import schema  # noqa: F401
+
+
+def __getattr__(name: str) -> _typing.Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    location = _LAZY_ATTRIBUTES[name]
+    if location is None:
+        value = _importlib.import_module(f"{__name__}.{name}")
+    else:
+        module, attribute = location if isinstance(location, tuple) else (location, name)
+        value = getattr(_importlib.import_module(module), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> _typing.List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
+
+def current_context() -> "ExecutionParameters":
     """
     Use this method to get a handle of specific parameters available in a flyte task.
 
@@ -168,4 +229,6 @@ def current_context() -> ExecutionParameters:
     Available params are documented in :py:class:`flytekit.core.context_manager.ExecutionParams`.
     There are some special params, that should be available
     """
-    return FlyteContext.current_context().user_space_params
+    from flytekit.core.context_manager import FlyteContext as _FlyteContext
+
+    return _FlyteContext.current_context().user_space_params
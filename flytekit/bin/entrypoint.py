@@ -4,11 +4,14 @@ import logging as _logging
 import os as _os
 import pathlib
 import random as _random
+import subprocess as _subprocess
+import sys as _sys
 import traceback as _traceback
-from typing import List
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 import click as _click
 from flyteidl.core import literals_pb2 as _literals_pb2
+from flyteidl.core import types_pb2 as _types_pb2
 
 from flytekit import PythonFunctionTask
 from flytekit.common import constants as _constants
@@ -37,7 +40,9 @@ from flytekit.models import dynamic_job as _dynamic_job
 from flytekit.models import literals as _literal_models
 from flytekit.models.core import errors as _error_models
 from flytekit.models.core import identifier as _identifier
-from flytekit.tools.fast_registration import download_distribution as _download_distribution
+from flytekit.tools.fast_registration import install_distribution as _install_distribution
+
+_MULTIPART = _types_pb2.BlobType.BlobDimensionality.MULTIPART
 
 
 def _compute_array_job_index():
@@ -89,7 +94,8 @@ def _dispatch_execute(ctx: FlyteContext, task_def: PythonTask, inputs_path: str,
         local_inputs_file = _os.path.join(ctx.execution_state.working_dir, "inputs.pb")
         ctx.file_access.get_data(inputs_path, local_inputs_file)
         input_proto = _utils.load_proto_from_file(_literals_pb2.LiteralMap, local_inputs_file)
-        idl_input_literals = _literal_models.LiteralMap.from_flyte_idl(input_proto)
+        # Wrap rather than convert the inputs, only the parts the task's transformers touch get turned into models.
+        idl_input_literals = _literal_models.LiteralMap.from_flyte_idl_view(input_proto)
         # Step2
         outputs = task_def.dispatch_execute(ctx, idl_input_literals)
         # Step3a
@@ -142,6 +148,63 @@ def _dispatch_execute(ctx: FlyteContext, task_def: PythonTask, inputs_path: str,
     _logging.info(f"Engine folder written successfully to the output prefix {output_prefix}")
 
 
+def _get_file_access(raw_output_data_prefix: str) -> _data_proxy.FileAccessProvider:
+    cloud_provider = _platform_config.CLOUD_PROVIDER.get()
+    if cloud_provider == _constants.CloudProvider.AWS:
+        return _data_proxy.FileAccessProvider(
+            local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get(),
+            remote_proxy=_s3proxy.AwsS3Proxy(raw_output_data_prefix),
+        )
+    elif cloud_provider == _constants.CloudProvider.GCP:
+        return _data_proxy.FileAccessProvider(
+            local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get(),
+            remote_proxy=_gcs_proxy.GCSProxy(raw_output_data_prefix),
+        )
+    elif cloud_provider == _constants.CloudProvider.LOCAL:
+        # A fake remote using the local disk will automatically be created
+        return _data_proxy.FileAccessProvider(local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get())
+    raise Exception(f"Bad cloud provider {cloud_provider}")
+
+
+def _remote_blobs(literals: _literals_pb2.LiteralMap) -> Iterator[Tuple[str, bool]]:
+    """
+    Yields the uri of every remote blob and schema in the literals, and whether it is multipart.
+    """
+    pending = list(literals.literals.values())
+    while pending:
+        literal = pending.pop()
+        kind = literal.WhichOneof("value")
+        if kind == "collection":
+            pending.extend(literal.collection.literals)
+        elif kind == "map":
+            pending.extend(literal.map.literals.values())
+        elif kind == "scalar":
+            scalar = literal.scalar
+            if scalar.WhichOneof("value") == "blob":
+                uri, multipart = scalar.blob.uri, scalar.blob.metadata.type.dimensionality == _MULTIPART
+            elif scalar.WhichOneof("value") == "schema":
+                uri, multipart = scalar.schema.uri, True
+            else:
+                continue
+            if _data_proxy.FileAccessProvider.is_remote(uri) and not uri.startswith("file:"):
+                yield uri, multipart
+
+
+def _prefetch_inputs(file_access: _data_proxy.FileAccessProvider, inputs: str, blobs: bool):
+    """
+    Starts downloading the inputs file while the task loads. With blobs and sdk.prefetch_blob_inputs, the remote blobs
+    it refers to follow as soon as it is in. _dispatch_execute and the type transformers then take the local copies.
+    """
+
+    def prefetch_blobs(local_inputs_file: str):
+        input_proto = _utils.load_proto_from_file(_literals_pb2.LiteralMap, local_inputs_file)
+        for uri, multipart in _remote_blobs(input_proto):
+            file_access.prefetch(uri, multipart)
+
+    on_fetched = prefetch_blobs if blobs and _sdk_config.PREFETCH_BLOB_INPUTS.get() else None
+    file_access.prefetch(inputs, on_fetched=on_fetched)
+
+
 def _handle_annotated_task(
     task_def: PythonTask,
     inputs: str,
@@ -149,12 +212,12 @@ def _handle_annotated_task(
     raw_output_data_prefix: str,
     dynamic_addl_distro: str = None,
     dynamic_dest_dir: str = None,
+    file_access: Optional[_data_proxy.FileAccessProvider] = None,
 ):
     """
     Entrypoint for all PythonTask extensions
     """
     _click.echo("Running native-typed task")
-    cloud_provider = _platform_config.CLOUD_PROVIDER.get()
     log_level = _internal_config.LOGGING_LEVEL.get() or _sdk_config.LOGGING_LEVEL.get()
     _logging.getLogger().setLevel(log_level)
 
@@ -194,21 +257,8 @@ def _handle_annotated_task(
         tmp_dir=user_workspace_dir,
     )
 
-    if cloud_provider == _constants.CloudProvider.AWS:
-        file_access = _data_proxy.FileAccessProvider(
-            local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get(),
-            remote_proxy=_s3proxy.AwsS3Proxy(raw_output_data_prefix),
-        )
-    elif cloud_provider == _constants.CloudProvider.GCP:
-        file_access = _data_proxy.FileAccessProvider(
-            local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get(),
-            remote_proxy=_gcs_proxy.GCSProxy(raw_output_data_prefix),
-        )
-    elif cloud_provider == _constants.CloudProvider.LOCAL:
-        # A fake remote using the local disk will automatically be created
-        file_access = _data_proxy.FileAccessProvider(local_sandbox_dir=_sdk_config.LOCAL_SANDBOX.get())
-    else:
-        raise Exception(f"Bad cloud provider {cloud_provider}")
+    if file_access is None:
+        file_access = _get_file_access(raw_output_data_prefix)
 
     with ctx.new_file_access_context(file_access_provider=file_access) as ctx:
         # TODO: This is copied from serialize, which means there's a similarity here I'm not seeing.
@@ -328,6 +378,11 @@ def _execute_task(
 
     resolver_obj = _load_resolver(resolver)
     with _TemporaryConfiguration(_internal_config.CONFIGURATION_PATH.get()):
+        file_access = None
+        if not test:
+            # The inputs download while the user code imports.
+            file_access = _get_file_access(raw_output_data_prefix)
+            _prefetch_inputs(file_access, inputs, blobs=True)
         # Use the resolver to load the actual task object
         _task_def = resolver_obj.load_task(loader_args=resolver_args)
         if test:
@@ -336,7 +391,13 @@ def _execute_task(
             )
             return
         _handle_annotated_task(
-            _task_def, inputs, output_prefix, raw_output_data_prefix, dynamic_addl_distro, dynamic_dest_dir
+            _task_def,
+            inputs,
+            output_prefix,
+            raw_output_data_prefix,
+            dynamic_addl_distro,
+            dynamic_dest_dir,
+            file_access=file_access,
         )
 
 
@@ -357,6 +418,11 @@ def _execute_map_task(
 
     resolver_obj = _load_resolver(resolver)
     with _TemporaryConfiguration(_internal_config.CONFIGURATION_PATH.get()):
+        file_access = None
+        if not test:
+            # Each instance only reads its own element of the inputs, so the blobs are left to the transformers.
+            file_access = _get_file_access(raw_output_data_prefix)
+            _prefetch_inputs(file_access, inputs, blobs=False)
         # Use the resolver to load the actual task object
         _task_def = resolver_obj.load_task(loader_args=resolver_args)
         if not isinstance(_task_def, PythonFunctionTask):
@@ -375,10 +441,37 @@ def _execute_map_task(
             return
 
         _handle_annotated_task(
-            map_task, inputs, output_prefix, raw_output_data_prefix, dynamic_addl_distro, dynamic_dest_dir
+            map_task,
+            inputs,
+            output_prefix,
+            raw_output_data_prefix,
+            dynamic_addl_distro,
+            dynamic_dest_dir,
+            file_access=file_access,
         )
 
 
+def _import_fresh_from(code_dir: str, installed: Iterable[str] = ()):
+    """
+    Puts code_dir first on the module search path and forgets the modules imported so far from the files just installed
+    there, so that the task is loaded from the new code. Nothing else is touched, even if it lives below code_dir too,
+    like the standard library of an interpreter installed under the home directory.
+
+    :param code_dir: where the distribution was installed
+    :param installed: the files of the distribution, relative to code_dir
+    """
+    code_dir = _os.path.realpath(code_dir)
+    if code_dir in _sys.path:
+        _sys.path.remove(code_dir)
+    _sys.path.insert(0, code_dir)
+    fresh = {_os.path.realpath(_os.path.join(code_dir, rel)) for rel in installed}
+    for name, module in list(_sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path and name.split(".")[0] != "flytekit" and _os.path.realpath(path) in fresh:
+            del _sys.modules[name]
+    _importlib.invalidate_caches()
+
+
 @_click.group()
 def _pass_through():
     pass
@@ -446,28 +539,38 @@ def execute_task_cmd(
 def fast_execute_task_cmd(additional_distribution, dest_dir, task_execute_cmd):
     """
     Downloads a compressed code distribution specified by additional-distribution and then calls the underlying
-    task execute command for the updated code.
+    task execute command for the updated code. flytekit entrypoints run in this process, see sdk.fast_execute_in_process,
+    anything else in a new one.
     :param Text additional_distribution:
     :param Text dest_dir:
     :param task_execute_cmd:
     :return:
     """
+    installed = []
     if additional_distribution is not None:
         if not dest_dir:
             dest_dir = _os.getcwd()
-        _download_distribution(additional_distribution, dest_dir)
-
-    # Use the commandline to run the task execute command rather than calling it directly in python code
-    # since the current runtime bytecode references the older user code, rather than the downloaded distribution.
+        installed = _install_distribution(additional_distribution, dest_dir, _sdk_config.FAST_EXECUTE_CACHE_DIR.get())
 
     # Insert the call to fast before the unbounded resolver args
     cmd = []
     for arg in task_execute_cmd:
-        if arg == "--resolver":
+        if arg == "--resolver" and additional_distribution is not None:
             cmd.extend(["--dynamic-addl-distro", additional_distribution, "--dynamic-dest-dir", dest_dir])
         cmd.append(arg)
 
-    _os.system(" ".join(cmd))
+    if _sdk_config.FAST_EXECUTE_IN_PROCESS.get() and cmd and _os.path.basename(cmd[0]) in _pass_through.commands:
+        # No user code has been imported in this process yet, so the task can be loaded from the downloaded
+        # distribution here rather than in another interpreter that would start up flytekit all over again.
+        if dest_dir:
+            _import_fresh_from(dest_dir, installed)
+        with _pass_through.make_context("pyflyte", [_os.path.basename(cmd[0])] + cmd[1:]) as ctx:
+            _pass_through.invoke(ctx)
+        return
+
+    returncode = _subprocess.call(cmd)
+    if returncode:
+        _sys.exit(returncode)
 
 
 @_pass_through.command("pyflyte-map-execute")
@@ -0,0 +1,730 @@
+"""
+An asyncio counterpart of :py:class:`flytekit.clients.friendly.SynchronousFlyteClient`. The methods take and return
+the same flytekit models, but are coroutines, so that many requests can be awaited together:
+
+.. code-block:: python
+
+    async with AsyncFlyteClient("flyte.example.com") as client:
+        executions = [e async for e in paginate(client.list_executions_paginated, "project", "domain")]
+        data = await asyncio.gather(*(client.get_execution_data(e.id) for e in executions))
+"""
+import typing
+
+import six as _six
+from flyteidl.admin import common_pb2 as _common_pb2
+from flyteidl.admin import execution_pb2 as _execution_pb2
+from flyteidl.admin import launch_plan_pb2 as _launch_plan_pb2
+from flyteidl.admin import matchable_resource_pb2 as _matchable_resource_pb2
+from flyteidl.admin import node_execution_pb2 as _node_execution_pb2
+from flyteidl.admin import project_domain_attributes_pb2 as _project_domain_attributes_pb2
+from flyteidl.admin import project_pb2 as _project_pb2
+from flyteidl.admin import task_execution_pb2 as _task_execution_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.admin import workflow_attributes_pb2 as _workflow_attributes_pb2
+from flyteidl.admin import workflow_pb2 as _workflow_pb2
+
+from flytekit.clients.raw_async import RawAsyncFlyteClient as _RawAsyncFlyteClient
+from flytekit.models import common as _common
+from flytekit.models import execution as _execution
+from flytekit.models import filters as _filters
+from flytekit.models import launch_plan as _launch_plan
+from flytekit.models import node_execution as _node_execution
+from flytekit.models import project as _project
+from flytekit.models import task as _task
+from flytekit.models.admin import task_execution as _task_execution
+from flytekit.models.admin import workflow as _workflow
+from flytekit.models.core import identifier as _identifier
+
+
+class AsyncFlyteClient(_RawAsyncFlyteClient):
+    """
+    Every method mirrors the method of the same name on :py:class:`flytekit.clients.friendly.SynchronousFlyteClient`,
+    see there for the details of its arguments and results.
+    """
+
+    @property
+    def raw(self):
+        """
+        Gives access to the raw client
+        :rtype: flytekit.clients.raw_async.RawAsyncFlyteClient
+        """
+        return super(AsyncFlyteClient, self)
+
+    ####################################################################################################################
+    #
+    #  Task Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_task(self, task_identifer, task_spec):
+        """
+        :param flytekit.models.core.identifier.Identifier task_identifer: The identifier for this task.
+        :param flytekit.models.task.TaskSpec task_spec: This is the actual definition of the task that
+            should be created.
+        :raises flytekit.common.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the
+            task is found.
+        """
+        await super(AsyncFlyteClient, self).create_task(
+            _task_pb2.TaskCreateRequest(id=task_identifer.to_flyte_idl(), spec=task_spec.to_flyte_idl())
+        )
+
+    async def list_task_ids_paginated(self, project, domain, limit=100, token=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.common.NamedEntityIdentifier], Text
+        """
+        identifier_list = await super(AsyncFlyteClient, self).list_task_ids_paginated(
+            _common_pb2.NamedEntityIdentifierListRequest(
+                project=project,
+                domain=domain,
+                limit=limit,
+                token=token,
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_common.NamedEntityIdentifier.from_flyte_idl(identifier_pb) for identifier_pb in identifier_list.entities],
+            _six.text_type(identifier_list.token),
+        )
+
+    async def list_tasks_paginated(self, identifier, limit=100, token=None, filters=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.task.Task], Text
+        """
+        task_list = await super(AsyncFlyteClient, self).list_tasks_paginated(
+            _common_pb2.ResourceListRequest(
+                id=identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        # TODO: tmp workaround
+        for pb in task_list.tasks:
+            pb.id.resource_type = _identifier.ResourceType.TASK
+        return (
+            [_task.Task.from_flyte_idl(task_pb2) for task_pb2 in task_list.tasks],
+            _six.text_type(task_list.token),
+        )
+
+    async def get_task(self, id):
+        """
+        :param flytekit.models.core.identifier.Identifier id: The ID representing a given task.
+        :rtype: flytekit.models.task.Task
+        """
+        return _task.Task.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_task(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl()))
+        )
+
+    ####################################################################################################################
+    #
+    #  Workflow Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_workflow(self, workflow_identifier, workflow_spec):
+        """
+        :param flytekit.models.core.identifier.Identifier workflow_identifier: The identifier for this workflow.
+        :param flytekit.models.admin.workflow.WorkflowSpec workflow_spec: This is the actual definition of the workflow
+            that should be created.
+        :raises flytekit.common.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the
+            workflow is found.
+        """
+        await super(AsyncFlyteClient, self).create_workflow(
+            _workflow_pb2.WorkflowCreateRequest(
+                id=workflow_identifier.to_flyte_idl(), spec=workflow_spec.to_flyte_idl()
+            )
+        )
+
+    async def list_workflow_ids_paginated(self, project, domain, limit=100, token=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.common.NamedEntityIdentifier], Text
+        """
+        identifier_list = await super(AsyncFlyteClient, self).list_workflow_ids_paginated(
+            _common_pb2.NamedEntityIdentifierListRequest(
+                project=project,
+                domain=domain,
+                limit=limit,
+                token=token,
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_common.NamedEntityIdentifier.from_flyte_idl(identifier_pb) for identifier_pb in identifier_list.entities],
+            _six.text_type(identifier_list.token),
+        )
+
+    async def list_workflows_paginated(self, identifier, limit=100, token=None, filters=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.admin.workflow.Workflow], Text
+        """
+        wf_list = await super(AsyncFlyteClient, self).list_workflows_paginated(
+            _common_pb2.ResourceListRequest(
+                id=identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        # TODO: tmp workaround
+        for pb in wf_list.workflows:
+            pb.id.resource_type = _identifier.ResourceType.WORKFLOW
+        return (
+            [_workflow.Workflow.from_flyte_idl(wf_pb2) for wf_pb2 in wf_list.workflows],
+            _six.text_type(wf_list.token),
+        )
+
+    async def get_workflow(self, id):
+        """
+        :param flytekit.models.core.identifier.Identifier id: The ID representing a given workflow.
+        :rtype: flytekit.models.admin.workflow.Workflow
+        """
+        return _workflow.Workflow.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_workflow(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl()))
+        )
+
+    ####################################################################################################################
+    #
+    #  Launch Plan Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_launch_plan(self, launch_plan_identifer, launch_plan_spec):
+        """
+        :param flytekit.models.core.identifier.Identifier launch_plan_identifer: The identifier for this launch plan.
+        :param flytekit.models.launch_plan.LaunchPlanSpec launch_plan_spec: This is the actual definition of the
+            launch plan that should be created.
+        :raises flytekit.common.exceptions.user.FlyteEntityAlreadyExistsException: If an identical version of the
+            launch plan is found.
+        """
+        await super(AsyncFlyteClient, self).create_launch_plan(
+            _launch_plan_pb2.LaunchPlanCreateRequest(
+                id=launch_plan_identifer.to_flyte_idl(),
+                spec=launch_plan_spec.to_flyte_idl(),
+            )
+        )
+
+    async def get_launch_plan(self, id):
+        """
+        :param flytekit.models.core.identifier.Identifier id: unique identifier for launch plan to retrieve
+        :rtype: flytekit.models.launch_plan.LaunchPlan
+        """
+        return _launch_plan.LaunchPlan.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_launch_plan(_common_pb2.ObjectGetRequest(id=id.to_flyte_idl()))
+        )
+
+    async def get_active_launch_plan(self, identifier):
+        """
+        :param flytekit.models.common.NamedEntityIdentifier identifier: NamedEntityIdentifier to list.
+        :rtype: flytekit.models.launch_plan.LaunchPlan
+        """
+        return _launch_plan.LaunchPlan.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_active_launch_plan(
+                _launch_plan_pb2.ActiveLaunchPlanRequest(id=identifier.to_flyte_idl())
+            )
+        )
+
+    async def list_launch_plan_ids_paginated(self, project, domain, limit=100, token=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.common.NamedEntityIdentifier], Text
+        """
+        identifier_list = await super(AsyncFlyteClient, self).list_launch_plan_ids_paginated(
+            _common_pb2.NamedEntityIdentifierListRequest(
+                project=project,
+                domain=domain,
+                limit=limit,
+                token=token,
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_common.NamedEntityIdentifier.from_flyte_idl(identifier_pb) for identifier_pb in identifier_list.entities],
+            _six.text_type(identifier_list.token),
+        )
+
+    async def list_launch_plans_paginated(self, identifier, limit=100, token=None, filters=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.launch_plan.LaunchPlan], str
+        """
+        lp_list = await super(AsyncFlyteClient, self).list_launch_plans_paginated(
+            _common_pb2.ResourceListRequest(
+                id=identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        # TODO: tmp workaround
+        for pb in lp_list.launch_plans:
+            pb.id.resource_type = _identifier.ResourceType.LAUNCH_PLAN
+        return (
+            [_launch_plan.LaunchPlan.from_flyte_idl(pb) for pb in lp_list.launch_plans],
+            _six.text_type(lp_list.token),
+        )
+
+    async def list_active_launch_plans_paginated(self, project, domain, limit=100, token=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.launch_plan.LaunchPlan], str
+        """
+        lp_list = await super(AsyncFlyteClient, self).list_active_launch_plans_paginated(
+            _launch_plan_pb2.ActiveLaunchPlanListRequest(
+                project=project,
+                domain=domain,
+                limit=limit,
+                token=token,
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        # TODO: tmp workaround
+        for pb in lp_list.launch_plans:
+            pb.id.resource_type = _identifier.ResourceType.LAUNCH_PLAN
+        return (
+            [_launch_plan.LaunchPlan.from_flyte_idl(pb) for pb in lp_list.launch_plans],
+            _six.text_type(lp_list.token),
+        )
+
+    async def update_launch_plan(self, id, state):
+        """
+        :param flytekit.models.core.identifier.Identifier id: identifier for launch plan to update
+        :param int state: Enum value from flytekit.models.LaunchPlanState
+        """
+        await super(AsyncFlyteClient, self).update_launch_plan(
+            _launch_plan_pb2.LaunchPlanUpdateRequest(id=id.to_flyte_idl(), state=state)
+        )
+
+    ####################################################################################################################
+    #
+    #  Named Entity Endpoints
+    #
+    ####################################################################################################################
+
+    async def update_named_entity(self, resource_type, id, metadata):
+        """
+        :param int resource_type: Enum value from flytekit.models.identifier.ResourceType
+        :param flytekit.models.admin.named_entity.NamedEntityIdentifier id: identifier for named entity to update
+        :param flytekit.models.admin.named_entity.NamedEntityIdentifierMetadata metadata:
+        """
+        await super(AsyncFlyteClient, self).update_named_entity(
+            _common_pb2.NamedEntityUpdateRequest(
+                resource_type=resource_type,
+                id=id.to_flyte_idl(),
+                metadata=metadata.to_flyte_idl(),
+            )
+        )
+
+    ####################################################################################################################
+    #
+    #  Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def create_execution(self, project, domain, name, execution_spec, inputs):
+        """
+        :param Text project:
+        :param Text domain:
+        :param Text name:
+        :param flytekit.models.execution.ExecutionSpec execution_spec: This is the specification for the execution.
+        :param flytekit.models.literals.LiteralMap inputs: The inputs for the execution
+        :rtype: flytekit.models.core.identifier.WorkflowExecutionIdentifier
+        """
+        response = await super(AsyncFlyteClient, self).create_execution(
+            _execution_pb2.ExecutionCreateRequest(
+                project=project,
+                domain=domain,
+                name=name,
+                spec=execution_spec.to_flyte_idl(),
+                inputs=inputs.to_flyte_idl(),
+            )
+        )
+        return _identifier.WorkflowExecutionIdentifier.from_flyte_idl(response.id)
+
+    async def get_execution(self, id):
+        """
+        :param flytekit.models.core.identifier.WorkflowExecutionIdentifier id:
+        :rtype: flytekit.models.execution.Execution
+        """
+        return _execution.Execution.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_execution(
+                _execution_pb2.WorkflowExecutionGetRequest(id=id.to_flyte_idl())
+            )
+        )
+
+    async def get_execution_data(self, id):
+        """
+        Returns signed URLs to LiteralMap blobs for an execution's inputs and outputs.
+
+        :param flytekit.models.core.identifier.WorkflowExecutionIdentifier id:
+        :rtype: flytekit.models.execution.WorkflowExecutionGetDataResponse
+        """
+        return _execution.WorkflowExecutionGetDataResponse.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_execution_data(
+                _execution_pb2.WorkflowExecutionGetDataRequest(id=id.to_flyte_idl())
+            )
+        )
+
+    async def list_executions_paginated(self, project, domain, limit=100, token=None, filters=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.execution.Execution], Text
+        """
+        exec_list = await super(AsyncFlyteClient, self).list_executions_paginated(
+            _common_pb2.ResourceListRequest(
+                id=_common_pb2.NamedEntityIdentifier(project=project, domain=domain),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_execution.Execution.from_flyte_idl(pb) for pb in exec_list.executions],
+            _six.text_type(exec_list.token),
+        )
+
+    async def terminate_execution(self, id, cause):
+        """
+        :param flytekit.models.core.identifier.WorkflowExecutionIdentifier id:
+        :param Text cause:
+        """
+        await super(AsyncFlyteClient, self).terminate_execution(
+            _execution_pb2.ExecutionTerminateRequest(id=id.to_flyte_idl(), cause=cause)
+        )
+
+    async def relaunch_execution(self, id, name=None):
+        """
+        :param flytekit.models.core.identifier.WorkflowExecutionIdentifier id:
+        :param Text name: [Optional] name for the new execution. If not specified, a randomly generated name will be
+            used
+        :returns: The unique identifier for the new execution.
+        :rtype: flytekit.models.core.identifier.WorkflowExecutionIdentifier
+        """
+        response = await super(AsyncFlyteClient, self).relaunch_execution(
+            _execution_pb2.ExecutionRelaunchRequest(id=id.to_flyte_idl(), name=name)
+        )
+        return _identifier.WorkflowExecutionIdentifier.from_flyte_idl(response.id)
+
+    ####################################################################################################################
+    #
+    #  Node Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def get_node_execution(self, node_execution_identifier):
+        """
+        :param flytekit.models.core.identifier.NodeExecutionIdentifier node_execution_identifier:
+        :rtype: flytekit.models.node_execution.NodeExecution
+        """
+        return _node_execution.NodeExecution.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_node_execution(
+                _node_execution_pb2.NodeExecutionGetRequest(id=node_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    async def get_node_execution_data(self, node_execution_identifier):
+        """
+        Returns signed URLs to LiteralMap blobs for a node execution's inputs and outputs.
+
+        :param flytekit.models.core.identifier.NodeExecutionIdentifier node_execution_identifier:
+        :rtype: flytekit.models.execution.NodeExecutionGetDataResponse
+        """
+        return _execution.NodeExecutionGetDataResponse.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_node_execution_data(
+                _node_execution_pb2.NodeExecutionGetDataRequest(id=node_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    async def list_node_executions(
+        self,
+        workflow_execution_identifier,
+        limit=100,
+        token=None,
+        filters=None,
+        sort_by=None,
+    ):
+        """
+        :rtype: list[flytekit.models.node_execution.NodeExecution], Text
+        """
+        exec_list = await super(AsyncFlyteClient, self).list_node_executions_paginated(
+            _node_execution_pb2.NodeExecutionListRequest(
+                workflow_execution_id=workflow_execution_identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_node_execution.NodeExecution.from_flyte_idl(e) for e in exec_list.node_executions],
+            _six.text_type(exec_list.token),
+        )
+
+    async def list_node_executions_for_task_paginated(
+        self,
+        task_execution_identifier,
+        limit=100,
+        token=None,
+        filters=None,
+        sort_by=None,
+    ):
+        """
+        :rtype: list[flytekit.models.node_execution.NodeExecution], Text
+        """
+        exec_list = await super(AsyncFlyteClient, self).list_node_executions_for_task_paginated(
+            _node_execution_pb2.NodeExecutionForTaskListRequest(
+                task_execution_id=task_execution_identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_node_execution.NodeExecution.from_flyte_idl(e) for e in exec_list.node_executions],
+            _six.text_type(exec_list.token),
+        )
+
+    ####################################################################################################################
+    #
+    #  Task Execution Endpoints
+    #
+    ####################################################################################################################
+
+    async def get_task_execution(self, id):
+        """
+        :param flytekit.models.core.identifier.TaskExecutionIdentifier id:
+        :rtype: flytekit.models.admin.task_execution.TaskExecution
+        """
+        return _task_execution.TaskExecution.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_task_execution(
+                _task_execution_pb2.TaskExecutionGetRequest(id=id.to_flyte_idl())
+            )
+        )
+
+    async def get_task_execution_data(self, task_execution_identifier):
+        """
+        Returns signed URLs to LiteralMap blobs for a task execution's inputs and outputs.
+
+        :param flytekit.models.core.identifier.TaskExecutionIdentifier task_execution_identifier:
+        :rtype: flytekit.models.execution.TaskExecutionGetDataResponse
+        """
+        return _execution.TaskExecutionGetDataResponse.from_flyte_idl(
+            await super(AsyncFlyteClient, self).get_task_execution_data(
+                _task_execution_pb2.TaskExecutionGetDataRequest(id=task_execution_identifier.to_flyte_idl())
+            )
+        )
+
+    async def list_task_executions_paginated(
+        self,
+        node_execution_identifier,
+        limit=100,
+        token=None,
+        filters=None,
+        sort_by=None,
+    ):
+        """
+        :rtype: list[flytekit.models.admin.task_execution.TaskExecution], Text
+        """
+        exec_list = await super(AsyncFlyteClient, self).list_task_executions_paginated(
+            _task_execution_pb2.TaskExecutionListRequest(
+                node_execution_id=node_execution_identifier.to_flyte_idl(),
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_task_execution.TaskExecution.from_flyte_idl(e) for e in exec_list.task_executions],
+            _six.text_type(exec_list.token),
+        )
+
+    ####################################################################################################################
+    #
+    #  Project Endpoints
+    #
+    ####################################################################################################################
+
+    async def register_project(self, project):
+        """
+        :param flytekit.models.project.Project project:
+        """
+        await super(AsyncFlyteClient, self).register_project(
+            _project_pb2.ProjectRegisterRequest(
+                project=project.to_flyte_idl(),
+            )
+        )
+
+    async def update_project(self, project):
+        """
+        :param flytekit.models.project.Project project:
+        """
+        await super(AsyncFlyteClient, self).update_project(project.to_flyte_idl())
+
+    async def list_projects_paginated(self, limit=100, token=None, filters=None, sort_by=None):
+        """
+        :rtype: list[flytekit.models.project.Project], Text
+        """
+        projects = await super(AsyncFlyteClient, self).list_projects(
+            _project_pb2.ProjectListRequest(
+                limit=limit,
+                token=token,
+                filters=_filters.FilterList(filters or []).to_flyte_idl(),
+                sort_by=None if sort_by is None else sort_by.to_flyte_idl(),
+            )
+        )
+        return (
+            [_project.Project.from_flyte_idl(pb) for pb in projects.projects],
+            _six.text_type(projects.token),
+        )
+
+    ####################################################################################################################
+    #
+    #  Matching Attributes Endpoints
+    #
+    ####################################################################################################################
+
+    async def update_project_domain_attributes(self, project, domain, matching_attributes):
+        """
+        :param Text project:
+        :param Text domain:
+        :param flytekit.models.MatchingAttributes matching_attributes:
+        """
+        await super(AsyncFlyteClient, self).update_project_domain_attributes(
+            _project_domain_attributes_pb2.ProjectDomainAttributesUpdateRequest(
+                attributes=_project_domain_attributes_pb2.ProjectDomainAttributes(
+                    project=project,
+                    domain=domain,
+                    matching_attributes=matching_attributes.to_flyte_idl(),
+                )
+            )
+        )
+
+    async def update_workflow_attributes(self, project, domain, workflow, matching_attributes):
+        """
+        :param Text project:
+        :param Text domain:
+        :param Text workflow:
+        :param flytekit.models.MatchingAttributes matching_attributes:
+        """
+        await super(AsyncFlyteClient, self).update_workflow_attributes(
+            _workflow_attributes_pb2.WorkflowAttributesUpdateRequest(
+                attributes=_workflow_attributes_pb2.WorkflowAttributes(
+                    project=project,
+                    domain=domain,
+                    workflow=workflow,
+                    matching_attributes=matching_attributes.to_flyte_idl(),
+                )
+            )
+        )
+
+    async def get_project_domain_attributes(self, project, domain, resource_type):
+        """
+        :param Text project:
+        :param Text domain:
+        :param flytekit.models.MatchableResource resource_type:
+        :return:
+        """
+        return await super(AsyncFlyteClient, self).get_project_domain_attributes(
+            _project_domain_attributes_pb2.ProjectDomainAttributesGetRequest(
+                project=project,
+                domain=domain,
+                resource_type=resource_type,
+            )
+        )
+
+    async def get_workflow_attributes(self, project, domain, workflow, resource_type):
+        """
+        :param Text project:
+        :param Text domain:
+        :param Text workflow:
+        :param flytekit.models.MatchableResource resource_type:
+        :return:
+        """
+        return await super(AsyncFlyteClient, self).get_workflow_attributes(
+            _workflow_attributes_pb2.WorkflowAttributesGetRequest(
+                project=project,
+                domain=domain,
+                workflow=workflow,
+                resource_type=resource_type,
+            )
+        )
+
+    async def list_matchable_attributes(self, resource_type):
+        """
+        :param flytekit.models.MatchableResource resource_type:
+        :return:
+        """
+        return await super(AsyncFlyteClient, self).list_matchable_attributes(
+            _matchable_resource_pb2.ListMatchableAttributesRequest(
+                resource_type=resource_type,
+            )
+        )
+
+
+async def paginate(list_fn, *args, limit=None, page_size=100, **kwargs) -> typing.AsyncIterator[typing.Any]:
+    """
+    Iterates over every entry of a paginated listing, fetching the next page only once the current one is consumed.
+
+    .. code-block:: python
+
+        async for execution in paginate(client.list_executions_paginated, "project", "domain", filters=filters):
+            ...
+
+    :param list_fn: one of the ``list_*`` coroutines of :py:class:`AsyncFlyteClient`, which return a page of entries
+        and the token of the next page
+    :param args: passed on to list_fn, as are any kwargs other than limit and page_size
+    :param int limit: [Optional] stop after this many entries
+    :param int page_size: the number of entries requested per page
+    """
+    token = ""
+    if limit is not None:
+        page_size = min(page_size, limit)
+    counter = 0
+    while True:
+        entries, next_token = await list_fn(*args, limit=page_size, token=token, **kwargs)
+        for e in entries:
+            counter += 1
+            if limit is not None and counter > limit:
+                return
+            yield e
+        if not next_token:
+            break
+        token = next_token
+
+
+def iterate_node_executions(
+    client,
+    workflow_execution_identifier=None,
+    task_execution_identifier=None,
+    limit=None,
+    filters=None,
+) -> typing.AsyncIterator[_node_execution.NodeExecution]:
+    """
+    The counterpart of :py:func:`flytekit.clients.helpers.iterate_node_executions` for the async client.
+
+    :param AsyncFlyteClient client:
+    :param flytekit.common.core.identifier.WorkflowExecutionIdentifier workflow_execution_identifier:
+    :param flytekit.common.core.identifier.TaskExecutionIdentifier task_execution_identifier:
+    :param int limit: The maximum number of elements to retrieve
+    :param list[flytekit.models.filters.Filter] filters:
+    """
+    if workflow_execution_identifier is not None:
+        return paginate(client.list_node_executions, workflow_execution_identifier, limit=limit, filters=filters)
+    return paginate(
+        client.list_node_executions_for_task_paginated, task_execution_identifier, limit=limit, filters=filters
+    )
+
+
+def iterate_task_executions(
+    client, node_execution_identifier, limit=None, filters=None
+) -> typing.AsyncIterator[_task_execution.TaskExecution]:
+    """
+    The counterpart of :py:func:`flytekit.clients.helpers.iterate_task_executions` for the async client.
+
+    :param AsyncFlyteClient client:
+    :param flytekit.models.core.identifier.NodeExecutionIdentifier node_execution_identifier:
+    :param int limit: The maximum number of elements to retrieve
+    :param list[flytekit.models.filters.Filter] filters:
+    """
+    return paginate(client.list_task_executions_paginated, node_execution_identifier, limit=limit, filters=filters)
@@ -0,0 +1,403 @@
+"""
+An asyncio counterpart of :py:class:`flytekit.clients.raw.RawSynchronousFlyteClient`, built on ``grpc.aio`` (grpcio 1.32
+or newer). Many RPCs can be in flight at once from a single thread, which is what tools that fan out over executions,
+node executions and their data need.
+"""
+import asyncio
+import itertools
+import logging as _logging
+import typing
+import weakref
+
+import six as _six
+from flyteidl.service import admin_pb2_grpc as _admin_service
+from google.protobuf.json_format import MessageToJson as _MessageToJson
+from grpc import RpcError as _RpcError
+from grpc import StatusCode as _GrpcStatusCode
+from grpc import aio as _aio
+from grpc import ssl_channel_credentials as _ssl_channel_credentials
+
+from flytekit.clients.raw import _get_refresh_handler
+from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.configuration import creds as _creds_config
+from flytekit.configuration.platform import AUTH as _AUTH
+
+
+def _handle_rpc_error(retry=False):
+    """
+    The same retry and credential refresh semantics as :py:func:`flytekit.clients.raw._handle_rpc_error`, for
+    coroutines. Refreshing credentials may block on the network, so it runs on the default executor instead of the
+    event loop.
+    """
+
+    def decorator(fn):
+        async def handler(*args, **kwargs):
+            max_retries = 3
+            max_wait_time = 1000
+            try:
+                for i in range(max_retries):
+                    try:
+                        return await fn(*args, **kwargs)
+                    except _RpcError as e:
+                        if e.code() == _GrpcStatusCode.UNAUTHENTICATED:
+                            # Always retry auth errors.
+                            if i == (max_retries - 1):
+                                # Exit the loop and wrap the authentication error.
+                                raise _user_exceptions.FlyteAuthenticationException(_six.text_type(e))
+                            refresh_handler_fn = _get_refresh_handler(_creds_config.AUTH_MODE.get())
+                            await asyncio.get_event_loop().run_in_executor(None, refresh_handler_fn, args[0])
+                        else:
+                            # No more retries if retry=False or max_retries reached.
+                            if (retry is False) or i == (max_retries - 1):
+                                raise
+                            else:
+                                # Retry: Start with 200ms wait-time and exponentially back-off upto 1 second.
+                                wait_time = min(200 * (2 ** i), max_wait_time)
+                                _logging.error(f"Non-auth RPC error {e}, sleeping {wait_time}ms and retrying")
+                                await asyncio.sleep(wait_time / 1000)
+            except _RpcError as e:
+                if e.code() == _GrpcStatusCode.ALREADY_EXISTS:
+                    raise _user_exceptions.FlyteEntityAlreadyExistsException(_six.text_type(e))
+                else:
+                    raise
+
+        return handler
+
+    return decorator
+
+
+def _handle_invalid_create_request(fn):
+    async def handler(self, create_request):
+        try:
+            await fn(self, create_request)
+        except _RpcError as e:
+            if e.code() == _GrpcStatusCode.INVALID_ARGUMENT:
+                _logging.error("Error creating Flyte entity because of invalid arguments. Create request: ")
+                _logging.error(_MessageToJson(create_request))
+
+            # In any case, re-raise since we're not truly handling the error here
+            raise e
+
+    return handler
+
+
+class _ChannelPool(object):
+    """
+    A fixed number of channels to one Admin endpoint. Every channel is a separate HTTP/2 connection, so calls spread
+    round-robin over the pool are not limited by the concurrent stream limit of a single connection.
+    """
+
+    def __init__(self, url, insecure, credentials, options, size):
+        options = list((options or {}).items())
+        if size > 1:
+            # Channels with the same arguments otherwise share their connection through the global subchannel pool.
+            options.append(("grpc.use_local_subchannel_pool", 1))
+        if insecure:
+            self._channels = [_aio.insecure_channel(url, options=options) for _ in range(size)]
+        else:
+            credentials = credentials or _ssl_channel_credentials()
+            self._channels = [_aio.secure_channel(url, credentials, options=options) for _ in range(size)]
+        self._stubs = [_admin_service.AdminServiceStub(c) for c in self._channels]
+        self._next = itertools.cycle(self._stubs)
+
+    def stub(self) -> _admin_service.AdminServiceStub:
+        return next(self._next)
+
+    async def close(self):
+        await asyncio.gather(*(c.close() for c in self._channels))
+
+
+# grpc.aio channels belong to the event loop they were created on, so shared pools are kept per loop.
+_SHARED_POOLS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, typing.Dict[tuple, _ChannelPool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_pool(url, insecure, credentials, options, size) -> typing.Tuple[_ChannelPool, bool]:
+    if credentials is not None:
+        # Credentials objects cannot be compared, so a client with its own credentials gets its own channels.
+        return _ChannelPool(url, insecure, credentials, options, size), False
+    pools = _SHARED_POOLS.setdefault(asyncio.get_event_loop(), {})
+    key = (url, insecure, tuple(sorted((options or {}).items())), size)
+    if key not in pools:
+        pools[key] = _ChannelPool(url, insecure, None, options, size)
+    return pools[key], True
+
+
+async def close_shared_channels():
+    """
+    Closes the channels that clients created on the running event loop share. Clients created afterwards open new
+    ones.
+    """
+    pools = _SHARED_POOLS.pop(asyncio.get_event_loop(), {})
+    await asyncio.gather(*(p.close() for p in pools.values()))
+
+
+class RawAsyncFlyteClient(object):
+    """
+    A thin asyncio wrapper around the auto-generated GRPC stubs for communicating with the admin service. Every method
+    is a coroutine that takes and returns the same protobuf messages as its counterpart in
+    :py:class:`flytekit.clients.raw.RawSynchronousFlyteClient`, and retries and refreshes credentials the same way.
+
+    Clients on the same event loop that connect to the same endpoint with the same settings share one pool of channels.
+    Use the client as an ``async with`` block, or await :py:meth:`close`, to release channels it does not share.
+    """
+
+    def __init__(self, url, insecure=False, credentials=None, options=None, pool_size=1):
+        """
+        Initializes the gRPC channels to the given Flyte Admin service.
+
+        :param Text url: The URL (including port if necessary) to connect to the appropriate Flyte Admin Service.
+        :param bool insecure: [Optional] Whether to use an insecure connection, default False
+        :param grpc.ChannelCredentials credentials: [Optional] If provided, secure channels are opened with these
+            credentials and are not shared with other clients.
+        :param dict[Text, Text] options: [Optional] A dict of key-value string pairs for configuring the gRPC core
+            runtime.
+        :param int pool_size: [Optional] The number of channels, and so connections, calls are spread over.
+        """
+        self._url = url
+        self._pool, self._shared = _get_pool(url, insecure, credentials, options, pool_size)
+        self._metadata = None
+        if _AUTH.get():
+            self.force_auth_flow()
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def _stub(self) -> _admin_service.AdminServiceStub:
+        return self._pool.stub()
+
+    def set_access_token(self, access_token):
+        # Always set the header to lower-case regardless of what the config is. The grpc libraries that Admin uses
+        # to parse the metadata don't change the metadata, but they do automatically lower the key you're looking for.
+        self._metadata = [
+            (
+                _creds_config.AUTHORIZATION_METADATA_KEY.get().lower(),
+                "Bearer {}".format(access_token),
+            )
+        ]
+
+    def force_auth_flow(self):
+        refresh_handler_fn = _get_refresh_handler(_creds_config.AUTH_MODE.get())
+        refresh_handler_fn(self)
+
+    async def close(self):
+        if not self._shared:
+            await self._pool.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    ####################################################################################################################
+    #
+    #  Task Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    @_handle_invalid_create_request
+    async def create_task(self, task_create_request):
+        return await self._stub.CreateTask(task_create_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_task_ids_paginated(self, identifier_list_request):
+        return await self._stub.ListTaskIds(identifier_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_tasks_paginated(self, resource_list_request):
+        return await self._stub.ListTasks(resource_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_task(self, get_object_request):
+        return await self._stub.GetTask(get_object_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Workflow Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    @_handle_invalid_create_request
+    async def create_workflow(self, workflow_create_request):
+        return await self._stub.CreateWorkflow(workflow_create_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_workflow_ids_paginated(self, identifier_list_request):
+        return await self._stub.ListWorkflowIds(identifier_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_workflows_paginated(self, resource_list_request):
+        return await self._stub.ListWorkflows(resource_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_workflow(self, get_object_request):
+        return await self._stub.GetWorkflow(get_object_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Launch Plan Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    @_handle_invalid_create_request
+    async def create_launch_plan(self, launch_plan_create_request):
+        return await self._stub.CreateLaunchPlan(launch_plan_create_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_launch_plan(self, object_get_request):
+        return await self._stub.GetLaunchPlan(object_get_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_active_launch_plan(self, active_launch_plan_request):
+        return await self._stub.GetActiveLaunchPlan(active_launch_plan_request, metadata=self._metadata)
+
+    @_handle_rpc_error()
+    async def update_launch_plan(self, update_request):
+        return await self._stub.UpdateLaunchPlan(update_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_launch_plan_ids_paginated(self, identifier_list_request):
+        return await self._stub.ListLaunchPlanIds(identifier_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_launch_plans_paginated(self, resource_list_request):
+        return await self._stub.ListLaunchPlans(resource_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_active_launch_plans_paginated(self, active_launch_plan_list_request):
+        return await self._stub.ListActiveLaunchPlans(active_launch_plan_list_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Named Entity Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    async def update_named_entity(self, update_named_entity_request):
+        return await self._stub.UpdateNamedEntity(update_named_entity_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Workflow Execution Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    async def create_execution(self, create_execution_request):
+        return await self._stub.CreateExecution(create_execution_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_execution(self, get_object_request):
+        return await self._stub.GetExecution(get_object_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_execution_data(self, get_execution_data_request):
+        return await self._stub.GetExecutionData(get_execution_data_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_executions_paginated(self, resource_list_request):
+        return await self._stub.ListExecutions(resource_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error()
+    async def terminate_execution(self, terminate_execution_request):
+        return await self._stub.TerminateExecution(terminate_execution_request, metadata=self._metadata)
+
+    @_handle_rpc_error()
+    async def relaunch_execution(self, relaunch_execution_request):
+        return await self._stub.RelaunchExecution(relaunch_execution_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Node Execution Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error(retry=True)
+    async def get_node_execution(self, node_execution_request):
+        return await self._stub.GetNodeExecution(node_execution_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_node_execution_data(self, get_node_execution_data_request):
+        return await self._stub.GetNodeExecutionData(get_node_execution_data_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_node_executions_paginated(self, node_execution_list_request):
+        return await self._stub.ListNodeExecutions(node_execution_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_node_executions_for_task_paginated(self, node_execution_for_task_list_request):
+        return await self._stub.ListNodeExecutionsForTask(node_execution_for_task_list_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Task Execution Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error(retry=True)
+    async def get_task_execution(self, task_execution_request):
+        return await self._stub.GetTaskExecution(task_execution_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_task_execution_data(self, get_task_execution_data_request):
+        return await self._stub.GetTaskExecutionData(get_task_execution_data_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_task_executions_paginated(self, task_execution_list_request):
+        return await self._stub.ListTaskExecutions(task_execution_list_request, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Project Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error(retry=True)
+    async def list_projects(self, project_list_request):
+        return await self._stub.ListProjects(project_list_request, metadata=self._metadata)
+
+    @_handle_rpc_error()
+    async def register_project(self, project_register_request):
+        return await self._stub.RegisterProject(project_register_request, metadata=self._metadata)
+
+    @_handle_rpc_error()
+    async def update_project(self, project):
+        return await self._stub.UpdateProject(project, metadata=self._metadata)
+
+    ####################################################################################################################
+    #
+    #  Matching Attributes Endpoints
+    #
+    ####################################################################################################################
+
+    @_handle_rpc_error()
+    async def update_project_domain_attributes(self, project_domain_attributes_update_request):
+        return await self._stub.UpdateProjectDomainAttributes(
+            project_domain_attributes_update_request, metadata=self._metadata
+        )
+
+    @_handle_rpc_error()
+    async def update_workflow_attributes(self, workflow_attributes_update_request):
+        return await self._stub.UpdateWorkflowAttributes(workflow_attributes_update_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def get_project_domain_attributes(self, project_domain_attributes_get_request):
+        return await self._stub.GetProjectDomainAttributes(
+            project_domain_attributes_get_request, metadata=self._metadata
+        )
+
+    @_handle_rpc_error(retry=True)
+    async def get_workflow_attributes(self, workflow_attributes_get_request):
+        return await self._stub.GetWorkflowAttributes(workflow_attributes_get_request, metadata=self._metadata)
+
+    @_handle_rpc_error(retry=True)
+    async def list_matchable_attributes(self, matchable_attributes_list_request):
+        return await self._stub.ListMatchableAttributes(matchable_attributes_list_request, metadata=self._metadata)
@@ -3,6 +3,8 @@ import os
 import os as _os
 import stat as _stat
 import sys as _sys
+import time as _time
+from concurrent import futures as _futures
 from typing import Callable, Dict, List, Tuple, Union
 
 import click as _click
@@ -23,6 +25,7 @@ from flytekit.clients import friendly as _friendly_client
 from flytekit.clis.helpers import construct_literal_map_from_parameter_map as _construct_literal_map_from_parameter_map
 from flytekit.clis.helpers import construct_literal_map_from_variable_map as _construct_literal_map_from_variable_map
 from flytekit.clis.helpers import hydrate_registration_parameters
+from flytekit.clis.helpers import iterate_entity_references as _iterate_entity_references
 from flytekit.clis.helpers import parse_args_into_dict as _parse_args_into_dict
 from flytekit.common import launch_plan as _launch_plan_common
 from flytekit.common import utils as _utils
@@ -58,6 +61,7 @@ from flytekit.models.matchable_resource import PluginOverride as _PluginOverride
 from flytekit.models.matchable_resource import PluginOverrides as _PluginOverrides
 from flytekit.models.project import Project as _Project
 from flytekit.models.schedule import Schedule as _Schedule
+from flytekit.tools.fast_registration import archive_compression as _archive_compression
 from flytekit.tools.fast_registration import get_additional_distribution_loc as _get_additional_distribution_loc
 
 try:  # Python 3
@@ -345,6 +349,14 @@ _optional_principal_option = _click.option(
     help="[Optional] Your team name, or your name",
 )
 _insecure_option = _click.option(*_INSECURE_FLAGS, is_flag=True, required=True, help="Do not use SSL")
+_registration_workers_option = _click.option(
+    "--workers",
+    type=int,
+    default=8,
+    show_default=True,
+    help="The number of entities registered at the same time. Entities are still registered only after everything "
+    "they reference has been.",
+)
 _urn_option = _click.option("-u", "--urn", required=True, help="The unique identifier for an entity.")
 
 _optional_urn_option = _click.option("-u", "--urn", required=False, help="The unique identifier for an entity.")
@@ -1804,6 +1816,68 @@ def _get_patch_launch_plan_fn(
     return patch_launch_plan
 
 
+def _registration_phases(flyte_entities_list):
+    """
+    Groups the entities into phases such that every entity comes after all the entities it references that are part of
+    the same registration. Tasks therefore come first, then the workflows that use them, then their launch plans.
+    References to entities outside the list are assumed to be registered already. Entities keep their relative order
+    within a phase.
+
+    :param list[(flyteidl.core.identifier_pb2.Identifier, T)] flyte_entities_list:
+    :rtype: list[list[(flyteidl.core.identifier_pb2.Identifier, T)]]
+    """
+
+    def key(i):
+        return i.resource_type, i.project, i.domain, i.name, i.version
+
+    keys = {key(id) for id, _ in flyte_entities_list}
+    pending = [
+        (id, entity, {key(r) for r in _iterate_entity_references(id.resource_type, entity)} & keys - {key(id)})
+        for id, entity in flyte_entities_list
+    ]
+    phases = []
+    while pending:
+        # An entity is ready once nothing still pending shares its key, so duplicates of a dependency go first too.
+        pending_keys = {key(id) for id, _, _ in pending}
+        phase = [(id, entity) for id, entity, dependencies in pending if not dependencies & pending_keys]
+        if not phase:
+            raise _user_exceptions.FlyteAssertion(
+                "Cannot order registration, these entities reference each other: "
+                + ", ".join(sorted(f"{id.name}:{id.version}" for id, _, _ in pending))
+            )
+        phases.append(phase)
+        pending = [(id, entity, dependencies) for id, entity, dependencies in pending if dependencies & pending_keys]
+    return phases
+
+
+def _register_entity(client, id, flyte_entity) -> bool:
+    """
+    :returns: False if an identical entity was registered already
+    """
+    try:
+        if id.resource_type == _identifier_pb2.LAUNCH_PLAN:
+            client.raw.create_launch_plan(_launch_plan_pb2.LaunchPlanCreateRequest(id=id, spec=flyte_entity.spec))
+        elif id.resource_type == _identifier_pb2.TASK:
+            client.raw.create_task(_task_pb2.TaskCreateRequest(id=id, spec=flyte_entity))
+        elif id.resource_type == _identifier_pb2.WORKFLOW:
+            client.raw.create_workflow(_workflow_pb2.WorkflowCreateRequest(id=id, spec=flyte_entity))
+        else:
+            raise _user_exceptions.FlyteAssertion(
+                f"Only tasks, launch plans, and workflows can be called with this function, "
+                f"resource type {id.resource_type} was passed"
+            )
+        return True
+    except _user_exceptions.FlyteEntityAlreadyExistsException:
+        return False
+
+
+_RESOURCE_TYPE_NAMES = {
+    _identifier_pb2.TASK: "tasks",
+    _identifier_pb2.WORKFLOW: "workflows",
+    _identifier_pb2.LAUNCH_PLAN: "launch plans",
+}
+
+
 def _extract_and_register(
     host: str,
     insecure: bool,
@@ -1812,29 +1886,47 @@ def _extract_and_register(
     version: str,
     file_paths: List[str],
     patches: Dict[int, Callable[[_GeneratedProtocolMessageType], _GeneratedProtocolMessageType]] = None,
+    workers: int = 1,
 ):
-
+    """
+    Registers the entities in phases, see :py:func:`_registration_phases`, with up to ``workers`` requests in flight
+    within a phase. The first failure stops the registration once the requests already in flight have finished.
+    """
     client = _friendly_client.SynchronousFlyteClient(host, insecure=insecure)
 
     flyte_entities_list = _extract_files(project, domain, version, file_paths, patches)
-    for id, flyte_entity in flyte_entities_list:
-        try:
-            if id.resource_type == _identifier_pb2.LAUNCH_PLAN:
-                client.raw.create_launch_plan(_launch_plan_pb2.LaunchPlanCreateRequest(id=id, spec=flyte_entity.spec))
-            elif id.resource_type == _identifier_pb2.TASK:
-                client.raw.create_task(_task_pb2.TaskCreateRequest(id=id, spec=flyte_entity))
-            elif id.resource_type == _identifier_pb2.WORKFLOW:
-                client.raw.create_workflow(_workflow_pb2.WorkflowCreateRequest(id=id, spec=flyte_entity))
-            else:
-                raise _user_exceptions.FlyteAssertion(
-                    f"Only tasks, launch plans, and workflows can be called with this function, "
-                    f"resource type {id.resource_type} was passed"
-                )
-            _click.secho(f"Registered {id}", fg="green")
-        except _user_exceptions.FlyteEntityAlreadyExistsException:
-            _click.secho(f"Skipping because already registered {id}", fg="cyan")
+    phases = _registration_phases(flyte_entities_list)
+    summary = []
+    with _futures.ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for phase in phases:
+            start = _time.perf_counter()
+            registered = 0
+            futures = {executor.submit(_register_entity, client, id, flyte_entity): id for id, flyte_entity in phase}
+            try:
+                for future in _futures.as_completed(futures):
+                    id = futures[future]
+                    if future.result():
+                        registered += 1
+                        _click.secho(f"Registered {id}", fg="green")
+                    else:
+                        _click.secho(f"Skipping because already registered {id}", fg="cyan")
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+            summary.append((phase, registered, _time.perf_counter() - start))
 
     _click.echo(f"Finished scanning {len(flyte_entities_list)} files")
+    for i, (phase, registered, elapsed) in enumerate(summary):
+        counts = {}
+        for id, _ in phase:
+            counts[id.resource_type] = counts.get(id.resource_type, 0) + 1
+        contents = ", ".join(f"{n} {_RESOURCE_TYPE_NAMES.get(t, t)}" for t, n in sorted(counts.items()))
+        _click.echo(
+            f"  Phase {i + 1}: {contents}: {registered} registered, {len(phase) - registered} already registered "
+            f"in {elapsed:.2f}s"
+        )
+    _click.echo(f"  Total: {sum(elapsed for _, _, elapsed in summary):.2f}s with {max(1, workers)} workers")
 
 
 @_flyte_cli.command("register-files", cls=_FlyteSubCommand)
@@ -1846,6 +1938,7 @@ def _extract_and_register(
 @_assumable_iam_role_option
 @_kubernetes_service_acct_option
 @_output_location_prefix_option
+@_registration_workers_option
 @_files_argument
 def register_files(
     project,
@@ -1856,14 +1949,14 @@ def register_files(
     assumable_iam_role,
     kubernetes_service_account,
     output_location_prefix,
+    workers,
     files,
 ):
     """
-    Given a list of files, this will (after sorting the input list), attempt to register them against Flyte Admin.
+    Given a list of files, this will attempt to register them against Flyte Admin.
     This command expects the files to be the output of the pyflyte serialize command.  See the code there for more
-    information. Valid files need to be:\n
-        * Ordered in the order that you want registration to happen. pyflyte should have done the topological sort
-          for you and produced file that have a prefix that sets the correct order.\n
+    information. Entities are registered in phases, each only after the entities it references among the files, with
+    up to --workers requests at a time within a phase. Valid files need to be:\n
         * Of the correct type. That is, they should be the serialized form of one of these Flyte IDL objects
           (or an identifier object).\n
           - flyteidl.admin.launch_plan_pb2.LaunchPlan for launch plans\n
@@ -1890,7 +1983,7 @@ def register_files(
             )
         }
 
-    _extract_and_register(host, insecure, project, domain, version, files, patches)
+    _extract_and_register(host, insecure, project, domain, version, files, patches, workers)
 
 
 @_flyte_cli.command("fast-register-files", cls=_FlyteSubCommand)
@@ -1914,6 +2007,7 @@ def register_files(
 @_assumable_iam_role_option
 @_kubernetes_service_acct_option
 @_output_location_prefix_option
+@_registration_workers_option
 @_files_argument
 def fast_register_files(
     project,
@@ -1926,14 +2020,14 @@ def fast_register_files(
     assumable_iam_role,
     kubernetes_service_account,
     output_location_prefix,
+    workers,
     files,
 ):
     """
-    Given a list of files, this will (after sorting the input list), attempt to register them against Flyte Admin.
+    Given a list of files, this will attempt to register them against Flyte Admin.
     This command expects the files to be the output of the pyflyte serialize command.  See the code there for more
-    information. Valid files need to be:\n
-        * Ordered in the order that you want registration to happen. pyflyte should have done the topological sort
-          for you and produced file that have a prefix that sets the correct order.\n
+    information. Entities are registered in phases, each only after the entities it references among the files, with
+    up to --workers requests at a time within a phase. Valid files need to be:\n
         * Of the correct type. That is, they should be the serialized form of one of these Flyte IDL objects
           (or an identifier object).\n
           - flyteidl.admin.launch_plan_pb2.LaunchPlanSpec for launch plans\n
@@ -1949,11 +2043,11 @@ def fast_register_files(
     files = list(files)
     files.sort()
     _click.secho("Parsing files...", fg="green", bold=True)
-    compressed_source, digest = None, None
+    compressed_source, digest, compression = None, None, None
     pb_files = []
     for f in files:
-        if f.endswith("tar.gz"):
-            compressed_source = f
+        if _archive_compression(f):
+            compressed_source, compression = f, _archive_compression(f)
             digest = os.path.basename(f).split(".")[0]
         else:
             _click.echo(f"  {f}")
@@ -1965,7 +2059,7 @@ def fast_register_files(
         )
 
     version = version if version else digest
-    full_remote_path = _get_additional_distribution_loc(additional_distribution_dir, version)
+    full_remote_path = _get_additional_distribution_loc(additional_distribution_dir, version, compression)
     Data.put_data(compressed_source, full_remote_path)
     _click.secho(f"Uploaded compressed code archive {compressed_source} to {full_remote_path}", fg="green")
 
@@ -1999,7 +2093,7 @@ def fast_register_files(
             }
         )
 
-    _extract_and_register(host, insecure, project, domain, version, pb_files, patches)
+    _extract_and_register(host, insecure, project, domain, version, pb_files, patches, workers)
 
 
 @_flyte_cli.command("update-workflow-meta", cls=_FlyteSubCommand)
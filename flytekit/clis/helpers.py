@@ -1,4 +1,4 @@
-from typing import Tuple, Union
+from typing import Iterator, Tuple, Union
 
 import six as _six
 from flyteidl.admin.launch_plan_pb2 import LaunchPlan
@@ -183,3 +183,37 @@ def hydrate_registration_parameters(
     del entity.sub_workflows[:]
     entity.sub_workflows.extend(refreshed_sub_workflows)
     return identifier, entity
+
+
+def _iterate_node_references(node: _workflow_pb2.Node) -> Iterator[_identifier_pb2.Identifier]:
+    if node.HasField("task_node"):
+        yield node.task_node.reference_id
+    elif node.HasField("workflow_node"):
+        workflow_node = node.workflow_node
+        if workflow_node.HasField("launchplan_ref"):
+            yield workflow_node.launchplan_ref
+        else:
+            yield workflow_node.sub_workflow_ref
+    elif node.HasField("branch_node"):
+        if_else = node.branch_node.if_else
+        yield from _iterate_node_references(if_else.case.then_node)
+        for if_block in if_else.other:
+            yield from _iterate_node_references(if_block.then_node)
+        if if_else.HasField("else_node"):
+            yield from _iterate_node_references(if_else.else_node)
+
+
+def iterate_entity_references(
+    resource_type: int, entity: Union[LaunchPlan, WorkflowSpec, TaskSpec]
+) -> Iterator[_identifier_pb2.Identifier]:
+    """
+    Yields the identifiers of the entities a serialized entity refers to, and which so must be registered before it:
+    the workflow of a launch plan, and the tasks, launch plans and sub-workflows that the nodes of a workflow (including
+    its inline sub-workflows) use. Tasks refer to nothing.
+    """
+    if resource_type == _identifier_pb2.LAUNCH_PLAN:
+        yield entity.spec.workflow_id
+    elif resource_type == _identifier_pb2.WORKFLOW:
+        for template in [entity.template, *entity.sub_workflows]:
+            for node in template.nodes:
+                yield from _iterate_node_references(node)
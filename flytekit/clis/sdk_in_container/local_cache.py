@@ -0,0 +1,38 @@
+import click
+
+from flytekit.core.local_cache import LocalTaskCache
+
+
+@click.group("local-cache")
+def local_cache():
+    """
+    Inspect and clear the cache that local executions of tasks declared with ``cache=True`` read from.
+    """
+    pass
+
+
+@click.command("list")
+def list_entries():
+    """
+    List the cached task outputs, least recently used first.
+    """
+    cache = LocalTaskCache()
+    entries = cache.entries()
+    for entry in entries:
+        click.echo(str(entry))
+    click.secho(f"{len(entries)} entries, {sum(e.size for e in entries)} bytes in {cache.directory}", fg="green")
+
+
+@click.command("clear")
+@click.option("-t", "--task", "task_name", required=False, help="Only clear the entries of this task.")
+def clear(task_name=None):
+    """
+    Remove cached task outputs.
+    """
+    cache = LocalTaskCache()
+    removed = cache.clear(task_name)
+    click.secho(f"Removed {removed} entries from {cache.directory}", fg="green")
+
+
+local_cache.add_command(list_entries)
+local_cache.add_command(clear)
@@ -1,15 +1,19 @@
+import functools as _functools
+import hashlib as _hashlib
+import json as _json
 import logging as _logging
 import math as _math
 import os as _os
 import sys
-import tarfile as _tarfile
+import time as _time
 from collections import OrderedDict
 from enum import Enum as _Enum
-from typing import List
+from typing import Dict, List, Optional, Set
 
 import click
 
 import flytekit as _flytekit
+from flytekit.clis.helpers import iterate_entity_references as _iterate_entity_references
 from flytekit.clis.sdk_in_container.constants import CTX_PACKAGES
 from flytekit.common import utils as _utils
 from flytekit.common.core import identifier as _identifier
@@ -23,8 +27,8 @@ from flytekit.core import context_manager as flyte_context
 from flytekit.core.base_task import PythonTask
 from flytekit.core.launch_plan import LaunchPlan
 from flytekit.core.workflow import WorkflowBase
-from flytekit.tools.fast_registration import compute_digest as _compute_digest
-from flytekit.tools.fast_registration import filter_tar_file_fn as _filter_tar_file_fn
+from flytekit.tools.fast_registration import build_package as _build_package
+from flytekit.tools.fast_registration import get_additional_distribution_loc as _get_additional_distribution_loc
 from flytekit.tools.module_loader import iterate_registerable_entities_in_order
 
 # Identifier fields use placeholders for registration-time substitution.
@@ -47,6 +51,9 @@ CTX_CONFIG_FILE_LOC = "config_file_loc"
 CTX_FLYTEKIT_VIRTUALENV_ROOT = "flytekit_virtualenv_root"
 CTX_PYTHON_INTERPRETER = "python_interpreter"
 
+# Written to the output folder by incremental serialization, see serialize_all.
+SERIALIZE_MANIFEST = ".serialize-manifest.json"
+
 
 class SerializationMode(_Enum):
     DEFAULT = 0
@@ -99,6 +106,7 @@ def serialize_all(
     config_path: str = None,
     flytekit_virtualenv_root: str = None,
     python_interpreter: str = None,
+    incremental: bool = False,
 ):
     """
     This function will write to the folder specified the following protobuf types ::
@@ -118,6 +126,8 @@ def serialize_all(
     :param image: The fully qualified and versioned default image to use
     :param config_path: Path to the config file, if any, to be used during serialization
     :param flytekit_virtualenv_root: The full path of the virtual env in the container.
+    :param incremental: Only write the entities that changed since the last incremental run into the same folder, along
+        with the entities they reference. See :py:func:`_plan_incremental`.
     """
 
     # m = module (i.e. python file)
@@ -188,9 +198,17 @@ def serialize_all(
         # This will pick up all the serializable entities, but we'll need to filter them because the process of
         # serializing creates a lot of objects that don't need to be directly registered, namely SdkNodes and
         # BranchNodes and other branching constructs
-        all_entities = list(new_api_serializable_entities.values())
-        registerable_entities = list(filter(lambda x: isinstance(x, RegisterableEntity), all_entities))
-        loaded_entities = old_style_entities + registerable_entities
+        registerable_entities = [
+            (o, e) for o, e in new_api_serializable_entities.items() if isinstance(e, RegisterableEntity)
+        ]
+        loaded_entities = old_style_entities + [e for _, e in registerable_entities]
+        source_modules = [o.instantiated_in for o in old_style_entities] + [
+            _source_module(o) for o, _ in registerable_entities
+        ]
+
+        if incremental:
+            _serialize_incremental(loaded_entities, source_modules, folder)
+            return
 
         zero_padded_length = _determine_text_chars(len(loaded_entities))
         for i, entity in enumerate(loaded_entities):
@@ -208,6 +226,131 @@ def serialize_all(
         click.secho(f"Successfully serialized {len(loaded_entities)} flyte objects", fg="green")
 
 
+def _source_module(entity) -> Optional[str]:
+    """
+    The name of the module that defines a task, workflow or launch plan, which for a launch plan is its workflow's.
+    """
+    if isinstance(entity, LaunchPlan):
+        entity = entity.workflow
+    module = getattr(entity, "instantiated_in", None)
+    if module:
+        return module
+    fn = getattr(entity, "task_function", None) or getattr(entity, "_workflow_function", None)
+    return getattr(fn, "__module__", None)
+
+
+@_functools.lru_cache(maxsize=None)
+def _module_digest(module_name: Optional[str]) -> str:
+    path = getattr(sys.modules.get(module_name), "__file__", None)
+    if not path or not _os.path.isfile(path):
+        return ""
+    with open(path, "rb") as fh:
+        return _hashlib.sha256(fh.read()).hexdigest()
+
+
+def _entity_key(identifier) -> str:
+    return f"{identifier.resource_type}:{identifier.name}"
+
+
+def _plan_incremental(
+    specs: Dict[str, "google.protobuf.message.Message"],
+    module_digests: Dict[str, str],
+    previous: Dict[str, str],
+) -> (Dict[str, str], Set[str]):
+    """
+    Fingerprints every entity and decides which ones to write.
+
+    An entity's fingerprint covers its serialized spec, the source of the module that defines it and the fingerprints
+    of the entities it references. The latter matters because references carry the version placeholder, so a workflow's
+    own spec does not change when one of its tasks does, yet it has to be registered again to pick up the new task.
+
+    The entities to write are those whose fingerprint differs from ``previous``, plus everything they reference: they
+    are registered under a new version, and the entities they refer to must exist under that version as well.
+
+    :param specs: serialized spec by entity key
+    :param module_digests: source module digest by entity key
+    :param previous: fingerprint by entity key from the last run
+    :return: the fingerprint of every entity, and the keys of the entities to write
+    """
+    references = {
+        k: [r for r in (_entity_key(i) for i in _iterate_entity_references(int(k.split(":")[0]), spec)) if r in specs]
+        for k, spec in specs.items()
+    }
+    fingerprints = {}
+
+    def fingerprint(k, visiting=()):
+        if k not in fingerprints:
+            h = _hashlib.sha256(specs[k].SerializeToString(deterministic=True))
+            h.update(module_digests[k].encode())
+            for r in sorted(references[k]):
+                if r not in visiting:
+                    h.update(fingerprint(r, visiting + (k,)).encode())
+            fingerprints[k] = h.hexdigest()
+        return fingerprints[k]
+
+    changed = [k for k in specs if fingerprint(k) != previous.get(k)]
+    emit = set()
+    while changed:
+        k = changed.pop()
+        if k not in emit:
+            emit.add(k)
+            changed.extend(references[k])
+    return fingerprints, emit
+
+
+def _serialize_incremental(loaded_entities, source_modules: List[Optional[str]], folder: Optional[str]):
+    """
+    Writes only what :py:func:`_plan_incremental` selects, so that registering the contents of the folder registers just
+    the delta since the last incremental run. Files written by that run for entities that have not changed since are
+    removed. The manifest of every entity's fingerprint and the time its file took to write is kept in the folder.
+    """
+    folder = folder or ""
+    manifest_path = _os.path.join(folder, SERIALIZE_MANIFEST)
+    previous = {}
+    if _os.path.exists(manifest_path):
+        with open(manifest_path) as fh:
+            previous = _json.load(fh)["entities"]
+
+    entities, specs, module_digests = {}, {}, {}
+    for entity, module in zip(loaded_entities, source_modules):
+        if entity.has_registered:
+            _logging.info(f"Skipping entity {entity.id} because already registered")
+            continue
+        k = _entity_key(entity.id)
+        entities[k], specs[k], module_digests[k] = entity, entity.serialize(), _module_digest(module)
+
+    fingerprints, emit = _plan_incremental(specs, module_digests, {k: v["fingerprint"] for k, v in previous.items()})
+
+    for entry in previous.values():
+        if entry.get("file") and _os.path.exists(_os.path.join(folder, entry["file"])):
+            _os.remove(_os.path.join(folder, entry["file"]))
+
+    manifest = {}
+    emitted = [k for k in entities if k in emit]
+    zero_padded_length = _determine_text_chars(len(emitted))
+    for i, k in enumerate(emitted):
+        entity = entities[k]
+        start = _time.perf_counter()
+        fname = "{}_{}_{}.pb".format(str(i).zfill(zero_padded_length), entity.id.name, entity.id.resource_type)
+        click.echo(f"  Writing type: {entity.id.resource_type_name()}, {entity.id.name} to\n    {fname}")
+        _write_proto_to_file(specs[k], _os.path.join(folder, fname))
+        manifest[k] = {"fingerprint": fingerprints[k], "file": fname, "seconds": _time.perf_counter() - start}
+    for k in entities:
+        if k not in emit:
+            manifest[k] = {"fingerprint": fingerprints[k], "file": None, "seconds": previous[k]["seconds"]}
+
+    with open(manifest_path, "w") as fh:
+        _json.dump({"entities": manifest}, fh, indent=1, sort_keys=True)
+
+    skipped = len(entities) - len(emitted)
+    saved = sum(manifest[k]["seconds"] for k in entities if k not in emit)
+    click.secho(
+        f"Successfully serialized {len(emitted)} changed flyte objects, skipped {skipped} unchanged ones "
+        f"(saving {saved:.2f}s of writing them, and their registration)",
+        fg="green",
+    )
+
+
 def _determine_text_chars(length):
     """
     This function is used to help prefix files. If there are only 10 entries, then we just need one digit (0-9) to be
@@ -303,8 +446,14 @@ def tasks(ctx, folder=None):
 # For now let's just assume that the directory needs to exist. If you're docker run -v'ing, docker will create the
 # directory for you so it shouldn't be a problem.
 @click.option("-f", "--folder", type=click.Path(exists=True))
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only write the entities that changed since the last incremental run into the same folder (and the entities "
+    "they reference), so that registering the folder registers just the changes.",
+)
 @click.pass_context
-def workflows(ctx, folder=None):
+def workflows(ctx, folder=None, incremental=False):
     _logging.getLogger().setLevel(_logging.DEBUG)
 
     if folder:
@@ -320,6 +469,7 @@ def workflows(ctx, folder=None):
         image=ctx.obj[CTX_IMAGE],
         config_path=ctx.obj[CTX_CONFIG_FILE_LOC],
         flytekit_virtualenv_root=ctx.obj[CTX_FLYTEKIT_VIRTUALENV_ROOT],
+        incremental=incremental,
     )
 
 
@@ -331,21 +481,27 @@ def fast(ctx):
 
 @click.command("workflows")
 @click.option("-f", "--folder", type=click.Path(exists=True))
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Only write the entities that changed since the last incremental run into the same folder (and the entities "
+    "they reference), so that registering the folder registers just the changes.",
+)
 @click.pass_context
-def fast_workflows(ctx, folder=None):
+def fast_workflows(ctx, folder=None, incremental=False):
     _logging.getLogger().setLevel(_logging.DEBUG)
 
     if folder:
         click.echo(f"Writing output to {folder}")
 
     source_dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
-    digest = _compute_digest(source_dir)
     folder = folder if folder else ""
-    archive_fname = _os.path.join(folder, f"{digest}.tar.gz")
-    click.echo(f"Writing compressed archive to {archive_fname}")
-    # Write using gzip
-    with _tarfile.open(archive_fname, "w:gz") as tar:
-        tar.add(source_dir, arcname="", filter=_filter_tar_file_fn)
+    # The name of the archive is the digest of the code, which is known once it is written.
+    tmp_fname = _os.path.join(folder, ".fast-package.tmp")
+    digest = _build_package(source_dir, tmp_fname)
+    archive_fname = _get_additional_distribution_loc(folder, digest)
+    _os.replace(tmp_fname, archive_fname)
+    click.echo(f"Wrote compressed archive to {archive_fname}")
 
     pkgs = ctx.obj[CTX_PACKAGES]
     dir = ctx.obj[CTX_LOCAL_SRC_ROOT]
@@ -357,6 +513,7 @@ def fast_workflows(ctx, folder=None):
         image=ctx.obj[CTX_IMAGE],
         config_path=ctx.obj[CTX_CONFIG_FILE_LOC],
         flytekit_virtualenv_root=ctx.obj[CTX_FLYTEKIT_VIRTUALENV_ROOT],
+        incremental=incremental,
     )
 
 
@@ -21,3 +21,11 @@ ENABLE_DEBUG = _config_common.FlyteBoolConfigurationEntry("aws", "enable_debug",
 RETRIES = _config_common.FlyteIntegerConfigurationEntry("aws", "retries", default=3)
 
 BACKOFF_SECONDS = _config_common.FlyteIntegerConfigurationEntry("aws", "backoff_seconds", default=5)
+
+USE_NATIVE_CLIENT = _config_common.FlyteBoolConfigurationEntry("aws", "use_native_client", default=False)
+"""
+If set, S3 data is moved in-process with a pooled boto3 client instead of shelling out to the aws cli. Falls back to the
+cli when boto3 is not installed.
+"""
+
+MAX_POOL_CONNECTIONS = _config_common.FlyteIntegerConfigurationEntry("aws", "max_pool_connections", default=10)
@@ -2,3 +2,23 @@ from flytekit.configuration import common as _config_common
 
 GCS_PREFIX = _config_common.FlyteRequiredStringConfigurationEntry("gcp", "gcs_prefix")
 GSUTIL_PARALLELISM = _config_common.FlyteBoolConfigurationEntry("gcp", "gsutil_parallelism", default=False)
+
+USE_NATIVE_CLIENT = _config_common.FlyteBoolConfigurationEntry("gcp", "use_native_client", default=False)
+"""
+If set, GCS data is moved in-process with the google-cloud-storage client instead of shelling out to gsutil. Falls back to
+gsutil when google-cloud-storage is not installed.
+"""
+
+NATIVE_CLIENT_WORKERS = _config_common.FlyteIntegerConfigurationEntry("gcp", "native_client_workers", default=8)
+"""
+Number of threads the native client uses for composite upload parts and batched existence checks. Directory transfers
+use the shared transfer engine, see ``sdk.data_transfer_concurrency``.
+"""
+
+PARALLEL_COMPOSITE_UPLOAD_THRESHOLD = _config_common.FlyteIntegerConfigurationEntry(
+    "gcp", "parallel_composite_upload_threshold", default=150 * 1024 * 1024
+)
+"""
+Files larger than this many bytes are uploaded by the native client as parallel parts that are then composed into the
+final object, mirroring gsutil's parallel composite uploads. Set to 0 to disable.
+"""
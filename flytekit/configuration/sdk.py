@@ -85,3 +85,157 @@ This is the remote directory where fast-registered code will be uploaded to.
 Users calling fast-execute need write permission to this directory.
 Furthermore, it is important that whichever role executes your workflow has read access to this directory.
 """
+
+FAST_REGISTRATION_COMPRESSION = _config_common.FlyteStringConfigurationEntry(
+    "sdk", "fast_registration_compression", default="gzip"
+)
+"""
+Compression of fast-registration packages, ``gzip`` or ``zstd``. Compressing and extracting zstd packages is several
+times faster, but needs the ``zstd`` extra, ``flytekit[zstd]``, both where the code is packaged and in the task images.
+"""
+
+FAST_REGISTRATION_DEDUP = _config_common.FlyteBoolConfigurationEntry("sdk", "fast_registration_dedup", default=False)
+"""
+When set, a fast-registration package only holds the files that changed since the last package uploaded from this
+machine to the same directory, as long as that saves at least half of the bytes. Such a package names the one it builds
+on, which tasks then download first. This needs the task images to run a flytekit that understands these packages.
+"""
+
+FAST_REGISTRATION_CACHE_PATH = _config_common.FlyteStringConfigurationEntry(
+    "sdk", "fast_registration_cache_path", default="~/.flyte/fast-registration.json"
+)
+"""
+Where fast registration keeps the content hash of every packaged file, keyed by its modification time, size and mode,
+and the manifest of the last package uploaded to every directory. An empty value disables the cache.
+"""
+
+FAST_REGISTRATION_HASH_WORKERS = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "fast_registration_hash_workers", default=8
+)
+"""
+Number of files hashed at the same time when computing the digest of the code to fast-register.
+"""
+
+FAST_EXECUTE_IN_PROCESS = _config_common.FlyteBoolConfigurationEntry("sdk", "fast_execute_in_process", default=True)
+"""
+Whether pyflyte-fast-execute runs the task in its own process once the code is installed, rather than starting another
+interpreter for the task command. Commands that are not flytekit entrypoints always run in a new process.
+"""
+
+FAST_EXECUTE_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "fast_execute_cache_dir", default=None)
+"""
+A directory, typically shared by all tasks on a node, where pyflyte-fast-execute keeps the code of the latest
+fast-registered versions it installed. Tasks of a cached version copy the code from there instead of downloading and
+extracting it again. Unset by default.
+"""
+
+DATA_TRANSFER_CONCURRENCY = _config_common.FlyteIntegerConfigurationEntry("sdk", "data_transfer_concurrency", default=8)
+"""
+Number of files (or parts of large files) the data transfer engine moves at the same time when uploading or downloading
+a multipart blob such as a directory or a schema.
+"""
+
+DATA_TRANSFER_RETRIES = _config_common.FlyteIntegerConfigurationEntry("sdk", "data_transfer_retries", default=3)
+"""
+Number of times the data transfer engine retries an individual file (or part) before failing the whole transfer.
+"""
+
+DATA_TRANSFER_PART_SIZE = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "data_transfer_part_size", default=64 * 1024 * 1024
+)
+"""
+Files larger than this many bytes are split into parts of this size that are transferred concurrently.
+"""
+
+LOCAL_WORKFLOW_CONCURRENCY = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "local_workflow_concurrency", default=1
+)
+"""
+When a workflow is run locally, this many nodes whose inputs are ready may execute at the same time on a thread pool.
+The default of 1 keeps the classic behavior of running the nodes one after the other in the order they were declared.
+"""
+
+LOCAL_CACHE_ENABLED = _config_common.FlyteBoolConfigurationEntry("sdk", "local_cache_enabled", default=False)
+"""
+Whether tasks declared with ``cache=True`` reuse the outputs of an earlier local run with the same inputs,
+``cache_version`` and task source. Off by default, since entries persist across processes. This only affects local
+executions; on the platform, caching is handled by Flyte itself.
+"""
+
+LOCAL_CACHE_DIR = _config_common.FlyteStringConfigurationEntry("sdk", "local_cache_dir", default="~/.flyte/local-cache")
+"""
+The directory the local task cache is kept in.
+"""
+
+LOCAL_CACHE_MAX_SIZE_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "local_cache_max_size_bytes", default=1024 * 1024 * 1024
+)
+"""
+Once the local task cache grows past this many bytes, the least recently used entries are evicted. 0 means no limit.
+"""
+
+LOCAL_CACHE_MAX_AGE_SECONDS = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "local_cache_max_age_seconds", default=7 * 24 * 60 * 60
+)
+"""
+Local task cache entries that have not been used for this many seconds are evicted. 0 means entries never expire.
+"""
+
+HTTP_PARALLEL_DOWNLOADS = _config_common.FlyteBoolConfigurationEntry("sdk", "http_parallel_downloads", default=True)
+"""
+Whether HTTP(S) downloads larger than ``data_transfer_part_size`` are fetched as concurrent byte ranges when the server
+supports range requests.
+"""
+
+PREFETCH_BLOB_INPUTS = _config_common.FlyteBoolConfigurationEntry("sdk", "prefetch_blob_inputs", default=False)
+"""
+By default, remote blob inputs of a task are only downloaded once the task reads them, except for ``os.PathLike``
+inputs, which are plain strings and are downloaded before the task runs. When this is set, they all start downloading
+concurrently in the background, so that the transfers overlap with each other and with the task body.
+In a task container they start as soon as the inputs file is in, while the task code is still being imported.
+"""
+
+ARROW_COMPRESSION = _config_common.FlyteStringConfigurationEntry("sdk", "arrow_compression", default="uncompressed")
+"""
+Compression for schema chunks written in the Arrow IPC format: ``uncompressed``, ``lz4`` or ``zstd``. Only uncompressed
+chunks can be memory-mapped and read without copying.
+"""
+
+SCHEMA_CHUNK_TARGET_BYTES = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "schema_chunk_target_bytes", default=128 * 1024 * 1024
+)
+"""
+Data frames written to a schema are split into chunk files of about this many bytes of in-memory data, so that large
+frames can be encoded in parallel and read back piece by piece. 0 writes every frame as a single chunk.
+"""
+
+SCHEMA_WRITE_CONCURRENCY = _config_common.FlyteIntegerConfigurationEntry("sdk", "schema_write_concurrency", default=4)
+"""
+Number of schema chunk files encoded at the same time.
+"""
+
+MODULE_CACHE_PATH = _config_common.FlyteStringConfigurationEntry(
+    "sdk", "module_cache_path", default="~/.flyte/module-cache.json"
+)
+"""
+Where discovering the modules of the workflow packages caches the package tree, and for every module file the result of
+the pre-filter and the entities found in it, keyed by the file's modification time and content hash. The cache only
+serves the pre-filter, so it is used only when ``module_prefilter`` is set, and holds the modules of the last discovery.
+An empty value disables the cache.
+"""
+
+MODULE_PREFILTER = _config_common.FlyteBoolConfigurationEntry("sdk", "module_prefilter", default=False)
+"""
+When set, a module of the workflow packages is only imported if a scan of its syntax tree finds names that declare
+entities (``task``, ``workflow``, ``dynamic``, ``LaunchPlan``, or ones ending in ``_task``, ``Task`` or ``Workflow``), or
+if it held entities the last time it was imported. Modules that create entities by other means, e.g. through a factory
+imported under another name, are skipped, so this is off by default.
+"""
+
+MODULE_DISCOVERY_CONCURRENCY = _config_common.FlyteIntegerConfigurationEntry(
+    "sdk", "module_discovery_concurrency", default=8
+)
+"""
+Number of threads that list package directories and scan module files during discovery. Modules are always imported one
+at a time, in the order of the package tree.
+"""
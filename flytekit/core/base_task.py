@@ -6,6 +6,7 @@ from typing import Any, Dict, Generic, Optional, Tuple, Type, TypeVar, Union
 
 from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.common.tasks.sdk_runnable import ExecutionParameters
+from flytekit.core import local_cache as _local_cache
 from flytekit.core.context_manager import (
     BranchEvalMode,
     ExecutionState,
@@ -205,7 +206,7 @@ class Task(object):
         )
         input_literal_map = _literal_models.LiteralMap(literals=kwargs)
 
-        outputs_literal_map = self.dispatch_execute(ctx, input_literal_map)
+        outputs_literal_map = self._dispatch_execute_with_local_cache(ctx, input_literal_map)
         outputs_literals = outputs_literal_map.literals
 
         # TODO maybe this is the part that should be done for local execution, we pass the outputs to some special
@@ -223,6 +224,25 @@ class Task(object):
         vals = [Promise(var, outputs_literals[var]) for var in output_names]
         return create_task_output(vals, self.python_interface)
 
+    def _dispatch_execute_with_local_cache(
+        self, ctx: FlyteContext, input_literal_map: _literal_models.LiteralMap
+    ) -> _literal_models.LiteralMap:
+        """
+        Honors ``cache=True`` for local executions by consulting the local task cache before running the task.
+        """
+        cache = _local_cache.get_cache() if self.metadata.cache else None
+        # flytekit.core.testing mocks a task by replacing execute on the instance, and a mock has to run.
+        if cache is None or "execute" in self.__dict__:
+            return self.dispatch_execute(ctx, input_literal_map)
+
+        code = _local_cache.code_digest(self)
+        outputs_literal_map = cache.get(self.name, self.metadata.cache_version, input_literal_map, code)
+        if outputs_literal_map is None:
+            outputs_literal_map = self.dispatch_execute(ctx, input_literal_map)
+            if isinstance(outputs_literal_map, _literal_models.LiteralMap):
+                cache.set(self.name, self.metadata.cache_version, input_literal_map, outputs_literal_map, code)
+        return outputs_literal_map
+
     def __call__(self, *args, **kwargs):
         # When a Task is () aka __called__, there are three things we may do:
         #  a. Task Execution Mode - just run the Python function as Python normally would. Flyte steps completely
@@ -442,16 +462,20 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
             # We manually construct a LiteralMap here because task inputs and outputs actually violate the assumption
             # built into the IDL that all the values of a literal map are of the same type.
             literals = {}
-            for k, v in native_outputs_as_map.items():
-                literal_type = self._outputs_interface[k].type
-                py_type = self.get_type_for_output_var(k, v)
-
-                if isinstance(v, tuple):
-                    raise AssertionError(f"Output({k}) in task{self.name} received a tuple {v}, instead of {py_type}")
-                try:
-                    literals[k] = TypeEngine.to_literal(exec_ctx, v, py_type, literal_type)
-                except Exception as e:
-                    raise AssertionError(f"failed to convert return value for var {k}") from e
+            # Offloaded outputs upload in the background while the next ones are converted.
+            with exec_ctx.file_access.background_uploads():
+                for k, v in native_outputs_as_map.items():
+                    literal_type = self._outputs_interface[k].type
+                    py_type = self.get_type_for_output_var(k, v)
+
+                    if isinstance(v, tuple):
+                        raise AssertionError(
+                            f"Output({k}) in task{self.name} received a tuple {v}, instead of {py_type}"
+                        )
+                    try:
+                        literals[k] = TypeEngine.to_literal(exec_ctx, v, py_type, literal_type)
+                    except Exception as e:
+                        raise AssertionError(f"failed to convert return value for var {k}") from e
 
             outputs_literal_map = _literal_models.LiteralMap(literals=literals)
             # After the execute has been successfully completed
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextvars
 import datetime as _datetime
 import logging as _logging
 import os
@@ -8,11 +9,8 @@ import re
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, Generator, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Tuple
 
-from docker_image import reference
-
-from flytekit.clients import friendly as friendly_client  # noqa
 from flytekit.common.core.identifier import WorkflowExecutionIdentifier as _SdkWorkflowExecutionIdentifier
 from flytekit.common.tasks.sdk_runnable import ExecutionParameters
 from flytekit.configuration import images, internal
@@ -21,6 +19,9 @@ from flytekit.engines.unit import mock_stats as _mock_stats
 from flytekit.interfaces.data import data_proxy as _data_proxy
 from flytekit.models.core import identifier as _identifier
 
+if TYPE_CHECKING:
+    from flytekit.clients import friendly as friendly_client
+
 # TODO: resolve circular import from flytekit.core.python_auto_container import TaskResolverMixin
 
 _DEFAULT_FLYTEKIT_ENTRYPOINT_FILELOC = "bin/entrypoint.py"
@@ -67,6 +68,9 @@ def look_up_image_info(name: str, tag: str, optional_tag: bool = False) -> Image
     :param Text tag: e.g. somedocker.com/myimage:someversion123
     :rtype: Text
     """
+    # Compiling the image reference grammar takes a while, and containers running a task never need it.
+    from docker_image import reference
+
     ref = reference.Reference.parse(tag)
     if not optional_tag and ref["tag"] is None:
         raise AssertionError(f"Incorrectly formatted image {tag}, missing tag value")
@@ -303,7 +307,11 @@ class ExecutionState(object):
 
 
 class FlyteContext(object):
-    OBJS = []
+    # The stack of entered contexts lives in a context variable, so every thread and every asyncio task works on its
+    # own chain and cannot push or pop another's contexts. An empty stack means only the root (default) context, set at
+    # the bottom of this file, is active.
+    _ROOT: Optional[FlyteContext] = None
+    _STACK = contextvars.ContextVar("flyte_context_stack", default=())
 
     def __init__(
         self,
@@ -315,8 +323,8 @@ class FlyteContext(object):
         user_space_params: ExecutionParameters = None,
         serialization_settings: SerializationSettings = None,
     ):
-        if parent is None and len(FlyteContext.OBJS) > 0:
-            parent = FlyteContext.OBJS[-1]
+        if parent is None and FlyteContext._ROOT is not None:
+            parent = FlyteContext.current_context()
 
         if compilation_state is not None and execution_state is not None:
             raise Exception("Can't specify both")
@@ -332,17 +340,49 @@ class FlyteContext(object):
     def __enter__(self):
         # Should we auto-assign the parent here?
         # Or detect if self's parent is not [-1]?
-        FlyteContext.OBJS.append(self)
+        FlyteContext._push(self)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        FlyteContext.OBJS.pop()
+        FlyteContext._pop()
+
+    @classmethod
+    def _push(cls, ctx: FlyteContext):
+        cls._STACK.set(cls._STACK.get() + (ctx,))
+
+    @classmethod
+    def _pop(cls):
+        cls._STACK.set(cls._STACK.get()[:-1])
 
     @classmethod
     def current_context(cls) -> FlyteContext:
-        if len(cls.OBJS) == 0:
+        stack = cls._STACK.get()
+        if stack:
+            return stack[-1]
+        if cls._ROOT is None:
             raise Exception("There should pretty much always be a base context object.")
-        return cls.OBJS[-1]
+        return cls._ROOT
+
+    @classmethod
+    def snapshot(cls) -> Tuple[FlyteContext, ...]:
+        """
+        Returns the current context stack, to be handed to :py:meth:`restore` in another thread. Note that asyncio tasks
+        inherit the stack of the code that created them and do not need this.
+        """
+        return cls._STACK.get()
+
+    @classmethod
+    @contextmanager
+    def restore(cls, snapshot: Tuple[FlyteContext, ...]) -> Generator[FlyteContext, None, None]:
+        """
+        Runs the enclosed block with the given context stack (see :py:meth:`snapshot`), and puts the previous stack
+        back afterwards.
+        """
+        token = cls._STACK.set(tuple(snapshot))
+        try:
+            yield cls.current_context()
+        finally:
+            cls._STACK.reset(token)
 
     @contextmanager
     def new_context(
@@ -363,11 +403,11 @@ class FlyteContext(object):
             user_space_params=user_space_params,
             serialization_settings=serialization_settings,
         )
-        FlyteContext.OBJS.append(new_ctx)
+        FlyteContext._push(new_ctx)
         try:
             yield new_ctx
         finally:
-            FlyteContext.OBJS.pop()
+            FlyteContext._pop()
 
     @property
     def file_access(self) -> _data_proxy.FileAccessProvider:
@@ -381,11 +421,11 @@ class FlyteContext(object):
     @contextmanager
     def new_file_access_context(self, file_access_provider: _data_proxy.FileAccessProvider):
         new_ctx = FlyteContext(parent=self, file_access=file_access_provider)
-        FlyteContext.OBJS.append(new_ctx)
+        FlyteContext._push(new_ctx)
         try:
             yield new_ctx
         finally:
-            FlyteContext.OBJS.pop()
+            FlyteContext._pop()
 
     @property
     def user_space_params(self) -> Optional[ExecutionParameters]:
@@ -426,11 +466,11 @@ class FlyteContext(object):
             execution_state=exec_state,
             user_space_params=execution_params or default_user_space_params,
         )
-        FlyteContext.OBJS.append(new_ctx)
+        FlyteContext._push(new_ctx)
         try:
             yield new_ctx
         finally:
-            FlyteContext.OBJS.pop()
+            FlyteContext._pop()
 
     @property
     def compilation_state(self) -> Optional[CompilationState]:
@@ -452,11 +492,11 @@ class FlyteContext(object):
         new_ctx = FlyteContext(
             parent=self, compilation_state=CompilationState(prefix=prefix or "", task_resolver=task_resolver)
         )
-        FlyteContext.OBJS.append(new_ctx)
+        FlyteContext._push(new_ctx)
         try:
             yield new_ctx
         finally:
-            FlyteContext.OBJS.pop()
+            FlyteContext._pop()
 
     @property
     def serialization_settings(self) -> SerializationSettings:
@@ -472,11 +512,11 @@ class FlyteContext(object):
         self, serialization_settings: SerializationSettings
     ) -> Generator[FlyteContext, None, None]:
         new_ctx = FlyteContext(parent=self, serialization_settings=serialization_settings)
-        FlyteContext.OBJS.append(new_ctx)
+        FlyteContext._push(new_ctx)
         try:
             yield new_ctx
         finally:
-            FlyteContext.OBJS.pop()
+            FlyteContext._pop()
 
     @property
     def flyte_client(self):
@@ -507,4 +547,4 @@ default_user_space_params = ExecutionParameters(
 default_context = FlyteContext(
     user_space_params=default_user_space_params, file_access=_data_proxy.default_local_file_access_provider
 )
-FlyteContext.OBJS.append(default_context)
+FlyteContext._ROOT = default_context
@@ -0,0 +1,138 @@
+"""
+Deferred downloads for blob inputs. The TextIO and BinaryIO transformers hand tasks a :py:class:`LazyFile` instead of
+downloading in ``to_python_value``, so an input that the task body never touches is never fetched.
+
+With ``sdk.prefetch_blob_inputs`` turned on, every remote blob input starts downloading on a shared background pool as
+soon as it is converted, which lets the transfers overlap with each other and with the start of the task body. The
+first read then only waits for whatever is still in flight.
+"""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+from flytekit.configuration import sdk as _sdk_config
+
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+
+
+def _prefetch_pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(
+                    max_workers=max(1, _sdk_config.DATA_TRANSFER_CONCURRENCY.get()), thread_name_prefix="flyte-prefetch"
+                )
+    return _POOL
+
+
+class LazyDownload(object):
+    """
+    Fetches one remote blob to a local path at most once, either on first use or ahead of time on the prefetch pool.
+    Calling the object waits for the download and returns the local path, so it can also serve as the downloader of a
+    FlyteFile or FlyteDirectory.
+    """
+
+    def __init__(self, file_access, remote_path: str, local_path: str, is_multipart: bool = False):
+        self._file_access = file_access
+        self._remote_path = remote_path
+        self._local_path = local_path
+        self._is_multipart = is_multipart
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        if _sdk_config.PREFETCH_BLOB_INPUTS.get():
+            self._future = _prefetch_pool().submit(self._download)
+
+    @property
+    def remote_path(self) -> str:
+        return self._remote_path
+
+    @property
+    def local_path(self) -> str:
+        return self._local_path
+
+    @property
+    def downloaded(self) -> bool:
+        return self._future is not None and self._future.done() and self._future.exception() is None
+
+    def _download(self):
+        self._file_access.get_data(self._remote_path, self._local_path, is_multipart=self._is_multipart)
+
+    def _run(self) -> Future:
+        future = Future()
+        try:
+            self._download()
+            future.set_result(None)
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def __call__(self) -> str:
+        with self._lock:
+            if self._future is None:
+                self._future = self._run()
+            future = self._future
+        try:
+            future.result()
+        except Exception:
+            # The prefetch or an earlier use may have hit a transient error, so the download is tried once more here
+            # rather than failing for good.
+            with self._lock:
+                if self._future is future:
+                    self._future = self._run()
+                future = self._future
+            future.result()
+        return self._local_path
+
+
+class LazyFile(object):
+    """
+    A read-only file handle for TextIO and BinaryIO inputs. The file is fetched and opened on first access to any file
+    attribute; closing a handle that was never used does not download anything.
+    """
+
+    def __init__(self, download: LazyDownload, mode: str):
+        self._download = download
+        self._mode = mode
+        self._fh = None
+        self._closed = False
+
+    @property
+    def remote_path(self) -> str:
+        return self._download.remote_path
+
+    def _file(self):
+        if self._fh is None:
+            if self._closed:
+                raise ValueError("I/O operation on closed file.")
+            self._fh = open(self._download(), self._mode)
+        return self._fh
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self._file(), item)
+
+    @property
+    def closed(self) -> bool:
+        return self._fh.closed if self._fh is not None else self._closed
+
+    def close(self):
+        self._closed = True
+        if self._fh is not None:
+            self._fh.close()
+
+    def __iter__(self):
+        return iter(self._file())
+
+    def __next__(self):
+        return next(self._file())
+
+    def __enter__(self):
+        self._file()
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __repr__(self):
+        return f"LazyFile({self._download.remote_path!r}, mode={self._mode!r})"
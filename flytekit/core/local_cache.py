@@ -0,0 +1,353 @@
+"""
+A local, on-disk memoization layer for tasks declared with ``cache=True``. On the platform, Flyte reuses the outputs of
+an earlier execution with the same task, ``cache_version`` and inputs; this module gives local runs the same behavior.
+
+Entries are keyed by the task name, its ``cache_version``, the source of its code and a canonical hash of the input
+``LiteralMap``. Blobs and schemas that live on the local filesystem are hashed by their content rather than their URI,
+since local runs write every offloaded value to a fresh random path. Offloaded outputs are copied into the entry, so
+that a hit does not depend on a sandbox directory that may have been cleaned up since.
+
+The cache is off unless ``sdk.local_cache_enabled`` is set.
+
+Each entry is a directory below the cache directory::
+
+    <key>/outputs.pb   the serialized output LiteralMap, its mtime is the last time the entry was used
+    <key>/meta.json    task name, cache version, creation time and size of the entry
+    <key>/blobs/...    local offloaded outputs, named by content digest
+"""
+import datetime as _datetime
+import hashlib as _hashlib
+import inspect as _inspect
+import json as _json
+import marshal as _marshal
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+import threading as _threading
+import time as _time
+import weakref as _weakref
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from flyteidl.core import literals_pb2 as _literals_pb2
+
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.interfaces.data.local.local_file_proxy import strip_file_header
+from flytekit.loggers import logger
+from flytekit.models import literals as _literal_models
+
+_OUTPUTS_FILE = "outputs.pb"
+_META_FILE = "meta.json"
+_BLOBS_DIR = "blobs"
+_READ_BUFFER_SIZE = 1024 * 1024
+
+# Content digests of local files and directories, keyed by (path, size, mtime) so unchanged inputs are only read once.
+_DIGESTS: Dict[Tuple[str, int, int], str] = {}
+_DIGESTS_LOCK = _threading.Lock()
+# Digests of the code of tasks, keyed by the function or class they were taken from.
+_CODE_DIGESTS = _weakref.WeakKeyDictionary()
+
+
+def _is_local(uri: str) -> bool:
+    return uri.startswith("/") or uri.startswith("file://")
+
+
+def _file_digest(path: str) -> str:
+    h = _hashlib.sha256()
+    with open(path, "rb") as fh:
+        for buf in iter(lambda: fh.read(_READ_BUFFER_SIZE), b""):
+            h.update(buf)
+    return h.hexdigest()
+
+
+def content_digest(path: str) -> str:
+    """
+    Returns the sha256 of a file, or of the relative paths and contents of every file below a directory.
+    """
+    st = _os.stat(path)
+    memo_key = (path, st.st_size, st.st_mtime_ns)
+    digest = _DIGESTS.get(memo_key)
+    if digest is not None:
+        return digest
+    if _os.path.isdir(path):
+        h = _hashlib.sha256()
+        for root, dirs, names in _os.walk(path, followlinks=True):
+            dirs.sort()
+            for name in sorted(names):
+                p = _os.path.join(root, name)
+                h.update(_os.path.relpath(p, path).replace(_os.sep, "/").encode("utf-8"))
+                h.update(_file_digest(p).encode("ascii"))
+        digest = h.hexdigest()
+    else:
+        digest = _file_digest(path)
+    with _DIGESTS_LOCK:
+        _DIGESTS[memo_key] = digest
+    return digest
+
+
+def code_digest(task) -> str:
+    """
+    Returns the sha256 of the code a task runs: the source of its function for function tasks, and the source of its
+    class otherwise. Editing a task then misses its earlier entries even if the ``cache_version`` was not bumped. Code
+    that the task calls into is not covered.
+    """
+    target = getattr(task, "task_function", None) or type(task)
+    try:
+        return _CODE_DIGESTS[target]
+    except (KeyError, TypeError):
+        pass
+    try:
+        source = _inspect.getsource(target).encode("utf-8")
+    except (OSError, TypeError):
+        # Defined somewhere the source cannot be read from, e.g. an interactive session.
+        code = getattr(target, "__code__", None)
+        source = _marshal.dumps(code) if code is not None else b""
+    digest = _hashlib.sha256(source).hexdigest()
+    try:
+        _CODE_DIGESTS[target] = digest
+    except TypeError:
+        pass
+    return digest
+
+
+def _visit_offloaded(literal_map: _literals_pb2.LiteralMap, fn: Callable[[object], None]):
+    """
+    Calls fn with every blob and schema message in the literal map, so that fn can rewrite its uri.
+    """
+    stack = list(literal_map.literals.values())
+    while stack:
+        lit = stack.pop()
+        which = lit.WhichOneof("value")
+        if which == "collection":
+            stack.extend(lit.collection.literals)
+        elif which == "map":
+            stack.extend(lit.map.literals.values())
+        elif which == "scalar":
+            kind = lit.scalar.WhichOneof("value")
+            if kind == "blob":
+                fn(lit.scalar.blob)
+            elif kind == "schema":
+                fn(lit.scalar.schema)
+
+
+@dataclass
+class CacheEntry(object):
+    key: str
+    task_name: str
+    cache_version: str
+    size: int
+    created: float
+    last_used: float
+
+    def __str__(self):
+        last_used = _datetime.datetime.fromtimestamp(self.last_used).isoformat(sep=" ", timespec="seconds")
+        return f"{self.key[:12]}  {self.task_name}@{self.cache_version}  {self.size} bytes  last used {last_used}"
+
+
+class LocalTaskCache(object):
+    """
+    The on-disk store. Entries are written to a temporary directory and renamed into place, so concurrent local
+    executions of the same task, from threads or from other processes, never observe a partial entry.
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_size_bytes: Optional[int] = None,
+        max_age_seconds: Optional[int] = None,
+    ):
+        self._directory = _os.path.abspath(_os.path.expanduser(directory or _sdk_config.LOCAL_CACHE_DIR.get()))
+        self._max_size_bytes = (
+            max_size_bytes if max_size_bytes is not None else _sdk_config.LOCAL_CACHE_MAX_SIZE_BYTES.get()
+        )
+        self._max_age_seconds = (
+            max_age_seconds if max_age_seconds is not None else _sdk_config.LOCAL_CACHE_MAX_AGE_SECONDS.get()
+        )
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @staticmethod
+    def key(task_name: str, cache_version: str, input_literal_map: _literal_models.LiteralMap, code: str = "") -> str:
+        """
+        The cache key for one invocation. Local blobs and schemas contribute their content rather than their URI.
+
+        :param code: the digest of the code of the task, see code_digest
+        """
+        pb = _literals_pb2.LiteralMap()
+        pb.CopyFrom(input_literal_map.to_flyte_idl())
+
+        def _canonicalize(offloaded):
+            if _is_local(offloaded.uri):
+                path = strip_file_header(offloaded.uri)
+                if _os.path.exists(path):
+                    offloaded.uri = "sha256:" + content_digest(path)
+
+        _visit_offloaded(pb, _canonicalize)
+        h = _hashlib.sha256()
+        for part in (task_name, cache_version, code):
+            h.update(part.encode("utf-8"))
+            h.update(b"\0")
+        h.update(pb.SerializeToString(deterministic=True))
+        return h.hexdigest()
+
+    def get(
+        self, task_name: str, cache_version: str, input_literal_map: _literal_models.LiteralMap, code: str = ""
+    ) -> Optional[_literal_models.LiteralMap]:
+        """
+        Returns the cached outputs, or None on a miss.
+        """
+        entry_dir = _os.path.join(self._directory, self.key(task_name, cache_version, input_literal_map, code))
+        outputs_path = _os.path.join(entry_dir, _OUTPUTS_FILE)
+        try:
+            with open(outputs_path, "rb") as fh:
+                pb = _literals_pb2.LiteralMap.FromString(fh.read())
+            _os.utime(outputs_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable local cache entry {entry_dir}: {e}")
+            _shutil.rmtree(entry_dir, ignore_errors=True)
+            return None
+        logger.info(f"Using cached outputs of {task_name}@{cache_version} from {entry_dir}")
+        return _literal_models.LiteralMap.from_flyte_idl(pb)
+
+    def set(
+        self,
+        task_name: str,
+        cache_version: str,
+        input_literal_map: _literal_models.LiteralMap,
+        outputs: _literal_models.LiteralMap,
+        code: str = "",
+    ):
+        """
+        Stores the outputs of one invocation and then evicts whatever the size and age limits require.
+        """
+        key = self.key(task_name, cache_version, input_literal_map, code)
+        _os.makedirs(self._directory, exist_ok=True)
+        tmp_dir = _tempfile.mkdtemp(prefix=".tmp-", dir=self._directory)
+        try:
+            pb = _literals_pb2.LiteralMap()
+            pb.CopyFrom(outputs.to_flyte_idl())
+            entry_dir = _os.path.join(self._directory, key)
+            size = 0
+
+            def _copy_into_entry(offloaded):
+                nonlocal size
+                if not _is_local(offloaded.uri):
+                    return
+                path = strip_file_header(offloaded.uri)
+                if not _os.path.exists(path):
+                    return
+                name = content_digest(path)
+                target = _os.path.join(tmp_dir, _BLOBS_DIR, name)
+                if not _os.path.exists(target):
+                    _os.makedirs(_os.path.dirname(target), exist_ok=True)
+                    if _os.path.isdir(path):
+                        _shutil.copytree(path, target)
+                    else:
+                        _shutil.copyfile(path, target)
+                    size += _tree_size(target)
+                offloaded.uri = _os.path.join(entry_dir, _BLOBS_DIR, name)
+
+            _visit_offloaded(pb, _copy_into_entry)
+            data = pb.SerializeToString()
+            with open(_os.path.join(tmp_dir, _OUTPUTS_FILE), "wb") as fh:
+                fh.write(data)
+            size += len(data)
+            with open(_os.path.join(tmp_dir, _META_FILE), "w") as fh:
+                _json.dump(
+                    {"task_name": task_name, "cache_version": cache_version, "created": _time.time(), "size": size}, fh
+                )
+            try:
+                _os.rename(tmp_dir, entry_dir)
+            except OSError:
+                # Another execution stored the same entry first.
+                pass
+        finally:
+            _shutil.rmtree(tmp_dir, ignore_errors=True)
+        self.evict()
+
+    def entries(self) -> List[CacheEntry]:
+        """
+        Lists every complete entry, least recently used first.
+        """
+        entries = []
+        if not _os.path.isdir(self._directory):
+            return entries
+        for name in _os.listdir(self._directory):
+            if name.startswith("."):
+                continue
+            entry_dir = _os.path.join(self._directory, name)
+            try:
+                with open(_os.path.join(entry_dir, _META_FILE)) as fh:
+                    meta = _json.load(fh)
+                last_used = _os.path.getmtime(_os.path.join(entry_dir, _OUTPUTS_FILE))
+            except (OSError, ValueError):
+                continue
+            entries.append(
+                CacheEntry(
+                    key=name,
+                    task_name=meta["task_name"],
+                    cache_version=meta["cache_version"],
+                    size=meta["size"],
+                    created=meta["created"],
+                    last_used=last_used,
+                )
+            )
+        return sorted(entries, key=lambda e: e.last_used)
+
+    def _remove(self, entry: CacheEntry):
+        _shutil.rmtree(_os.path.join(self._directory, entry.key), ignore_errors=True)
+
+    def evict(self) -> int:
+        """
+        Removes entries that exceed the age limit, then the least recently used entries until the cache fits the size
+        limit.
+
+        :return: the number of entries removed
+        """
+        entries = self.entries()
+        removed = 0
+        if self._max_age_seconds > 0:
+            cutoff = _time.time() - self._max_age_seconds
+            while entries and entries[0].last_used < cutoff:
+                self._remove(entries.pop(0))
+                removed += 1
+        if self._max_size_bytes > 0:
+            total = sum(e.size for e in entries)
+            while entries and total > self._max_size_bytes:
+                entry = entries.pop(0)
+                self._remove(entry)
+                total -= entry.size
+                removed += 1
+        return removed
+
+    def clear(self, task_name: Optional[str] = None) -> int:
+        """
+        Removes every entry, or only those of one task.
+
+        :return: the number of entries removed
+        """
+        removed = 0
+        for entry in self.entries():
+            if task_name is None or entry.task_name == task_name:
+                self._remove(entry)
+                removed += 1
+        return removed
+
+
+def _tree_size(path: str) -> int:
+    if not _os.path.isdir(path):
+        return _os.path.getsize(path)
+    return sum(_os.path.getsize(_os.path.join(root, n)) for root, _, names in _os.walk(path) for n in names)
+
+
+def get_cache() -> Optional[LocalTaskCache]:
+    """
+    Returns the cache for the current configuration, or None if local caching is disabled.
+    """
+    if not _sdk_config.LOCAL_CACHE_ENABLED.get():
+        return None
+    return LocalTaskCache()
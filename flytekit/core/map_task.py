@@ -13,6 +13,7 @@ from flytekit.core.context_manager import ExecutionState, FlyteContext, Serializ
 from flytekit.core.interface import transform_interface_to_list_interface
 from flytekit.core.python_auto_container import get_registerable_container_image
 from flytekit.core.python_function_task import PythonFunctionTask
+from flytekit.models import literals as _literal_models
 from flytekit.models.array_job import ArrayJob
 from flytekit.models.interface import Variable
 from flytekit.models.task import Container
@@ -100,6 +101,46 @@ class MapPythonTask(PythonTask):
     def run_task(self) -> PythonTask:
         return self._run_task
 
+    def dispatch_execute(
+        self, ctx: FlyteContext, input_literal_map: _literal_models.LiteralMap
+    ) -> _literal_models.LiteralMap:
+        """
+        In TASK_EXECUTION mode every array job instance is handed the full input collections but only needs its own
+        element of each. The collections are sliced here, before any type conversion, so the other elements are never
+        turned into Python values (or downloaded, for offloaded types like files and schemas) and the cost of one
+        instance does not grow with the size of the map.
+        """
+        if ctx.execution_state and ctx.execution_state.mode == ExecutionState.Mode.TASK_EXECUTION:
+            task_index = self._compute_array_job_index()
+            return self._run_task.dispatch_execute(ctx, self._select_array_job_inputs(input_literal_map, task_index))
+
+        return super().dispatch_execute(ctx, input_literal_map)
+
+    def _select_array_job_inputs(
+        self, input_literal_map: _literal_models.LiteralMap, task_index: int
+    ) -> _literal_models.LiteralMap:
+        """
+        Returns a literal map for the underlying run task, made of the element at task_index of each input collection.
+        Collections that are still protobuf views, as read by the entrypoint, are indexed in the protobuf so that only
+        the selected element is wrapped in a Literal.
+        """
+        literals = {}
+        for k in self.interface.inputs.keys():
+            collection = input_literal_map.literals[k].collection
+            if collection is None:
+                raise ValueError(f"Map task input {k} is not a collection: {input_literal_map.literals[k]}")
+            view = collection.idl_view
+            elements = view.literals if view is not None else collection.literals
+            if task_index >= len(elements):
+                raise ValueError(
+                    f"Array job index {task_index} is out of range for input {k} of length {len(elements)}"
+                )
+            if view is not None:
+                literals[k] = _literal_models.Literal.from_flyte_idl_view(elements[task_index])
+            else:
+                literals[k] = elements[task_index]
+        return _literal_models.LiteralMap(literals=literals)
+
     def execute(self, **kwargs) -> Any:
         ctx = FlyteContext.current_context()
         if ctx.execution_state and ctx.execution_state.mode == ExecutionState.Mode.TASK_EXECUTION:
@@ -2,14 +2,19 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as _datetime
+import importlib
 import json as _json
 import mimetypes
 import os
+import sys
+import threading
 import typing
 from abc import ABC, abstractmethod
 from typing import Type
 
 from dataclasses_json import DataClassJsonMixin
+from dataclasses_json import cfg as _dataclasses_json_cfg
+from flyteidl.core import literals_pb2 as _literals_pb2
 from google.protobuf import json_format as _json_format
 from google.protobuf import reflection as _proto_reflection
 from google.protobuf import struct_pb2 as _struct
@@ -19,6 +24,7 @@ from google.protobuf.struct_pb2 import Struct
 
 from flytekit.common.types import primitives as _primitives
 from flytekit.core.context_manager import FlyteContext
+from flytekit.core.lazy_download import LazyDownload, LazyFile
 from flytekit.models import interface as _interface_models
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
@@ -27,6 +33,10 @@ from flytekit.models.types import LiteralType, SimpleType
 
 T = typing.TypeVar("T")
 
+# Python types that map onto a single field of the Primitive protobuf. Lists and maps of these are converted in bulk,
+# straight to and from the protobuf, rather than element by element through the TypeEngine and the literal models.
+_PRIMITIVE_FIELDS = {int: "integer", float: "float_value", bool: "boolean", str: "string_value"}
+
 
 class TypeTransformer(typing.Generic[T]):
     """
@@ -140,6 +150,219 @@ class RestrictedType(TypeTransformer[T], ABC):
         raise RestrictedTypeError(f"Transformer for type {self.python_type} is restricted currently")
 
 
+class _Unplanned(Exception):
+    """
+    Raised for a type or a value that the direct dataclass conversion does not cover. The JSON round trip of
+    dataclasses_json then converts it instead.
+    """
+
+
+_NoneType = type(None)
+
+
+def _write_scalar(target: _struct.Value, v: typing.Any):
+    if v is None:
+        target.null_value = _struct.NULL_VALUE
+    elif v is True or v is False:
+        target.bool_value = v
+    elif isinstance(v, (int, float)):
+        target.number_value = v
+    elif isinstance(v, str):
+        target.string_value = v
+    else:
+        raise _Unplanned(type(v))
+
+
+def _scalar_reader(kind: str, cast: typing.Callable) -> typing.Callable[[_struct.Value], typing.Any]:
+    def read(value: _struct.Value):
+        which = value.WhichOneof("kind")
+        if which == kind:
+            return cast(getattr(value, kind))
+        if which == "null_value":
+            return None
+        raise _Unplanned(which)
+
+    return read
+
+
+_SCALAR_READERS = {
+    int: _scalar_reader("number_value", int),
+    float: _scalar_reader("number_value", float),
+    str: _scalar_reader("string_value", str),
+    bool: _scalar_reader("bool_value", bool),
+}
+
+
+def _list_converters(write_item, read_item):
+    def write(target: _struct.Value, v: typing.Any):
+        if v is None:
+            target.null_value = _struct.NULL_VALUE
+            return
+        if not isinstance(v, (list, tuple)):
+            raise _Unplanned(type(v))
+        values = target.list_value.values
+        target.list_value.SetInParent()
+        for x in v:
+            write_item(values.add(), x)
+
+    def read(value: _struct.Value):
+        which = value.WhichOneof("kind")
+        if which == "list_value":
+            return [read_item(x) for x in value.list_value.values]
+        if which == "null_value":
+            return None
+        raise _Unplanned(which)
+
+    return write, read
+
+
+def _dict_converters(write_item, read_item):
+    def write(target: _struct.Value, v: typing.Any):
+        if v is None:
+            target.null_value = _struct.NULL_VALUE
+            return
+        if not isinstance(v, dict):
+            raise _Unplanned(type(v))
+        fields = target.struct_value.fields
+        target.struct_value.SetInParent()
+        for k, x in v.items():
+            if not isinstance(k, str):
+                raise _Unplanned(type(k))
+            write_item(fields[k], x)
+
+    def read(value: _struct.Value):
+        which = value.WhichOneof("kind")
+        if which == "struct_value":
+            return {k: read_item(x) for k, x in value.struct_value.fields.items()}
+        if which == "null_value":
+            return None
+        raise _Unplanned(which)
+
+    return write, read
+
+
+def _write_dataclass(target: _struct.Value, v: typing.Any):
+    if v is None:
+        target.null_value = _struct.NULL_VALUE
+        return
+    plan = _dataclass_plan(type(v))
+    if plan is None:
+        raise _Unplanned(type(v))
+    target.struct_value.SetInParent()
+    plan.write(target.struct_value, v)
+
+
+def _dataclass_reader(t: Type) -> typing.Callable[[_struct.Value], typing.Any]:
+    def read(value: _struct.Value):
+        which = value.WhichOneof("kind")
+        if which == "struct_value":
+            # Looked up on use rather than when the plan is made, so that a dataclass can refer to itself.
+            plan = _dataclass_plan(t)
+            if plan is None:
+                raise _Unplanned(t)
+            return plan.read(value.struct_value)
+        if which == "null_value":
+            return None
+        raise _Unplanned(which)
+
+    return read
+
+
+def _value_converters(t: Type):
+    """
+    Returns the functions that write a python value of type t into a protobuf Value, and read it back.
+    """
+    if t in _SCALAR_READERS:
+        return _write_scalar, _SCALAR_READERS[t]
+    origin, args = getattr(t, "__origin__", None), getattr(t, "__args__", ())
+    if origin is typing.Union and len(args) == 2 and _NoneType in args:
+        # Every converter takes None for a null.
+        return _value_converters(args[0] if args[1] is _NoneType else args[1])
+    if origin is list:
+        return _list_converters(*_value_converters(args[0]))
+    if origin is dict and args[0] is str:
+        return _dict_converters(*_value_converters(args[1]))
+    if isinstance(t, type) and dataclasses.is_dataclass(t):
+        return _write_dataclass, _dataclass_reader(t)
+    raise _Unplanned(t)
+
+
+def _uses_default_json(t: Type) -> bool:
+    """
+    Whether dataclasses_json converts t without any customization, which the direct conversion could not honor.
+    """
+    if getattr(t, "dataclass_json_config", None):
+        return False
+    if isinstance(t, type) and issubclass(t, DataClassJsonMixin):
+        for name in ("to_json", "to_dict", "from_json", "from_dict"):
+            method, default = getattr(t, name), getattr(DataClassJsonMixin, name)
+            if getattr(method, "__func__", method) is not getattr(default, "__func__", default):
+                return False
+    return True
+
+
+class _DataclassPlan(object):
+    """
+    Converts one dataclass straight to and from the Struct that the JSON round trip of dataclasses_json produces, with
+    a writer and a reader per field chosen once from the type of the field. Unlike that round trip, which leaves every
+    number a float, int fields read back as ints at any depth.
+    """
+
+    def __init__(self, t: Type):
+        hints = typing.get_type_hints(t)
+        self._type = t
+        self._fields = []
+        self._required = []
+        for f in dataclasses.fields(t):
+            if not f.init or f.metadata.get("dataclasses_json"):
+                raise _Unplanned(f.name)
+            write, read = _value_converters(hints[f.name])
+            self._fields.append((f.name, write, read))
+            if f.default is dataclasses.MISSING and f.default_factory is dataclasses.MISSING:
+                self._required.append(f.name)
+
+    def write(self, struct: Struct, v: typing.Any):
+        fields = struct.fields
+        for name, write, _ in self._fields:
+            write(fields[name], getattr(v, name))
+
+    def read(self, struct: Struct) -> typing.Any:
+        fields = struct.fields
+        kwargs = {}
+        for name, _, read in self._fields:
+            if name in fields:
+                kwargs[name] = read(fields[name])
+        if len(kwargs) < len(self._fields) and any(name not in kwargs for name in self._required):
+            raise _Unplanned(self._type)
+        # Fields that are not in the struct get their defaults.
+        return self._type(**kwargs)
+
+
+_DATACLASS_PLANS: typing.Dict[Type, typing.Optional[_DataclassPlan]] = {}
+
+
+def _dataclass_plan(t: Type) -> typing.Optional[_DataclassPlan]:
+    """
+    Returns the plan of t, made the first time it is asked for, or None if t has to go through the JSON round trip.
+    """
+    try:
+        return _DATACLASS_PLANS[t]
+    except KeyError:
+        pass
+    try:
+        plan = _DataclassPlan(t) if _uses_default_json(t) else None
+    except (_Unplanned, NameError, TypeError):
+        plan = None
+    _DATACLASS_PLANS[t] = plan
+    return plan
+
+
+def _customized_json() -> bool:
+    # Encoders and decoders registered with dataclasses_json for a type apply to every dataclass field of that type.
+    config = _dataclasses_json_cfg.global_config
+    return bool(config.encoders or config.decoders or config.mm_fields)
+
+
 class DataclassTransformer(TypeTransformer[object]):
     def __init__(self):
         super().__init__("Object-Dataclass-Transformer", object)
@@ -161,6 +384,14 @@ class DataclassTransformer(TypeTransformer[object]):
             raise AssertionError(
                 f"Dataclass {python_type} should be decorated with @dataclass_json to be " f"serialized correctly"
             )
+        plan = None if _customized_json() else _dataclass_plan(type(python_val))
+        if plan is not None:
+            struct = _struct.Struct()
+            try:
+                plan.write(struct, python_val)
+                return Literal(scalar=Scalar(generic=struct))
+            except _Unplanned:
+                pass
         return Literal(scalar=Scalar(generic=_json_format.Parse(python_val.to_json(), _struct.Struct())))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
@@ -174,6 +405,12 @@ class DataclassTransformer(TypeTransformer[object]):
                 f"Dataclass {expected_python_type} should be decorated with @dataclass_json to be "
                 f"serialized correctly"
             )
+        plan = None if _customized_json() else _dataclass_plan(expected_python_type)
+        if plan is not None:
+            try:
+                return plan.read(lv.scalar.generic)
+            except (_Unplanned, ValueError, OverflowError):
+                pass
         dc = expected_python_type.from_json(_json_format.MessageToJson(lv.scalar.generic))
         # NOTE: Protobuf Struct does not support explicit int types, int types are upconverted to a double value
         # https://developers.google.com/protocol-buffers/docs/reference/google.protobuf#google.protobuf.Value
@@ -221,6 +458,14 @@ class TypeEngine(typing.Generic[T]):
 
     _REGISTRY: typing.Dict[type, TypeTransformer[T]] = {}
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()
+    # Memoized results of get_transformer, keyed by the python type that was asked for. The resolution is a pure
+    # function of the registry, so the cache only has to be dropped when a transformer is registered.
+    _RESOLVED: typing.Dict[Type, TypeTransformer[T]] = {}
+    # Modules that register transformers but are too expensive to import up front, by the top-level package of the
+    # python types they handle. See register_deferred.
+    _DEFERRED: typing.Dict[str, str] = {}
+    # Held while a deferred module is imported, so that other threads wait for its transformers to be registered.
+    _DEFERRED_LOCK = threading.RLock()
 
     @classmethod
     def register(cls, transformer: TypeTransformer):
@@ -234,9 +479,57 @@ class TypeEngine(typing.Generic[T]):
                 f" Cannot override with {transformer.name}"
             )
         cls._REGISTRY[transformer.python_type] = transformer
+        cls._RESOLVED.clear()
+
+    @classmethod
+    def register_deferred(cls, package: str, module: str):
+        """
+        Defers importing a module that registers transformers until a type from the given top-level package is first
+        looked up, e.g. the pandas transformer until a task uses a ``pandas.DataFrame``. This keeps importing flytekit
+        cheap for tasks that never use those types. Types defined elsewhere, like a subclass of ``pandas.DataFrame``
+        in user code, load every deferred module once no registered transformer matches them.
+        """
+        cls._DEFERRED[package] = module
+
+    @classmethod
+    def _load_deferred(cls, package: str) -> bool:
+        """
+        Imports the module deferred for the package, if any, and returns whether it did. The entry is only dropped
+        once the import has succeeded, i.e. once its transformers are registered.
+        """
+        if package not in cls._DEFERRED:
+            return False
+        with cls._DEFERRED_LOCK:
+            module = cls._DEFERRED.get(package)
+            if module is None:
+                return False
+            importlib.import_module(module)
+            cls._DEFERRED.pop(package, None)
+            return True
+
+    @classmethod
+    def _load_all_deferred(cls) -> bool:
+        loaded = False
+        for package in list(cls._DEFERRED):
+            loaded = cls._load_deferred(package) or loaded
+        return loaded
 
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
+        try:
+            return cls._RESOLVED[python_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # Not hashable, so it cannot be memoized.
+            return cls._resolve_transformer(python_type)
+        transformer = cls._resolve_transformer(python_type)
+        cls._RESOLVED[python_type] = transformer
+        return transformer
+
+    @classmethod
+    def _resolve_transformer(cls, python_type: Type) -> TypeTransformer[T]:
+        cls._load_deferred((getattr(python_type, "__module__", None) or "").partition(".")[0])
         if python_type in cls._REGISTRY:
             return cls._REGISTRY[python_type]
         if hasattr(python_type, "__origin__"):
@@ -253,6 +546,8 @@ class TypeEngine(typing.Generic[T]):
                 continue  # None is actually one of the keys, but isinstance/issubclass doesn't work on it
             if isinstance(python_type, base_type) or issubclass(python_type, base_type):
                 return cls._REGISTRY[base_type]
+        if cls._load_all_deferred():
+            return cls._resolve_transformer(python_type)
         raise ValueError(f"Type {python_type} not supported currently in Flytekit. Please register a new transformer")
 
     @classmethod
@@ -301,6 +596,7 @@ class TypeEngine(typing.Generic[T]):
         """
         Returns all python types for which transformers are available
         """
+        cls._load_all_deferred()
         return cls._REGISTRY.keys()
 
 
@@ -334,13 +630,96 @@ class ListTransformer(TypeTransformer[T]):
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         t = self.get_sub_type(python_type)
+        if t in _PRIMITIVE_FIELDS:
+            lv = _primitive_collection_to_literal(python_val, _PRIMITIVE_FIELDS[t])
+            if lv is not None:
+                return lv
         lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> T:
         st = self.get_sub_type(expected_python_type)
+        if st in _PRIMITIVE_FIELDS and lv.collection.idl_view is not None:
+            values = _primitive_values(lv.collection.idl_view.literals, _PRIMITIVE_FIELDS[st])
+            if values is not None:
+                return values
         return [TypeEngine.to_python_value(ctx, x, st) for x in lv.collection.literals]
 
+    def to_numpy_array(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]):
+        """
+        Same as to_python_value, but returns a one dimensional numpy array. Requires numpy to be installed.
+        """
+        import numpy as np
+
+        return np.array(self.to_python_value(ctx, lv, expected_python_type))
+
+
+def _is_numpy_array(v: typing.Any) -> bool:
+    # If numpy was never imported, v cannot be an array, and there is no need to pay for importing it here.
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(v, np.ndarray)
+
+
+def _primitive_collection_to_literal(values: typing.Iterable, field: str) -> typing.Optional[Literal]:
+    """
+    Builds the LiteralCollection protobuf for a list (or a one dimensional numpy array) of primitives directly. Returns
+    None if an element does not fit the primitive field, so that the regular path can handle it and report errors.
+    """
+    if _is_numpy_array(values):
+        values = values.tolist()
+    pb = _literals_pb2.LiteralCollection()
+    add = pb.literals.add
+    try:
+        for v in values:
+            setattr(add().scalar.primitive, field, v)
+    except (TypeError, ValueError):
+        return None
+    return Literal(collection=LiteralCollection.from_flyte_idl_view(pb))
+
+
+def _primitive_map_to_literal(values: dict, field: str) -> typing.Optional[Literal]:
+    """
+    Map counterpart of _primitive_collection_to_literal.
+    """
+    pb = _literals_pb2.LiteralMap()
+    literals = pb.literals
+    try:
+        for k, v in values.items():
+            if not isinstance(k, str):
+                raise ValueError("Flyte MapType expects all keys to be strings")
+            setattr(literals[k].scalar.primitive, field, v)
+    except TypeError:
+        return None
+    return Literal(map=LiteralMap.from_flyte_idl_view(pb))
+
+
+def _primitive_values(literals: typing.Iterable, field: str) -> typing.Optional[typing.List]:
+    """
+    Reads the given primitive field out of a sequence of Literal protobufs. Returns None as soon as one of them holds
+    something else, in which case the regular conversion (which e.g. accepts integers for floats) has to be used.
+    """
+    values = []
+    append = values.append
+    for lit in literals:
+        primitive = lit.scalar.primitive
+        if primitive.WhichOneof("value") != field:
+            return None
+        append(getattr(primitive, field))
+    return values
+
+
+def _primitive_value_map(literals: typing.Mapping, field: str) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """
+    Map counterpart of _primitive_values.
+    """
+    values = {}
+    for k, lit in literals.items():
+        primitive = lit.scalar.primitive
+        if primitive.WhichOneof("value") != field:
+            return None
+        values[k] = getattr(primitive, field)
+    return values
+
 
 class DictTransformer(TypeTransformer[dict]):
     """
@@ -382,16 +761,22 @@ class DictTransformer(TypeTransformer[dict]):
         if expected and expected.simple and expected.simple == SimpleType.STRUCT:
             return self.dict_to_generic_literal(python_val)
 
+        k_type, v_type = self.get_dict_types(python_type)
+        if v_type in _PRIMITIVE_FIELDS:
+            lv = _primitive_map_to_literal(python_val, _PRIMITIVE_FIELDS[v_type])
+            if lv is not None:
+                return lv
+
         lit_map = {}
         for k, v in python_val.items():
-            if type(k) != str:
+            if not isinstance(k, str):
                 raise ValueError("Flyte MapType expects all keys to be strings")
-            k_type, v_type = self.get_dict_types(python_type)
             lit_map[k] = TypeEngine.to_literal(ctx, v, v_type, expected.map_value_type)
         return Literal(map=LiteralMap(literals=lit_map))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[dict]) -> dict:
-        if lv and lv.map and lv.map.literals:
+        # Peek at the protobuf of a map that was never unpacked, so that it does not get unpacked just for this check.
+        if lv and lv.map and (lv.map.idl_view.literals if lv.map.idl_view is not None else lv.map.literals):
             tp = self.get_dict_types(expected_python_type)
             if tp is None or tp[0] is None:
                 raise TypeError(
@@ -401,6 +786,10 @@ class DictTransformer(TypeTransformer[dict]):
                 )
             if tp[0] != str:
                 raise TypeError("TypeMismatch. Destination dictionary does not accept 'str' key")
+            if tp[1] in _PRIMITIVE_FIELDS and lv.map.idl_view is not None:
+                values = _primitive_value_map(lv.map.idl_view.literals, _PRIMITIVE_FIELDS[tp[1]])
+                if values is not None:
+                    return values
             py_map = {}
             for k, v in lv.map.literals.items():
                 py_map[k] = TypeEngine.to_python_value(ctx, v, tp[1])
@@ -440,11 +829,10 @@ class TextIOTransformer(TypeTransformer[typing.TextIO]):
     def to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[typing.TextIO]
     ) -> typing.TextIO:
-        # TODO rename to get_auto_local_path()
-        local_path = ctx.file_access.get_random_local_path()
-        ctx.file_access.get_data(lv.scalar.blob.uri, local_path, is_multipart=False)
+        # The file is only fetched once the task reads from it.
+        download = LazyDownload(ctx.file_access, lv.scalar.blob.uri, ctx.file_access.get_random_local_path())
         # TODO it is probably the responsibility of the framework to close() this
-        return open(local_path, "r")
+        return LazyFile(download, "r")
 
 
 class BinaryIOTransformer(TypeTransformer[typing.BinaryIO]):
@@ -474,10 +862,9 @@ class BinaryIOTransformer(TypeTransformer[typing.BinaryIO]):
     def to_python_value(
         self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[typing.BinaryIO]
     ) -> typing.BinaryIO:
-        local_path = ctx.file_access.get_random_local_path()
-        ctx.file_access.get_data(lv.scalar.blob.uri, local_path, is_multipart=False)
+        download = LazyDownload(ctx.file_access, lv.scalar.blob.uri, ctx.file_access.get_random_local_path())
         # TODO it is probability the responsibility of the framework to close this
-        return open(local_path, "rb")
+        return LazyFile(download, "rb")
 
 
 class PathLikeTransformer(TypeTransformer[os.PathLike]):
@@ -524,15 +911,17 @@ class PathLikeTransformer(TypeTransformer[os.PathLike]):
         if not ctx.file_access.is_remote(uri):
             return uri
 
-        # Since no delayed downloading is possible with strings, always download immediately.
+        # Since no delayed downloading is possible with strings, always download immediately. A str is returned either
+        # way, and open() does not consult __fspath__ for a str or a subclass of it. Inputs that the entrypoint
+        # prefetched are moved into place rather than downloaded again.
         ctx.file_access.get_data(lv.scalar.blob.uri, local_destination_path, is_multipart=False)
         return local_destination_path
 
 
 def _check_and_covert_float(lv: Literal) -> float:
-    if lv.scalar.primitive.float_value:
+    if lv.scalar.primitive.float_value is not None:
         return lv.scalar.primitive.float_value
-    elif lv.scalar.primitive.integer:
+    elif lv.scalar.primitive.integer is not None:
         return float(lv.scalar.primitive.integer)
     raise RuntimeError(f"Cannot convert literal {lv} to float")
 
@@ -625,5 +1014,6 @@ def _register_default_type_transformers():
 
 
 _register_default_type_transformers()
+TypeEngine.register_deferred("pandas", "flytekit.types.schema")
 
 TypeEngine.register(ProtobufTransformer())
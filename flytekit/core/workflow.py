@@ -2,14 +2,16 @@ from __future__ import annotations
 
 import collections
 import inspect
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from flytekit.common import constants as _common_constants
 from flytekit.common.exceptions.user import FlyteValidationException, FlyteValueException
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.class_based_resolver import ClassStorageTaskResolver
-from flytekit.core.condition import ConditionalSection
+from flytekit.core.condition import BranchNode, ConditionalSection
 from flytekit.core.context_manager import BranchEvalMode, CompilationState, ExecutionState, FlyteContext, FlyteEntities
 from flytekit.core.interface import (
     Interface,
@@ -147,6 +149,36 @@ def get_promise_map(
     return entity_kwargs
 
 
+def _binding_data_nodes(binding_data: _literal_models.BindingData) -> List[Node]:
+    """
+    Returns the nodes whose outputs the binding reads, looking inside binding collections and maps.
+    """
+    if binding_data.promise is not None:
+        return [binding_data.promise.node]
+    elif binding_data.collection is not None:
+        return [n for bd in binding_data.collection.bindings for n in _binding_data_nodes(bd)]
+    elif binding_data.map is not None:
+        return [n for bd in binding_data.map.bindings.values() for n in _binding_data_nodes(bd)]
+    return []
+
+
+def get_node_dependencies(nodes: List[Node]) -> Dict[Node, List[Node]]:
+    """
+    Maps each node to the nodes in the given list that have to complete before it can run. These are the node's
+    explicit upstream nodes (see Node.runs_before) plus every node whose outputs one of its bindings consumes. Nodes
+    outside the list, such as the global start node, are left out.
+    """
+    in_scope = set(nodes)
+    dependencies = {}
+    for node in nodes:
+        upstream = list(node.upstream_nodes)
+        for b in node.bindings:
+            upstream.extend(_binding_data_nodes(b.binding))
+        # dict.fromkeys de-duplicates while keeping the order stable
+        dependencies[node] = [n for n in dict.fromkeys(upstream) if n in in_scope and n is not node]
+    return dependencies
+
+
 class WorkflowBase(object):
     def __init__(
         self,
@@ -348,6 +380,140 @@ class WorkflowBase(object):
 
         return create_task_output(new_promises, self.python_interface)
 
+    def _execute_graph(
+        self, inputs: Dict[str, Promise], concurrency: int
+    ) -> Union[Tuple[Promise], Promise, VoidPromise]:
+        """
+        Runs the workflow's nodes locally, taking the place of propeller: every node is called with the promises its
+        bindings resolve to, and once all nodes have run the workflow's output bindings are resolved the same way.
+
+        :param inputs: the workflow inputs, all of them Promise objects
+        :param concurrency: with 1, nodes run one after the other in the order they were declared. With more, up to
+            that many nodes whose upstream nodes have completed run at the same time on a thread pool.
+        """
+        # Create a map that holds the outputs of each node, starting with the outputs of the global input node, i.e.
+        # the inputs to the workflow.
+        intermediate_node_outputs = {GLOBAL_START_NODE: dict(inputs)}  # type: Dict[Node, Dict[str, Promise]]
+        if concurrency > 1:
+            self._execute_nodes_concurrently(intermediate_node_outputs, concurrency)
+        else:
+            for node in self.nodes:
+                entity_kwargs = get_promise_map(node.bindings, intermediate_node_outputs)
+                intermediate_node_outputs[node] = self._call_node_entity(node, entity_kwargs)
+
+        # The rest of this function looks like _call_node_entity but now we're doing it for the workflow as a whole
+        # rather than just one node at a time.
+        if len(self.python_interface.outputs) == 0:
+            return VoidPromise(self.name)
+
+        # The values that we return below from the output have to be pulled by fulfilling all of the
+        # workflow's output bindings.
+        # The return style here has to match what 1) what the workflow would've returned had it been declared
+        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
+        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
+        # if it's a single element then we return a single element
+        if len(self.output_bindings) == 1:
+            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
+            # named tuple
+            if self.python_interface.output_tuple_name:
+                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
+            # Just a normal single element
+            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
+        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+
+    def _execute_nodes_concurrently(self, intermediate_node_outputs: Dict[Node, Dict[str, Promise]], concurrency: int):
+        """
+        Schedules every node as soon as all of its dependencies (see get_node_dependencies) have produced outputs.
+        Inputs are resolved and outputs recorded on the calling thread only, so the output map is never shared with
+        the workers.
+
+        Errors are reported deterministically: after the first failure no new nodes are started, the running ones are
+        allowed to finish, and the error of the failed node that was declared first is raised.
+        """
+        nodes = self.nodes
+        order = {node: i for i, node in enumerate(nodes)}
+        waiting_on = {node: set(upstream) for node, upstream in get_node_dependencies(nodes).items()}
+        downstream = {node: [] for node in nodes}
+        for node, upstream in waiting_on.items():
+            for u in upstream:
+                downstream[u].append(node)
+
+        snapshot = FlyteContext.snapshot()
+        ready = [n for n in nodes if not waiting_on[n]]
+        running = {}
+        failures = {}
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{self.short_name}-node") as executor:
+            while ready or running:
+                if not failures:
+                    for node in sorted(ready, key=order.get):
+                        entity_kwargs = get_promise_map(node.bindings, intermediate_node_outputs)
+                        future = executor.submit(self._call_node_entity_in_thread, snapshot, node, entity_kwargs)
+                        running[future] = node
+                ready = []
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: order[running[f]]):
+                    node = running.pop(future)
+                    if future.exception() is not None:
+                        failures[node] = future.exception()
+                        continue
+                    intermediate_node_outputs[node] = future.result()
+                    for d in downstream[node]:
+                        waiting_on[d].discard(node)
+                        if not waiting_on[d]:
+                            ready.append(d)
+
+        if failures:
+            first = min(failures, key=order.get)
+            for node, e in failures.items():
+                if node is not first:
+                    logger.error(f"Node {node.id} of workflow {self.name} also failed: {e}")
+            raise failures[first]
+        not_run = [n.id for n in nodes if n not in intermediate_node_outputs]
+        if not_run:
+            raise FlyteValidationException(f"Nodes {not_run} of workflow {self.name} depend on each other in a cycle")
+
+    @staticmethod
+    def _call_node_entity_in_thread(
+        snapshot: Tuple[FlyteContext, ...], node: Node, entity_kwargs: Dict[str, Promise]
+    ) -> Dict[str, Promise]:
+        with FlyteContext.restore(snapshot) as ctx:
+            # Each node gets an execution state of its own, so that e.g. a conditional evaluated inside one
+            # sub-workflow cannot mark nodes that run at the same time as skipped.
+            with ctx.new_execution_context(
+                mode=ctx.execution_state.mode,
+                execution_params=ctx.user_space_params,
+                working_dir=ctx.execution_state.working_dir,
+            ):
+                return WorkflowBase._call_node_entity(node, entity_kwargs)
+
+    @staticmethod
+    def _call_node_entity(node: Node, entity_kwargs: Dict[str, Promise]) -> Dict[str, Promise]:
+        """
+        Calls the node's entity with the already resolved input promises and returns its outputs by output name.
+        """
+        entity = node.flyte_entity
+        results = entity(**entity_kwargs)
+        expected_output_names = list(entity.python_interface.outputs.keys())
+
+        if isinstance(results, VoidPromise) or results is None:
+            return {}  # Move along, nothing to assign
+
+        # Because we should've already returned in the above check, we just raise an Exception here.
+        if len(entity.python_interface.outputs) == 0:
+            raise FlyteValueException(results, f"{results} received but should've been VoidPromise or None.")
+
+        # if there's only one output,
+        if len(expected_output_names) == 1:
+            if entity.python_interface.output_tuple_name and isinstance(results, tuple):
+                return {expected_output_names[0]: results[0]}
+            return {expected_output_names[0]: results}
+
+        if len(results) != len(expected_output_names):
+            raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
+        return {expected_output_names[idx]: r for idx, r in enumerate(results)}
+
 
 class ImperativeWorkflow(WorkflowBase):
     def __init__(
@@ -400,71 +566,13 @@ class ImperativeWorkflow(WorkflowBase):
         start things off, filled in only with the workflow inputs (if any). As things are run, their outputs are stored
         in this map.
         After all nodes are run, we fill in workflow level outputs the same way as any other previous node.
+        With ``sdk.local_workflow_concurrency`` above 1, nodes whose inputs are available run concurrently instead.
         """
         if not self.ready():
             raise FlyteValidationException(f"Workflow not ready, wf is currently {self}")
 
-        # Create a map that holds the outputs of each node.
-        intermediate_node_outputs = {GLOBAL_START_NODE: {}}  # type: Dict[Node, Dict[str, Promise]]
-
-        # Start things off with the outputs of the global input node, i.e. the inputs to the workflow.
         # _local_execute should've already ensured that all the values in kwargs are Promise objects
-        for k, v in kwargs.items():
-            intermediate_node_outputs[GLOBAL_START_NODE][k] = v
-
-        # Next iterate through the nodes in order.
-        for node in self.compilation_state.nodes:
-            if node not in intermediate_node_outputs.keys():
-                intermediate_node_outputs[node] = {}
-
-            # Retrieve the entity from the node, and call it by looking up the promises the node's bindings require,
-            # and then fill them in using the node output tracker map we have.
-            entity = node.flyte_entity
-            entity_kwargs = get_promise_map(node.bindings, intermediate_node_outputs)
-
-            # Handle the calling and outputs of each node's entity
-            results = entity(**entity_kwargs)
-            expected_output_names = list(entity.python_interface.outputs.keys())
-
-            if isinstance(results, VoidPromise) or results is None:
-                continue  # pragma: no cover # Move along, nothing to assign
-
-            # Because we should've already returned in the above check, we just raise an Exception here.
-            if len(entity.python_interface.outputs) == 0:
-                raise FlyteValueException(results, f"{results} received but should've been VoidPromise or None.")
-
-            # if there's only one output,
-            if len(expected_output_names) == 1:
-                if entity.python_interface.output_tuple_name and isinstance(results, tuple):
-                    intermediate_node_outputs[node][expected_output_names[0]] = results[0]
-                else:
-                    intermediate_node_outputs[node][expected_output_names[0]] = results
-
-            else:
-                if len(results) != len(expected_output_names):
-                    raise FlyteValueException(results, f"Different lengths {results} {expected_output_names}")
-                for idx, r in enumerate(results):
-                    intermediate_node_outputs[node][expected_output_names[idx]] = r
-
-        # The rest of this function looks like the above but now we're doing it for the workflow as a whole rather
-        # than just one node at a time.
-        if len(self.python_interface.outputs) == 0:
-            return VoidPromise(self.name)
-
-        # The values that we return below from the output have to be pulled by fulfilling all of the
-        # workflow's output bindings.
-        # The return style here has to match what 1) what the workflow would've returned had it been declared
-        # functionally, and 2) what a user would return in mock function. That is, if it's a tuple, then it
-        # should be a tuple here, if it's a one element named tuple, then we do a one-element non-named tuple,
-        # if it's a single element then we return a single element
-        if len(self.output_bindings) == 1:
-            # Again use presence of output_tuple_name to understand that we're dealing with a one-element
-            # named tuple
-            if self.python_interface.output_tuple_name:
-                return (get_promise(self.output_bindings[0].binding, intermediate_node_outputs),)
-            # Just a normal single element
-            return get_promise(self.output_bindings[0].binding, intermediate_node_outputs)
-        return tuple([get_promise(b.binding, intermediate_node_outputs) for b in self.output_bindings])
+        return self._execute_graph(kwargs, _sdk_config.LOCAL_WORKFLOW_CONCURRENCY.get())
 
     def add_entity(self, entity: PythonAutoContainerTask, **kwargs) -> Node:
         """
@@ -673,8 +781,22 @@ class PythonFunctionWorkflow(WorkflowBase, ClassStorageTaskResolver):
         This function is here only to try to streamline the pattern between workflows and tasks. Since tasks
         call execute from dispatch_execute which is in _local_execute, workflows should also call an execute inside
         _local_execute. This makes mocking cleaner.
+
+        If ``sdk.local_workflow_concurrency`` is above 1, the compiled nodes are run as a graph instead of running the
+        function, so that independent nodes can execute at the same time. Workflows with conditionals are always run
+        through the function, as the branch to take is only known while it runs.
         """
-        return self._workflow_function(**kwargs)
+        concurrency = _sdk_config.LOCAL_WORKFLOW_CONCURRENCY.get()
+        if concurrency <= 1 or any(isinstance(n.flyte_entity, BranchNode) for n in self.nodes):
+            return self._workflow_function(**kwargs)
+
+        # The function would have filled in the defaults for inputs that were not passed.
+        ctx = FlyteContext.current_context()
+        for k, v in self.python_interface.default_inputs_as_kwargs.items():
+            if k not in kwargs:
+                lt = self.interface.inputs[k].type
+                kwargs[k] = Promise(var=k, val=TypeEngine.to_literal(ctx, v, self.python_interface.inputs[k], lt))
+        return self._execute_graph(kwargs, concurrency)
 
 
 def workflow(
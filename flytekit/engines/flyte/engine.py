@@ -8,7 +8,6 @@ from deprecated import deprecated as _deprecated
 from flyteidl.core import literals_pb2 as _literals_pb2
 
 import flytekit
-from flytekit.clients.friendly import SynchronousFlyteClient as _SynchronousFlyteClient
 from flytekit.clients.helpers import iterate_node_executions as _iterate_node_executions
 from flytekit.clients.helpers import iterate_task_executions as _iterate_task_executions
 from flytekit.common import constants as _constants
@@ -39,6 +38,9 @@ class _FlyteClientManager(object):
         # TODO: React to changing configs.  For now this is frozen for the lifetime of the process, which covers most
         # TODO: use cases.
         if type(self)._CLIENT is None:
+            # Imported here, since the admin client pulls in grpc and the auth flows which most processes never need.
+            from flytekit.clients.friendly import SynchronousFlyteClient as _SynchronousFlyteClient
+
             c = _SynchronousFlyteClient(*args, **kwargs)
             type(self)._CLIENT = c
 
@@ -52,7 +54,7 @@ class _FlyteClientManager(object):
 
 # This is a simple helper function that ties the client together with the configuration construct.
 # This will be refactored away when we move to a heavier context object.
-def get_client() -> _SynchronousFlyteClient:
+def get_client() -> "flytekit.clients.friendly.SynchronousFlyteClient":
     return _FlyteClientManager(_platform_config.URL.get(), insecure=_platform_config.INSECURE.get()).client
 
 
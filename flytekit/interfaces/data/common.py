@@ -1,4 +1,8 @@
 import abc as _abc
+import os as _os
+import shutil as _shutil
+import tempfile as _tempfile
+from contextlib import contextmanager as _contextmanager
 
 
 class DataProxy(object, metaclass=_abc.ABCMeta):
@@ -23,6 +27,24 @@ class DataProxy(object, metaclass=_abc.ABCMeta):
         """
         pass
 
+    @_contextmanager
+    def open_read(self, remote_path):
+        """
+        Yields a binary file object that reads the data at remote_path. Proxies that cannot stream it download it to a
+        temporary file first.
+
+        :param Text remote_path:
+        :rtype: typing.Iterator[typing.BinaryIO]
+        """
+        tmp_dir = _tempfile.mkdtemp(prefix="flyte-read-")
+        try:
+            local_path = _os.path.join(tmp_dir, _os.path.basename(remote_path.rstrip("/")) or "data")
+            self.download(remote_path, local_path)
+            with open(local_path, "rb") as fh:
+                yield fh
+        finally:
+            _shutil.rmtree(tmp_dir, ignore_errors=True)
+
     def upload(self, file_path, to_path):
         """
         :param Text file_path:
@@ -1,7 +1,12 @@
+import contextvars
 import datetime
 import os
 import pathlib
-from typing import Optional, Union
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 from flytekit.common import constants as _constants
 from flytekit.common import utils as _common_utils
@@ -14,43 +19,85 @@ from flytekit.interfaces.data.local import local_file_proxy as _local_file_proxy
 from flytekit.interfaces.data.s3 import s3proxy as _s3proxy
 from flytekit.loggers import logger
 
+_POOL: Optional[ThreadPoolExecutor] = None
+_POOL_LOCK = threading.Lock()
+# The uploads started by put_data inside FileAccessProvider.background_uploads. Each thread and asyncio task has its own.
+_BACKGROUND_UPLOADS = contextvars.ContextVar("background_uploads", default=None)
+
+
+def _background_pool() -> ThreadPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = ThreadPoolExecutor(
+                    max_workers=max(1, _sdk_config.DATA_TRANSFER_CONCURRENCY.get()), thread_name_prefix="flyte-io"
+                )
+    return _POOL
+
+
+def _move_into(source: str, destination: str):
+    """
+    Moves a downloaded file or directory to where it was asked for. Directories are merged into an existing one.
+    """
+    if os.path.isdir(source) and os.path.isdir(destination):
+        for name in os.listdir(source):
+            target = os.path.join(destination, name)
+            if os.path.isdir(target) and not os.path.islink(target):
+                _move_into(os.path.join(source, name), target)
+                continue
+            if os.path.lexists(target):
+                os.remove(target)
+            shutil.move(os.path.join(source, name), target)
+        os.rmdir(source)
+        return
+    parent = os.path.dirname(destination)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+    shutil.move(source, destination)
+
 
 class LocalWorkingDirectoryContext(object):
-    _CONTEXTS = []
+    # Entered directories, innermost last. Kept in a context variable so that each thread and asyncio task has its own.
+    _CONTEXTS = contextvars.ContextVar("local_working_directories", default=())
 
     def __init__(self, directory):
         self._directory = directory
 
     def __enter__(self):
-        self._CONTEXTS.append(self._directory)
+        self._CONTEXTS.set(self._CONTEXTS.get() + (self._directory,))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._CONTEXTS.pop()
+        self._CONTEXTS.set(self._CONTEXTS.get()[:-1])
 
     @classmethod
     def get(cls):
-        return cls._CONTEXTS[-1] if cls._CONTEXTS else None
+        contexts = cls._CONTEXTS.get()
+        return contexts[-1] if contexts else None
 
 
 class _OutputDataContext(object):
-    _CONTEXTS = [_local_file_proxy.LocalFileProxy(_sdk_config.LOCAL_SANDBOX.get())]
+    _DEFAULT = _local_file_proxy.LocalFileProxy(_sdk_config.LOCAL_SANDBOX.get())
+    # Entered proxies on top of the default one, innermost last. Each thread and asyncio task has its own stack.
+    _CONTEXTS = contextvars.ContextVar("output_data_contexts", default=())
 
     def __init__(self, context):
         self._context = context
 
     def __enter__(self):
-        self._CONTEXTS.append(self._context)
+        self._CONTEXTS.set(self._CONTEXTS.get() + (self._context,))
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._CONTEXTS.pop()
+        self._CONTEXTS.set(self._CONTEXTS.get()[:-1])
 
     @classmethod
     def get_active_proxy(cls):
-        return cls._CONTEXTS[-1]
+        contexts = cls._CONTEXTS.get()
+        return contexts[-1] if contexts else cls._DEFAULT
 
     @classmethod
     def get_default_proxy(cls):
-        return cls._CONTEXTS[0]
+        return cls._DEFAULT
 
 
 class LocalDataContext(_OutputDataContext):
@@ -138,6 +185,19 @@ class Data(object):
                 )
             )
 
+    @classmethod
+    @contextmanager
+    def open_data(cls, remote_path):
+        """
+        Yields a binary file object to read the data at remote_path from, which streams it where the proxy can.
+
+        :param Text remote_path:
+        :rtype: typing.Iterator[typing.BinaryIO]
+        """
+        with _common_utils.PerformanceTimer("Reading {}".format(remote_path)):
+            with cls._load_data_proxy_by_path(remote_path).open_read(remote_path) as fh:
+                yield fh
+
     @classmethod
     def put_data(cls, local_path, remote_path, is_multipart=False):
         """
@@ -208,6 +268,9 @@ class FileAccessProvider(object):
         # HTTP access
         self._http_proxy = _http_data_proxy.HttpFileProxy()
 
+        self._prefetched: Dict[Tuple[str, bool], Future] = {}
+        self._prefetch_lock = threading.Lock()
+
     @staticmethod
     def is_remote(path: Union[str, os.PathLike]) -> bool:
         if path.startswith("s3:/") or path.startswith("gs:/") or path.startswith("file:/") or path.startswith("http"):
@@ -301,11 +364,59 @@ class FileAccessProvider(object):
         """
         return self._get_data_proxy_by_path(remote_path).exists(remote_path)
 
+    def prefetch(
+        self, remote_path: str, is_multipart: bool = False, on_fetched: Optional[Callable[[str], None]] = None
+    ) -> Future:
+        """
+        Starts downloading remote_path in the background to a local path of its own. The next download of the same
+        remote path waits for this one and moves the result into place, rather than fetching it again.
+
+        :param Text remote_path:
+        :param bool is_multipart:
+        :param on_fetched: Called with the local path once the download is done, before anyone can take it.
+        :rtype: concurrent.futures.Future
+        """
+        key = (remote_path, is_multipart)
+        with self._prefetch_lock:
+            if key not in self._prefetched:
+                self._prefetched[key] = _background_pool().submit(self._prefetch, remote_path, is_multipart, on_fetched)
+            return self._prefetched[key]
+
+    def _prefetch(self, remote_path: str, is_multipart: bool, on_fetched: Optional[Callable[[str], None]]) -> str:
+        proxy = self._get_data_proxy_by_path(remote_path)
+        if is_multipart:
+            local_path = self.get_random_local_directory()
+            proxy.download_directory(remote_path, local_path)
+        else:
+            local_path = self.get_random_local_path(remote_path)
+            proxy.download(remote_path, local_path)
+        if on_fetched is not None:
+            try:
+                on_fetched(local_path)
+            except Exception as e:
+                logger.warning(f"Failed to handle prefetched {remote_path}: {e}")
+        return local_path
+
+    def _take_prefetched(self, remote_path: str, local_path: str, is_multipart: bool) -> bool:
+        with self._prefetch_lock:
+            future = self._prefetched.pop((remote_path, is_multipart), None)
+        if future is None:
+            return False
+        try:
+            prefetched = future.result()
+        except Exception as e:
+            logger.warning(f"Prefetching {remote_path} failed, downloading it again: {e}")
+            return False
+        _move_into(prefetched, local_path)
+        return True
+
     def download_directory(self, remote_path: str, local_path: str):
         """
         :param Text remote_path: remote s3:// path
         :param Text local_path: directory to copy to
         """
+        if self._take_prefetched(remote_path, local_path, True):
+            return
         return self._get_data_proxy_by_path(remote_path).download_directory(remote_path, local_path)
 
     def download(self, remote_path: str, local_path: str):
@@ -313,6 +424,8 @@ class FileAccessProvider(object):
         :param Text remote_path: remote s3:// path
         :param Text local_path: directory to copy to
         """
+        if self._take_prefetched(remote_path, local_path, False):
+            return
         return self._get_data_proxy_by_path(remote_path).download(remote_path, local_path)
 
     def upload(self, file_path: str, to_path: str):
@@ -355,6 +468,29 @@ class FileAccessProvider(object):
                 )
             )
 
+    @contextmanager
+    def background_uploads(self):
+        """
+        Within this context, put_data starts the upload in the background and returns right away. Leaving it waits for
+        all of those uploads, and raises the error of the first one that failed. The local data must not change until
+        then.
+        """
+        if _BACKGROUND_UPLOADS.get() is not None:
+            # Waited for by the outer context.
+            yield
+            return
+        uploads: List[Future] = []
+        token = _BACKGROUND_UPLOADS.set(uploads)
+        try:
+            yield
+        finally:
+            _BACKGROUND_UPLOADS.reset(token)
+            # Wait for all of them, even after a failure, so nothing is still writing when this returns.
+            errors = [f.exception() for f in uploads]
+        for error in errors:
+            if error is not None:
+                raise error
+
     def put_data(self, local_path: Union[str, os.PathLike], remote_path: str, is_multipart=False):
         """
         The implication here is that we're always going to put data to the remote location, so we .remote to ensure
@@ -364,6 +500,13 @@ class FileAccessProvider(object):
         :param Text remote_path:
         :param bool is_multipart:
         """
+        uploads = _BACKGROUND_UPLOADS.get()
+        if uploads is not None:
+            uploads.append(_background_pool().submit(self._put_data, local_path, remote_path, is_multipart))
+            return
+        self._put_data(local_path, remote_path, is_multipart)
+
+    def _put_data(self, local_path: Union[str, os.PathLike], remote_path: str, is_multipart: bool):
         try:
             with _common_utils.PerformanceTimer("Writing ({} -> {})".format(local_path, remote_path)):
                 if is_multipart:
@@ -1,3 +1,4 @@
+import logging
 import os as _os
 import sys as _sys
 import uuid as _uuid
@@ -6,6 +7,7 @@ from flytekit.common.exceptions.user import FlyteUserException as _FlyteUserExce
 from flytekit.configuration import gcp as _gcp_config
 from flytekit.interfaces import random as _flyte_random
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data.gcs import native as _native
 from flytekit.tools import subprocess as _subprocess
 
 if _sys.version_info >= (3,):
@@ -47,6 +49,20 @@ class GCSProxy(_common_data.DataProxy):
         if not _which(GCSProxy._GS_UTIL_CLI):
             raise _FlyteUserException("gsutil (gcloud cli) not found! Please install.")
 
+    @staticmethod
+    def _native_client():
+        """
+        Returns the shared in-process client when gcp.use_native_client is set, or None if gsutil should be used.
+
+        :rtype: Optional[flytekit.interfaces.data.gcs.native.NativeGCSClient]
+        """
+        if not _gcp_config.USE_NATIVE_CLIENT.get():
+            return None
+        if not _native.is_available():
+            logging.warning("gcp.use_native_client is set but google-cloud-storage is not installed, using gsutil")
+            return None
+        return _native.get_client()
+
     @staticmethod
     def _maybe_with_gsutil_parallelism(*gsutil_args):
         """
@@ -67,11 +83,14 @@ class GCSProxy(_common_data.DataProxy):
         :param Text remote_path: remote gs:// path
         :rtype bool: whether the gs file exists or not
         """
-        GCSProxy._check_binary()
-
         if not remote_path.startswith("gs://"):
             raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.exists(remote_path)
+
+        GCSProxy._check_binary()
         cmd = [GCSProxy._GS_UTIL_CLI, "-q", "stat", remote_path]
         try:
             _update_cmd_config_and_execute(cmd)
@@ -79,16 +98,36 @@ class GCSProxy(_common_data.DataProxy):
         except Exception:
             return False
 
+    def exists_many(self, remote_paths):
+        """
+        Batched form of :py:meth:`exists`. With the native client the checks run concurrently over one session.
+
+        :param list[Text] remote_paths: remote gs:// paths
+        :rtype: list[bool]
+        """
+        remote_paths = list(remote_paths)
+        for p in remote_paths:
+            if not p.startswith("gs://"):
+                raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
+
+        native = self._native_client()
+        if native is not None:
+            return native.exists_many(remote_paths)
+        return [self.exists(p) for p in remote_paths]
+
     def download_directory(self, remote_path, local_path):
         """
         :param Text remote_path: remote gs:// path
         :param Text local_path: directory to copy to
         """
-        GCSProxy._check_binary()
-
         if not remote_path.startswith("gs://"):
             raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.download_directory(remote_path, local_path)
+
+        GCSProxy._check_binary()
         cmd = self._maybe_with_gsutil_parallelism("cp", "-r", _amend_path(remote_path), local_path)
         return _update_cmd_config_and_execute(cmd)
 
@@ -100,8 +139,11 @@ class GCSProxy(_common_data.DataProxy):
         if not remote_path.startswith("gs://"):
             raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
 
-        GCSProxy._check_binary()
+        native = self._native_client()
+        if native is not None:
+            return native.download(remote_path, local_path)
 
+        GCSProxy._check_binary()
         cmd = self._maybe_with_gsutil_parallelism("cp", remote_path, local_path)
         return _update_cmd_config_and_execute(cmd)
 
@@ -110,8 +152,11 @@ class GCSProxy(_common_data.DataProxy):
         :param Text file_path:
         :param Text to_path:
         """
-        GCSProxy._check_binary()
+        native = self._native_client()
+        if native is not None:
+            return native.upload(file_path, to_path)
 
+        GCSProxy._check_binary()
         cmd = self._maybe_with_gsutil_parallelism("cp", file_path, to_path)
         return _update_cmd_config_and_execute(cmd)
 
@@ -123,8 +168,11 @@ class GCSProxy(_common_data.DataProxy):
         if not remote_path.startswith("gs://"):
             raise ValueError("Not an GS Key. Please use FQN (GS ARN) of the format gs://...")
 
-        GCSProxy._check_binary()
+        native = self._native_client()
+        if native is not None:
+            return native.upload_directory(local_path, remote_path)
 
+        GCSProxy._check_binary()
         cmd = self._maybe_with_gsutil_parallelism(
             "cp",
             "-r",
@@ -0,0 +1,221 @@
+"""
+In-process GCS access for :py:class:`flytekit.interfaces.data.gcs.gcs_proxy.GCSProxy`. A single authenticated
+google-cloud-storage client is shared by the whole process so that no gsutil interpreter has to be started per file.
+"""
+import io as _io
+import logging
+import math as _math
+import os as _os
+import threading as _threading
+import uuid as _uuid
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from typing import Iterable, List, Tuple
+
+from flytekit.configuration import gcp as _gcp_config
+from flytekit.interfaces.data import transfer as _transfer
+from flytekit.tools import lazy_loader as _lazy_loader
+
+# google-cloud-storage takes a while to import, and most processes that import this module never create a client.
+_storage = (
+    _lazy_loader.lazy_load_module("google.cloud.storage") if _lazy_loader.is_installed("google.cloud.storage") else None
+)
+
+# GCS refuses to compose more than 32 source objects in a single request.
+_MAX_COMPOSE_COMPONENTS = 32
+# The parts of a composite upload are sent in chunks of this size, which bounds the memory each one takes however large
+# the part. Resumable upload chunks have to be a multiple of 256 KiB.
+_PART_CHUNK_SIZE = 8 * 1024 * 1024
+
+_CLIENT = None
+_CLIENT_LOCK = _threading.Lock()
+
+
+def is_available() -> bool:
+    """
+    Whether google-cloud-storage could be imported. The proxy uses this to decide whether it has to fall back to gsutil.
+    """
+    return _storage is not None
+
+
+def split_gcs_path(path: str) -> Tuple[str, str]:
+    """
+    :param path: gs://bucket/key
+    :return: (bucket, key). The key is empty when the path names a bucket only.
+    """
+    path = path[len("gs://") :]
+    bucket, _, key = path.partition("/")
+    return bucket, key
+
+
+def _as_prefix(key: str) -> str:
+    key = key.rstrip("*")
+    return key if not key or key.endswith("/") else key + "/"
+
+
+class _FilePart(_io.RawIOBase):
+    """
+    A read-only view of length bytes of a file, starting at offset. Reads end at the end of the part, so the part can be
+    streamed without reading it into memory or past its end.
+    """
+
+    def __init__(self, fh, offset: int, length: int):
+        super().__init__()
+        self._fh = fh
+        self._offset = offset
+        self._length = length
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = _io.SEEK_SET) -> int:
+        base = {_io.SEEK_SET: 0, _io.SEEK_CUR: self._pos, _io.SEEK_END: self._length}[whence]
+        self._pos = min(max(base + pos, 0), self._length)
+        return self._pos
+
+    def read(self, n: int = -1) -> bytes:
+        remaining = self._length - self._pos
+        if n is None or n < 0 or n > remaining:
+            n = remaining
+        self._fh.seek(self._offset + self._pos)
+        data = self._fh.read(n)
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+class NativeGCSClient(object):
+    """
+    Wraps a google-cloud-storage client. Use :py:func:`get_client` rather than constructing this directly so the
+    authenticated session is shared.
+    """
+
+    def __init__(self, client=None):
+        if _storage is None:
+            raise ImportError(
+                "google-cloud-storage is required to use the native GCS client, please pip install google-cloud-storage"
+            )
+        if client is None:
+            # The emulator used in tests and local sandboxes does not do auth.
+            if _os.environ.get("STORAGE_EMULATOR_HOST"):
+                client = _storage.Client.create_anonymous_client()
+            else:
+                client = _storage.Client()
+        self._client = client
+        self._workers = max(1, _gcp_config.NATIVE_CLIENT_WORKERS.get())
+
+    @property
+    def client(self):
+        return self._client
+
+    def _blob(self, path: str):
+        bucket, key = split_gcs_path(path)
+        return self._client.bucket(bucket).blob(key)
+
+    def exists(self, remote_path: str) -> bool:
+        return self._blob(remote_path).exists()
+
+    def exists_many(self, remote_paths: Iterable[str]) -> List[bool]:
+        """
+        Checks several objects at once, issuing the metadata requests concurrently over the shared session.
+        """
+        remote_paths = list(remote_paths)
+        if len(remote_paths) <= 1:
+            return [self.exists(p) for p in remote_paths]
+        with _ThreadPoolExecutor(max_workers=min(self._workers, len(remote_paths))) as executor:
+            return list(executor.map(self.exists, remote_paths))
+
+    def download(self, remote_path: str, local_path: str):
+        if _os.path.isdir(local_path):
+            local_path = _os.path.join(local_path, _os.path.basename(split_gcs_path(remote_path)[1]))
+        self._blob(remote_path).download_to_filename(local_path)
+
+    def download_directory(self, remote_path: str, local_path: str):
+        bucket, key = split_gcs_path(remote_path)
+        prefix = _as_prefix(key)
+        blobs = {}
+        for blob in self._client.list_blobs(bucket, prefix=prefix):
+            if not blob.name.endswith("/"):
+                blobs[blob.name] = blob
+        _transfer.TransferEngine().download_directory(
+            [(name, name[len(prefix) :], b.size or 0) for name, b in blobs.items()],
+            local_path,
+            lambda name, target: blobs[name].download_to_filename(target),
+        )
+
+    def upload(self, file_path: str, to_path: str):
+        bucket, key = split_gcs_path(to_path)
+        if not key or key.endswith("/"):
+            key += _os.path.basename(file_path)
+        blob = self._client.bucket(bucket).blob(key)
+        threshold = _gcp_config.PARALLEL_COMPOSITE_UPLOAD_THRESHOLD.get()
+        if threshold > 0 and _os.path.getsize(file_path) > threshold:
+            self._composite_upload(file_path, blob, threshold)
+        else:
+            blob.upload_from_filename(file_path)
+
+    def upload_directory(self, local_path: str, remote_path: str):
+        bucket, key = split_gcs_path(remote_path)
+        prefix = _as_prefix(key)
+        _transfer.TransferEngine().upload_directory(
+            local_path, lambda file_path, rel: self.upload(file_path, f"gs://{bucket}/{prefix}{rel}")
+        )
+
+    def _composite_upload(self, file_path: str, blob, threshold: int):
+        """
+        Uploads the file as up to 32 temporary component objects in parallel, composes them into ``blob`` and then
+        deletes the components. Each component is streamed from its range of the file in chunks.
+        """
+        size = _os.path.getsize(file_path)
+        n_parts = min(_MAX_COMPOSE_COMPONENTS, int(_math.ceil(size / float(threshold))))
+        part_size = int(_math.ceil(size / float(n_parts)))
+        # Rounding the part size up can leave fewer ranges with data than parts asked for, e.g. 17 ranges of 2 bytes for
+        # a 33 byte file split 32 ways. Only those become parts, so no part is empty or has a negative length.
+        ranges = [(offset, min(part_size, size - offset)) for offset in range(0, size, part_size)]
+        bucket = blob.bucket
+        tmp_prefix = f"{blob.name}.parts-{_uuid.uuid4().hex}/"
+        parts = [bucket.blob(f"{tmp_prefix}{i:02d}") for i in range(len(ranges))]
+
+        def _upload_part(i: int):
+            offset, length = ranges[i]
+            parts[i].chunk_size = _PART_CHUNK_SIZE
+            with open(file_path, "rb") as fh:
+                parts[i].upload_from_file(_FilePart(fh, offset, length), size=length)
+
+        try:
+            _transfer.TransferEngine(concurrency=self._workers).run(
+                [
+                    (lambda i=i: _upload_part(i), f"upload part {i} of {file_path}", length)
+                    for i, (_, length) in enumerate(ranges)
+                ],
+                f"{file_path} (composite upload)",
+            )
+            blob.compose(parts)
+        finally:
+            for p in parts:
+                try:
+                    p.delete()
+                except Exception as e:
+                    logging.warning(f"Failed to delete composite upload part {p.name}: {e}")
+
+
+def get_client() -> NativeGCSClient:
+    """
+    Returns the process-wide client, creating and authenticating it on first use.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = NativeGCSClient()
+    return _CLIENT
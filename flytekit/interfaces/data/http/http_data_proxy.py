@@ -1,12 +1,48 @@
+import threading as _threading
+import time as _time
+from contextlib import contextmanager as _contextmanager
+
 import requests as _requests
+from requests.adapters import HTTPAdapter as _HTTPAdapter
 
 from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data import transfer as _transfer
+from flytekit.loggers import logger
+
+_CHUNK_SIZE = 1024 * 1024
+
+_SESSION = None
+_SESSION_LOCK = _threading.Lock()
+
+
+def get_session() -> _requests.Session:
+    """
+    Returns the process-wide session. Sharing it keeps connections to the same host alive between files and lets the
+    ranged parts of one file reuse a pool sized for ``sdk.data_transfer_concurrency``.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                pool_size = max(1, _sdk_config.DATA_TRANSFER_CONCURRENCY.get())
+                adapter = _HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+                session = _requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+class _TruncatedResponse(IOError):
+    pass
 
 
 class HttpFileProxy(_common_data.DataProxy):
 
     _HTTP_OK = 200
+    _HTTP_PARTIAL_CONTENT = 206
     _HTTP_FORBIDDEN = 403
     _HTTP_NOT_FOUND = 404
 
@@ -15,7 +51,7 @@ class HttpFileProxy(_common_data.DataProxy):
         :param Text path: the path of the file
         :rtype bool: whether the file exists or not
         """
-        rsp = _requests.head(path)
+        rsp = get_session().head(path)
         allowed_codes = {
             type(self)._HTTP_OK,
             type(self)._HTTP_NOT_FOUND,
@@ -37,18 +73,119 @@ class HttpFileProxy(_common_data.DataProxy):
 
     def download(self, from_path, to_path):
         """
+        Streams the body to disk in chunks, so memory use does not grow with the file. A dropped connection is resumed
+        with a range request. Files above ``sdk.data_transfer_part_size`` are fetched as concurrent ranges when the
+        server supports it.
+
         :param Text from_path:
         :param Text to_path:
         """
+        engine = _transfer.TransferEngine()
+        rsp = self._get(from_path, 0)
+        self._check_status(from_path, rsp, {type(self)._HTTP_OK})
+        size = rsp.headers.get("Content-Length")
+        if (
+            _sdk_config.HTTP_PARALLEL_DOWNLOADS.get()
+            and engine.concurrency > 1
+            and rsp.headers.get("Accept-Ranges") == "bytes"
+            and size is not None
+            and int(size) > engine.part_size
+        ):
+            rsp.close()
+            self._download_ranges(from_path, to_path, int(size), engine)
+        else:
+            with open(to_path, "wb"):
+                pass
+            self._fetch(from_path, to_path, 0, None, rsp)
+
+    @_contextmanager
+    def open_read(self, path):
+        """
+        Streams the body as it arrives. Unlike download, a dropped connection is not resumed.
+
+        :param Text path:
+        :rtype: typing.Iterator[typing.BinaryIO]
+        """
+        rsp = self._get(path, 0)
+        self._check_status(path, rsp, {type(self)._HTTP_OK})
+        rsp.raw.decode_content = True
+        try:
+            yield rsp.raw
+        finally:
+            rsp.close()
+
+    def _download_ranges(self, from_path, to_path, size, engine):
+        # Pre-size the destination so that every range can be written at its offset independently.
+        with open(to_path, "wb") as fh:
+            fh.truncate(size)
+        jobs = []
+        for offset in range(0, size, engine.part_size):
+            end = min(offset + engine.part_size, size) - 1
+            jobs.append(
+                (
+                    lambda o=offset, e=end: self._fetch(from_path, to_path, o, e),
+                    f"download {from_path}[{offset}:{end + 1}]",
+                    end + 1 - offset,
+                )
+            )
+        # _fetch resumes every range on its own, so the engine does not retry whole ranges on top of that.
+        _transfer.TransferEngine(concurrency=engine.concurrency, retries=0).run(jobs, f"{from_path} -> {to_path}")
 
-        rsp = _requests.get(from_path)
-        if rsp.status_code != type(self)._HTTP_OK:
+    @staticmethod
+    def _get(url, offset, end=None):
+        headers = {}
+        if offset > 0 or end is not None:
+            headers["Range"] = f"bytes={offset}-{'' if end is None else end}"
+        return get_session().get(url, headers=headers, stream=True)
+
+    def _check_status(self, url, rsp, expected):
+        if rsp.status_code not in expected:
+            rsp.close()
             raise _user_exceptions.FlyteValueException(
                 rsp.status_code,
-                "Request for data @ {} failed. Expected status code {}".format(from_path, type(self)._HTTP_OK),
+                "Request for data @ {} failed. Expected status code {}".format(url, type(self)._HTTP_OK),
             )
-        with open(to_path, "wb") as writer:
-            writer.write(rsp.content)
+
+    def _fetch(self, url, to_path, start, end, rsp=None):
+        """
+        Writes bytes start through end, or through the end of the body if end is None, of url into to_path at the same
+        offsets. Up to ``sdk.data_transfer_retries`` dropped connections are resumed from the last byte written.
+        """
+        offset = start
+        failures = 0
+        with open(to_path, "r+b") as fh:
+            while True:
+                try:
+                    if rsp is None:
+                        rsp = self._get(url, offset, end)
+                    if offset > 0 and rsp.status_code == type(self)._HTTP_OK:
+                        # The server ignored the range. That can only be recovered from by starting over.
+                        if start > 0 or end is not None:
+                            raise _user_exceptions.FlyteValueException(
+                                rsp.status_code, f"Server for {url} did not honor the range request"
+                            )
+                        offset = 0
+                        fh.truncate(0)
+                    self._check_status(url, rsp, {type(self)._HTTP_OK, type(self)._HTTP_PARTIAL_CONTENT})
+                    length = rsp.headers.get("Content-Length")
+                    stop = offset + int(length) if length is not None else None
+                    fh.seek(offset)
+                    for chunk in rsp.iter_content(chunk_size=_CHUNK_SIZE):
+                        fh.write(chunk)
+                        offset += len(chunk)
+                    if stop is not None and offset < stop:
+                        raise _TruncatedResponse(f"connection closed after {offset} of {stop} bytes")
+                    return
+                except (_requests.exceptions.RequestException, _TruncatedResponse) as e:
+                    failures += 1
+                    if failures > _sdk_config.DATA_TRANSFER_RETRIES.get():
+                        raise
+                    logger.warning(f"Download of {url} interrupted at byte {offset} ({e}), resuming")
+                    _time.sleep(min(2 ** (failures - 1), 10) * 0.1)
+                finally:
+                    if rsp is not None:
+                        rsp.close()
+                        rsp = None
 
     def upload(self, from_path, to_path):
         """
@@ -1,10 +1,11 @@
 import os as _os
 import uuid as _uuid
-from distutils import dir_util as _dir_util
+from contextlib import contextmanager as _contextmanager
 from shutil import copyfile as _copyfile
 
 from flytekit.interfaces import random as _flyte_random
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data import transfer as _transfer
 
 
 def _make_local_path(path):
@@ -46,7 +47,7 @@ class LocalFileProxy(_common_data.DataProxy):
         :param Text to_path:
         """
         if from_path != to_path:
-            _dir_util.copy_tree(strip_file_header(from_path), strip_file_header(to_path))
+            _transfer.TransferEngine().copy_tree(strip_file_header(from_path), strip_file_header(to_path))
 
     def download(self, from_path, to_path):
         """
@@ -55,6 +56,15 @@ class LocalFileProxy(_common_data.DataProxy):
         """
         _copyfile(strip_file_header(from_path), strip_file_header(to_path))
 
+    @_contextmanager
+    def open_read(self, path):
+        """
+        :param Text path:
+        :rtype: typing.Iterator[typing.BinaryIO]
+        """
+        with open(strip_file_header(path), "rb") as fh:
+            yield fh
+
     def upload(self, from_path, to_path):
         """
         :param Text from_path:
@@ -0,0 +1,203 @@
+"""
+In-process S3 access for :py:class:`flytekit.interfaces.data.s3.s3proxy.AwsS3Proxy`. Instead of forking the aws cli for
+every object, requests go through one botocore client per configuration, which keeps an HTTP connection pool alive for
+the lifetime of the process.
+"""
+import logging
+import os as _os
+import threading as _threading
+import time
+from typing import Callable, Dict, Optional, Tuple, TypeVar
+
+from flytekit.configuration import aws as _aws_config
+from flytekit.interfaces.data import transfer as _transfer
+from flytekit.tools import lazy_loader as _lazy_loader
+
+# boto3 takes a while to import, and most processes that import this module never create a client.
+_boto3 = None
+if _lazy_loader.is_installed("boto3"):
+    _boto3 = _lazy_loader.lazy_load_module("boto3")
+    type(_boto3).add_sub_module("s3.transfer")
+    _botocore = _lazy_loader.lazy_load_module("botocore")
+    type(_botocore).add_sub_module("config")
+    type(_botocore).add_sub_module("exceptions")
+
+T = TypeVar("T")
+
+_NOT_FOUND_CODES = frozenset(["404", "NoSuchKey", "NotFound"])
+
+_CLIENTS: Dict[Tuple, "NativeS3Client"] = {}
+_CLIENTS_LOCK = _threading.Lock()
+
+
+def is_available() -> bool:
+    """
+    Whether boto3 could be imported. The proxy uses this to decide whether it has to fall back to the cli.
+    """
+    return _boto3 is not None
+
+
+def _retry(fn: Callable[[], T], description: str) -> T:
+    """
+    Mirrors the retry loop the cli path uses, so that both backends honor ``aws.retries`` and ``aws.backoff_seconds``
+    the same way. A missing object is an answer rather than a failure and is never retried.
+    """
+    retry = 0
+    while True:
+        try:
+            return fn()
+        except _botocore.exceptions.ClientError as e:
+            if _is_not_found(e):
+                raise
+            retry = _record_failure(retry, description, e)
+        except Exception as e:
+            retry = _record_failure(retry, description, e)
+
+
+def _record_failure(retry: int, description: str, e: Exception) -> int:
+    logging.error(f"Exception when trying to {description}, reason: {str(e)}")
+    retry += 1
+    if retry > _aws_config.RETRIES.get():
+        raise e
+    secs = _aws_config.BACKOFF_SECONDS.get()
+    logging.info(f"Sleeping before retrying again, after {secs} seconds")
+    time.sleep(secs)
+    logging.info("Retrying again")
+    return retry
+
+
+def _is_not_found(e: Exception) -> bool:
+    return str(e.response.get("Error", {}).get("Code")) in _NOT_FOUND_CODES
+
+
+def split_s3_path(path: str) -> Tuple[str, str]:
+    """
+    :param path: s3://bucket/key
+    :return: (bucket, key). The key is empty when the path names a bucket only.
+    """
+    path = path[len("s3://") :]
+    bucket, _, key = path.partition("/")
+    return bucket, key
+
+
+def _as_prefix(key: str) -> str:
+    return key if not key or key.endswith("/") else key + "/"
+
+
+class NativeS3Client(object):
+    """
+    Thin wrapper around a botocore S3 client. botocore clients are thread-safe, so a single instance is shared by every
+    proxy in the process with the same endpoint and credentials; use :py:func:`get_client` rather than constructing
+    this directly.
+    """
+
+    def __init__(self, endpoint: Optional[str], access_key_id: Optional[str], secret_access_key: Optional[str]):
+        if _boto3 is None:
+            raise ImportError("boto3 is required to use the native S3 client, please pip install boto3")
+        # The session is only used to build the client; sessions themselves are not thread-safe.
+        session = _boto3.session.Session(aws_access_key_id=access_key_id, aws_secret_access_key=secret_access_key)
+        self._client = session.client(
+            "s3",
+            endpoint_url=endpoint,
+            config=_botocore.config.Config(
+                max_pool_connections=_aws_config.MAX_POOL_CONNECTIONS.get(),
+                # Retries are handled by _retry so they follow the same settings as the cli path.
+                retries={"max_attempts": 0},
+            ),
+        )
+
+    @property
+    def client(self):
+        return self._client
+
+    def exists(self, remote_path: str) -> bool:
+        bucket, key = split_s3_path(remote_path)
+        try:
+            _retry(lambda: self._client.head_object(Bucket=bucket, Key=key), f"head {remote_path}")
+            return True
+        except _botocore.exceptions.ClientError as e:
+            if _is_not_found(e):
+                return False
+            raise
+
+    @staticmethod
+    def _transfer_config(part_size: int, concurrency: int):
+        # Objects above the part size are moved as concurrent multipart uploads / ranged gets.
+        return _boto3.s3.transfer.TransferConfig(
+            multipart_threshold=part_size, multipart_chunksize=part_size, max_concurrency=concurrency
+        )
+
+    def download(self, remote_path: str, local_path: str):
+        bucket, key = split_s3_path(remote_path)
+        if _os.path.isdir(local_path):
+            local_path = _os.path.join(local_path, _os.path.basename(key))
+        engine = _transfer.TransferEngine()
+        config = self._transfer_config(engine.part_size, engine.concurrency)
+        _retry(lambda: self._client.download_file(bucket, key, local_path, Config=config), f"download {remote_path}")
+
+    def open_read(self, remote_path: str):
+        """
+        Returns the body of the object, which reads it from the response as it arrives. The caller closes it.
+        """
+        bucket, key = split_s3_path(remote_path)
+        return _retry(lambda: self._client.get_object(Bucket=bucket, Key=key)["Body"], f"get {remote_path}")
+
+    def download_directory(self, remote_path: str, local_path: str):
+        bucket, key = split_s3_path(remote_path)
+        prefix = _as_prefix(key)
+        files = []
+        paginator = self._client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith("/"):
+                    files.append((obj["Key"], obj["Key"][len(prefix) :], obj["Size"]))
+
+        # The engine retries each file and already runs files in parallel, so parts of one file are not fanned out.
+        engine = _transfer.TransferEngine()
+        config = self._transfer_config(engine.part_size, 1)
+        engine.download_directory(
+            files,
+            local_path,
+            lambda object_key, target: self._client.download_file(bucket, object_key, target, Config=config),
+        )
+
+    def upload(self, file_path: str, to_path: str, extra_args: Optional[Dict[str, str]] = None):
+        bucket, key = split_s3_path(to_path)
+        if not key or key.endswith("/"):
+            key += _os.path.basename(file_path)
+        engine = _transfer.TransferEngine()
+        config = self._transfer_config(engine.part_size, engine.concurrency)
+        _retry(
+            lambda: self._client.upload_file(file_path, bucket, key, ExtraArgs=extra_args, Config=config),
+            f"upload {file_path} to {to_path}",
+        )
+
+    def upload_directory(self, local_path: str, remote_path: str, extra_args: Optional[Dict[str, str]] = None):
+        bucket, key = split_s3_path(remote_path)
+        prefix = _as_prefix(key)
+        engine = _transfer.TransferEngine()
+        config = self._transfer_config(engine.part_size, 1)
+        engine.upload_directory(
+            local_path,
+            lambda file_path, rel: self._client.upload_file(
+                file_path, bucket, prefix + rel, ExtraArgs=extra_args, Config=config
+            ),
+        )
+
+
+def get_client() -> NativeS3Client:
+    """
+    Returns the process-wide client for the current aws configuration, creating it on first use.
+    """
+    key = (
+        _aws_config.S3_ENDPOINT.get(),
+        _aws_config.S3_ACCESS_KEY_ID.get(),
+        _aws_config.S3_SECRET_ACCESS_KEY.get(),
+    )
+    client = _CLIENTS.get(key)
+    if client is None:
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(key)
+            if client is None:
+                client = _CLIENTS[key] = NativeS3Client(*key)
+    return client
@@ -5,6 +5,7 @@ import string as _string
 import sys as _sys
 import time
 import uuid as _uuid
+from contextlib import contextmanager as _contextmanager
 from typing import Dict, List
 
 from six import moves as _six_moves
@@ -14,6 +15,7 @@ from flytekit.common.exceptions.user import FlyteUserException as _FlyteUserExce
 from flytekit.configuration import aws as _aws_config
 from flytekit.interfaces import random as _flyte_random
 from flytekit.interfaces.data import common as _common_data
+from flytekit.interfaces.data.s3 import native as _native
 from flytekit.tools import subprocess as _subprocess
 
 if _sys.version_info >= (3,):
@@ -89,6 +91,20 @@ class AwsS3Proxy(_common_data.DataProxy):
         if not _which(AwsS3Proxy._AWS_CLI):
             raise _FlyteUserException("AWS CLI not found at Please install.")
 
+    @staticmethod
+    def _native_client():
+        """
+        Returns the shared in-process client when aws.use_native_client is set, or None if the aws cli should be used.
+
+        :rtype: Optional[flytekit.interfaces.data.s3.native.NativeS3Client]
+        """
+        if not _aws_config.USE_NATIVE_CLIENT.get():
+            return None
+        if not _native.is_available():
+            logging.warning("aws.use_native_client is set but boto3 is not installed, falling back to the aws cli")
+            return None
+        return _native.get_client()
+
     @staticmethod
     def _split_s3_path_to_bucket_and_key(path):
         """
@@ -104,11 +120,14 @@ class AwsS3Proxy(_common_data.DataProxy):
         :param Text remote_path: remote s3:// path
         :rtype bool: whether the s3 file exists or not
         """
-        AwsS3Proxy._check_binary()
-
         if not remote_path.startswith("s3://"):
             raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.exists(remote_path)
+
+        AwsS3Proxy._check_binary()
         bucket, file_path = self._split_s3_path_to_bucket_and_key(remote_path)
         cmd = [
             AwsS3Proxy._AWS_CLI,
@@ -126,7 +145,7 @@ class AwsS3Proxy(_common_data.DataProxy):
             # The s3api command returns an error if the object does not exist. The error message contains
             # the http status code: "An error occurred (404) when calling the HeadObject operation: Not Found"
             #  This is a best effort for returning if the object does not exist by searching
-            # for existence of (404) in the error message. This should not be needed when we get off the cli and use lib
+            # for existence of (404) in the error message. The native client (aws.use_native_client) avoids this.
             if _re.search("(404)", _text_type(ex)):
                 return False
             else:
@@ -137,11 +156,14 @@ class AwsS3Proxy(_common_data.DataProxy):
         :param Text remote_path: remote s3:// path
         :param Text local_path: directory to copy to
         """
-        AwsS3Proxy._check_binary()
-
         if not remote_path.startswith("s3://"):
             raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.download_directory(remote_path, local_path)
+
+        AwsS3Proxy._check_binary()
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", "--recursive", remote_path, local_path]
         return _update_cmd_config_and_execute(cmd)
 
@@ -153,21 +175,51 @@ class AwsS3Proxy(_common_data.DataProxy):
         if not remote_path.startswith("s3://"):
             raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.download(remote_path, local_path)
+
         AwsS3Proxy._check_binary()
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", remote_path, local_path]
         return _update_cmd_config_and_execute(cmd)
 
+    @_contextmanager
+    def open_read(self, remote_path):
+        """
+        Streams the object with the native client. The aws cli downloads it to a temporary file first.
+
+        :param Text remote_path: remote s3:// path
+        :rtype: typing.Iterator[typing.BinaryIO]
+        """
+        if not remote_path.startswith("s3://"):
+            raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
+
+        native = self._native_client()
+        if native is None:
+            with super().open_read(remote_path) as fh:
+                yield fh
+            return
+
+        body = native.open_read(remote_path)
+        try:
+            yield body
+        finally:
+            body.close()
+
     def upload(self, file_path, to_path):
         """
         :param Text file_path:
         :param Text to_path:
         """
-        AwsS3Proxy._check_binary()
-
         extra_args = {
             "ACL": "bucket-owner-full-control",
         }
 
+        native = self._native_client()
+        if native is not None:
+            return native.upload(file_path, to_path, extra_args)
+
+        AwsS3Proxy._check_binary()
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp"]
         cmd.extend(_extra_args(extra_args))
         cmd += [file_path, to_path]
@@ -186,6 +238,10 @@ class AwsS3Proxy(_common_data.DataProxy):
         if not remote_path.startswith("s3://"):
             raise ValueError("Not an S3 ARN. Please use FQN (S3 ARN) of the format s3://...")
 
+        native = self._native_client()
+        if native is not None:
+            return native.upload_directory(local_path, remote_path, extra_args)
+
         AwsS3Proxy._check_binary()
         cmd = [AwsS3Proxy._AWS_CLI, "s3", "cp", "--recursive"]
         cmd.extend(_extra_args(extra_args))
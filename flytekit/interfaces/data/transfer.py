@@ -0,0 +1,198 @@
+"""
+A small engine for moving multipart blobs (directories, schemas, ...) file by file on a bounded thread pool. The data
+proxies use it for ``upload_directory``/``download_directory`` instead of issuing one opaque serial copy, so that a
+blob with hundreds of chunks is transferred concurrently, failed files are retried individually and large files can be
+split into ranged parts.
+"""
+import os as _os
+import shutil as _shutil
+import time as _time
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.loggers import logger
+
+_COPY_BUFFER_SIZE = 1024 * 1024
+
+
+@dataclass
+class TransferStats(object):
+    """
+    Aggregate numbers for one transfer. Parts of a file that was split into ranges count as separate files.
+    """
+
+    files: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes per second over the whole transfer.
+        """
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def __str__(self):
+        return (
+            f"{self.files} files, {self.bytes / (1024 * 1024):.2f} MiB in {self.seconds:.2f}s "
+            f"({self.throughput / (1024 * 1024):.2f} MiB/s)"
+        )
+
+
+def list_local_files(local_path: str) -> List[Tuple[str, str, int]]:
+    """
+    Lists every file below ``local_path``, following symlinked directories the same way ``copy_tree`` does.
+
+    :return: (absolute path, '/'-separated path relative to local_path, size in bytes), sorted by relative path
+    """
+    local_path = local_path.rstrip("*")
+    if not _os.path.isdir(local_path):
+        raise ValueError(f"Cannot transfer {local_path}, it is not a directory")
+    files = []
+    for root, _, names in _os.walk(local_path, followlinks=True):
+        for name in names:
+            p = _os.path.join(root, name)
+            files.append((p, _os.path.relpath(p, local_path).replace(_os.sep, "/"), _os.path.getsize(p)))
+    return sorted(files, key=lambda f: f[1])
+
+
+class TransferEngine(object):
+    """
+    Runs file transfers on a bounded thread pool with per-file retries. The defaults come from the
+    ``sdk.data_transfer_*`` configuration.
+    """
+
+    def __init__(
+        self, concurrency: Optional[int] = None, retries: Optional[int] = None, part_size: Optional[int] = None
+    ):
+        self._concurrency = max(1, concurrency or _sdk_config.DATA_TRANSFER_CONCURRENCY.get())
+        self._retries = retries if retries is not None else _sdk_config.DATA_TRANSFER_RETRIES.get()
+        self._part_size = part_size or _sdk_config.DATA_TRANSFER_PART_SIZE.get()
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    @property
+    def part_size(self) -> int:
+        return self._part_size
+
+    def _with_retries(self, fn: Callable[[], None], description: str):
+        attempt = 0
+        while True:
+            try:
+                return fn()
+            except Exception as e:
+                attempt += 1
+                if attempt > self._retries:
+                    raise
+                logger.warning(f"Failed to {description} (attempt {attempt}), retrying. Reason: {e}")
+                _time.sleep(min(2 ** (attempt - 1), 10) * 0.1)
+
+    def run(self, jobs: Iterable[Tuple[Callable[[], None], str, int]], description: str) -> TransferStats:
+        """
+        Runs every job on the pool and raises the first failure once all jobs have settled.
+
+        :param jobs: (callable, description, bytes moved) triples. Each callable is retried on its own.
+        :param description: used for the throughput log line
+        """
+        jobs = list(jobs)
+        stats = TransferStats()
+        start = _time.perf_counter()
+        if jobs:
+            with _ThreadPoolExecutor(max_workers=min(self._concurrency, len(jobs))) as executor:
+                futures = [executor.submit(self._with_retries, fn, d) for fn, d, _ in jobs]
+                errors = [f.exception() for f in futures]
+            errors = [e for e in errors if e is not None]
+            if errors:
+                raise errors[0]
+        stats.files = len(jobs)
+        stats.bytes = sum(size for _, _, size in jobs)
+        stats.seconds = _time.perf_counter() - start
+        logger.info(f"Transferred {description}: {stats}")
+        return stats
+
+    def upload_directory(self, local_path: str, put_file: Callable[[str, str], None]) -> TransferStats:
+        """
+        :param local_path: directory to upload
+        :param put_file: called as put_file(absolute local path, relative path) for every file
+        """
+        files = list_local_files(local_path)
+        return self.run(
+            [(lambda p=p, r=r: put_file(p, r), f"upload {p}", size) for p, r, size in files],
+            f"{local_path} (upload)",
+        )
+
+    def download_directory(
+        self, remote_files: Iterable[Tuple[str, str, int]], local_path: str, get_file: Callable[[str, str], None]
+    ) -> TransferStats:
+        """
+        :param remote_files: (remote path, '/'-separated relative path, size) for every file to fetch
+        :param local_path: directory to download into, created if needed
+        :param get_file: called as get_file(remote path, absolute local path) for every file
+        """
+        jobs = []
+        for remote, rel, size in remote_files:
+            target = _os.path.join(local_path, *rel.split("/"))
+            _os.makedirs(_os.path.dirname(target), exist_ok=True)
+            jobs.append((lambda s=remote, t=target: get_file(s, t), f"download {remote}", size))
+        _os.makedirs(local_path, exist_ok=True)
+        return self.run(jobs, f"{local_path} (download)")
+
+    def copy_tree(self, from_path: str, to_path: str) -> TransferStats:
+        """
+        Local-to-local directory copy. Files above the part size are copied as concurrent byte ranges.
+        """
+        jobs = []
+        ranged = []
+        for p, rel, size in list_local_files(from_path):
+            target = _os.path.join(to_path, *rel.split("/"))
+            _os.makedirs(_os.path.dirname(target), exist_ok=True)
+            if size <= self._part_size:
+                jobs.append((lambda s=p, t=target: _shutil.copy2(s, t), f"copy {p}", size))
+            else:
+                jobs.extend(self._ranged_copy_jobs(p, target, size))
+                ranged.append((p, target))
+        _os.makedirs(to_path, exist_ok=True)
+        stats = self.run(jobs, f"{from_path} -> {to_path}")
+        # Match copy2 for the files that were copied in parts.
+        for p, target in ranged:
+            _shutil.copystat(p, target)
+        return stats
+
+    def copy_file(self, from_path: str, to_path: str) -> TransferStats:
+        """
+        Local-to-local single file copy, split into concurrent byte ranges if the file is large.
+        """
+        size = _os.path.getsize(from_path)
+        if size <= self._part_size:
+            jobs = [(lambda: _shutil.copyfile(from_path, to_path), f"copy {from_path}", size)]
+        else:
+            jobs = self._ranged_copy_jobs(from_path, to_path, size)
+        return self.run(jobs, f"{from_path} -> {to_path}")
+
+    def _ranged_copy_jobs(self, from_path: str, to_path: str, size: int) -> List[Tuple[Callable[[], None], str, int]]:
+        # Pre-size the destination so that every part can be written at its offset independently.
+        with open(to_path, "wb") as fh:
+            fh.truncate(size)
+
+        def _copy_part(offset: int, length: int):
+            with open(from_path, "rb") as src, open(to_path, "r+b") as dst:
+                src.seek(offset)
+                dst.seek(offset)
+                while length > 0:
+                    buf = src.read(min(length, _COPY_BUFFER_SIZE))
+                    if not buf:
+                        raise IOError(f"{from_path} was truncated while it was being copied")
+                    dst.write(buf)
+                    length -= len(buf)
+
+        jobs = []
+        for offset in range(0, size, self._part_size):
+            length = min(self._part_size, size - offset)
+            jobs.append(
+                (lambda o=offset, n=length: _copy_part(o, n), f"copy {from_path}[{offset}:{offset + length}]", length)
+            )
+        return jobs
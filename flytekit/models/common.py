@@ -39,8 +39,10 @@ class FlyteType(FlyteABCMeta):
 
 
 class FlyteIdlEntity(object, metaclass=FlyteType):
+    _CACHE_CANONICAL_IDL = False
+
     def __eq__(self, other):
-        return isinstance(other, FlyteIdlEntity) and other.to_flyte_idl() == self.to_flyte_idl()
+        return isinstance(other, FlyteIdlEntity) and (other is self or other._canonical_idl() == self._canonical_idl())
 
     def __ne__(self, other):
         return not (self == other)
@@ -52,7 +54,34 @@ class FlyteIdlEntity(object, metaclass=FlyteType):
         return self.verbose_string()
 
     def __hash__(self):
-        return hash(self.to_flyte_idl().SerializeToString(deterministic=True))
+        return hash(self._canonical_idl())
+
+    def __getstate__(self):
+        # Copies are often modified in place right after they are made, e.g. to rename a deep-copied entity, so
+        # they must not inherit the serialization of the original. This covers copy, deepcopy and pickle.
+        state = self.__dict__.copy()
+        state.pop("_canonical_idl_cache", None)
+        return state
+
+    def _canonical_idl(self):
+        """
+        Returns (message name, deterministic serialization), which is what equality and hashing are based on.
+        Classes opt in through ``_CACHE_CANONICAL_IDL`` to compute this on first use and keep it on the instance,
+        though not on copies. That is only correct when the serialization cannot change other than by assigning
+        attributes of the instance itself, see :py:class:`FlyteMutableIdlEntity`. An entity that holds lists, dicts
+        or other entities that may be modified in place must not opt in, as its cache would not see those changes.
+        """
+        key = self.__dict__.get("_canonical_idl_cache")
+        if key is None:
+            idl = self.to_flyte_idl()
+            if hasattr(idl, "DESCRIPTOR"):
+                key = (idl.DESCRIPTOR.full_name, idl.SerializeToString(deterministic=True))
+            else:
+                # A few entities, like filters, serialize to plain strings.
+                key = (None, idl)
+            if self._CACHE_CANONICAL_IDL:
+                self.__dict__["_canonical_idl_cache"] = key
+        return key
 
     def short_string(self):
         """
@@ -75,6 +104,17 @@ class FlyteIdlEntity(object, metaclass=FlyteType):
         pass
 
 
+class FlyteMutableIdlEntity(FlyteIdlEntity):
+    """
+    An entity whose attributes are assigned in place after construction, e.g. the id of an entity that is renamed
+    while it is registered. A cached canonical serialization is dropped on every assignment.
+    """
+
+    def __setattr__(self, name, value):
+        self.__dict__.pop("_canonical_idl_cache", None)
+        super(FlyteMutableIdlEntity, self).__setattr__(name, value)
+
+
 class FlyteCustomIdlEntity(FlyteIdlEntity):
     @classmethod
     def from_flyte_idl(cls, idl_object):
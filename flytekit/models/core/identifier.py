@@ -10,7 +10,10 @@ class ResourceType(object):
     LAUNCH_PLAN = _identifier_pb2.LAUNCH_PLAN
 
 
-class Identifier(_common_models.FlyteIdlEntity):
+class Identifier(_common_models.FlyteMutableIdlEntity):
+    # Project, name and version are filled in place when entities are registered or renamed.
+    _CACHE_CANONICAL_IDL = True
+
     def __init__(self, resource_type, project, domain, name, version):
         """
         :param int resource_type: enum value from ResourceType
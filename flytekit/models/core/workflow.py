@@ -150,7 +150,10 @@ class BranchNode(_common.FlyteIdlEntity):
         return cls(if_else=IfElseBlock.from_flyte_idl(pb2_objct.if_else))
 
 
-class NodeMetadata(_common.FlyteIdlEntity):
+class NodeMetadata(_common.FlyteMutableIdlEntity):
+    # The name is assigned in place along with the id of the node. The retry strategy is never modified in place.
+    _CACHE_CANONICAL_IDL = True
+
     def __init__(self, name, timeout, retries, interruptible=False):
         """
         Defines extra information about the Node.
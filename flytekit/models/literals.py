@@ -13,6 +13,8 @@ from flytekit.models.types import SchemaType as _SchemaType
 
 
 class RetryStrategy(_common.FlyteIdlEntity):
+    _CACHE_CANONICAL_IDL = True
+
     def __init__(self, retries):
         """
         :param int retries: Number of retries to attempt on recoverable failures.  If retries is 0, then
@@ -546,18 +548,49 @@ class LiteralCollection(_common.FlyteIdlEntity):
         :param list[Literal] literals: underlying list of literals in this collection.
         """
         self._literals = literals
+        self._idl_view = None
+
+    @classmethod
+    def from_flyte_idl_view(cls, pb2_object):
+        """
+        Wraps the protobuf without converting its elements. Accessing :py:attr:`literals` unpacks it into a list of
+        lazy Literal views (see :py:meth:`Literal.from_flyte_idl_view`), and serializing a collection that was never
+        unpacked just hands back the protobuf. This is what makes bulk conversions of large collections cheap.
+
+        :param flyteidl.core.literals_pb2.LiteralCollection pb2_object:
+        :rtype: LiteralCollection
+        """
+        collection = cls(None)
+        collection._idl_view = pb2_object
+        return collection
+
+    @property
+    def idl_view(self):
+        """
+        The wrapped protobuf if this collection was created with :py:meth:`from_flyte_idl_view` and has not been
+        unpacked since, otherwise None.
+
+        :rtype: flyteidl.core.literals_pb2.LiteralCollection
+        """
+        return self._idl_view
 
     @property
     def literals(self):
         """
         :rtype: list[Literal]
         """
+        if self._idl_view is not None:
+            # Once unpacked, the list is the source of truth again since callers may modify it.
+            self._literals = [Literal.from_flyte_idl_view(l) for l in self._idl_view.literals]
+            self._idl_view = None
         return self._literals
 
     def to_flyte_idl(self):
         """
         :rtype: flyteidl.core.literals_pb2.LiteralCollection
         """
+        if self._idl_view is not None:
+            return self._idl_view
         return _literals_pb2.LiteralCollection(literals=[l.to_flyte_idl() for l in self.literals])
 
     @classmethod
@@ -575,6 +608,29 @@ class LiteralMap(_common.FlyteIdlEntity):
         :param dict[Text, Literal] literals: A dictionary mapping Text key names to Literal objects.
         """
         self._literals = literals
+        self._idl_view = None
+
+    @classmethod
+    def from_flyte_idl_view(cls, pb2_object):
+        """
+        Wraps the protobuf without converting its values, see :py:meth:`LiteralCollection.from_flyte_idl_view`.
+
+        :param flyteidl.core.literals_pb2.LiteralMap pb2_object:
+        :rtype: LiteralMap
+        """
+        literal_map = cls(None)
+        literal_map._idl_view = pb2_object
+        return literal_map
+
+    @property
+    def idl_view(self):
+        """
+        The wrapped protobuf if this map was created with :py:meth:`from_flyte_idl_view` and has not been unpacked
+        since, otherwise None.
+
+        :rtype: flyteidl.core.literals_pb2.LiteralMap
+        """
+        return self._idl_view
 
     @property
     def literals(self):
@@ -582,12 +638,17 @@ class LiteralMap(_common.FlyteIdlEntity):
         A dictionary mapping Text key names to Literal objects.
         :rtype: dict[Text, Literal]
         """
+        if self._idl_view is not None:
+            self._literals = {k: Literal.from_flyte_idl_view(v) for k, v in _six.iteritems(self._idl_view.literals)}
+            self._idl_view = None
         return self._literals
 
     def to_flyte_idl(self):
         """
         :rtype: flyteidl.core.literals_pb2.LiteralMap
         """
+        if self._idl_view is not None:
+            return self._idl_view
         return _literals_pb2.LiteralMap(literals={k: v.to_flyte_idl() for k, v in _six.iteritems(self.literals)})
 
     @classmethod
@@ -729,6 +790,21 @@ class Literal(_common.FlyteIdlEntity):
         self._scalar = scalar
         self._collection = collection
         self._map = map
+        self._idl_view = None
+
+    @classmethod
+    def from_flyte_idl_view(cls, pb2_object):
+        """
+        Wraps the protobuf without converting it. The scalar, collection or map is only turned into a model when it is
+        accessed, and collections and maps stay lazy views themselves. A literal whose value was never accessed
+        serializes by handing back the protobuf, so untouched subtrees are neither copied nor rebuilt.
+
+        :param flyteidl.core.literals_pb2.Literal pb2_object:
+        :rtype: Literal
+        """
+        literal = cls()
+        literal._idl_view = pb2_object
+        return literal
 
     @property
     def scalar(self):
@@ -736,6 +812,8 @@ class Literal(_common.FlyteIdlEntity):
         If not None, this value holds a scalar value which can be further unpacked.
         :rtype: Scalar
         """
+        if self._scalar is None and self._idl_view is not None and self._idl_view.HasField("scalar"):
+            self._scalar = Scalar.from_flyte_idl(self._idl_view.scalar)
         return self._scalar
 
     @property
@@ -744,6 +822,8 @@ class Literal(_common.FlyteIdlEntity):
         If not None, this value holds a collection of Literal values which can be further unpacked.
         :rtype: LiteralCollection
         """
+        if self._collection is None and self._idl_view is not None and self._idl_view.HasField("collection"):
+            self._collection = LiteralCollection.from_flyte_idl_view(self._idl_view.collection)
         return self._collection
 
     @property
@@ -752,6 +832,8 @@ class Literal(_common.FlyteIdlEntity):
         If not None, this value holds a map of Literal values which can be further unpacked.
         :rtype: LiteralMap
         """
+        if self._map is None and self._idl_view is not None and self._idl_view.HasField("map"):
+            self._map = LiteralMap.from_flyte_idl_view(self._idl_view.map)
         return self._map
 
     @property
@@ -766,6 +848,8 @@ class Literal(_common.FlyteIdlEntity):
         """
         :rtype: flyteidl.core.literals_pb2.Literal
         """
+        if self._idl_view is not None and self._scalar is None and self._collection is None and self._map is None:
+            return self._idl_view
         return _literals_pb2.Literal(
             scalar=self.scalar.to_flyte_idl() if self.scalar is not None else None,
             collection=self.collection.to_flyte_idl() if self.collection is not None else None,
@@ -1,31 +1,47 @@
+import gzip as _gzip
+import hashlib as _hashlib
+import io as _io
+import json as _json
+import logging as _logging
 import os as _os
-import subprocess as _subprocess
+import shutil as _shutil
+import stat as _stat
 import tarfile as _tarfile
 import tempfile as _tempfile
+import time as _time
+from concurrent.futures import ThreadPoolExecutor as _ThreadPoolExecutor
+from contextlib import contextmanager as _contextmanager
 from pathlib import Path as _Path
+from typing import BinaryIO, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
-import dirhash as _dirhash
-
-from flytekit.interfaces.data import data_proxy as _data_proxy
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.interfaces.data.data_proxy import Data as _Data
+from flytekit.tools import lazy_loader as _lazy_loader
 
 _tmp_versions_dir = "tmp/versions"
 
+# The first member of every package. It lists the fingerprint of every file of the packaged code and, for a package that
+# only holds the files changed since an earlier one, the location of that base package and the files deleted since.
+PACKAGE_MANIFEST = ".flyte-package.json"
 
-def compute_digest(source_dir: _os.PathLike) -> str:
-    """
-    Walks the entirety of the source dir to compute a deterministic hex digest of the dir contents.
-    :param _os.PathLike source_dir:
-    :return Text:
-    """
-    return f"fast{_dirhash.dirhash(source_dir, 'md5', match=['*.py'])}"
+_SUFFIXES = {"gzip": ".tar.gz", "zstd": ".tar.zst"}
+_CACHE_VERSION = 1
+# A package that only holds the changes to an earlier one has to leave out at least this fraction of the bytes,
+# otherwise the whole code is packaged, and becomes the base for the packages after it.
+_MAX_DELTA_FRACTION = 0.5
+# Packaged files get a modification time derived from their content rather than a constant one, which would let a
+# bytecode cache written for an older version of a file of the same size pass for the new one.
+_MTIME_EPOCH = 946684800
+_HASH_BLOCK_SIZE = 1024 * 1024
+# The number of versions install_distribution keeps the extracted code of.
+_CACHED_DISTRIBUTIONS = 8
 
+_zstd = _lazy_loader.lazy_load_module("zstandard") if _lazy_loader.is_installed("zstandard") else None
 
-def _write_marker(marker: _os.PathLike):
-    try:
-        open(marker, "x")
-    except FileExistsError:
-        pass
+
+class _PackageFile(NamedTuple):
+    fingerprint: str
+    size: int
 
 
 def filter_tar_file_fn(tarinfo: _tarfile.TarInfo) -> _tarfile.TarInfo:
@@ -43,19 +59,280 @@ def filter_tar_file_fn(tarinfo: _tarfile.TarInfo) -> _tarfile.TarInfo:
     return tarinfo
 
 
-def get_additional_distribution_loc(remote_location: str, identifier: str) -> str:
+def _package_entries(source_dir: _os.PathLike) -> Tuple[List[str], List[str]]:
+    """
+    Returns the directories and the files (and symlinks) under the source dir that go into a package, as sorted
+    relative posix paths, leaving out what filter_tar_file_fn does.
+    """
+    dirs, files = [], []
+    for root, dirnames, filenames in _os.walk(source_dir):
+        rel_root = _os.path.relpath(root, source_dir)
+        rel_root = "" if rel_root == "." else rel_root.replace(_os.sep, "/") + "/"
+        walked = []
+        for name in dirnames:
+            rel = rel_root + name
+            if filter_tar_file_fn(_tarfile.TarInfo(rel)) is None:
+                continue
+            if _os.path.islink(_os.path.join(root, name)):
+                files.append(rel)
+            else:
+                dirs.append(rel)
+                walked.append(name)
+        dirnames[:] = walked
+        files.extend(rel_root + name for name in filenames if filter_tar_file_fn(_tarfile.TarInfo(rel_root + name)))
+    return sorted(dirs), sorted(files)
+
+
+def _fingerprint(path: str, st: _os.stat_result) -> str:
+    if _stat.S_ISLNK(st.st_mode):
+        return "link:" + _hashlib.sha256(_os.readlink(path).encode()).hexdigest()
+    h = _hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(_HASH_BLOCK_SIZE), b""):
+            h.update(block)
+    return f"{h.hexdigest()}:{_file_mode(st.st_mode):o}"
+
+
+def _file_mode(mode: int) -> int:
+    return 0o755 if mode & 0o111 else 0o644
+
+
+def _load_state(path: Optional[str]) -> dict:
+    state = {"version": _CACHE_VERSION, "files": {}, "packages": {}}
+    if path and _os.path.exists(path):
+        try:
+            with open(path) as fh:
+                loaded = _json.load(fh)
+            if loaded.get("version") == _CACHE_VERSION:
+                state = loaded
+        except (OSError, ValueError):
+            _logging.warning(f"Ignoring the unreadable fast registration cache {path}")
+    return state
+
+
+def _save_state(path: Optional[str], state: dict):
+    if not path:
+        return
+    tmp = f"{path}.{_os.getpid()}.tmp"
+    try:
+        _os.makedirs(_os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w") as fh:
+            _json.dump(state, fh)
+        _os.replace(tmp, path)
+    except OSError as e:
+        _logging.warning(f"Could not write the fast registration cache {path}: {e}")
+
+
+def _cache_path() -> Optional[str]:
+    path = _sdk_config.FAST_REGISTRATION_CACHE_PATH.get()
+    return _os.path.abspath(_os.path.expanduser(path)) if path else None
+
+
+def _scan(source_dir: _os.PathLike, state: dict) -> Tuple[List[str], Dict[str, _PackageFile]]:
+    """
+    Fingerprints every file that goes into the package of the source dir, on a pool of threads. Files whose modification
+    time, size and mode match the cache are not read again. Updates the cache in the state, leaving out the files under
+    the source dir that no longer exist.
+    """
+    start = _time.perf_counter()
+    root = _os.path.abspath(source_dir)
+    dirs, files = _package_entries(root)
+    cached = state["files"]
+
+    def fingerprint(rel):
+        path = _os.path.join(root, rel)
+        st = _os.lstat(path)
+        entry = cached.get(path)
+        if entry and (entry["mtime_ns"], entry["size"], entry["mode"]) == (st.st_mtime_ns, st.st_size, st.st_mode):
+            return rel, path, entry, False
+        entry = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "mode": st.st_mode,
+            "fingerprint": _fingerprint(path, st),
+        }
+        return rel, path, entry, True
+
+    prefix = root + _os.sep
+    refreshed = {p: e for p, e in cached.items() if not p.startswith(prefix)}
+    result, hashed = {}, 0
+    with _ThreadPoolExecutor(max(1, _sdk_config.FAST_REGISTRATION_HASH_WORKERS.get())) as pool:
+        for rel, path, entry, fresh in pool.map(fingerprint, files):
+            refreshed[path] = entry
+            result[rel] = _PackageFile(entry["fingerprint"], entry["size"])
+            hashed += fresh
+    state["files"] = refreshed
+    _logging.info(
+        f"Fingerprinted {len(files)} files under {source_dir} in {_time.perf_counter() - start:.2f}s, "
+        f"{hashed} of them had to be read"
+    )
+    return dirs, result
+
+
+def _digest(files: Dict[str, _PackageFile]) -> str:
+    h = _hashlib.sha256()
+    for rel in sorted(files):
+        h.update(f"{rel}\0{files[rel].fingerprint}\n".encode())
+    return f"fast{h.hexdigest()[:32]}"
+
+
+def compute_digest(source_dir: _os.PathLike) -> str:
+    """
+    Walks the entirety of the source dir to compute a deterministic hex digest of the dir contents, that is of the path,
+    content and executable bit of every file that goes into its package.
+    :param _os.PathLike source_dir:
+    :return Text:
+    """
+    path = _cache_path()
+    state = _load_state(path)
+    _, files = _scan(source_dir, state)
+    _save_state(path, state)
+    return _digest(files)
+
+
+def _write_marker(marker: _os.PathLike):
+    try:
+        open(marker, "x")
+    except FileExistsError:
+        pass
+
+
+def archive_compression(path: str) -> Optional[str]:
+    """
+    Returns the compression of a package from its file name, or None if it is not a package.
+    :param Text path:
+    :rtype: Optional[Text]
+    """
+    for compression, suffix in _SUFFIXES.items():
+        if path.endswith(suffix):
+            return compression
+    return None
+
+
+def get_additional_distribution_loc(remote_location: str, identifier: str, compression: str = None) -> str:
     """
     :param Text remote_location:
     :param Text identifier:
+    :param Text compression: gzip or zstd, the configured compression if not given
     :return Text:
     """
-    return _os.path.join(remote_location, "{}.{}".format(identifier, "tar.gz"))
+    compression = compression or _sdk_config.FAST_REGISTRATION_COMPRESSION.get()
+    if compression not in _SUFFIXES:
+        raise ValueError(f"Unsupported fast registration compression {compression}, use one of {list(_SUFFIXES)}")
+    return _os.path.join(remote_location, f"{identifier}{_SUFFIXES[compression]}")
+
+
+def _require_zstd():
+    if _zstd is None:
+        raise ImportError("zstandard is required for zstd compressed packages, please pip install flytekit[zstd]")
+
+
+@_contextmanager
+def _package_writer(path: str, compression: str) -> Iterator[_tarfile.TarFile]:
+    with open(path, "wb") as raw:
+        if compression == "zstd":
+            _require_zstd()
+            # Compresses on all cores.
+            out = _zstd.ZstdCompressor(level=10, threads=-1).stream_writer(raw)
+        else:
+            # No file name or time in the header, so that the same files make the same package.
+            out = _gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+        with out, _tarfile.open(fileobj=out, mode="w|", format=_tarfile.PAX_FORMAT) as tar:
+            yield tar
+
+
+@_contextmanager
+def _package_reader(raw: BinaryIO, compression: str) -> Iterator[_tarfile.TarFile]:
+    """
+    Reads a package from a stream, front to back, without seeking.
+    """
+    if compression == "zstd":
+        _require_zstd()
+        with _zstd.ZstdDecompressor().stream_reader(raw) as stream, _tarfile.open(fileobj=stream, mode="r|") as tar:
+            yield tar
+    else:
+        with _tarfile.open(fileobj=raw, mode="r|gz") as tar:
+            yield tar
+
+
+def _normalized(info: _tarfile.TarInfo, mode: int, mtime: int) -> _tarfile.TarInfo:
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    info.mode = mode
+    info.mtime = mtime
+    return info
+
+
+def _write_package(
+    source_dir: _os.PathLike,
+    archive_path: str,
+    compression: str,
+    dirs: List[str],
+    files: Dict[str, _PackageFile],
+    manifest: dict,
+    included: Optional[List[str]] = None,
+) -> int:
+    """
+    Writes the manifest and then the given directories and files (all of them by default) in path order, with normalized
+    owners, modes and modification times, so that the same code always makes the same package.
+
+    :return: the number of files written
+    """
+    included = sorted(files) if included is None else included
+    with _package_writer(archive_path, compression) as tar:
+        data = _json.dumps(manifest, sort_keys=True).encode()
+        info = _normalized(_tarfile.TarInfo(PACKAGE_MANIFEST), 0o644, _MTIME_EPOCH)
+        info.size = len(data)
+        tar.addfile(info, _io.BytesIO(data))
+        for rel in sorted(dirs + included):
+            path = _os.path.join(source_dir, rel)
+            info = tar.gettarinfo(path, arcname=rel)
+            if info.isdir():
+                tar.addfile(_normalized(info, 0o755, _MTIME_EPOCH))
+                continue
+            digest = files[rel].fingerprint.rpartition(":")[2 if info.issym() else 0]
+            mtime = _MTIME_EPOCH + int(digest[:7], 16)
+            if info.issym():
+                tar.addfile(_normalized(info, 0o777, mtime))
+            else:
+                with open(path, "rb") as fh:
+                    tar.addfile(_normalized(info, _file_mode(info.mode), mtime), fh)
+    return len(included)
+
+
+def build_package(source_dir: _os.PathLike, archive_path: str, compression: str = None) -> str:
+    """
+    Packages all of the source dir into a reproducible archive at the given path.
+    :param _os.PathLike source_dir:
+    :param Text archive_path:
+    :param Text compression: gzip or zstd, the configured compression if not given
+    :return Text: the digest of the packaged code, see compute_digest
+    """
+    compression = compression or _sdk_config.FAST_REGISTRATION_COMPRESSION.get()
+    path = _cache_path()
+    state = _load_state(path)
+    dirs, files = _scan(source_dir, state)
+    _save_state(path, state)
+    _write_package(source_dir, archive_path, compression, dirs, files, _manifest(files))
+    return _digest(files)
+
+
+def _manifest(files: Dict[str, _PackageFile], base: str = None, deleted: List[str] = ()) -> dict:
+    return {
+        "version": _CACHE_VERSION,
+        "files": {rel: f.fingerprint for rel, f in files.items()},
+        "base": base,
+        "deleted": sorted(deleted),
+    }
 
 
 def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: str, dry_run=False) -> str:
     """
     Uploads the contents of the source dir as a tar package to a destination specified by the unique identifier and
     remote_location.
+
+    With fast_registration_dedup set, the package only holds the files that changed since the last whole package
+    uploaded to the same remote location, and names that package as its base, see download_distribution.
     :param _os.PathLike source_dir:
     :param Text identifier:
     :param Text remote_location:
@@ -65,7 +342,8 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
     tmp_versions_dir = _os.path.join(_os.getcwd(), _tmp_versions_dir)
     _os.makedirs(tmp_versions_dir, exist_ok=True)
     marker = _Path(_os.path.join(tmp_versions_dir, identifier))
-    full_remote_path = get_additional_distribution_loc(remote_location, identifier)
+    compression = _sdk_config.FAST_REGISTRATION_COMPRESSION.get()
+    full_remote_path = get_additional_distribution_loc(remote_location, identifier, compression)
     if _os.path.exists(marker):
         print("Local marker for identifier {} already exists, skipping upload".format(identifier))
         return full_remote_path
@@ -75,15 +353,51 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
         _write_marker(marker)
         return full_remote_path
 
-    with _tempfile.NamedTemporaryFile() as fp:
-        # Write using gzip
-        with _tarfile.open(fp.name, "w:gz") as tar:
-            tar.add(source_dir, arcname="", filter=filter_tar_file_fn)
+    cache_path = _cache_path()
+    state = _load_state(cache_path)
+    start = _time.perf_counter()
+    dirs, files = _scan(source_dir, state)
+    hash_seconds = _time.perf_counter() - start
+
+    base, included, deleted = None, None, []
+    previous = state["packages"].get(remote_location)
+    if _sdk_config.FAST_REGISTRATION_DEDUP.get() and previous and _Data.data_exists(previous["archive"]):
+        changed = [rel for rel, f in files.items() if previous["files"].get(rel) != f.fingerprint]
+        total = sum(f.size for f in files.values())
+        if sum(files[rel].size for rel in changed) <= _MAX_DELTA_FRACTION * total:
+            base, included = previous["archive"], changed
+            deleted = [rel for rel in previous["files"] if rel not in files]
+            # The directories of the base package exist once it is extracted.
+            dirs = [d for d in dirs if not any(rel.startswith(d + "/") for rel in previous["files"])]
+
+    with _tempfile.TemporaryDirectory() as tmp:
+        archive = _os.path.join(tmp, _os.path.basename(full_remote_path))
+        start = _time.perf_counter()
+        written = _write_package(
+            source_dir, archive, compression, dirs, files, _manifest(files, base, deleted), included
+        )
+        compress_seconds = _time.perf_counter() - start
+        size = _os.path.getsize(archive)
+        start = _time.perf_counter()
         if dry_run:
-            print("Would upload {} to {}".format(fp.name, full_remote_path))
+            print("Would upload {} to {}".format(archive, full_remote_path))
         else:
-            _Data.put_data(fp.name, full_remote_path)
-            print("Uploaded {} to {}".format(fp.name, full_remote_path))
+            _Data.put_data(archive, full_remote_path)
+            print("Uploaded {} to {}".format(archive, full_remote_path))
+        upload_seconds = _time.perf_counter() - start
+
+    print(
+        f"Hashed {len(files)} files in {hash_seconds:.2f}s, packaged {written} of them "
+        + (f"on top of {base} " if base else "")
+        + f"into {size / 1024:.1f} KiB ({compression}) in {compress_seconds:.2f}s, uploaded in {upload_seconds:.2f}s"
+    )
+
+    if base is None and not dry_run:
+        state["packages"][remote_location] = {
+            "archive": full_remote_path,
+            "files": {rel: f.fingerprint for rel, f in files.items()},
+        }
+    _save_state(cache_path, state)
 
     # Finally, touch the marker file so we have a flag in the future to avoid re-uploading the package dir as an
     # optimization
@@ -91,21 +405,148 @@ def upload_package(source_dir: _os.PathLike, identifier: str, remote_location: s
     return full_remote_path
 
 
-def download_distribution(additional_distribution: str, destination: str):
+def _within(root: str, path: str) -> bool:
+    return path == root or path.startswith(root + _os.sep)
+
+
+def _safe_path(root: str, name: str) -> str:
+    """
+    Joins a relative name from a package to the real path of the destination it is installed to. Refuses absolute
+    names, names with "..", and names whose parent directory resolves outside of the destination through a symlink.
+    """
+    if _os.path.isabs(name) or ".." in _Path(name).parts:
+        raise ValueError(f"Refusing to install {name} outside of the destination")
+    if not _within(root, _os.path.realpath(_os.path.join(root, _os.path.dirname(name)))):
+        raise ValueError(f"Refusing to install {name}, which leads outside of the destination")
+    return _os.path.join(root, name)
+
+
+def _safe_members(tar: _tarfile.TarFile, destination: str) -> Iterator[_tarfile.TarInfo]:
+    """
+    Yields the members of a package that is extracted into destination, and refuses any that would write outside of it:
+    absolute paths and paths with "..", links whose target is outside, and paths that go through a symlink to outside.
+    Each member is checked against what is on disk right before it is extracted, so this covers the symlinks extracted
+    earlier from the same package or from its base, as well as those that were in the destination already.
     """
-    Downloads a remote code distribution and overwrites any local files.
+    root = _os.path.realpath(destination)
+    for member in tar:
+        if member.name == PACKAGE_MANIFEST:
+            continue
+        path = _safe_path(root, member.name)
+        if member.issym():
+            target = _os.path.realpath(_os.path.join(_os.path.dirname(path), member.linkname))
+        elif member.islnk():
+            target = _os.path.realpath(_os.path.join(root, member.linkname))
+        else:
+            target = _os.path.realpath(path)
+        if not _within(root, target):
+            raise ValueError(f"Refusing to install {member.name}, which leads outside of the destination")
+        yield member
+
+
+def download_distribution(additional_distribution: str, destination: str) -> List[str]:
+    """
+    Downloads a remote code distribution and overwrites any local files. The package is extracted as it streams in,
+    without a copy of the archive on disk. A package that only holds the changes to a base package is extracted after
+    that one, and the files deleted since are removed.
     :param Text additional_distribution:
     :param _os.PathLike destination:
+    :return: the files of the distribution, relative to the destination
     """
-    _data_proxy.Data.get_data(additional_distribution, destination)
-    tarfile_name = _os.path.basename(additional_distribution)
-    file_suffix = _Path(tarfile_name).suffixes
-    if len(file_suffix) != 2 or file_suffix[0] != ".tar" or file_suffix[1] != ".gz":
+    compression = archive_compression(additional_distribution)
+    if compression is None:
         raise ValueError("Unrecognized additional distribution format for {}".format(additional_distribution))
 
-    # This will overwrite the existing user flyte workflow code in the current working code dir.
-    result = _subprocess.run(
-        ["tar", "-xvf", _os.path.join(destination, tarfile_name), "-C", destination],
-        stdout=_subprocess.PIPE,
-    )
-    result.check_returncode()
+    manifest = {}
+    installed = set()
+
+    def _record(members):
+        for member in members:
+            if not member.isdir():
+                installed.add(_os.path.normpath(member.name))
+            yield member
+
+    with _Data.open_data(additional_distribution) as raw, _package_reader(raw, compression) as tar:
+        first = tar.next()
+        # Packages made by older versions of flytekit have no manifest.
+        if first is not None and first.name == PACKAGE_MANIFEST:
+            manifest = _json.load(tar.extractfile(first))
+        if manifest.get("base"):
+            installed.update(download_distribution(manifest["base"], destination))
+        # This will overwrite the existing user flyte workflow code in the current working code dir.
+        tar.extractall(destination, members=_record(_safe_members(tar, destination)))
+    root = _os.path.realpath(destination)
+    for rel in manifest.get("deleted", []):
+        # The entry itself is removed, not what it links to, so only its parent has to be within the destination.
+        path = _safe_path(root, rel)
+        installed.discard(_os.path.normpath(rel))
+        if _os.path.lexists(path):
+            _os.remove(path)
+    return sorted(installed)
+
+
+def _copy_tree(source: str, destination: str) -> List[str]:
+    copied = []
+    for root, dirnames, filenames in _os.walk(source):
+        target = _os.path.join(destination, _os.path.relpath(root, source))
+        _os.makedirs(target, exist_ok=True)
+        for name in dirnames + filenames:
+            src, dst = _os.path.join(root, name), _os.path.join(target, name)
+            if _os.path.islink(src):
+                if _os.path.lexists(dst):
+                    _os.remove(dst)
+                _os.symlink(_os.readlink(src), dst)
+            elif name in filenames:
+                _shutil.copy2(src, dst)
+            else:
+                continue
+            copied.append(_os.path.relpath(src, source))
+    return sorted(copied)
+
+
+def _prune_cache(cache_dir: str, keep: int):
+    installed = [
+        _os.path.join(cache_dir, name)
+        for name in _os.listdir(cache_dir)
+        if not name.startswith(".") and _os.path.isdir(_os.path.join(cache_dir, name))
+    ]
+    installed.sort(key=_os.path.getmtime, reverse=True)
+    for path in installed[keep:]:
+        _shutil.rmtree(path, ignore_errors=True)
+
+
+def install_distribution(additional_distribution: str, destination: str, cache_dir: Optional[str] = None):
+    """
+    Installs a remote code distribution into the destination, like download_distribution. Packages are named after the
+    digest of the code they hold, so with a cache dir the extracted code of the latest packages is kept there under that
+    name, and installing one of them again is a local copy.
+    :param Text additional_distribution:
+    :param _os.PathLike destination:
+    :param Text cache_dir:
+    :return: the files of the distribution, relative to the destination
+    """
+    if not cache_dir:
+        return download_distribution(additional_distribution, destination)
+
+    cache_dir = _os.path.expanduser(cache_dir)
+    _os.makedirs(cache_dir, exist_ok=True)
+    name = _os.path.basename(additional_distribution)
+    cached = _os.path.join(cache_dir, name[: -len(_SUFFIXES[archive_compression(name) or "gzip"])])
+    if _os.path.isdir(cached):
+        _logging.info(f"Installing {additional_distribution} from {cached}")
+        _os.utime(cached)
+    else:
+        # Extracted next to its final place and then renamed, so that a partial install is never used. When tasks on
+        # the same node race to install a version, the first one to finish wins.
+        partial = _tempfile.mkdtemp(prefix=".install-", dir=cache_dir)
+        try:
+            download_distribution(additional_distribution, partial)
+            try:
+                _os.rename(partial, cached)
+            except OSError:
+                if not _os.path.isdir(cached):
+                    raise
+        finally:
+            _shutil.rmtree(partial, ignore_errors=True)
+        _prune_cache(cache_dir, _CACHED_DISTRIBUTIONS)
+    return _copy_tree(cached, destination)
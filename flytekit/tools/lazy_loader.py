@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib as _importlib
+import importlib.util as _importlib_util
 import sys as _sys
 import types as _types
 from typing import List
@@ -42,6 +43,19 @@ class LazyLoadPlugin(object):
         return d
 
 
+def is_installed(module: str) -> bool:
+    """
+    Whether a module could be imported, without importing it (only its parent packages).
+
+    :param Text module:
+    :rtype: bool
+    """
+    try:
+        return _importlib_util.find_spec(module) is not None
+    except ImportError:
+        return False
+
+
 def lazy_load_module(module: str) -> _types.ModuleType:
     """
     :param Text module:
@@ -1,26 +1,291 @@
+import ast
 import contextlib
+import hashlib
 import importlib
+import inspect
+import json
+import logging as _logging
 import os
-import pkgutil
 import sys
-from typing import Iterator, List, Union
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import ModuleType
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.common.local_workflow import SdkRunnableWorkflow as _SdkRunnableWorkflow
 from flytekit.common.mixins import registerable as _registerable
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core.context_manager import FlyteEntities
 
+_ENTITY_NAMES = frozenset(["task", "workflow", "dynamic", "LaunchPlan", "workflow_class"])
+_ENTITY_SUFFIXES = ("_task", "Task", "Workflow")
+_CACHE_VERSION = 1
 
-def iterate_modules(pkgs):
-    for package_name in pkgs:
-        package = importlib.import_module(package_name)
-        yield package
 
-        # Check if package is a python file. If so, there is no reason to walk.
-        if not hasattr(package, "__path__"):
+def _declares_entities(source: bytes) -> bool:
+    """
+    A cheap guess whether a module declares tasks, workflows or launch plans, from the names it uses.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # Importing the module reports the error.
+        return True
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            name = node.id
+        elif isinstance(node, ast.Attribute):
+            name = node.attr
+        elif isinstance(node, ast.alias):
+            name = node.name.rpartition(".")[2]
+        else:
             continue
+        if name in _ENTITY_NAMES or name.endswith(_ENTITY_SUFFIXES):
+            return True
+    return False
+
+
+def _is_package(listing: dict) -> bool:
+    return any(inspect.getmodulename(n) == "__init__" for n in listing["names"])
+
+
+class ModuleDiscovery(object):
+    """
+    Finds and imports the modules of workflow packages, in the order :py:func:`pkgutil.walk_packages` would.
+
+    The package tree is read from the file system rather than by importing every subpackage first, and directories are
+    listed by a pool of threads. So are the module files read and hashed when they are new or modified since the cache
+    was written, and scanned by :py:func:`_declares_entities` when pre-filtering. Importing stays serial: imports take
+    the interpreter's import lock, and the order entities are created in is the order they are serialized in.
+
+    The cache keeps every directory listing by modification time, and for every module file whether it passed the
+    pre-filter and the names of the entities found in it when last imported, by modification time and size, falling
+    back to the content hash when those changed. It only holds what the last discovery walked, so it does not grow
+    with every project it was used for.
+    """
+
+    def __init__(self, cache_path: Optional[str] = None, prefilter: bool = False, concurrency: int = 8):
+        self._cache_path = os.path.abspath(os.path.expanduser(cache_path)) if cache_path else None
+        self._prefilter = prefilter
+        self._concurrency = max(concurrency, 1)
+        self._dirs, self._files = self._load_cache()
+        self._dirty = False
+        self._visited = set()
+        self._module_files = {}
+        self.timings: Dict[str, float] = {}
+        """Seconds each module took to import, by module name"""
+        self.skipped: List[str] = []
+        """The modules that the pre-filter left out"""
+
+    @classmethod
+    def from_config(cls) -> "ModuleDiscovery":
+        prefilter = _sdk_config.MODULE_PREFILTER.get()
+        return cls(
+            # Without the pre-filter, nothing reads the cache back.
+            cache_path=_sdk_config.MODULE_CACHE_PATH.get() if prefilter else None,
+            prefilter=prefilter,
+            concurrency=_sdk_config.MODULE_DISCOVERY_CONCURRENCY.get(),
+        )
+
+    def _load_cache(self) -> Tuple[Dict[str, dict], Dict[str, dict]]:
+        if self._cache_path and os.path.exists(self._cache_path):
+            try:
+                with open(self._cache_path) as fh:
+                    cache = json.load(fh)
+                if cache.get("version") == _CACHE_VERSION:
+                    return cache["dirs"], cache["files"]
+            except (OSError, ValueError, KeyError):
+                _logging.warning(f"Ignoring the unreadable module cache {self._cache_path}")
+        return {}, {}
+
+    def save(self):
+        """
+        Writes the cache, with the files and directories walked this time only.
+        """
+        if not self._cache_path or not (self._dirty or set(self._dirs).union(self._files) - self._visited):
+            return
+
+        cache = {
+            "version": _CACHE_VERSION,
+            "dirs": {p: e for p, e in self._dirs.items() if p in self._visited},
+            "files": {p: e for p, e in self._files.items() if p in self._visited},
+        }
+        tmp = f"{self._cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(tmp, "w") as fh:
+                json.dump(cache, fh)
+            os.replace(tmp, self._cache_path)
+            self._dirty = False
+        except OSError as e:
+            _logging.warning(f"Could not write the module cache {self._cache_path}: {e}")
 
-        for _, name, _ in pkgutil.walk_packages(package.__path__, prefix="{}.".format(package_name)):
-            yield importlib.import_module(name)
+    def _listing(self, path: str) -> Tuple[str, Optional[dict]]:
+        """
+        Returns the cached listing of a directory, or a new one if it changed since.
+        """
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return path, {"mtime_ns": None, "names": [], "dirs": []}
+        cached = self._dirs.get(path)
+        if cached and cached["mtime_ns"] == mtime:
+            return path, None
+        with os.scandir(path) as it:
+            entries = list(it)
+        return path, {
+            "mtime_ns": mtime,
+            "names": sorted(e.name for e in entries),
+            "dirs": sorted(e.name for e in entries if e.is_dir()),
+        }
+
+    def _scan(self, path: str) -> Tuple[str, Optional[dict]]:
+        """
+        Returns a new cache entry for a module file, or None if the cached one still holds.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return path, None
+        cached = self._files.get(path)
+        stale = cached is None or (self._prefilter and cached["candidate"] is None)
+        if not stale and cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return path, None
+        with open(path, "rb") as fh:
+            source = fh.read()
+        digest = hashlib.sha256(source).hexdigest()
+        if not stale and cached["sha256"] == digest:
+            return path, dict(cached, mtime_ns=st.st_mtime_ns, size=st.st_size)
+        candidate = None
+        if self._prefilter:
+            candidate = not path.endswith(".py") or _declares_entities(source)
+        return path, {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": digest,
+            "candidate": candidate,
+            "entities": None,
+        }
+
+    def _walk(self, paths: List[str], prefix: str) -> List[Tuple[str, str]]:
+        """
+        The names and files of the modules under the given package directories, in the order of
+        :py:func:`pkgutil.walk_packages`.
+        """
+        roots = [os.path.abspath(p) for p in paths]
+        listings = {}
+        with ThreadPoolExecutor(self._concurrency) as pool:
+            level = roots
+            while level:
+                for path, listing in pool.map(self._listing, level):
+                    if listing is not None:
+                        self._dirs[path] = listing
+                        self._dirty = True
+                    listings[path] = self._dirs[path]
+                # Only the subdirectories of packages can hold modules, and have to be listed to tell if they do.
+                level = [
+                    os.path.join(p, d)
+                    for p in level
+                    if p in roots or _is_package(listings[p])
+                    for d in listings[p]["dirs"]
+                    if "." not in d
+                ]
+
+            modules = []
+            self._order(roots, prefix, listings, modules)
+            self._visited.update(listings)
+            if self._cache_path or self._prefilter:
+                for path, entry in pool.map(self._scan, [f for _, f in modules]):
+                    if entry is not None:
+                        self._files[path] = entry
+                        self._dirty = True
+            self._visited.update(f for _, f in modules)
+        return modules
+
+    def _order(self, paths: List[str], prefix: str, listings: Dict[str, dict], modules: List[Tuple[str, str]]):
+        # Follows pkgutil.iter_modules for each directory, and descends into packages like walk_packages.
+        yielded = set()
+        for path in paths:
+            listing = listings[path]
+            for fn in listing["names"]:
+                modname = inspect.getmodulename(fn)
+                if modname == "__init__" or modname in yielded:
+                    continue
+                child = os.path.join(path, fn)
+                if not modname and fn in listing["dirs"] and "." not in fn:
+                    if not _is_package(listings[child]):
+                        continue
+                    init = next(n for n in listings[child]["names"] if inspect.getmodulename(n) == "__init__")
+                    yielded.add(fn)
+                    modules.append((prefix + fn, os.path.join(child, init)))
+                    self._order([child], f"{prefix}{fn}.", listings, modules)
+                elif modname and "." not in modname:
+                    yielded.add(modname)
+                    modules.append((prefix + modname, child))
+
+    def _import(self, name: str, path: Optional[str] = None) -> ModuleType:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        self.timings[name] = time.perf_counter() - start
+        _logging.debug(f"Imported {name} in {self.timings[name]:.3f}s")
+        entry = self._files.get(path)
+        if entry is not None:
+            entities = {id(e) for e in FlyteEntities.entities}
+            names = sorted(
+                k
+                for k, o in vars(module).items()
+                if id(o) in entities or isinstance(o, _registerable.RegisterableEntity)
+            )
+            if entry["entities"] != names:
+                entry["entities"] = names
+                self._dirty = True
+        return module
+
+    def entities(self, path: str) -> Optional[List[str]]:
+        """
+        The names the module file at the given path bound to tasks, workflows or launch plans when it was last imported,
+        or None if it was not imported since it changed.
+        """
+        entry = self._files.get(os.path.abspath(path))
+        return entry and entry["entities"]
+
+    def iterate_modules(self, pkgs: List[str]) -> Iterator[ModuleType]:
+        """
+        Imports and yields the given packages, and all packages and modules under them, pre-filtered if configured so.
+        The cache is written once all are imported.
+        """
+        try:
+            for package_name in pkgs:
+                package = self._import(package_name)
+                yield package
+
+                # Check if package is a python file. If so, there is no reason to walk.
+                if not hasattr(package, "__path__"):
+                    continue
+
+                for name, path in self._walk(list(package.__path__), f"{package_name}."):
+                    entry = self._files.get(path)
+                    if self._prefilter and entry is not None and not (entry["candidate"] or entry["entities"]):
+                        _logging.debug(f"Skipping {name}, which does not seem to declare entities")
+                        self.skipped.append(name)
+                        continue
+                    yield self._import(name, path)
+        finally:
+            self.save()
+            slowest = sorted(self.timings.items(), key=lambda t: t[1], reverse=True)[:5]
+            _logging.debug(
+                f"Imported {len(self.timings)} modules in {sum(self.timings.values()):.2f}s, skipped "
+                f"{len(self.skipped)}. Slowest: " + ", ".join(f"{n} {t:.3f}s" for n, t in slowest)
+            )
+
+
+def iterate_modules(pkgs, discovery: ModuleDiscovery = None) -> Iterator[ModuleType]:
+    """
+    Imports and yields the given packages and everything under them, see :py:class:`ModuleDiscovery`, which is
+    configured from the sdk settings unless given.
+    """
+    return (discovery or ModuleDiscovery.from_config()).iterate_modules(pkgs)
 
 
 @contextlib.contextmanager
@@ -38,10 +303,8 @@ def just_load_modules(pkgs: List[str]):
     """
     This one differs from the above in that we don't yield anything, just load all the modules.
     """
-    for package_name in pkgs:
-        package = importlib.import_module(package_name)
-        for _, name, _ in pkgutil.walk_packages(package.__path__, prefix="{}.".format(package_name)):
-            importlib.import_module(name)
+    for _ in iterate_modules(pkgs):
+        pass
 
 
 def load_workflow_modules(pkgs):
@@ -5,6 +5,7 @@ import typing
 from pathlib import Path
 
 from flytekit.core.context_manager import FlyteContext
+from flytekit.core.lazy_download import LazyDownload
 from flytekit.core.type_engine import TypeEngine, TypeTransformer
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
@@ -221,9 +222,8 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
 
         # For the remote case, return an FlyteDirectory object that can download
         local_folder = ctx.file_access.get_random_local_directory()
-
-        def _downloader():
-            return ctx.file_access.get_data(uri, local_folder, is_multipart=True)
+        # Downloads at most once, and starts right away if blob inputs are prefetched.
+        _downloader = LazyDownload(ctx.file_access, uri, local_folder, is_multipart=True)
 
         expected_format = self.get_format(expected_python_type)
 
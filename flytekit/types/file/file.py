@@ -4,6 +4,7 @@ import os
 import typing
 
 from flytekit.core.context_manager import FlyteContext
+from flytekit.core.lazy_download import LazyDownload
 from flytekit.core.type_engine import TypeEngine, TypeTransformer
 from flytekit.models import types as _type_models
 from flytekit.models.core import types as _core_types
@@ -263,9 +264,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         # For the remote case, return an FlyteFile object that can download
         local_path = ctx.file_access.get_random_local_path(uri)
-
-        def _downloader():
-            return ctx.file_access.get_data(uri, local_path, is_multipart=False)
+        # Downloads at most once, and starts right away if blob inputs are prefetched.
+        _downloader = LazyDownload(ctx.file_access, uri, local_path)
 
         expected_format = FlyteFilePathTransformer.get_format(expected_python_type)
         ff = FlyteFile[expected_format](local_path, _downloader)
@@ -15,6 +15,7 @@ from .types import (
     FlyteSchema,
     LocalIOSchemaReader,
     LocalIOSchemaWriter,
+    SchemaChunk,
     SchemaEngine,
     SchemaFormat,
     SchemaHandler,
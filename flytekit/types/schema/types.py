@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import datetime as _datetime
+import itertools
+import json
 import os
 import typing
 from abc import abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Type
 
 import numpy as _np
 
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core.context_manager import FlyteContext
 from flytekit.core.type_engine import T, TypeEngine, TypeTransformer
 from flytekit.models.literals import Literal, Scalar, Schema
@@ -20,11 +24,11 @@ from flytekit.plugins import pandas
 class SchemaFormat(Enum):
     """
     Represents the the schema storage format (at rest).
-    Currently only parquet is supported
+    Currently parquet and Arrow IPC (Feather v2) are supported
     """
 
     PARQUET = "parquet"
-    # ARROW = "arrow"
+    ARROW = "arrow"
     # HDF5 = "hdf5"
     # CSV = "csv"
     # RECORDIO = "recordio"
@@ -35,11 +39,40 @@ class SchemaOpenMode(Enum):
     WRITE = "w"
 
 
-def generate_ordered_files(directory: os.PathLike, n: int) -> typing.Generator[os.PathLike, None, None]:
-    for i in range(n):
+def generate_ordered_files(
+    directory: os.PathLike, n: typing.Optional[int] = None
+) -> typing.Generator[os.PathLike, None, None]:
+    """
+    Generates the chunk file names for a schema directory, endlessly if n is None. Names are zero-padded to five digits
+    and grow longer past 99999, which :py:func:`_chunk_order` takes into account.
+    """
+    for i in range(n) if n is not None else itertools.count():
         yield os.path.join(directory, f"{i:05}")
 
 
+def _chunk_order(name: str) -> typing.Tuple[int, str]:
+    # Shorter names come first, so that 100000 sorts after 99999.
+    return len(name), name
+
+
+SCHEMA_MANIFEST = ".manifest.json"
+"""
+The file, next to the chunks of a schema, in which writers record every chunk. Readers skip dot files when listing
+chunks, so the manifest is never mistaken for one.
+"""
+
+
+@dataclass
+class SchemaChunk(object):
+    """
+    One chunk file of a schema as recorded in its manifest.
+    """
+
+    name: str
+    rows: typing.Optional[int]
+    size: int
+
+
 class SchemaReader(typing.Generic[T]):
     """
     Base SchemaReader to handle any readers (that can manage their own IO or otherwise)
@@ -75,8 +108,7 @@ class SchemaWriter(typing.Generic[T]):
         self._to_path = to_path
         self._fmt = fmt
         self._columns = cols
-        # TODO This should be change to send a stop instead of hardcoded to 1024
-        self._file_name_gen = generate_ordered_files(self._to_path, 1024)
+        self._file_name_gen = generate_ordered_files(self._to_path)
 
     @property
     def to_path(self) -> str:
@@ -101,33 +133,91 @@ class LocalIOSchemaReader(SchemaReader[T]):
     def _read(self, *path: os.PathLike, **kwargs) -> T:
         pass
 
-    def iter(self, **kwargs) -> typing.Generator[T, None, None]:
-        with os.scandir(self._from_path) as it:
-            for entry in it:
-                if not entry.name.startswith(".") and entry.is_file():
-                    yield self._read(entry.path, **kwargs)
-
-    def all(self, **kwargs) -> T:
+    def _chunk_paths(self) -> typing.List[str]:
+        """
+        The chunk files in the order they were written. Writers name chunks with zero-padded sequence numbers, so
+        sorting by name restores that order regardless of what order the filesystem lists them in.
+        """
         files = []
         with os.scandir(self._from_path) as it:
             for entry in it:
                 if not entry.name.startswith(".") and entry.is_file():
                     files.append(entry.path)
+        return sorted(files, key=lambda p: _chunk_order(os.path.basename(p)))
+
+    def manifest(self) -> typing.Optional[typing.List[SchemaChunk]]:
+        """
+        The chunks in the order they were written, with their row counts and sizes, as recorded by the writer. Use it to
+        plan partial or parallel reads with :py:meth:`read_chunks`. Returns None for schemas written without a manifest.
+        """
+        try:
+            with open(os.path.join(self._from_path, SCHEMA_MANIFEST)) as fh:
+                return [SchemaChunk(**c) for c in json.load(fh)["chunks"]]
+        except FileNotFoundError:
+            return None
+
+    def read_chunks(self, chunks: typing.Iterable[typing.Union[SchemaChunk, str]], **kwargs) -> T:
+        """
+        Reads only the given chunks, in the given order, as one data frame.
+        """
+        names = [c.name if isinstance(c, SchemaChunk) else c for c in chunks]
+        return self._read(*[os.path.join(self._from_path, n) for n in names], **kwargs)
+
+    def iter(self, **kwargs) -> typing.Generator[T, None, None]:
+        for path in self._chunk_paths():
+            yield self._read(path, **kwargs)
 
-        return self._read(*files, **kwargs)
+    def all(self, **kwargs) -> T:
+        return self._read(*self._chunk_paths(), **kwargs)
 
 
 class LocalIOSchemaWriter(SchemaWriter[T]):
     def __init__(self, to_local_path: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(str(to_local_path), cols, fmt)
+        self._chunks: typing.List[SchemaChunk] = []
 
     @abstractmethod
     def _write(self, df: T, path: os.PathLike, **kwargs):
         pass
 
+    def _split(self, df: T) -> typing.Iterable[T]:
+        """
+        Splits a data frame into the pieces that are written as separate chunks. By default every frame is one chunk.
+        """
+        return [df]
+
+    def _num_rows(self, df: T) -> typing.Optional[int]:
+        """
+        The number of rows recorded in the manifest for a chunk, if the writer can tell.
+        """
+        return None
+
+    def _write_chunk(self, df: T, path: str, **kwargs) -> SchemaChunk:
+        self._write(df, path, **kwargs)
+        return SchemaChunk(name=os.path.basename(path), rows=self._num_rows(df), size=os.path.getsize(path))
+
     def write(self, *dfs, **kwargs):
-        for df in dfs:
-            self._write(df, next(self._file_name_gen), **kwargs)
+        """
+        Writes the data frames as chunks following any already written. Frames are split as :py:meth:`_split` decides
+        and up to ``sdk.schema_write_concurrency`` chunks are encoded at the same time. Chunk names are assigned
+        before encoding starts, so the chunks keep the order of the frames.
+        """
+        pieces = [(piece, next(self._file_name_gen)) for df in dfs for piece in self._split(df)]
+        workers = min(len(pieces), _sdk_config.SCHEMA_WRITE_CONCURRENCY.get())
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="flyte-schema-write") as executor:
+                futures = [executor.submit(self._write_chunk, piece, path, **kwargs) for piece, path in pieces]
+                chunks = [f.result() for f in futures]
+        else:
+            chunks = [self._write_chunk(piece, path, **kwargs) for piece, path in pieces]
+        self._chunks.extend(chunks)
+        self._write_manifest()
+
+    def _write_manifest(self):
+        tmp = os.path.join(self._to_path, f"{SCHEMA_MANIFEST}.tmp")
+        with open(tmp, "w") as fh:
+            json.dump({"format": self._fmt.value, "chunks": [asdict(c) for c in self._chunks]}, fh)
+        os.replace(tmp, os.path.join(self._to_path, SCHEMA_MANIFEST))
 
 
 @dataclass
@@ -187,22 +277,26 @@ class FlyteSchema(object):
     def __class_getitem__(
         cls, columns: typing.Dict[str, typing.Type], fmt: SchemaFormat = SchemaFormat.PARQUET
     ) -> Type[FlyteSchema]:
+        # FlyteSchema[columns, fmt] arrives here as a single tuple
+        if isinstance(columns, tuple):
+            columns, fmt = columns
+
         if columns is None:
-            return FlyteSchema
+            columns = {}
 
         if not isinstance(columns, dict):
             raise AssertionError(
                 f"Columns should be specified as an ordered dict of column names and their types, received {type(columns)}"
             )
 
-        if len(columns) == 0:
-            return FlyteSchema
-
         if not isinstance(fmt, SchemaFormat):
             raise AssertionError(
                 f"Only FlyteSchemaFormat types are supported, received format is {fmt} of type {type(fmt)}"
             )
 
+        if len(columns) == 0 and fmt == SchemaFormat.PARQUET:
+            return FlyteSchema
+
         class _TypedSchema(FlyteSchema):
             # Get the type engine to see this as kind of a generic
             __origin__ = FlyteSchema
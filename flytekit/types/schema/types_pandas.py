@@ -2,6 +2,8 @@ import os
 import typing
 from typing import Type
 
+import numpy as _np
+
 from flytekit import FlyteContext
 from flytekit.configuration import sdk
 from flytekit.core.type_engine import T, TypeEngine, TypeTransformer
@@ -18,13 +20,50 @@ class ParquetIO(object):
         return pandas.read_parquet(chunk, columns=columns, engine=self.PARQUET_ENGINE, **kwargs)
 
     def read(self, *files: os.PathLike, columns: typing.List[str] = None, **kwargs) -> pandas.DataFrame:
-        frames = [self._read(chunk=f, columns=columns, **kwargs) for f in files if os.path.getsize(f) > 0]
-        if len(frames) == 1:
-            return frames[0]
-        elif len(frames) > 1:
-            return pandas.concat(frames, copy=True)
+        files = [f for f in files if os.path.getsize(f) > 0]
+        if len(files) == 1:
+            return self._read(chunk=files[0], columns=columns, **kwargs)
+        elif len(files) > 1:
+            return self._read_all(files, columns=columns, **kwargs)
         return pandas.DataFrame()
 
+    def _read_all(self, files: typing.List[os.PathLike], columns: typing.List[str], **kwargs) -> pandas.DataFrame:
+        import pyarrow.parquet as _pq
+
+        return _tables_to_pandas(
+            [_pq.read_table(f, columns=columns, use_pandas_metadata=True, **kwargs) for f in files]
+        )
+
+    def read_table(self, *files: os.PathLike, columns: typing.List[str] = None) -> "pyarrow.Table":
+        """
+        Reads the chunks into a single arrow table, without converting to pandas.
+        """
+        import pyarrow as _pa
+        import pyarrow.parquet as _pq
+
+        return _pa.concat_tables([_pq.read_table(f, columns=columns) for f in files if os.path.getsize(f) > 0])
+
+    def iter_batches(
+        self,
+        *files: os.PathLike,
+        columns: typing.List[str] = None,
+        filters=None,
+        max_rows: typing.Optional[int] = None,
+        max_bytes: typing.Optional[int] = None,
+    ) -> typing.Generator["pyarrow.RecordBatch", None, None]:
+        """
+        Streams the chunks as arrow record batches, in the order of ``files``, without materializing more than one
+        batch at a time.
+
+        :param columns: only these columns are read from disk
+        :param filters: a pyarrow.dataset expression, or filters in the DNF form that pandas.read_parquet takes, e.g.
+            ``[("a", ">", 3)]``. Row groups whose statistics exclude a match are skipped without being read.
+        :param max_rows: upper bound on the rows in one batch
+        :param max_bytes: upper bound on the in-memory size of one batch. Batches are sliced, without copying, based
+            on the average row size; a single row larger than this is still yielded on its own.
+        """
+        return _iter_dataset_batches(files, "parquet", columns, filters, max_rows, max_bytes)
+
     def write(
         self,
         df: pandas.DataFrame,
@@ -55,9 +94,122 @@ class ParquetIO(object):
         )
 
 
+def _range_index(table) -> typing.Optional[typing.Tuple[typing.Tuple[int, int, int], typing.Optional[str]]]:
+    """
+    Returns ((start, stop, step), name) if the table was written from a frame with a RangeIndex.
+    """
+    metadata = table.schema.pandas_metadata or {}
+    index_columns = metadata.get("index_columns", [])
+    if len(index_columns) == 1 and isinstance(index_columns[0], dict) and index_columns[0].get("kind") == "range":
+        index = index_columns[0]
+        return (index["start"], index["stop"], index["step"]), index.get("name")
+    return None
+
+
+def _tables_to_pandas(tables: typing.List["pyarrow.Table"]) -> pandas.DataFrame:
+    """
+    Assembles the chunks as one arrow table, which concatenates without copying, and converts that to pandas while
+    releasing the arrow buffers as they are consumed. Concatenating one data frame per chunk instead would hold every
+    chunk frame and the concatenated copy in memory at the same time.
+    """
+    import pyarrow as _pa
+
+    ranges = [_range_index(t) for t in tables]
+    try:
+        table = _pa.concat_tables(tables)
+    except _pa.ArrowInvalid:
+        # The chunks do not share a schema, let pandas reconcile them.
+        return pandas.concat([t.to_pandas() for t in tables], copy=False)
+    del tables
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    if all(r is not None for r in ranges):
+        # Each chunk stores its RangeIndex as metadata only. Rebuild the index pandas.concat would have produced.
+        df.index = pandas.Index(_np.concatenate([_np.arange(*r[0]) for r in ranges]), name=ranges[0][1])
+    return df
+
+
+def _filters_to_expression(filters) -> "pyarrow.dataset.Expression":
+    """
+    Converts filters in the disjunctive normal form accepted by ``pyarrow.parquet.read_table``, a list of
+    ``(column, op, value)`` tuples or a list of such lists, to a ``pyarrow.dataset`` expression.
+    """
+    import pyarrow.dataset as _ds
+
+    def _predicate(col, op, value):
+        field = _ds.field(col)
+        if op in ("=", "=="):
+            return field == value
+        if op == "!=":
+            return field != value
+        if op == "<":
+            return field < value
+        if op == ">":
+            return field > value
+        if op == "<=":
+            return field <= value
+        if op == ">=":
+            return field >= value
+        if op == "in":
+            return field.isin(value)
+        if op == "not in":
+            return ~field.isin(value)
+        raise ValueError(f"Unsupported filter operator {op!r} on column {col!r}")
+
+    if not filters:
+        raise ValueError("Filters must not be empty")
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    disjunction = None
+    for conjunction in filters:
+        if not conjunction:
+            raise ValueError("Filters must not contain an empty conjunction")
+        expr = None
+        for col, op, value in conjunction:
+            p = _predicate(col, op, value)
+            expr = p if expr is None else expr & p
+        disjunction = expr if disjunction is None else disjunction | expr
+    return disjunction
+
+
+def _iter_dataset_batches(
+    files: typing.Iterable[os.PathLike],
+    fmt: str,
+    columns: typing.Optional[typing.List[str]],
+    filters,
+    max_rows: typing.Optional[int],
+    max_bytes: typing.Optional[int],
+) -> typing.Generator["pyarrow.RecordBatch", None, None]:
+    import pyarrow.dataset as _ds
+
+    if filters is not None and not isinstance(filters, _ds.Expression):
+        filters = _filters_to_expression(filters)
+    scan_args = {"columns": columns, "filter": filters, "use_threads": False}
+    if max_rows:
+        scan_args["batch_size"] = max_rows
+    for f in files:
+        if os.path.getsize(f) == 0:
+            continue
+        for batch in _ds.dataset(f, format=fmt).to_batches(**scan_args):
+            if batch.num_rows == 0:
+                continue
+            # Arrow IPC files are scanned in the batches they were written with, regardless of batch_size.
+            rows = min(batch.num_rows, max_rows or batch.num_rows)
+            if max_bytes and batch.nbytes > max_bytes:
+                rows = min(rows, max(1, int(max_bytes * batch.num_rows / batch.nbytes)))
+            if rows == batch.num_rows:
+                yield batch
+                continue
+            for offset in range(0, batch.num_rows, rows):
+                yield batch.slice(offset, rows)
+
+
 class FastParquetIO(ParquetIO):
     PARQUET_ENGINE = "fastparquet"
 
+    def _read_all(self, files: typing.List[os.PathLike], columns: typing.List[str], **kwargs) -> pandas.DataFrame:
+        frames = [self._read(chunk=f, columns=columns, **kwargs) for f in files]
+        return pandas.concat(frames, copy=True)
+
     def _read(self, chunk: os.PathLike, columns: typing.List[str], **kwargs) -> pandas.DataFrame:
         from fastparquet import ParquetFile as _ParquetFile
         from fastparquet import thrift_structures as _ts
@@ -85,22 +237,175 @@ _PARQUETIO_ENGINES: typing.Dict[str, ParquetIO] = {
 }
 
 
+class ArrowIO(object):
+    """
+    Reads and writes chunks as Arrow IPC files, also known as Feather v2. This skips the encoding and decoding that
+    parquet needs, and uncompressed chunks are memory-mapped so that reading them into arrow does not copy the data.
+    """
+
+    MAGIC = b"ARROW1"
+
+    def read_table(self, *files: os.PathLike, columns: typing.List[str] = None) -> "pyarrow.Table":
+        """
+        Reads the chunks into a single arrow table. The table references the memory-mapped files directly unless the
+        chunks were compressed.
+        """
+        import pyarrow as _pa
+
+        return _pa.concat_tables(self._read_tables(files, columns))
+
+    @staticmethod
+    def _read_tables(files: typing.Iterable[os.PathLike], columns: typing.List[str]) -> typing.List["pyarrow.Table"]:
+        from pyarrow import feather as _feather
+
+        return [_feather.read_table(f, columns=columns, memory_map=True) for f in files if os.path.getsize(f) > 0]
+
+    def read(self, *files: os.PathLike, columns: typing.List[str] = None, **kwargs) -> pandas.DataFrame:
+        tables = self._read_tables(files, columns)
+        if not tables:
+            return pandas.DataFrame()
+        return _tables_to_pandas(tables)
+
+    def iter_batches(
+        self,
+        *files: os.PathLike,
+        columns: typing.List[str] = None,
+        filters=None,
+        max_rows: typing.Optional[int] = None,
+        max_bytes: typing.Optional[int] = None,
+    ) -> typing.Generator["pyarrow.RecordBatch", None, None]:
+        """
+        See :py:meth:`ParquetIO.iter_batches`.
+        """
+        return _iter_dataset_batches(files, "ipc", columns, filters, max_rows, max_bytes)
+
+    def write(self, df: typing.Union[pandas.DataFrame, "pyarrow.Table"], to_file: os.PathLike, **kwargs):
+        """
+        :param df: a pandas data frame or an arrow table
+        :param to_file: Sink file to write the chunk to
+        :param kwargs: passed on to pyarrow.feather.write_feather. ``compression`` defaults to
+            ``sdk.arrow_compression``.
+        """
+        from pyarrow import feather as _feather
+
+        kwargs.setdefault("compression", sdk.ARROW_COMPRESSION.get())
+        _feather.write_feather(df, to_file, **kwargs)
+
+
+_ARROW_IO = ArrowIO()
+
+
+def _is_arrow_file(path: os.PathLike) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(len(ArrowIO.MAGIC)) == ArrowIO.MAGIC
+
+
 class PandasSchemaReader(LocalIOSchemaReader[pandas.DataFrame]):
+    """
+    Reads parquet as well as Arrow IPC chunks. The format of each chunk is detected from the file itself, so a schema
+    can be read regardless of the format its producer declared.
+    """
+
     def __init__(self, local_dir: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(local_dir, cols, fmt)
         self._parquet_engine = _PARQUETIO_ENGINES[sdk.PARQUET_ENGINE.get()]
 
+    def _io(self, paths: typing.Sequence[os.PathLike]) -> typing.Union[ParquetIO, ArrowIO]:
+        non_empty = [p for p in paths if os.path.getsize(p) > 0]
+        if non_empty and all(_is_arrow_file(p) for p in non_empty):
+            return _ARROW_IO
+        return self._parquet_engine
+
     def _read(self, *path: os.PathLike, **kwargs) -> pandas.DataFrame:
-        return self._parquet_engine.read(*path, columns=self.column_names, **kwargs)
+        return self._io(path).read(*path, columns=self.column_names, **kwargs)
+
+    def read_table(self, columns: typing.List[str] = None) -> "pyarrow.Table":
+        """
+        Reads the whole schema as one arrow table, without converting to pandas. For uncompressed Arrow IPC chunks
+        this is zero-copy: the table references the memory-mapped chunk files.
+
+        :param columns: defaults to the columns of the schema type
+        """
+        paths = self._chunk_paths()
+        io = self._io(paths) if paths else _ARROW_IO
+        if isinstance(io, FastParquetIO):
+            io = _PARQUETIO_ENGINES[ParquetIO.PARQUET_ENGINE]
+        return io.read_table(*paths, columns=columns or self.column_names)
+
+    def iter_batches(
+        self,
+        columns: typing.List[str] = None,
+        filters=None,
+        max_rows: typing.Optional[int] = None,
+        max_bytes: typing.Optional[int] = None,
+        as_arrow: bool = False,
+    ) -> typing.Generator[typing.Union[pandas.DataFrame, "pyarrow.RecordBatch"], None, None]:
+        """
+        Streams the schema in bounded batches, chunk by chunk in the order the chunks were written. Column projection
+        and filters are pushed down to pyarrow, so excluded columns and row groups are never read. See
+        :py:meth:`ParquetIO.iter_batches` for the arguments.
+
+        :param columns: defaults to the columns of the schema type
+        :param as_arrow: yield pyarrow.RecordBatch objects instead of converting each batch to pandas
+        """
+        for path in self._chunk_paths():
+            io = _ARROW_IO if os.path.getsize(path) > 0 and _is_arrow_file(path) else _PARQUETIO_ENGINES["pyarrow"]
+            for batch in io.iter_batches(
+                path,
+                columns=columns or self.column_names,
+                filters=filters,
+                max_rows=max_rows,
+                max_bytes=max_bytes,
+            ):
+                yield batch if as_arrow else batch.to_pandas()
+
+
+_SIZE_SAMPLE_ROWS = 1000
+
+
+def _estimate_memory_usage(df: pandas.DataFrame) -> int:
+    """
+    Estimates the in-memory size of the frame. Measuring object columns exactly means visiting every value in Python,
+    so their size is measured on evenly spaced sample rows and scaled to the length of the frame.
+    """
+    size = df.select_dtypes(exclude="object").memory_usage(index=True, deep=False).sum()
+    objects = df.select_dtypes(include="object")
+    if objects.shape[1]:
+        sample = objects.iloc[:: max(1, len(df) // _SIZE_SAMPLE_ROWS)]
+        size += sample.memory_usage(index=False, deep=True).sum() * len(df) / len(sample)
+    return int(size)
 
 
 class PandasSchemaWriter(LocalIOSchemaWriter[pandas.DataFrame]):
+    """
+    Writes parquet chunks, or Arrow IPC chunks for schemas declared with ``SchemaFormat.ARROW``.
+    """
+
     def __init__(self, local_dir: os.PathLike, cols: typing.Optional[typing.Dict[str, type]], fmt: SchemaFormat):
         super().__init__(local_dir, cols, fmt)
-        self._parquet_engine = _PARQUETIO_ENGINES[sdk.PARQUET_ENGINE.get()]
+        if fmt == SchemaFormat.ARROW:
+            self._engine = _ARROW_IO
+        else:
+            self._engine = _PARQUETIO_ENGINES[sdk.PARQUET_ENGINE.get()]
 
     def _write(self, df: T, path: os.PathLike, **kwargs):
-        return self._parquet_engine.write(df, to_file=path, **kwargs)
+        return self._engine.write(df, to_file=path, **kwargs)
+
+    def _split(self, df: T) -> typing.Iterable[T]:
+        """
+        Slices frames larger than ``sdk.schema_chunk_target_bytes`` in memory into row ranges of about that size.
+        """
+        target = sdk.SCHEMA_CHUNK_TARGET_BYTES.get()
+        if not target or not isinstance(df, pandas.DataFrame) or len(df) < 2:
+            return [df]
+        size = _estimate_memory_usage(df)
+        if size <= target:
+            return [df]
+        rows = max(1, len(df) * target // size)
+        return [df.iloc[i : i + rows] for i in range(0, len(df), rows)]
+
+    def _num_rows(self, df: T) -> typing.Optional[int]:
+        return len(df)
 
 
 class PandasDataFrameTransformer(TypeTransformer[pandas.DataFrame]):
@@ -19,8 +19,11 @@ schema = ["numpy>=1.14.0,<2.0.0", "pandas>=0.22.0,<2.0.0", "pyarrow>2.0.0,<4.0.0
 hive_sensor = ["hmsclient>=0.0.1,<1.0.0"]
 notebook = ["papermill>=1.2.0", "nbconvert>=6.0.7", "ipykernel>=5.0.0"]
 sagemaker = ["sagemaker-training>=3.6.2,<4.0.0"]
+aws = ["boto3>=1.12.0,<2.0.0"]
+gcp = ["google-cloud-storage>=1.28.0,<2.0.0"]
+zstd = ["zstandard>=0.15.0,<1.0.0"]
 
-all_but_spark = sidecar + schema + hive_sensor + notebook + sagemaker
+all_but_spark = sidecar + schema + hive_sensor + notebook + sagemaker + aws + gcp + zstd
 
 extras_require = {
     "spark": spark,
@@ -30,6 +33,9 @@ extras_require = {
     "hive_sensor": hive_sensor,
     "notebook": notebook,
     "sagemaker": sagemaker,
+    "aws": aws,
+    "gcp": gcp,
+    "zstd": zstd,
     "all-spark2.4": spark + all_but_spark,
     "all": spark3 + all_but_spark,
 }
@@ -64,7 +70,7 @@ setup(
         "croniter>=0.3.20,<4.0.0",
         "deprecated>=1.0,<2.0",
         "python-dateutil<=2.8.1,>=2.1",
-        "grpcio>=1.3.0,<2.0",
+        "grpcio>=1.32.0,<2.0",
         "protobuf>=3.6.1,<4",
         "pytimeparse>=1.1.8,<2.0.0",
         "pytz>=2017.2,<2018.5",
@@ -79,7 +85,6 @@ setup(
         "retry==0.9.2",
         "dataclasses-json>=0.5.2",
         "natsort>=7.0.1",
-        "dirhash>=0.2.1",
         "docker-image-py>=0.1.10",
     ],
     extras_require=extras_require,
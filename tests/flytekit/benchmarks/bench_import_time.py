@@ -0,0 +1,66 @@
+"""
+Measures the cold-start import cost of a task container and fails when it exceeds a budget. Not collected by pytest;
+run it directly, e.g.
+
+    python -m tests.flytekit.benchmarks.bench_import_time --budget-ms 750
+
+Every run imports the modules in a fresh interpreter with ``-X importtime``. The median cumulative time of each module
+is compared against the budget, and the process exits with status 1 if it is over, or if any of the forbidden modules
+was imported along the way. With ``--top`` it also lists the most expensive imports of the median run.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+_FORBIDDEN = ["pandas", "numpy", "pyarrow", "grpc", "boto3", "google.cloud.storage", "docker_image"]
+
+
+def _importtime(module: str):
+    """
+    Returns the cumulative import time in microseconds of every module imported by a fresh interpreter importing
+    ``module``.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-W", "ignore", "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+    times = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--modules", nargs="+", default=["flytekit", "flytekit.bin.entrypoint"])
+    parser.add_argument("--budget-ms", type=float, default=750, help="allowed median import time of every module")
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--forbid", nargs="*", default=_FORBIDDEN, help="modules that must not get imported")
+    parser.add_argument("--top", type=int, default=0, help="list this many of the most expensive imports")
+    args = parser.parse_args()
+
+    failed = False
+    for module in args.modules:
+        runs = sorted((_importtime(module) for _ in range(args.runs)), key=lambda t: t[module])
+        median = runs[len(runs) // 2]
+        ms = statistics.median(r[module] for r in runs) / 1000
+        forbidden = [m for m in args.forbid if any(m in r for r in runs)]
+        over = ms > args.budget_ms
+        failed = failed or over or bool(forbidden)
+        print(f"{module:<28} {ms:>8.1f} ms  budget {args.budget_ms:.0f} ms  {'OVER BUDGET' if over else 'ok'}")
+        if forbidden:
+            print(f"  imports {', '.join(forbidden)}")
+        for name, us in sorted(median.items(), key=lambda t: t[1], reverse=True)[1 : args.top + 1]:
+            print(f"  {us / 1000:>8.1f} ms  {name}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmarks round-tripping a FlyteSchema through each storage format. Not collected by pytest; run it directly, e.g.
+
+    python -m tests.flytekit.benchmarks.bench_schema_formats --mb 1024 --formats parquet arrow arrow:lz4
+
+Every format runs in a fresh subprocess so that its peak RSS is measured on its own. Reading is timed both into pandas
+and into an arrow table; for uncompressed arrow chunks the latter is a memory map and copies nothing.
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+_ROWS_PER_MB = 1024 * 1024 // 32
+
+
+def _frame(rows: int, seed: int):
+    import numpy as np
+
+    from flytekit.plugins import pandas
+
+    rng = np.random.default_rng(seed)
+    return pandas.DataFrame(
+        {
+            "id": np.arange(rows, dtype=np.int64),
+            "x": rng.random(rows),
+            "y": rng.random(rows),
+            "label": rng.integers(0, 1000, rows).astype(str),
+        }
+    )
+
+
+def _run(fmt: str, mb: int, chunks: int):
+    from flytekit.configuration import sdk
+    from flytekit.types.schema import PandasSchemaReader, PandasSchemaWriter, SchemaFormat
+
+    name, _, compression = fmt.partition(":")
+    if compression:
+        os.environ[sdk.ARROW_COMPRESSION.env_var] = compression
+    schema_format = SchemaFormat(name)
+    frames = [_frame(mb * _ROWS_PER_MB // chunks, i) for i in range(chunks)]
+    result = {}
+    with tempfile.TemporaryDirectory() as d:
+        start = time.perf_counter()
+        PandasSchemaWriter(d, None, schema_format).write(*frames)
+        result["write"] = time.perf_counter() - start
+        result["size"] = sum(e.stat().st_size for e in os.scandir(d))
+        del frames
+
+        reader = PandasSchemaReader(d, None, schema_format)
+        start = time.perf_counter()
+        table = reader.read_table()
+        result["read_table"] = time.perf_counter() - start
+        del table
+        start = time.perf_counter()
+        df = reader.all()
+        result["read_pandas"] = time.perf_counter() - start
+        del df
+    print(json.dumps(result))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mb", type=int, nargs="+", default=[256], help="approximate in-memory data sizes")
+    parser.add_argument("--chunks", type=int, default=8)
+    parser.add_argument(
+        "--formats", nargs="+", default=["parquet", "arrow", "arrow:lz4", "arrow:zstd"], help="format[:compression]"
+    )
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        _run(args.run, args.mb[0], args.chunks)
+        return
+
+    print(f"{'format':<12} {'MB':>6} {'on disk':>9} {'write s':>8} {'table s':>8} {'pandas s':>9} {'peak RSS':>9}")
+    for mb in args.mb:
+        for fmt in args.formats:
+            cmd = [sys.executable, "-m", __spec__.name, "--run", fmt, "--mb", str(mb), "--chunks", str(args.chunks)]
+            before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+            r = json.loads(subprocess.run(cmd, check=True, stdout=subprocess.PIPE).stdout.splitlines()[-1])
+            # ru_maxrss of the children is the largest of them so far, only a new maximum is attributable to this run.
+            peak = max(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss, before)
+            print(
+                f"{fmt:<12} {mb:>6} {r['size'] / 2 ** 20:>8.0f}M {r['write']:>8.2f} {r['read_table']:>8.2f} "
+                f"{r['read_pandas']:>9.2f} {peak / 1024:>8.0f}M{'' if peak > before else '*'}"
+            )
+    print("* peak RSS not above an earlier run, so only an upper bound")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmarks serializing a large workflow. Not collected by pytest; run it directly, e.g.
+
+    python -m tests.flytekit.benchmarks.bench_serialization --nodes 2000
+
+Besides translating the workflow and writing the protobufs, it reads the template back into models and repeatedly
+deduplicates the node references and compares templates, all of which goes through FlyteIdlEntity.__hash__/__eq__.
+"""
+import argparse
+import time
+from collections import OrderedDict
+
+from flytekit.common.translator import get_serializable
+from flytekit.core import context_manager
+from flytekit.core.context_manager import Image, ImageConfig
+from flytekit.core.python_function_task import PythonFunctionTask
+from flytekit.core.task import task
+from flytekit.core.workflow import workflow
+from flytekit.models.core import workflow as _workflow_models
+
+_default_image = Image(name="default", fqn="test", tag="tag")
+_settings = context_manager.SerializationSettings(
+    project="project",
+    domain="domain",
+    version="version",
+    env=None,
+    image_config=ImageConfig(default_image=_default_image, images=[_default_image]),
+)
+
+
+@task
+def inc(a: int) -> int:
+    return a + 1
+
+
+def _build_workflow(n_nodes: int, n_sub_nodes: int):
+    @workflow
+    def sub_wf(a: int) -> int:
+        x = a
+        for _ in range(n_sub_nodes):
+            x = inc(a=x)
+        return x
+
+    @workflow
+    def wf(a: int) -> int:
+        x = a
+        for i in range(n_nodes):
+            # Every tenth node is a sub-workflow, the rest are tasks.
+            x = sub_wf(a=x) if i % 10 == 0 else inc(a=x)
+        return x
+
+    return wf
+
+
+def _timed(name: str, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{name:<40} {(time.perf_counter() - start) * 1000:10.2f} ms")
+    return result
+
+
+def _aggregate(sdk_workflow):
+    tasks, sub_workflows = set(), set()
+    for n in sdk_workflow.nodes:
+        PythonFunctionTask.aggregate(tasks, sub_workflows, n)
+    return tasks, sub_workflows
+
+
+def _dedupe_references(template, repeat: int):
+    for _ in range(repeat):
+        references = set()
+        for n in template.nodes:
+            references.add(n.task_node.reference_id if n.task_node else n.workflow_node.sub_workflow_ref)
+            references.add(n.metadata)
+    return references
+
+
+def _compare_templates(template, other, repeat: int):
+    for _ in range(repeat):
+        assert template == other and hash(template) == hash(other)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--sub-nodes", type=int, default=200, help="nodes in the sub-workflow used by every 10th node")
+    parser.add_argument("--repeat", type=int, default=20, help="passes over the template models")
+    args = parser.parse_args()
+
+    wf = _timed(f"compile ({args.nodes} nodes)", lambda: _build_workflow(args.nodes, args.sub_nodes))
+    entity_mapping = OrderedDict()
+    sdk_workflow = _timed("get_serializable", lambda: get_serializable(entity_mapping, _settings, wf))
+    tasks, sub_workflows = _timed("aggregate tasks and sub-workflows", lambda: _aggregate(sdk_workflow))
+    assert len(tasks) == 1 and len(sub_workflows) == 1
+    _timed("to_flyte_idl", lambda: [e.to_flyte_idl() for e in entity_mapping.values()])
+    template = _workflow_models.WorkflowTemplate.from_flyte_idl(sdk_workflow.to_flyte_idl())
+    other = _workflow_models.WorkflowTemplate.from_flyte_idl(sdk_workflow.to_flyte_idl())
+    _timed(f"dedupe node references x{args.repeat}", lambda: _dedupe_references(template, args.repeat))
+    _timed(f"compare templates x{args.repeat}", lambda: _compare_templates(template, other, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""
+Micro-benchmarks for the type engine. These are not collected by pytest; run them directly, e.g.
+
+    python -m tests.flytekit.benchmarks.bench_type_engine
+
+Every benchmark reports the best time over a few repeats, and the time per element.
+"""
+import argparse
+import timeit
+import typing
+from dataclasses import dataclass, field
+
+from dataclasses_json import dataclass_json
+from google.protobuf import json_format as _json_format
+from google.protobuf import struct_pb2 as _struct
+
+from flytekit.core.context_manager import FlyteContext
+from flytekit.core.type_engine import TypeEngine
+from flytekit.models.literals import Literal, LiteralCollection, LiteralMap
+
+
+def _report(name: str, seconds: float, n: int):
+    print(f"{name:<45} {seconds * 1000:10.2f} ms  {seconds / n * 1e6:8.3f} us/value")
+
+
+def _best(fn: typing.Callable[[], typing.Any], repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def bench_get_transformer(repeat: int):
+    n = 100000
+    for t in (int, typing.List[int], typing.Dict[str, float]):
+        _report(f"get_transformer({t})", _best(lambda: [TypeEngine.get_transformer(t) for _ in range(n)], repeat), n)
+
+
+def _element_wise_to_literal(ctx, v, t, lt) -> Literal:
+    # The conversion as it is done for collections of non-primitive types, one TypeEngine call per element.
+    if isinstance(v, dict):
+        vt = t.__args__[1]
+        return Literal(map=LiteralMap({k: TypeEngine.to_literal(ctx, x, vt, lt.map_value_type) for k, x in v.items()}))
+    st = t.__args__[0]
+    return Literal(collection=LiteralCollection([TypeEngine.to_literal(ctx, x, st, lt.collection_type) for x in v]))
+
+
+def _element_wise_to_python_value(ctx, lv: Literal, t):
+    if lv.map is not None:
+        return {k: TypeEngine.to_python_value(ctx, x, t.__args__[1]) for k, x in lv.map.literals.items()}
+    return [TypeEngine.to_python_value(ctx, x, t.__args__[0]) for x in lv.collection.literals]
+
+
+def bench_collections(size: int, repeat: int):
+    """
+    Compares the bulk primitive path with element wise conversion, including the protobuf (de)serialization that
+    happens when task inputs are read and outputs are written.
+    """
+    ctx = FlyteContext.current_context()
+    payloads = [
+        (typing.List[int], list(range(size))),
+        (typing.List[float], [i + 0.5 for i in range(size)]),
+        (typing.Dict[str, float], {str(i): i + 0.5 for i in range(size)}),
+    ]
+    for t, v in payloads:
+        lt = TypeEngine.to_literal_type(t)
+        pb = TypeEngine.to_literal(ctx, v, t, lt).to_flyte_idl()
+        _report(f"write {t} (bulk)", _best(lambda: TypeEngine.to_literal(ctx, v, t, lt).to_flyte_idl(), repeat), size)
+        _report(
+            f"write {t} (element wise)",
+            _best(lambda: _element_wise_to_literal(ctx, v, t, lt).to_flyte_idl(), repeat),
+            size,
+        )
+        _report(
+            f"read {t} (bulk)",
+            _best(lambda: TypeEngine.to_python_value(ctx, Literal.from_flyte_idl_view(pb), t), repeat),
+            size,
+        )
+        _report(
+            f"read {t} (element wise)",
+            _best(lambda: _element_wise_to_python_value(ctx, Literal.from_flyte_idl(pb), t), repeat),
+            size,
+        )
+
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    arr = np.arange(size, dtype=np.float64)
+    lt = TypeEngine.to_literal_type(typing.List[float])
+    _report(
+        "write numpy float64 array",
+        _best(lambda: TypeEngine.to_literal(ctx, arr, typing.List[float], lt), repeat),
+        size,
+    )
+
+
+@dataclass_json
+@dataclass
+class _Resources(object):
+    cpu: int
+    memory: str
+    gpu: typing.Optional[int] = None
+
+
+@dataclass_json
+@dataclass
+class _Config(object):
+    name: str
+    learning_rate: float
+    epochs: int
+    enabled: bool
+    resources: _Resources
+    layers: typing.List[int] = field(default_factory=list)
+    labels: typing.Dict[str, str] = field(default_factory=dict)
+    stages: typing.List[_Resources] = field(default_factory=list)
+
+
+def bench_dataclasses(size: int, repeat: int):
+    """
+    Compares the direct dataclass conversion with the JSON round trip through dataclasses_json, for a single config
+    like dataclass and for a list of them.
+    """
+    ctx = FlyteContext.current_context()
+    v = _Config(
+        name="train",
+        learning_rate=0.01,
+        epochs=10,
+        enabled=True,
+        resources=_Resources(cpu=2, memory="4Gi"),
+        layers=[64, 128, 64],
+        labels={"team": "ml", "stage": "dev"},
+        stages=[_Resources(cpu=i, memory=f"{i}Gi", gpu=i % 2) for i in range(4)],
+    )
+    n = max(size // 100, 1)
+    for name, t, value, count in (("_Config", _Config, v, 1), ("List[_Config]", typing.List[_Config], [v] * n, n)):
+        lt = TypeEngine.to_literal_type(t)
+        lv = TypeEngine.to_literal(ctx, value, t, lt)
+        number = 1000 // count or 1
+        _report(
+            f"write {name} (plan)",
+            _best(lambda: [TypeEngine.to_literal(ctx, value, t, lt) for _ in range(number)], repeat) / number,
+            count,
+        )
+        _report(
+            f"read {name} (plan)",
+            _best(lambda: [TypeEngine.to_python_value(ctx, lv, t) for _ in range(number)], repeat) / number,
+            count,
+        )
+
+    structs = [_json_format.Parse(v.to_json(), _struct.Struct()) for _ in range(n)]
+    _report(
+        "write List[_Config] (json round trip)",
+        _best(lambda: [_json_format.Parse(x.to_json(), _struct.Struct()) for x in [v] * n], repeat),
+        n,
+    )
+    _report(
+        "read List[_Config] (json round trip)",
+        _best(lambda: [_Config.from_json(_json_format.MessageToJson(s)) for s in structs], repeat),
+        n,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=100000, help="number of elements in the collection payloads")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    bench_get_transformer(args.repeat)
+    bench_collections(args.size, args.repeat)
+    bench_dataclasses(args.size, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
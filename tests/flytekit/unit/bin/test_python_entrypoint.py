@@ -1,4 +1,6 @@
 import os
+import sys
+import typing
 
 import mock
 import six
@@ -6,16 +8,31 @@ from click.testing import CliRunner
 from flyteidl.core import literals_pb2 as _literals_pb2
 from flyteidl.core.errors_pb2 import ErrorDocument
 
-from flytekit.bin.entrypoint import _dispatch_execute, _legacy_execute_task, execute_task_cmd
+from flytekit.bin.entrypoint import (
+    _dispatch_execute,
+    _import_fresh_from,
+    _legacy_execute_task,
+    _prefetch_inputs,
+    execute_task_cmd,
+    fast_execute_task_cmd,
+)
 from flytekit.common import constants as _constants
 from flytekit.common import utils as _utils
 from flytekit.common.types import helpers as _type_helpers
 from flytekit.configuration import TemporaryConfiguration as _TemporaryConfiguration
+from flytekit.configuration import internal as _internal_config
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.core import context_manager
 from flytekit.core.base_task import IgnoreOutputs
 from flytekit.core.promise import VoidPromise
+from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
+from flytekit.interfaces.data.data_proxy import FileAccessProvider
 from flytekit.models import literals as _literal_models
 from flytekit.models import literals as _literals
+from flytekit.models import types as _types
+from flytekit.models.core import types as _core_types
+from flytekit.tools.fast_registration import build_package, get_additional_distribution_loc
 from tests.flytekit.common import task_definitions as _task_defs
 
 
@@ -244,3 +261,182 @@ def test_dispatch_execute_exception(mock_write_to_file, mock_upload_dir, mock_ge
         mock_write_to_file.side_effect = verify_output
         _dispatch_execute(ctx, python_task, "inputs path", "outputs prefix")
         assert mock_write_to_file.call_count == 1
+
+
+@mock.patch("flytekit.common.utils.load_proto_from_file")
+@mock.patch("flytekit.interfaces.data.data_proxy.FileAccessProvider.get_data")
+@mock.patch("flytekit.interfaces.data.data_proxy.FileAccessProvider.upload_directory")
+@mock.patch("flytekit.common.utils.write_proto_to_file")
+def test_dispatch_execute_wraps_inputs(mock_write_to_file, mock_upload_dir, mock_get_data, mock_load_proto):
+    mock_get_data.return_value = True
+    mock_upload_dir.return_value = True
+
+    @task
+    def double(a: typing.List[int], b: str) -> typing.List[int]:
+        return [x * 2 for x in a]
+
+    ctx = context_manager.FlyteContext.current_context()
+    with ctx.new_execution_context(mode=context_manager.ExecutionState.Mode.TASK_EXECUTION) as ctx:
+        input_proto = _literal_models.LiteralMap(
+            {
+                "a": TypeEngine.to_literal(
+                    ctx, [1, 2, 3], typing.List[int], TypeEngine.to_literal_type(typing.List[int])
+                ),
+                "b": TypeEngine.to_literal(ctx, "unused", str, TypeEngine.to_literal_type(str)),
+            }
+        ).to_flyte_idl()
+        mock_load_proto.return_value = input_proto
+
+        received = []
+        original_dispatch = double.dispatch_execute
+
+        def spy(ctx, input_literal_map):
+            received.append(input_literal_map.idl_view)
+            return original_dispatch(ctx, input_literal_map)
+
+        written = {}
+        mock_write_to_file.side_effect = lambda proto, path: written.__setitem__(os.path.basename(path), proto)
+        with mock.patch.object(double, "dispatch_execute", side_effect=spy):
+            _dispatch_execute(ctx, double, "inputs path", "outputs prefix")
+
+        # The task received a lazy view over the protobuf that was read, not a converted copy.
+        assert received[0] is input_proto
+        outputs = _literal_models.LiteralMap.from_flyte_idl(written[_constants.OUTPUT_FILE_NAME])
+        assert TypeEngine.to_python_value(ctx, outputs.literals["o0"], typing.List[int]) == [2, 4, 6]
+
+
+def _fast_package(tmp_path, increment):
+    code = tmp_path / "code"
+    code.mkdir(exist_ok=True)
+    (code / "fast_wf.py").write_text(
+        "from flytekit import task\n\n\n@task\ndef t(a: int) -> int:\n    return a + {}\n".format(increment)
+    )
+    archive = str(tmp_path / "package")
+    location = get_additional_distribution_loc(str(tmp_path), build_package(code, archive))
+    os.replace(archive, location)
+    return location
+
+
+def _fast_execute(tmp_path, distribution):
+    inputs = str(tmp_path / "inputs.pb")
+    literal = _literals.Literal(scalar=_literals.Scalar(primitive=_literals.Primitive(integer=1)))
+    _utils.write_proto_to_file(_literals.LiteralMap({"a": literal}).to_flyte_idl(), inputs)
+    out = tmp_path / "out"
+    cmd = ["--additional-distribution", distribution, "--dest-dir", str(tmp_path / "dest"), "--"]
+    cmd += ["pyflyte-execute", "--inputs", inputs, "--output-prefix", str(out)]
+    cmd += ["--resolver", "flytekit.core.python_auto_container.default_task_resolver"]
+    cmd += ["--", "task-module", "fast_wf", "task-name", "t"]
+    # Not through CliRunner, whose output streams do not survive the live logging of pytest.
+    fast_execute_task_cmd.main(cmd, standalone_mode=False)
+    outputs = _utils.load_proto_from_file(_literals_pb2.LiteralMap, str(out / _constants.OUTPUT_FILE_NAME))
+    return _literal_models.LiteralMap.from_flyte_idl(outputs).literals["o0"].scalar.primitive.integer
+
+
+def test_fast_execute_in_proc(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setenv(_internal_config.IMAGE.env_var, "docker.io/abc:123")
+    monkeypatch.setenv(_sdk_config.FAST_REGISTRATION_CACHE_PATH.env_var, str(tmp_path / "cache.json"))
+    (tmp_path / "dest").mkdir()
+    try:
+        with _TemporaryConfiguration(os.path.join(os.path.dirname(__file__), "fake.config")):
+            assert _fast_execute(tmp_path, _fast_package(tmp_path, 1)) == 2
+            # The module loaded from the first version is replaced by the one of the second.
+            assert _fast_execute(tmp_path, _fast_package(tmp_path, 2)) == 3
+    finally:
+        sys.modules.pop("fast_wf", None)
+
+
+def test_import_fresh_from_only_forgets_installed_modules(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    monkeypatch.setattr(sys, "modules", dict(sys.modules))
+    (tmp_path / "fresh_pkg").mkdir()
+    (tmp_path / "fresh_pkg" / "__init__.py").write_text("")
+    (tmp_path / "fresh_pkg" / "mod.py").write_text("")
+    # Stands in for anything else that lives below the destination, like an interpreter installed in the home dir.
+    (tmp_path / "lib").mkdir()
+    (tmp_path / "lib" / "stdlib_like.py").write_text("")
+    sys.path.insert(0, str(tmp_path / "lib"))
+    sys.path.insert(0, str(tmp_path))
+    import fresh_pkg.mod  # noqa: F401
+    import stdlib_like  # noqa: F401
+
+    _import_fresh_from(str(tmp_path), ["fresh_pkg/__init__.py", "fresh_pkg/mod.py"])
+    assert "fresh_pkg" not in sys.modules and "fresh_pkg.mod" not in sys.modules
+    assert "stdlib_like" in sys.modules
+    assert sys.path[0] == os.path.realpath(str(tmp_path))
+
+
+@mock.patch("flytekit.bin.entrypoint._subprocess.call", return_value=0)
+@mock.patch("flytekit.bin.entrypoint._install_distribution")
+def test_fast_execute_out_of_proc(mock_install, mock_call):
+    task_cmd = ["pyflyte-execute", "--inputs", "in put.pb", "--resolver", "resolver", "--", "task-name", "t"]
+    with mock.patch.dict(os.environ, {_sdk_config.FAST_EXECUTE_IN_PROCESS.env_var: "false"}):
+        result = CliRunner().invoke(
+            fast_execute_task_cmd,
+            ["--additional-distribution", "s3://a/b.tar.gz", "--dest-dir", "/root", "--"] + task_cmd,
+        )
+    assert result.exit_code == 0, result.output
+    mock_install.assert_called_once_with("s3://a/b.tar.gz", "/root", None)
+    # The arguments are passed as they are, without going through a shell.
+    assert (
+        mock_call.call_args[0][0]
+        == task_cmd[:3]
+        + [
+            "--dynamic-addl-distro",
+            "s3://a/b.tar.gz",
+            "--dynamic-dest-dir",
+            "/root",
+        ]
+        + task_cmd[3:]
+    )
+
+
+def _blob(uri, dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE):
+    return _literals.Literal(
+        scalar=_literals.Scalar(
+            blob=_literals.Blob(_literals.BlobMetadata(_core_types.BlobType("", dimensionality)), uri)
+        )
+    )
+
+
+def test_prefetch_inputs(tmp_path):
+    inputs = _literals.LiteralMap(
+        {
+            "file": _blob("s3://bucket/file"),
+            "dir": _blob("gs://bucket/dir", _core_types.BlobType.BlobDimensionality.MULTIPART),
+            "local": _blob("/tmp/file"),
+            "files": _literals.Literal(collection=_literals.LiteralCollection([_blob("s3://bucket/in_list")])),
+            "nested": _literals.Literal(
+                map=_literals.LiteralMap(
+                    {
+                        "schema": _literals.Literal(
+                            scalar=_literals.Scalar(
+                                schema=_literals.Schema("s3://bucket/schema", _types.SchemaType([]))
+                            )
+                        )
+                    }
+                )
+            ),
+            "int": _literals.Literal(scalar=_literals.Scalar(primitive=_literals.Primitive(integer=1))),
+        }
+    )
+    _utils.write_proto_to_file(inputs.to_flyte_idl(), str(tmp_path / "inputs.pb"))
+
+    def prefetch(uri, is_multipart=False, on_fetched=None):
+        if on_fetched is not None:
+            on_fetched(uri)
+
+    file_access = mock.MagicMock(spec=FileAccessProvider)
+    file_access.prefetch.side_effect = prefetch
+    with mock.patch.dict(os.environ, {_sdk_config.PREFETCH_BLOB_INPUTS.env_var: "true"}):
+        _prefetch_inputs(file_access, str(tmp_path / "inputs.pb"), blobs=True)
+    assert sorted(c[0] for c in file_access.prefetch.call_args_list[1:]) == [
+        ("gs://bucket/dir", True),
+        ("s3://bucket/file", False),
+        ("s3://bucket/in_list", False),
+        ("s3://bucket/schema", True),
+    ]
+
+    file_access.reset_mock()
+    _prefetch_inputs(file_access, str(tmp_path / "inputs.pb"), blobs=True)
+    file_access.prefetch.assert_called_once_with(str(tmp_path / "inputs.pb"), on_fetched=None)
@@ -0,0 +1,76 @@
+import json
+import os
+
+from flyteidl.admin import launch_plan_pb2 as _launch_plan_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.admin import workflow_pb2 as _workflow_pb2
+from flyteidl.core import identifier_pb2 as _identifier_pb2
+
+from flytekit.clis.sdk_in_container import serialize as _serialize
+from flytekit.configuration import internal as _internal_config
+
+
+def _pb_files(folder):
+    return sorted(f for f in os.listdir(folder) if f.endswith(".pb"))
+
+
+def test_incremental_serialize(mock_clirunner, monkeypatch, tmp_path):
+    def run(image):
+        # Legacy tasks take their image from the configuration of the container.
+        monkeypatch.setenv(_internal_config.IMAGE.env_var, image)
+        return mock_clirunner("serialize", "--image", image, "workflows", "-f", str(tmp_path), "--incremental")
+
+    first = run("docker.io/abc:123")
+    assert "skipped 0 unchanged" in first.output
+    written = _pb_files(tmp_path)
+    # 4 tasks, a workflow and a launch plan, along with whatever other tests have defined with the new API.
+    assert len(_simple(written)) == 6
+    manifest = json.load(open(tmp_path / _serialize.SERIALIZE_MANIFEST))["entities"]
+    assert sorted(e["file"] for e in manifest.values()) == written
+
+    second = run("docker.io/abc:123")
+    assert f"serialized 0 changed flyte objects, skipped {len(written)} unchanged" in second.output
+    assert _pb_files(tmp_path) == []
+
+    # The image is part of every task, so everything in the module is written again.
+    run("docker.io/abc:456")
+    assert len(_simple(_pb_files(tmp_path))) == 6
+
+
+def _simple(files):
+    return [f for f in files if "common.workflows.simple" in f]
+
+
+def _specs():
+    def task(name):
+        return _task_pb2.TaskSpec(template={"id": {"resource_type": _identifier_pb2.TASK, "name": name}})
+
+    wf = _workflow_pb2.WorkflowSpec(
+        template={
+            "nodes": [
+                {"task_node": {"reference_id": {"resource_type": _identifier_pb2.TASK, "name": "t1"}}},
+                {"task_node": {"reference_id": {"resource_type": _identifier_pb2.TASK, "name": "t2"}}},
+            ]
+        }
+    )
+    lp = _launch_plan_pb2.LaunchPlan(spec={"workflow_id": {"resource_type": _identifier_pb2.WORKFLOW, "name": "wf"}})
+    return {"1:t1": task("t1"), "1:t2": task("t2"), "2:wf": wf, "3:lp": lp}
+
+
+def test_plan_incremental():
+    digests = {"1:t1": "a", "1:t2": "b", "2:wf": "c", "3:lp": "c"}
+    fingerprints, emit = _serialize._plan_incremental(_specs(), digests, {})
+    assert emit == set(digests)
+
+    assert _serialize._plan_incremental(_specs(), digests, fingerprints)[1] == set()
+
+    # A changed task changes the fingerprints of everything that refers to it, and takes along what they refer to.
+    changed, emit = _serialize._plan_incremental(_specs(), dict(digests, **{"1:t2": "b2"}), fingerprints)
+    assert [k for k in digests if changed[k] != fingerprints[k]] == ["1:t2", "2:wf", "3:lp"]
+    assert emit == set(digests)
+
+    # A changed launch plan only needs the workflow and tasks it runs.
+    _, emit = _serialize._plan_incremental(_specs(), digests, dict(fingerprints, **{"3:lp": "stale"}))
+    assert emit == set(digests)
+    _, emit = _serialize._plan_incremental(_specs(), digests, dict(fingerprints, **{"1:t1": "stale"}))
+    assert emit == {"1:t1"}
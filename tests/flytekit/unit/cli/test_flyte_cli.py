@@ -1,8 +1,14 @@
 import mock as _mock
 import pytest
 from click.testing import CliRunner as _CliRunner
+from flyteidl.admin import launch_plan_pb2 as _launch_plan_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.admin import workflow_pb2 as _workflow_pb2
+from flyteidl.core import identifier_pb2 as _identifier_pb2
+from flyteidl.core import workflow_pb2 as _core_workflow_pb2
 
 from flytekit.clis.flyte_cli import main as _main
+from flytekit.common.exceptions import user as _user_exceptions
 from flytekit.common.exceptions.user import FlyteAssertion
 from flytekit.common.types import primitives
 from flytekit.configuration import TemporaryConfiguration
@@ -105,3 +111,84 @@ def test_activate_project(mock_client):
     result = runner.invoke(_main._flyte_cli, ["activate-project", "-p", "foo", "-h", "a.b.com", "-i"])
     assert result.exit_code == 0
     mock_client().update_project.assert_called_with(_Project.active_project("foo"))
+
+
+def _id(resource_type, name):
+    return _identifier_pb2.Identifier(resource_type=resource_type, project="p", domain="d", name=name, version="v")
+
+
+def _workflow(name, *references):
+    nodes = []
+    for r in references:
+        if r.resource_type == _identifier_pb2.TASK:
+            nodes.append(_core_workflow_pb2.Node(id=r.name, task_node=_core_workflow_pb2.TaskNode(reference_id=r)))
+        else:
+            nodes.append(
+                _core_workflow_pb2.Node(id=r.name, workflow_node=_core_workflow_pb2.WorkflowNode(launchplan_ref=r))
+            )
+    template = _core_workflow_pb2.WorkflowTemplate(id=_id(_identifier_pb2.WORKFLOW, name), nodes=nodes)
+    return template.id, _workflow_pb2.WorkflowSpec(template=template)
+
+
+def _launch_plan(name, workflow_id):
+    lp_id = _id(_identifier_pb2.LAUNCH_PLAN, name)
+    return lp_id, _launch_plan_pb2.LaunchPlan(id=lp_id, spec=_launch_plan_pb2.LaunchPlanSpec(workflow_id=workflow_id))
+
+
+def _entities():
+    t1, t2 = _id(_identifier_pb2.TASK, "t1"), _id(_identifier_pb2.TASK, "t2")
+    child_wf = _workflow("child", t2)
+    child_lp = _launch_plan("child_lp", child_wf[0])
+    parent_wf = _workflow("parent", t1, child_lp[0], _id(_identifier_pb2.TASK, "registered_elsewhere"))
+    parent_lp = _launch_plan("parent_lp", parent_wf[0])
+    # Listed in an order that would fail if registered as is.
+    return [parent_lp, parent_wf, child_lp, child_wf, (t1, _task_pb2.TaskSpec()), (t2, _task_pb2.TaskSpec())]
+
+
+def test_registration_phases():
+    phases = _main._registration_phases(_entities())
+    assert [[id.name for id, _ in phase] for phase in phases] == [
+        ["t1", "t2"],
+        ["child"],
+        ["child_lp"],
+        ["parent"],
+        ["parent_lp"],
+    ]
+
+    wf_a, wf_b = _id(_identifier_pb2.WORKFLOW, "a"), _id(_identifier_pb2.WORKFLOW, "b")
+    lp_a, lp_b = _launch_plan("a", wf_a), _launch_plan("b", wf_b)
+    with pytest.raises(FlyteAssertion, match="reference each other"):
+        _main._registration_phases([_workflow("a", lp_b[0]), lp_b, _workflow("b", lp_a[0]), lp_a])
+
+
+@_mock.patch("flytekit.clis.flyte_cli.main._extract_files")
+@_mock.patch("flytekit.clis.flyte_cli.main._friendly_client.SynchronousFlyteClient")
+def test_extract_and_register_concurrently(mock_client, mock_extract):
+    mock_extract.return_value = _entities()
+    registered = []
+
+    def create(request):
+        registered.append(request.id.name)
+        if request.id.name == "t2":
+            raise _user_exceptions.FlyteEntityAlreadyExistsException("exists")
+
+    raw = mock_client.return_value.raw
+    raw.create_task.side_effect = raw.create_workflow.side_effect = raw.create_launch_plan.side_effect = create
+
+    result = _CliRunner().invoke(
+        _main._flyte_cli, ["register-files", "-p", "p", "-d", "d", "-v", "v", "-h", "a.b.com", "-i", "--workers", "4"]
+    )
+    assert result.exit_code == 0, result.output
+    assert sorted(registered[:2]) == ["t1", "t2"]
+    assert registered[2:] == ["child", "child_lp", "parent", "parent_lp"]
+    assert "Skipping because already registered" in result.output
+    assert "Phase 1: 2 tasks: 1 registered, 1 already registered" in result.output
+    assert "Phase 5: 1 launch plans: 1 registered, 0 already registered" in result.output
+
+    registered.clear()
+    raw.create_workflow.side_effect = _user_exceptions.FlyteAssertion("invalid")
+    result = _CliRunner().invoke(
+        _main._flyte_cli, ["register-files", "-p", "p", "-d", "d", "-v", "v", "-h", "a.b.com", "-i"]
+    )
+    assert result.exit_code != 0
+    assert sorted(registered) == ["t1", "t2"]
@@ -0,0 +1,168 @@
+import asyncio
+
+import grpc
+import mock
+import pytest
+from flyteidl.admin import execution_pb2 as _execution_pb2
+from flyteidl.admin import node_execution_pb2 as _node_execution_pb2
+from flyteidl.admin import task_pb2 as _task_pb2
+from flyteidl.service import admin_pb2_grpc as _admin_service
+
+from flytekit.clients import raw_async as _raw_async
+from flytekit.clients.friendly_async import AsyncFlyteClient, iterate_node_executions, paginate
+from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.models.core import identifier as _identifier
+
+_EXECUTION_NAMES = [f"e{i}" for i in range(25)]
+# The retry back-off is patched out below, the fake server still needs to wait.
+_sleep = asyncio.sleep
+
+
+class _FakeAdmin(_admin_service.AdminServiceServicer):
+    """
+    Serves executions page by page, where the token is the offset of the page, and fails calls on request.
+    """
+
+    def __init__(self):
+        self.failures = []
+        self.calls = []
+        self.metadata = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _enter(self, name, context):
+        self.calls.append(name)
+        self.metadata.append(dict(context.invocation_metadata()))
+        if self.failures:
+            await context.abort(self.failures.pop(0), "injected failure")
+
+    async def ListExecutions(self, request, context):
+        await self._enter("ListExecutions", context)
+        offset = int(request.token or 0)
+        page = _EXECUTION_NAMES[offset : offset + request.limit]
+        next_token = str(offset + request.limit) if offset + request.limit < len(_EXECUTION_NAMES) else ""
+        return _execution_pb2.ExecutionList(
+            executions=[
+                _execution_pb2.Execution(id=_identifier.WorkflowExecutionIdentifier("p", "d", n).to_flyte_idl())
+                for n in page
+            ],
+            token=next_token,
+        )
+
+    async def GetExecution(self, request, context):
+        await self._enter("GetExecution", context)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await _sleep(0.05)
+        self.in_flight -= 1
+        return _execution_pb2.Execution(id=request.id)
+
+    async def CreateTask(self, request, context):
+        await self._enter("CreateTask", context)
+        return _task_pb2.TaskCreateResponse()
+
+    async def ListNodeExecutions(self, request, context):
+        await self._enter("ListNodeExecutions", context)
+        return _node_execution_pb2.NodeExecutionList()
+
+
+def _run(test):
+    """
+    Runs test(client, admin) against a fresh in-process Admin server, all on one event loop.
+    """
+
+    async def main():
+        admin = _FakeAdmin()
+        server = grpc.aio.server()
+        _admin_service.add_AdminServiceServicer_to_server(admin, server)
+        port = server.add_insecure_port("localhost:0")
+        await server.start()
+        try:
+            async with AsyncFlyteClient(f"localhost:{port}", insecure=True) as client:
+                await test(client, admin)
+        finally:
+            await _raw_async.close_shared_channels()
+            await server.stop(None)
+
+    with mock.patch("flytekit.clients.raw_async.asyncio.sleep", side_effect=lambda s: _noop()):
+        # Unlike asyncio.run, this leaves the current event loop of the thread alone.
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(main())
+        finally:
+            loop.close()
+
+
+async def _noop():
+    pass
+
+
+def test_paginate():
+    async def test(client, admin):
+        names = [e.id.name async for e in paginate(client.list_executions_paginated, "p", "d", page_size=10)]
+        assert names == _EXECUTION_NAMES
+        assert admin.calls == ["ListExecutions"] * 3
+
+        limited = [e.id.name async for e in paginate(client.list_executions_paginated, "p", "d", limit=12)]
+        assert limited == _EXECUTION_NAMES[:12]
+
+    _run(test)
+
+
+def test_requests_run_concurrently():
+    async def test(client, admin):
+        ids = [_identifier.WorkflowExecutionIdentifier("p", "d", n) for n in _EXECUTION_NAMES[:10]]
+        executions = await asyncio.gather(*(client.get_execution(i) for i in ids))
+        assert [e.id for e in executions] == ids
+        assert admin.max_in_flight > 1
+
+    _run(test)
+
+
+def test_retries_transient_errors():
+    async def test(client, admin):
+        admin.failures = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.UNAVAILABLE]
+        await client.get_execution(_identifier.WorkflowExecutionIdentifier("p", "d", "e0"))
+        assert admin.calls == ["GetExecution"] * 3
+
+        # Creating is not retried.
+        admin.failures = [grpc.StatusCode.UNAVAILABLE]
+        with pytest.raises(grpc.RpcError):
+            await client.raw.create_task(_task_pb2.TaskCreateRequest())
+
+        admin.failures = [grpc.StatusCode.ALREADY_EXISTS]
+        with pytest.raises(_user_exceptions.FlyteEntityAlreadyExistsException):
+            await client.raw.create_task(_task_pb2.TaskCreateRequest())
+
+    _run(test)
+
+
+def test_refreshes_credentials():
+    def refresh(client):
+        client.set_access_token("fresh")
+
+    async def test(client, admin):
+        admin.failures = [grpc.StatusCode.UNAUTHENTICATED]
+        with mock.patch.object(_raw_async, "_get_refresh_handler", return_value=refresh):
+            await client.get_execution(_identifier.WorkflowExecutionIdentifier("p", "d", "e0"))
+        assert "authorization" not in admin.metadata[0]
+        assert admin.metadata[1]["authorization"] == "Bearer fresh"
+
+        admin.failures = [grpc.StatusCode.UNAUTHENTICATED] * 3
+        with mock.patch.object(_raw_async, "_get_refresh_handler", return_value=refresh):
+            with pytest.raises(_user_exceptions.FlyteAuthenticationException):
+                await client.get_execution(_identifier.WorkflowExecutionIdentifier("p", "d", "e0"))
+
+    _run(test)
+
+
+def test_clients_share_channels():
+    async def test(client, admin):
+        other = AsyncFlyteClient(client.url, insecure=True)
+        assert other._pool is client._pool
+        assert AsyncFlyteClient(client.url, insecure=True, pool_size=2)._pool is not client._pool
+        assert [
+            n async for n in iterate_node_executions(other, _identifier.WorkflowExecutionIdentifier("p", "d", "e0"))
+        ] == []
+
+    _run(test)
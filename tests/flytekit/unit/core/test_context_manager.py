@@ -1,4 +1,8 @@
+import asyncio
+import threading
+
 from flytekit.core.context_manager import CompilationState, ExecutionState, FlyteContext, look_up_image_info
+from flytekit.interfaces.data import data_proxy as _data_proxy
 
 
 class SampleTestClass(object):
@@ -53,3 +57,62 @@ def test_additional_context():
                 mode=ExecutionState.Mode.TASK_EXECUTION, additional_context={1: "inner", 3: "baz"}
             ) as exec_ctx_inner:
                 assert exec_ctx_inner.execution_state.additional_context == {1: "inner", 2: "foo", 3: "baz"}
+
+
+def test_stack_is_per_thread():
+    seen = {}
+
+    def worker():
+        seen["plain"] = FlyteContext.current_context()
+        with FlyteContext.restore(snapshot) as ctx:
+            seen["restored"] = ctx
+        seen["after"] = FlyteContext.current_context()
+
+    root = FlyteContext.current_context()
+    with FlyteContext(flyte_client=SampleTestClass(value=1)) as ctx:
+        snapshot = FlyteContext.snapshot()
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+        assert FlyteContext.current_context() is ctx
+
+    assert seen["plain"] is root
+    assert seen["restored"] is ctx
+    assert seen["after"] is root
+
+
+def test_stack_is_per_asyncio_task():
+    async def enter(value, entered, other_entered):
+        with FlyteContext(flyte_client=SampleTestClass(value=value)) as ctx:
+            entered.set()
+            # Wait until the other task has pushed its own context on top of the "shared" stack.
+            await other_entered.wait()
+            assert FlyteContext.current_context() is ctx
+            return FlyteContext.current_context().flyte_client.value
+
+    async def main():
+        a, b = asyncio.Event(), asyncio.Event()
+        return await asyncio.gather(enter(1, a, b), enter(2, b, a))
+
+    root = FlyteContext.current_context()
+    assert asyncio.get_event_loop().run_until_complete(main()) == [1, 2]
+    assert FlyteContext.current_context() is root
+
+
+def test_data_contexts_are_per_thread(tmp_path):
+    seen = {}
+
+    def worker():
+        seen["proxy"] = _data_proxy.LocalDataContext.get_active_proxy()
+        seen["dir"] = _data_proxy.LocalWorkingDirectoryContext.get()
+
+    default_proxy = _data_proxy.LocalDataContext.get_default_proxy()
+    with _data_proxy.LocalDataContext(str(tmp_path)), _data_proxy.LocalWorkingDirectoryContext(str(tmp_path)):
+        assert _data_proxy.LocalDataContext.get_active_proxy() is not default_proxy
+        assert _data_proxy.LocalWorkingDirectoryContext.get() == str(tmp_path)
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+    assert seen == {"proxy": default_proxy, "dir": None}
+    assert _data_proxy.LocalDataContext.get_active_proxy() is default_proxy
@@ -0,0 +1,205 @@
+import os
+
+import mock
+import pandas
+import pyarrow
+import pytest
+
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core.task import task
+from flytekit.core.workflow import workflow
+from flytekit.types.schema import FlyteSchema, PandasSchemaReader, PandasSchemaWriter, SchemaFormat, SchemaOpenMode
+from flytekit.types.schema.types_pandas import _estimate_memory_usage, _filters_to_expression
+
+_COLUMNS = {"a": int, "b": str}
+
+
+def _frames():
+    return [pandas.DataFrame({"a": list(range(i * 4, i * 4 + 4)), "b": ["x" * (i + 1)] * 4}) for i in range(3)]
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.PARQUET).write(*_frames())
+    return tmp_path
+
+
+def test_chunks_are_read_in_write_order(schema_dir, monkeypatch):
+    r = PandasSchemaReader(str(schema_dir), _COLUMNS, SchemaFormat.PARQUET)
+    # Make the filesystem list the chunks in reverse.
+    scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda p: _Listing(sorted(scandir(p), key=lambda e: e.name, reverse=True)))
+    assert [df["a"].iloc[0] for df in r.iter()] == [0, 4, 8]
+
+
+class _Listing(object):
+    def __init__(self, entries):
+        self._entries = entries
+
+    def __enter__(self):
+        return iter(self._entries)
+
+    def __exit__(self, *args):
+        pass
+
+
+def test_all_matches_concat(schema_dir):
+    r = PandasSchemaReader(str(schema_dir), _COLUMNS, SchemaFormat.PARQUET)
+    assert r.all().equals(pandas.concat(_frames(), copy=True))
+
+
+def test_iter_batches(schema_dir):
+    r = PandasSchemaReader(str(schema_dir), _COLUMNS, SchemaFormat.PARQUET)
+    batches = list(r.iter_batches(max_rows=3))
+    assert [len(b) for b in batches] == [3, 1, 3, 1, 3, 1]
+    assert pandas.concat(batches)["a"].tolist() == list(range(12))
+
+    projected = list(r.iter_batches(columns=["a"], filters=[("a", ">=", 6)], as_arrow=True))
+    assert all(isinstance(b, pyarrow.RecordBatch) and b.schema.names == ["a"] for b in projected)
+    assert [v for b in projected for v in b.column(0).to_pylist()] == list(range(6, 12))
+
+    # Every 4-row chunk takes between 40 and 80 bytes in memory, so a 40 byte bound cuts each into 2-row slices.
+    assert all(40 < b.nbytes < 80 for b in r.iter_batches(as_arrow=True))
+    assert [b.num_rows for b in r.iter_batches(max_bytes=40, as_arrow=True)] == [2] * 6
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("a", "=", 3)],
+        [("a", "!=", 3), ("a", "<", 6)],
+        [("a", ">", 8), ("a", "<=", 10)],
+        [[("a", "in", {1, 2})], [("a", ">=", 10)]],
+        [("a", "not in", [0, 4, 8])],
+    ],
+)
+def test_filters_match_read_table(schema_dir, filters):
+    import pyarrow.parquet as pq
+
+    r = PandasSchemaReader(str(schema_dir), _COLUMNS, SchemaFormat.PARQUET)
+    expected = [v for p in r._chunk_paths() for v in pq.read_table(p, filters=filters).column("a").to_pylist()]
+    assert [v for b in r.iter_batches(filters=filters) for v in b["a"].tolist()] == expected
+
+
+def test_unsupported_filter_operator():
+    with pytest.raises(ValueError):
+        _filters_to_expression([("a", "~", 1)])
+
+
+def test_open_streams_task_input():
+    @task
+    def produce() -> FlyteSchema[_COLUMNS]:
+        s = FlyteSchema[_COLUMNS]()
+        s.open().write(*_frames())
+        return s
+
+    @task
+    def total(s: FlyteSchema[_COLUMNS]) -> int:
+        return sum(int(df["a"].sum()) for df in s.open().iter_batches(max_rows=5))
+
+    @workflow
+    def wf() -> int:
+        return total(s=produce())
+
+    assert wf() == sum(range(12))
+
+
+def test_readonly_schema(schema_dir):
+    s = FlyteSchema[_COLUMNS](local_path=str(schema_dir), remote_path="", supported_mode=SchemaOpenMode.WRITE)
+    assert [len(b) for b in s.as_readonly().open().iter_batches(max_rows=4)] == [4, 4, 4]
+
+
+@pytest.mark.parametrize("compression", ["uncompressed", "lz4", "zstd"])
+def test_arrow_round_trip(tmp_path, compression):
+    with mock.patch.dict(os.environ, {_sdk_config.ARROW_COMPRESSION.env_var: compression}):
+        PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.ARROW).write(*_frames())
+    chunks = sorted(c for c in os.listdir(tmp_path) if not c.startswith("."))
+    assert all(open(tmp_path / c, "rb").read(6) == b"ARROW1" for c in chunks)
+
+    r = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.ARROW)
+    # Arrow IPC chunks do not store the pandas index.
+    assert r.all().equals(pandas.concat(_frames(), ignore_index=True))
+    assert [len(b) for b in r.iter_batches(columns=["a"], max_rows=3)] == [3, 1, 3, 1, 3, 1]
+
+
+def test_arrow_read_table_is_memory_mapped(tmp_path):
+    PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.ARROW).write(*_frames())
+    pool = pyarrow.default_memory_pool()
+    before = pool.bytes_allocated()
+    table = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.ARROW).read_table(columns=["a"])
+    assert table.column_names == ["a"]
+    assert table.column("a").to_pylist() == list(range(12))
+    assert pool.bytes_allocated() == before
+
+
+def test_reader_detects_chunk_format(tmp_path):
+    PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.ARROW).write(*_frames())
+    # A reader declared as parquet still reads the arrow chunks, whole or chunk by chunk.
+    r = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.PARQUET)
+    assert r.all()["a"].tolist() == list(range(12))
+    assert [df["a"].iloc[0] for df in r.iter()] == [0, 4, 8]
+
+
+def test_arrow_schema_between_tasks():
+    arrow_schema = FlyteSchema[_COLUMNS, SchemaFormat.ARROW]
+    assert arrow_schema.format() == SchemaFormat.ARROW
+    assert FlyteSchema[{}, SchemaFormat.ARROW].format() == SchemaFormat.ARROW
+
+    @task
+    def produce() -> arrow_schema:
+        s = arrow_schema()
+        s.open().write(*_frames())
+        return s
+
+    @task
+    def total(s: FlyteSchema[_COLUMNS]) -> int:
+        return sum(s.open().read_table().column("a").to_pylist())
+
+    @workflow
+    def wf() -> int:
+        return total(s=produce())
+
+    assert wf() == sum(range(12))
+
+
+def test_large_frames_are_split_and_written_in_parallel(tmp_path):
+    df = pandas.DataFrame({"a": range(1000), "b": ["y"] * 1000})
+    size = int(df.memory_usage(index=True, deep=True).sum())
+    env = {
+        _sdk_config.SCHEMA_CHUNK_TARGET_BYTES.env_var: str(size // 10 + 10),
+        _sdk_config.SCHEMA_WRITE_CONCURRENCY.env_var: "4",
+    }
+    with mock.patch.dict(os.environ, env):
+        w = PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.PARQUET)
+        w.write(df)
+        w.write(*_frames())
+
+    r = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.PARQUET)
+    manifest = r.manifest()
+    assert [c.rows for c in manifest] == [100] * 10 + [4] * 3
+    assert [c.name for c in manifest] == [os.path.basename(p) for p in r._chunk_paths()]
+    assert all(c.size == os.path.getsize(tmp_path / c.name) for c in manifest)
+    assert r.all()["a"].tolist() == list(range(1000)) + list(range(12))
+    assert r.read_chunks(manifest[9:11])["a"].tolist() == list(range(900, 1000)) + [0, 1, 2, 3]
+
+
+def test_memory_usage_of_object_columns_is_sampled():
+    df = pandas.DataFrame({"a": range(50_000), "b": ["value %d" % (i % 100) for i in range(50_000)]})
+    exact = int(df.memory_usage(index=True, deep=True).sum())
+    assert abs(_estimate_memory_usage(df) - exact) < exact * 0.05
+
+
+def test_chunk_count_is_unbounded(tmp_path):
+    with mock.patch.dict(os.environ, {_sdk_config.SCHEMA_WRITE_CONCURRENCY.env_var: "1"}):
+        PandasSchemaWriter(str(tmp_path), _COLUMNS, SchemaFormat.ARROW).write(*(_frames()[:1] * 1030))
+    r = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.ARROW)
+    assert len(r.manifest()) == 1030
+    assert len(r.all()) == 4 * 1030
+
+
+def test_chunk_names_sort_past_five_digits(tmp_path):
+    for name in ["99999", "100000", "00001"]:
+        (tmp_path / name).write_bytes(b"")
+    r = PandasSchemaReader(str(tmp_path), _COLUMNS, SchemaFormat.PARQUET)
+    assert [os.path.basename(p) for p in r._chunk_paths()] == ["00001", "99999", "100000"]
+    assert r.manifest() is None
@@ -0,0 +1,104 @@
+import os
+import threading
+import typing
+
+import mock
+import pytest
+
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core import context_manager
+from flytekit.core.lazy_download import LazyDownload, LazyFile
+from flytekit.core.type_engine import TypeEngine
+from flytekit.interfaces.data.data_proxy import FileAccessProvider
+from flytekit.models.core import types as _core_types
+from flytekit.models.literals import Blob, BlobMetadata, Literal, Scalar
+from flytekit.models.types import LiteralType
+
+_BLOB_TYPE = _core_types.BlobType(format="", dimensionality=_core_types.BlobType.BlobDimensionality.SINGLE)
+
+
+@pytest.fixture
+def remote_file(tmp_path):
+    source = tmp_path / "remote.txt"
+    source.write_text("line 1\nline 2\n")
+    return f"file://{source}"
+
+
+@pytest.fixture
+def ctx(tmp_path):
+    fs = FileAccessProvider(local_sandbox_dir=str(tmp_path / "sandbox"))
+    with mock.patch.object(fs, "get_data", wraps=fs.get_data):
+        with context_manager.FlyteContext.current_context().new_file_access_context(file_access_provider=fs) as ctx:
+            yield ctx
+
+
+def _literal(uri):
+    return Literal(scalar=Scalar(blob=Blob(metadata=BlobMetadata(_BLOB_TYPE), uri=uri)))
+
+
+def test_path_is_a_downloaded_str(ctx, remote_file):
+    p = TypeEngine.to_python_value(ctx, _literal(remote_file), os.PathLike)
+    # Task code treats these as strings, e.g. to join paths or to put them in json.
+    assert type(p) is str
+    with open(p) as fh:
+        assert fh.readline() == "line 1\n"
+    assert ctx.file_access.get_data.call_count == 1
+    lv = TypeEngine.to_literal(ctx, p, os.PathLike, LiteralType(blob=_BLOB_TYPE))
+    assert lv.scalar.blob.uri != remote_file
+
+
+@pytest.mark.parametrize("t, expected", [(typing.TextIO, "line 1\n"), (typing.BinaryIO, b"line 1\n")])
+def test_file_handles_open_on_first_read(ctx, remote_file, t, expected):
+    fh = TypeEngine.to_python_value(ctx, _literal(remote_file), t)
+    assert isinstance(fh, LazyFile)
+    assert ctx.file_access.get_data.call_count == 0
+    with fh:
+        assert fh.readline() == expected
+        assert len(list(fh)) == 1
+    assert fh.closed
+
+    unused = TypeEngine.to_python_value(ctx, _literal(remote_file), t)
+    unused.close()
+    assert unused.closed
+    assert ctx.file_access.get_data.call_count == 1
+    with pytest.raises(ValueError):
+        unused.read()
+
+
+def test_failed_download_is_retried():
+    file_access = mock.MagicMock()
+    file_access.get_data.side_effect = IOError("unreachable")
+    download = LazyDownload(file_access, "s3://bucket/key", "/tmp/unused")
+    with pytest.raises(IOError, match="unreachable"):
+        download()
+    assert file_access.get_data.call_count == 2
+    assert not download.downloaded
+
+    # A transient error, e.g. in the prefetch, does not stick.
+    file_access.get_data.side_effect = [IOError("flaky"), None]
+    with mock.patch.dict(os.environ, {_sdk_config.PREFETCH_BLOB_INPUTS.env_var: "true"}):
+        download = LazyDownload(file_access, "s3://bucket/key", "/tmp/prefetched")
+    assert download() == "/tmp/prefetched"
+    assert download.downloaded
+    assert download() == "/tmp/prefetched"
+    assert file_access.get_data.call_count == 4
+
+
+def test_prefetch_starts_immediately():
+    started = threading.Event()
+    release = threading.Event()
+
+    def get_data(remote_path, local_path, is_multipart=False):
+        started.set()
+        release.wait(5)
+
+    file_access = mock.MagicMock()
+    file_access.get_data.side_effect = get_data
+    with mock.patch.dict(os.environ, {_sdk_config.PREFETCH_BLOB_INPUTS.env_var: "true"}):
+        download = LazyDownload(file_access, "s3://bucket/key", "/tmp/prefetched")
+    assert started.wait(5)
+    assert not download.downloaded
+    release.set()
+    assert download() == "/tmp/prefetched"
+    assert download.downloaded
+    assert file_access.get_data.call_count == 1
@@ -0,0 +1,54 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import flytekit
+from flytekit.configuration import internal as _internal_config
+
+# Importing any of these is a regression for tasks that do not use them, see tests/flytekit/benchmarks/bench_import_time.py.
+_HEAVY_MODULES = ["pandas", "numpy", "pyarrow", "grpc", "boto3", "google.cloud.storage", "docker_image"]
+
+
+def test_lazy_public_api():
+    from flytekit.core.workflow import ImperativeWorkflow
+    from flytekit.types import schema
+
+    assert flytekit.Workflow is ImperativeWorkflow
+    assert flytekit.schema is schema
+    assert {"task", "workflow", "LaunchPlan", "current_context"} <= set(dir(flytekit))
+    with pytest.raises(AttributeError, match="not_there"):
+        flytekit.not_there
+
+
+def test_tasks_only_import_what_they_use():
+    code = textwrap.dedent(
+        f"""
+        import sys
+
+        import flytekit.bin.entrypoint
+        from flytekit import task
+
+        @task
+        def repeat(a: int, b: str) -> str:
+            return b * a
+
+        assert repeat(a=2, b="x") == "xx"
+        heavy = [m for m in {_HEAVY_MODULES!r} if m in sys.modules]
+        assert not heavy, heavy
+
+        # The pandas transformer is registered the first time a data frame type is looked up.
+        import pandas
+
+        @task
+        def count(df: pandas.DataFrame) -> int:
+            return len(df)
+
+        assert count(df=pandas.DataFrame({{"a": [1, 2]}})) == 2
+        """
+    )
+    # Other tests may leave a configuration file in the environment that the new interpreter should not read.
+    env = {k: v for k, v in os.environ.items() if k != _internal_config.CONFIGURATION_PATH.env_var}
+    subprocess.run([sys.executable, "-W", "ignore", "-c", code], check=True, env=env)
@@ -0,0 +1,196 @@
+import os
+import time
+
+import mock
+import pytest
+from click.testing import CliRunner
+
+from flytekit.clis.sdk_in_container.local_cache import local_cache
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.core import local_cache as _local_cache
+from flytekit.core.task import task
+from flytekit.core.testing import task_mock
+from flytekit.core.workflow import workflow
+from flytekit.models import literals as _literals
+from flytekit.types.file.file import FlyteFile
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    d = tmp_path / "local-cache"
+    env = {_sdk_config.LOCAL_CACHE_DIR.env_var: str(d), _sdk_config.LOCAL_CACHE_ENABLED.env_var: "true"}
+    with mock.patch.dict(os.environ, env):
+        yield d
+
+
+def test_cached_task_runs_once_per_inputs_and_version(cache_dir):
+    calls = []
+
+    def make_workflow(version):
+        @task(cache=True, cache_version=version)
+        def square(a: int) -> int:
+            calls.append(a)
+            return a * a
+
+        @workflow
+        def wf(a: int) -> int:
+            return square(a=square(a=a))
+
+        return wf
+
+    wf = make_workflow("1")
+    assert wf(a=2) == 16
+    assert wf(a=2) == 16
+    assert calls == [2, 4]
+    assert wf(a=3) == 81
+    assert calls == [2, 4, 3, 9]
+
+    wf = make_workflow("2")
+    assert wf(a=2) == 16
+    assert calls == [2, 4, 3, 9, 2, 4]
+    assert len(_local_cache.LocalTaskCache().entries()) == 6
+
+    with mock.patch.dict(os.environ, {_sdk_config.LOCAL_CACHE_ENABLED.env_var: "false"}):
+        wf(a=2)
+    assert calls == [2, 4, 3, 9, 2, 4, 2, 4]
+
+
+def test_disabled_by_default(tmp_path):
+    assert _local_cache.get_cache() is None
+
+
+def test_edited_task_misses(cache_dir):
+    calls = []
+
+    def version_one():
+        @task(cache=True, cache_version="1")
+        def inc(a: int) -> int:
+            calls.append(a)
+            return a + 1
+
+        return inc
+
+    def version_two():
+        @task(cache=True, cache_version="1")
+        def inc(a: int) -> int:
+            calls.append(a)
+            return a + 2
+
+        return inc
+
+    for make, expected in ((version_one, 2), (version_two, 3), (version_two, 3)):
+        inc = make()
+
+        @workflow
+        def wf(a: int) -> int:
+            return inc(a=a)
+
+        assert wf(a=1) == expected
+    # The same name and cache_version, but the edited source runs again.
+    assert calls == [1, 1]
+
+
+def test_mocked_task_is_not_served_from_cache(cache_dir):
+    @task(cache=True, cache_version="1")
+    def inc(a: int) -> int:
+        return a + 1
+
+    @workflow
+    def wf(a: int) -> int:
+        return inc(a=a)
+
+    assert wf(a=1) == 2
+    with task_mock(inc) as m:
+        m.return_value = 100
+        assert wf(a=1) == 100
+    assert wf(a=1) == 2
+
+
+def test_uncached_task_is_not_stored(cache_dir):
+    @task
+    def double(a: int) -> int:
+        return a * 2
+
+    @workflow
+    def wf(a: int) -> int:
+        return double(a=a)
+
+    wf(a=1)
+    assert not cache_dir.exists()
+
+
+def test_files_are_keyed_and_stored_by_content(cache_dir, tmp_path):
+    calls = []
+
+    @task(cache=True, cache_version="1")
+    def copy(f: FlyteFile) -> FlyteFile:
+        calls.append(f)
+        out = os.path.join(tmp_path, f"out-{len(calls)}.txt")
+        with open(f, "r") as src, open(out, "w") as dst:
+            dst.write(src.read().upper())
+        return FlyteFile(out)
+
+    @workflow
+    def wf(f: FlyteFile) -> FlyteFile:
+        return copy(f=f)
+
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    first.write_text("hello")
+    second.write_text("hello")
+
+    out = wf(f=str(first))
+    os.remove(str(tmp_path / "out-1.txt"))
+    # A different path with the same content is a hit, and the output survives its original being removed.
+    out = wf(f=str(second))
+    assert len(calls) == 1
+    with open(out, "r") as fh:
+        assert fh.read() == "HELLO"
+
+    second.write_text("bye")
+    wf(f=str(second))
+    assert len(calls) == 2
+
+
+def _store(cache, name, payload_size):
+    inputs = _literals.LiteralMap({"a": _literals.Literal(_literals.Scalar(_literals.Primitive(string_value=name)))})
+    outputs = _literals.LiteralMap(
+        {"o": _literals.Literal(_literals.Scalar(_literals.Primitive(string_value="x" * payload_size)))}
+    )
+    cache.set(name, "1", inputs, outputs)
+    return inputs
+
+
+def test_eviction(cache_dir):
+    cache = _local_cache.LocalTaskCache(max_size_bytes=2500, max_age_seconds=0)
+    old = _store(cache, "old", 1000)
+    _store(cache, "middle", 1000)
+    # Reading an entry makes it the most recently used one.
+    assert cache.get("old", "1", old) is not None
+    _store(cache, "new", 1000)
+    assert sorted(e.task_name for e in cache.entries()) == ["new", "old"]
+
+    aged = _local_cache.LocalTaskCache(max_age_seconds=60)
+    stale = time.time() - 120
+    for entry in cache.entries():
+        if entry.task_name == "old":
+            os.utime(os.path.join(cache.directory, entry.key, "outputs.pb"), (stale, stale))
+    assert aged.evict() == 1
+    assert [e.task_name for e in cache.entries()] == ["new"]
+
+
+def test_cli(cache_dir):
+    cache = _local_cache.LocalTaskCache()
+    _store(cache, "t1", 10)
+    _store(cache, "t2", 10)
+
+    runner = CliRunner()
+    result = runner.invoke(local_cache, ["list"])
+    assert result.exit_code == 0
+    assert "t1@1" in result.output and "2 entries" in result.output
+
+    result = runner.invoke(local_cache, ["clear", "--task", "t1"])
+    assert result.exit_code == 0
+    assert [e.task_name for e in cache.entries()] == ["t2"]
+
+    runner.invoke(local_cache, ["clear"])
+    assert cache.entries() == []
@@ -0,0 +1,145 @@
+import threading
+import time
+import typing
+
+import mock as _mock
+import pytest
+
+from flytekit.core.condition import conditional
+from flytekit.core.node_creation import create_node
+from flytekit.core.task import task
+from flytekit.core.workflow import ImperativeWorkflow, get_node_dependencies, workflow
+
+
+@pytest.fixture
+def concurrency():
+    with _mock.patch("flytekit.configuration.sdk.LOCAL_WORKFLOW_CONCURRENCY") as mock_concurrency:
+        mock_concurrency.get.return_value = 4
+        yield mock_concurrency
+
+
+@task
+def double(a: int) -> int:
+    return a * 2
+
+
+@task
+def add(a: int, b: int) -> int:
+    return a + b
+
+
+@task
+def total(xs: typing.List[int]) -> int:
+    return sum(xs)
+
+
+@workflow
+def sub_wf(a: int) -> int:
+    return double(a=a)
+
+
+@workflow
+def fan_out_wf(a: int, b: int = 5) -> typing.Tuple[int, int]:
+    x = double(a=a)
+    y = double(a=b)
+    z = sub_wf(a=x)
+    return total(xs=[x, y, z]), add(a=y, b=z)
+
+
+def test_dependencies():
+    nodes = fan_out_wf.nodes
+    deps = get_node_dependencies(nodes)
+    assert deps[nodes[0]] == []
+    assert deps[nodes[1]] == []
+    assert deps[nodes[2]] == [nodes[0]]
+    assert set(deps[nodes[3]]) == {nodes[0], nodes[1], nodes[2]}
+    assert set(deps[nodes[4]]) == {nodes[1], nodes[2]}
+
+
+def test_same_results(concurrency):
+    concurrency.get.return_value = 1
+    serial = fan_out_wf(a=3)
+    concurrency.get.return_value = 4
+    assert fan_out_wf(a=3) == serial == (6 + 10 + 12, 10 + 12)
+    assert fan_out_wf(a=3, b=1) == (6 + 2 + 12, 2 + 12)
+
+
+def test_independent_nodes_overlap(concurrency):
+    # Neither task can get past the barrier unless the other one is running at the same time.
+    barrier = threading.Barrier(2, timeout=10)
+
+    @task
+    def meet(a: int) -> int:
+        barrier.wait()
+        return a
+
+    @workflow
+    def wf() -> int:
+        return add(a=meet(a=1), b=meet(a=2))
+
+    assert wf() == 3
+
+
+def test_explicit_dependencies_respected(concurrency):
+    calls = []
+
+    @task
+    def first():
+        time.sleep(0.2)
+        calls.append("first")
+
+    @task
+    def second():
+        calls.append("second")
+
+    @workflow
+    def wf():
+        f = create_node(first)
+        s = create_node(second)
+        f >> s
+
+    wf()
+    assert calls == ["first", "second"]
+
+
+def test_first_declared_failure_is_raised(concurrency):
+    @task
+    def fails_late():
+        time.sleep(0.2)
+        raise ValueError("declared first")
+
+    @task
+    def fails_early():
+        raise KeyError("declared second")
+
+    @task
+    def never_runs(a: int) -> int:
+        raise AssertionError("should not be scheduled after a failure")
+
+    @workflow
+    def wf() -> int:
+        fails_late()
+        fails_early()
+        return never_runs(a=double(a=1))
+
+    with pytest.raises(ValueError, match="declared first"):
+        wf()
+
+
+def test_conditionals_run_through_function(concurrency):
+    @workflow
+    def wf(a: int) -> int:
+        return conditional("test").if_(a > 2).then(double(a=a)).else_().then(add(a=a, b=a))
+
+    assert wf(a=3) == 6
+    assert wf(a=1) == 2
+
+
+def test_imperative(concurrency):
+    wb = ImperativeWorkflow(name="my.concurrent.workflow")
+    wb.add_workflow_input("in1", int)
+    n0 = wb.add_entity(double, a=wb.inputs["in1"])
+    n1 = wb.add_entity(double, a=wb.inputs["in1"])
+    n2 = wb.add_entity(add, a=n0.outputs["o0"], b=n1.outputs["o0"])
+    wb.add_workflow_output("out", n2.outputs["o0"])
+    assert wb(in1=2) == 8
@@ -6,10 +6,12 @@ import pytest
 from flytekit import LaunchPlan, map_task
 from flytekit.common.translator import get_serializable
 from flytekit.core import context_manager
-from flytekit.core.context_manager import Image, ImageConfig
+from flytekit.core.context_manager import ExecutionState, FlyteContext, Image, ImageConfig
 from flytekit.core.map_task import MapPythonTask
 from flytekit.core.task import TaskMetadata, task
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.workflow import workflow
+from flytekit.models import literals as _literal_models
 
 
 @task
@@ -139,3 +141,66 @@ def test_inputs_outputs_length():
 
     with pytest.raises(ValueError):
         _ = map_task(many_inputs)
+
+
+def test_map_task_dispatch_execute_slices_inputs(monkeypatch):
+    monkeypatch.setenv("BATCH_JOB_ARRAY_INDEX_VAR_NAME", "AWS_BATCH_JOB_ARRAY_INDEX")
+    monkeypatch.setenv("AWS_BATCH_JOB_ARRAY_INDEX", "1")
+
+    converted = []
+    original = TypeEngine.to_python_value
+
+    def spy(ctx, lv, expected_python_type):
+        converted.append(lv)
+        return original(ctx, lv, expected_python_type)
+
+    monkeypatch.setattr(TypeEngine, "to_python_value", spy)
+
+    maptask = map_task(t1, metadata=TaskMetadata(retries=1))
+    ctx = FlyteContext.current_context()
+    list_type = TypeEngine.to_literal_type(typing.List[int])
+    input_literal_map = _literal_models.LiteralMap(
+        literals={"a": TypeEngine.to_literal(ctx, [5, 6, 7], typing.List[int], list_type)}
+    )
+    with ctx.new_execution_context(mode=ExecutionState.Mode.TASK_EXECUTION) as ctx:
+        outputs = maptask.dispatch_execute(ctx, input_literal_map)
+
+    assert isinstance(outputs, _literal_models.LiteralMap)
+    assert outputs.literals["o0"].scalar.primitive.string_value == "8"
+    # Only the element for this instance was converted, never the whole collection.
+    assert [lv.scalar.primitive.integer for lv in converted] == [6]
+
+    monkeypatch.setenv("AWS_BATCH_JOB_ARRAY_INDEX", "3")
+    with pytest.raises(ValueError):
+        with ctx.new_execution_context(mode=ExecutionState.Mode.TASK_EXECUTION) as ctx:
+            maptask.dispatch_execute(ctx, input_literal_map)
+
+
+def test_map_task_dispatch_execute_indexes_protobuf_views(monkeypatch):
+    monkeypatch.setenv("BATCH_JOB_ARRAY_INDEX_VAR_NAME", "AWS_BATCH_JOB_ARRAY_INDEX")
+    monkeypatch.setenv("AWS_BATCH_JOB_ARRAY_INDEX", "7")
+
+    maptask = map_task(t1, metadata=TaskMetadata(retries=1))
+    ctx = FlyteContext.current_context()
+    list_type = TypeEngine.to_literal_type(typing.List[int])
+    literal_map = _literal_models.LiteralMap(
+        literals={"a": TypeEngine.to_literal(ctx, list(range(1000)), typing.List[int], list_type)}
+    )
+    # As the entrypoint reads the inputs.
+    input_literal_map = _literal_models.LiteralMap.from_flyte_idl_view(literal_map.to_flyte_idl())
+
+    wrapped = []
+    original = _literal_models.Literal.from_flyte_idl_view.__func__
+
+    def spy(cls, pb2_object):
+        wrapped.append(pb2_object)
+        return original(cls, pb2_object)
+
+    monkeypatch.setattr(_literal_models.Literal, "from_flyte_idl_view", classmethod(spy))
+    with ctx.new_execution_context(mode=ExecutionState.Mode.TASK_EXECUTION) as ctx:
+        outputs = maptask.dispatch_execute(ctx, input_literal_map)
+
+    assert outputs.literals["o0"].scalar.primitive.string_value == "9"
+    # The input map entry and the selected element, not every element of the collection.
+    assert len(wrapped) == 2
+    assert input_literal_map.literals["a"].collection.idl_view is not None
@@ -1,10 +1,17 @@
 import datetime
+import importlib
 import os
+import sys
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import timedelta
 
 import pytest
+from dataclasses_json import LetterCase, dataclass_json
 from flyteidl.core import errors_pb2
+from google.protobuf import json_format as _json_format
+from google.protobuf import struct_pb2 as _struct
 
 from flytekit import kwtypes
 from flytekit.core.context_manager import FlyteContext
@@ -14,6 +21,7 @@ from flytekit.core.type_engine import (
     PathLikeTransformer,
     SimpleTransformer,
     TypeEngine,
+    _dataclass_plan,
 )
 from flytekit.models import types as model_types
 from flytekit.models.core.types import BlobType
@@ -197,3 +205,202 @@ def test_protos():
     l0 = Literal(scalar=Scalar(primitive=Primitive(integer=4)))
     with pytest.raises(AssertionError):
         TypeEngine.to_python_value(ctx, l0, errors_pb2.ContainerError)
+
+
+def test_transformer_resolution_is_cached():
+    class Base(object):
+        pass
+
+    class Child(Base):
+        pass
+
+    base_transformer = SimpleTransformer(
+        "base", Base, LiteralType(simple=SimpleType.STRING), lambda x: None, lambda x: None
+    )
+    child_transformer = SimpleTransformer(
+        "child", Child, LiteralType(simple=SimpleType.STRING), lambda x: None, lambda x: None
+    )
+    try:
+        TypeEngine.register(base_transformer)
+        # Resolved through the subclass scan, then served from the cache.
+        assert TypeEngine.get_transformer(Child) is base_transformer
+        assert TypeEngine._RESOLVED[Child] is base_transformer
+
+        # Registering a more specific transformer has to take effect immediately.
+        TypeEngine.register(child_transformer)
+        assert Child not in TypeEngine._RESOLVED
+        assert TypeEngine.get_transformer(Child) is child_transformer
+    finally:
+        TypeEngine._REGISTRY.pop(Base, None)
+        TypeEngine._REGISTRY.pop(Child, None)
+        TypeEngine._RESOLVED.clear()
+
+    with pytest.raises(ValueError):
+        TypeEngine.get_transformer(Child)
+
+
+@pytest.mark.parametrize(
+    "python_type,value",
+    [
+        (typing.List[int], [0, 1, -5]),
+        (typing.List[float], [0.0, 1.5, -2.25]),
+        (typing.List[bool], [True, False]),
+        (typing.List[str], ["", "a", "b"]),
+        (typing.Dict[str, int], {"a": 0, "b": 3}),
+        (typing.Dict[str, float], {"a": 0.0, "b": 2.5}),
+    ],
+)
+def test_primitive_collections_bulk_path(python_type, value):
+    ctx = FlyteContext.current_context()
+    lt = TypeEngine.to_literal_type(python_type)
+    lv = TypeEngine.to_literal(ctx, value, python_type, lt)
+    # Built directly as a protobuf, with the same result as the element wise conversion.
+    container = lv.map if isinstance(value, dict) else lv.collection
+    assert container.idl_view is not None
+    assert TypeEngine.to_python_value(ctx, lv, python_type) == value
+
+    round_tripped = Literal.from_flyte_idl(lv.to_flyte_idl())
+    assert TypeEngine.to_python_value(ctx, round_tripped, python_type) == value
+
+
+def test_primitive_collections_fall_back():
+    ctx = FlyteContext.current_context()
+    lt = TypeEngine.to_literal_type(typing.List[int])
+    with pytest.raises(AssertionError):
+        TypeEngine.to_literal(ctx, [1, None], typing.List[int], lt)
+
+    # Integers are accepted for floats when reading, which the bulk reader leaves to the regular path.
+    pb = Literal(collection=LiteralCollection(literals=[Literal(scalar=Scalar(primitive=Primitive(integer=3)))]))
+    lv = Literal(collection=LiteralCollection.from_flyte_idl_view(pb.collection.to_flyte_idl()))
+    assert TypeEngine.to_python_value(ctx, lv, typing.List[float]) == [3.0]
+
+
+def test_primitive_collections_numpy():
+    np = pytest.importorskip("numpy")
+    ctx = FlyteContext.current_context()
+    t = typing.List[float]
+    lv = TypeEngine.to_literal(ctx, np.array([1.5, 2.5]), t, TypeEngine.to_literal_type(t))
+    assert lv.collection.idl_view is not None
+    arr = TypeEngine.get_transformer(t).to_numpy_array(ctx, lv, t)
+    assert isinstance(arr, np.ndarray)
+    assert arr.tolist() == [1.5, 2.5]
+
+
+@dataclass_json
+@dataclass
+class Inner(object):
+    a: int
+    b: typing.Optional[float] = None
+
+
+@dataclass_json
+@dataclass
+class Outer(object):
+    name: str
+    flag: bool
+    inner: Inner
+    inners: typing.List[Inner]
+    counts: typing.Dict[str, typing.List[int]]
+    maybe: typing.Optional[Inner] = None
+    tags: typing.List[str] = field(default_factory=list)
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class Camel(object):
+    some_value: int
+
+
+@dataclass_json
+@dataclass
+class WithDate(object):
+    when: datetime.datetime
+
+
+def _roundtrip(v, t):
+    ctx = FlyteContext.current_context()
+    lv = TypeEngine.to_literal(ctx, v, t, TypeEngine.to_literal_type(t))
+    return lv, TypeEngine.to_python_value(ctx, Literal.from_flyte_idl(lv.to_flyte_idl()), t)
+
+
+def test_dataclass_plan():
+    assert _dataclass_plan(Outer) is not None
+    v = Outer(
+        name="x",
+        flag=True,
+        inner=Inner(a=1, b=0.5),
+        inners=[Inner(a=2), Inner(a=3, b=-1.0)],
+        counts={"a": [1, 2], "b": []},
+    )
+    lv, pv = _roundtrip(v, Outer)
+    # The same struct as the JSON round trip of dataclasses_json.
+    assert lv.scalar.generic == _json_format.Parse(v.to_json(), _struct.Struct())
+    assert pv == v
+    # Integers stay integers, also where the JSON round trip would leave floats.
+    assert type(pv.inners[1].a) is int
+    assert type(pv.counts["a"][0]) is int
+
+    # Fields missing from the struct take their defaults.
+    generic = _json_format.Parse('{"a": 4}', _struct.Struct())
+    lv = Literal(scalar=Scalar(generic=generic))
+    assert TypeEngine.to_python_value(FlyteContext.current_context(), lv, Inner) == Inner(a=4)
+
+
+def test_dataclass_plan_falls_back():
+    assert _dataclass_plan(Camel) is None
+    assert _dataclass_plan(WithDate) is None
+    assert _roundtrip(Camel(some_value=3), Camel)[1] == Camel(some_value=3)
+    lv, _ = _roundtrip(Camel(some_value=3), Camel)
+    assert set(lv.scalar.generic.fields) == {"someValue"}
+
+    when = datetime.datetime(2021, 1, 2, tzinfo=datetime.timezone.utc)
+    assert _roundtrip(WithDate(when=when), WithDate)[1] == WithDate(when=when)
+
+    # A value that does not match its declared type goes through the JSON round trip as a whole.
+    v = Outer(name="x", flag=False, inner=Inner(a=1), inners=[], counts={}, tags=[("a", 1)])
+    lv, pv = _roundtrip(v, Outer)
+    assert lv.scalar.generic == _json_format.Parse(v.to_json(), _struct.Struct())
+    assert pv.tags == [["a", 1]]
+
+
+@pytest.fixture
+def deferred_package(tmp_path, monkeypatch):
+    """
+    A package "deferred_pkg" with a type Thing, whose transformer is registered by the module "deferred_transformer".
+    That module takes a moment to import, so that lookups from other threads overlap with it.
+    """
+    (tmp_path / "deferred_pkg").mkdir()
+    (tmp_path / "deferred_pkg" / "__init__.py").write_text("class Thing(object):\n    pass\n")
+    (tmp_path / "deferred_transformer.py").write_text(
+        "import time\n"
+        "from deferred_pkg import Thing\n"
+        "from flytekit.core.type_engine import SimpleTransformer, TypeEngine\n"
+        "from flytekit.models.types import LiteralType, SimpleType\n"
+        "time.sleep(0.2)\n"
+        "TypeEngine.register(\n"
+        "    SimpleTransformer('thing', Thing, LiteralType(simple=SimpleType.STRING), lambda x: None, lambda x: None)\n"
+        ")\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(TypeEngine, "_REGISTRY", dict(TypeEngine._REGISTRY))
+    monkeypatch.setattr(TypeEngine, "_RESOLVED", {})
+    monkeypatch.setattr(TypeEngine, "_DEFERRED", {"deferred_pkg": "deferred_transformer"})
+    yield importlib.import_module("deferred_pkg")
+    for name in ("deferred_pkg", "deferred_transformer"):
+        sys.modules.pop(name, None)
+
+
+def test_deferred_transformer_is_loaded_once_for_concurrent_lookups(deferred_package):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        transformers = list(pool.map(lambda _: TypeEngine.get_transformer(deferred_package.Thing), range(4)))
+    assert {t.name for t in transformers} == {"thing"}
+    assert TypeEngine._DEFERRED == {}
+
+
+def test_deferred_transformer_is_loaded_for_subclasses_defined_elsewhere(deferred_package):
+    class MyThing(deferred_package.Thing):
+        pass
+
+    assert TypeEngine.get_transformer(MyThing).name == "thing"
+    with pytest.raises(ValueError, match="not supported"):
+        TypeEngine.get_transformer(ThreadPoolExecutor)
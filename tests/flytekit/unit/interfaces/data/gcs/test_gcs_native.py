@@ -0,0 +1,202 @@
+import os as _os
+import urllib.request as _request
+import uuid as _uuid
+
+import mock as _mock
+import pytest as _pytest
+
+from flytekit.interfaces.data.gcs import gcs_proxy as _gcs_proxy
+from flytekit.interfaces.data.gcs import native as _native
+
+
+class _FakeBlob(object):
+    def __init__(self, bucket, name):
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def size(self):
+        return len(self.bucket.objects[self.name])
+
+    def exists(self):
+        return self.name in self.bucket.objects
+
+    def upload_from_filename(self, filename):
+        with open(filename, "rb") as fh:
+            self.upload_from_string(fh.read())
+
+    def upload_from_string(self, data):
+        self.bucket.objects[self.name] = data
+
+    def upload_from_file(self, file_obj, size=None):
+        # Reads in small chunks, as a resumable upload does, until the end of the stream.
+        data = b"".join(iter(lambda: file_obj.read(3), b""))
+        assert size is None or len(data) == size
+        self.bucket.objects[self.name] = data
+
+    def download_to_filename(self, filename):
+        with open(filename, "wb") as fh:
+            fh.write(self.bucket.objects[self.name])
+
+    def compose(self, sources):
+        self.bucket.objects[self.name] = b"".join(self.bucket.objects[s.name] for s in sources)
+
+    def delete(self):
+        del self.bucket.objects[self.name]
+
+
+class _FakeBucket(object):
+    def __init__(self):
+        self.objects = {}
+
+    def blob(self, name):
+        return _FakeBlob(self, name)
+
+
+class _FakeStorageClient(object):
+    """
+    In-memory stand-in for google.cloud.storage.Client, covering the calls the native client makes.
+    """
+
+    def __init__(self):
+        self.buckets = {}
+
+    def bucket(self, name):
+        return self.buckets.setdefault(name, _FakeBucket())
+
+    def list_blobs(self, bucket, prefix=""):
+        b = self.bucket(bucket)
+        return [b.blob(k) for k in sorted(b.objects) if k.startswith(prefix)]
+
+
+@_pytest.fixture
+def storage():
+    fake = _FakeStorageClient()
+    with _mock.patch("flytekit.configuration.gcp.USE_NATIVE_CLIENT.get", return_value=True):
+        with _mock.patch.object(_native, "_CLIENT", _native.NativeGCSClient(fake)):
+            yield fake
+
+
+def test_split_gcs_path():
+    assert _native.split_gcs_path("gs://bucket/a/b") == ("bucket", "a/b")
+    assert _native.split_gcs_path("gs://bucket") == ("bucket", "")
+
+
+@_mock.patch("flytekit.interfaces.data.gcs.gcs_proxy._update_cmd_config_and_execute")
+def test_exists(mock_execute, storage):
+    storage.bucket("bar").objects["a/b"] = b"x"
+    proxy = _gcs_proxy.GCSProxy()
+    assert proxy.exists("gs://bar/a/b") is True
+    assert proxy.exists("gs://bar/a/c") is False
+    assert proxy.exists_many(["gs://bar/a/b", "gs://bar/a/c", "gs://bar/a/b"]) == [True, False, True]
+    mock_execute.assert_not_called()
+
+
+def test_upload_download(storage, tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_bytes(b"hello")
+    proxy = _gcs_proxy.GCSProxy()
+
+    proxy.upload(str(src), "gs://bar/x/y.txt")
+    proxy.upload(str(src), "gs://bar/dir/")
+    assert sorted(storage.bucket("bar").objects) == ["dir/src.txt", "x/y.txt"]
+
+    dest = tmp_path / "dest.txt"
+    proxy.download("gs://bar/x/y.txt", str(dest))
+    assert dest.read_bytes() == b"hello"
+
+
+def test_directories(storage, tmp_path):
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_bytes(b"a")
+    (src / "nested" / "b.txt").write_bytes(b"b")
+    proxy = _gcs_proxy.GCSProxy()
+
+    proxy.upload_directory(str(src), "gs://bar/0")
+    assert sorted(storage.bucket("bar").objects) == ["0/a.txt", "0/nested/b.txt"]
+
+    dest = tmp_path / "dest"
+    proxy.download_directory("gs://bar/0/", str(dest))
+    assert (dest / "a.txt").read_bytes() == b"a"
+    assert (dest / "nested" / "b.txt").read_bytes() == b"b"
+
+
+@_pytest.mark.parametrize(
+    "threshold, data",
+    [
+        (4, b"0123456789abcdefg"),
+        # 32 parts at most, of 2 bytes each, of which only 17 have data.
+        (1, bytes(range(33))),
+    ],
+)
+def test_composite_upload(storage, tmp_path, threshold, data):
+    src = tmp_path / "big"
+    src.write_bytes(data)
+    with _mock.patch("flytekit.configuration.gcp.PARALLEL_COMPOSITE_UPLOAD_THRESHOLD.get", return_value=threshold):
+        with _mock.patch.object(_FakeBlob, "upload_from_string", side_effect=AssertionError("read into memory")):
+            _gcs_proxy.GCSProxy().upload(str(src), "gs://bar/big")
+    # Only the composed object is left behind, the parts are cleaned up.
+    assert storage.bucket("bar").objects == {"big": data}
+
+
+@_mock.patch("flytekit.interfaces.data.gcs.native._storage", None)
+@_mock.patch("flytekit.configuration.gcp.USE_NATIVE_CLIENT.get", return_value=True)
+@_mock.patch("flytekit.interfaces.data.gcs.gcs_proxy._update_cmd_config_and_execute")
+@_mock.patch("flytekit.interfaces.data.gcs.gcs_proxy.GCSProxy._check_binary")
+def test_falls_back_to_gsutil(mock_check, mock_execute, mock_native):
+    _gcs_proxy.GCSProxy().exists("gs://bar/a")
+    mock_execute.assert_called_once_with(["gsutil", "-q", "stat", "gs://bar/a"])
+
+
+@_pytest.fixture
+def emulator():
+    """
+    A bucket on the GCS emulator that STORAGE_EMULATOR_HOST points to, e.g. a fake-gcs-server started with
+    ``docker run -p 4443:4443 fsouza/fake-gcs-server -scheme http`` and STORAGE_EMULATOR_HOST=http://localhost:4443.
+    The native client talks to it with the real google-cloud-storage client rather than the fakes above.
+    """
+    host = _os.environ.get("STORAGE_EMULATOR_HOST")
+    if not host or not _native.is_available():
+        _pytest.skip("needs google-cloud-storage and a GCS emulator at STORAGE_EMULATOR_HOST")
+    try:
+        _request.urlopen(f"{host.rstrip('/')}/storage/v1/b?project=test", timeout=2).close()
+    except OSError:
+        _pytest.skip(f"no GCS emulator is listening at {host}")
+    client = _native.NativeGCSClient()
+    bucket = client.client.create_bucket(f"flytekit-test-{_uuid.uuid4().hex[:12]}", project="test")
+    with _mock.patch("flytekit.configuration.gcp.USE_NATIVE_CLIENT.get", return_value=True):
+        with _mock.patch.object(_native, "_CLIENT", client):
+            yield bucket
+
+
+def test_emulator_round_trip(emulator, tmp_path):
+    root = f"gs://{emulator.name}"
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_bytes(b"a")
+    (src / "nested" / "b.txt").write_bytes(b"b")
+    proxy = _gcs_proxy.GCSProxy()
+
+    proxy.upload(str(src / "a.txt"), f"{root}/x/y.txt")
+    proxy.upload_directory(str(src), f"{root}/0")
+    assert proxy.exists_many([f"{root}/x/y.txt", f"{root}/x/z.txt", f"{root}/0/nested/b.txt"]) == [True, False, True]
+
+    dest = tmp_path / "dest"
+    proxy.download_directory(f"{root}/0/", str(dest))
+    assert (dest / "a.txt").read_bytes() == b"a"
+    assert (dest / "nested" / "b.txt").read_bytes() == b"b"
+    proxy.download(f"{root}/x/y.txt", str(tmp_path / "y.txt"))
+    assert (tmp_path / "y.txt").read_bytes() == b"a"
+
+
+@_pytest.mark.parametrize("threshold, size", [(4, 17), (1, 33), (1024, 1024 * 100 + 7)])
+def test_emulator_composite_upload(emulator, tmp_path, threshold, size):
+    data = _os.urandom(size)
+    src = tmp_path / "big"
+    src.write_bytes(data)
+    with _mock.patch("flytekit.configuration.gcp.PARALLEL_COMPOSITE_UPLOAD_THRESHOLD.get", return_value=threshold):
+        _gcs_proxy.GCSProxy().upload(str(src), f"gs://{emulator.name}/big")
+    assert emulator.blob("big").download_as_bytes() == data
+    # The parts are deleted once they are composed.
+    assert [b.name for b in emulator.client.list_blobs(emulator.name)] == ["big"]
@@ -0,0 +1,94 @@
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+_RANGE = re.compile(r"bytes=(\d+)-(\d*)")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that connections are kept alive between requests.
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, send_body):
+        server = self.server
+        server.requests.append((self.command, self.path, self.headers.get("Range"), self.client_address))
+        data = server.files.get(self.path)
+        if data is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        status, start, end = 200, 0, len(data) - 1
+        match = _RANGE.fullmatch(self.headers.get("Range") or "")
+        if match and server.ranges:
+            status, start = 206, int(match.group(1))
+            if match.group(2):
+                end = min(int(match.group(2)), end)
+        body = data[start : end + 1]
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        if server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        if status == 206:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+        self.end_headers()
+        if not send_body:
+            return
+
+        with server.lock:
+            truncate = send_body and server.truncations > 0 and len(body) > server.truncate_after
+            if truncate:
+                server.truncations -= 1
+        if truncate:
+            # Drop the connection part way through the body.
+            self.wfile.write(body[: server.truncate_after])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self._respond(False)
+
+    def do_GET(self):
+        self._respond(True)
+
+
+class HttpTestServer(ThreadingHTTPServer):
+    """
+    Serves ``files`` (path -> bytes) with optional range support, and can cut the next ``truncations`` responses short
+    after ``truncate_after`` bytes. Every request is recorded as (method, path, range header, client address).
+    """
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.files = {}
+        self.requests = []
+        self.ranges = True
+        self.truncations = 0
+        self.truncate_after = 0
+        self.lock = threading.Lock()
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+@pytest.fixture
+def http_server():
+    server = HttpTestServer()
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,87 @@
+import os
+
+import mock
+import pytest
+
+from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.interfaces.data.http import http_data_proxy as _http_data_proxy
+
+_DATA = os.urandom(10000)
+
+
+@pytest.fixture
+def proxy(http_server):
+    http_server.files["/data.bin"] = _DATA
+    # Isolate the connection pool from other tests.
+    with mock.patch.object(_http_data_proxy, "_SESSION", None), mock.patch(
+        "flytekit.interfaces.data.http.http_data_proxy._time.sleep"
+    ):
+        yield _http_data_proxy.HttpFileProxy()
+
+
+def _gets(server):
+    return [(path, rng) for method, path, rng, _ in server.requests if method == "GET"]
+
+
+def test_download_reuses_connection(proxy, http_server, tmp_path):
+    for i in range(3):
+        proxy.download(http_server.url("/data.bin"), str(tmp_path / f"out{i}"))
+        assert (tmp_path / f"out{i}").read_bytes() == _DATA
+    assert len({client for _, _, _, client in http_server.requests}) == 1
+
+
+def test_exists(proxy, http_server):
+    assert proxy.exists(http_server.url("/data.bin"))
+    assert not proxy.exists(http_server.url("/missing"))
+
+
+def test_download_missing(proxy, http_server, tmp_path):
+    with pytest.raises(_user_exceptions.FlyteValueException):
+        proxy.download(http_server.url("/missing"), str(tmp_path / "out"))
+
+
+def test_download_resumes_with_range(proxy, http_server, tmp_path):
+    http_server.truncations, http_server.truncate_after = 2, 3000
+    proxy.download(http_server.url("/data.bin"), str(tmp_path / "out"))
+    assert (tmp_path / "out").read_bytes() == _DATA
+    assert _gets(http_server) == [("/data.bin", None), ("/data.bin", "bytes=3000-"), ("/data.bin", "bytes=6000-")]
+
+
+def test_download_restarts_without_range_support(proxy, http_server, tmp_path):
+    http_server.ranges = False
+    http_server.truncations, http_server.truncate_after = 1, 3000
+    proxy.download(http_server.url("/data.bin"), str(tmp_path / "out"))
+    assert (tmp_path / "out").read_bytes() == _DATA
+
+
+def test_download_gives_up(proxy, http_server, tmp_path):
+    http_server.truncations, http_server.truncate_after = 10, 100
+    with mock.patch.dict(os.environ, {_sdk_config.DATA_TRANSFER_RETRIES.env_var: "2"}):
+        with pytest.raises(IOError):
+            proxy.download(http_server.url("/data.bin"), str(tmp_path / "out"))
+    assert len(_gets(http_server)) == 3
+
+
+@pytest.mark.parametrize("parallel", [True, False])
+def test_download_parallel_ranges(proxy, http_server, tmp_path, parallel):
+    env = {
+        _sdk_config.DATA_TRANSFER_PART_SIZE.env_var: "4096",
+        _sdk_config.DATA_TRANSFER_CONCURRENCY.env_var: "4",
+        _sdk_config.HTTP_PARALLEL_DOWNLOADS.env_var: str(parallel),
+    }
+    with mock.patch.dict(os.environ, env):
+        proxy.download(http_server.url("/data.bin"), str(tmp_path / "out"))
+    assert (tmp_path / "out").read_bytes() == _DATA
+    # The first response is dropped once its headers show the file is large enough to split.
+    ranges = sorted(rng for _, rng in _gets(http_server)[1:])
+    assert ranges == (["bytes=0-4095", "bytes=4096-8191", "bytes=8192-9999"] if parallel else [])
+
+
+def test_open_read(proxy, http_server):
+    with proxy.open_read(http_server.url("/data.bin")) as fh:
+        assert fh.read(100) == _DATA[:100]
+        assert fh.read() == _DATA[100:]
+    with pytest.raises(_user_exceptions.FlyteValueException):
+        with proxy.open_read(http_server.url("/missing")):
+            pass
@@ -0,0 +1,99 @@
+import boto3
+import mock as _mock
+import pytest
+from moto import mock_s3
+
+from flytekit.interfaces.data.s3 import native as _native
+from flytekit.interfaces.data.s3.s3proxy import AwsS3Proxy as _AwsS3Proxy
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(_native, "_CLIENTS", {})
+    with mock_s3():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket="bucket")
+        with _mock.patch("flytekit.configuration.aws.USE_NATIVE_CLIENT") as mock_native:
+            mock_native.get.return_value = True
+            yield client
+
+
+def test_split_s3_path():
+    assert _native.split_s3_path("s3://bucket/some/key") == ("bucket", "some/key")
+    assert _native.split_s3_path("s3://bucket") == ("bucket", "")
+
+
+def test_client_is_shared(s3):
+    assert _native.get_client() is _native.get_client()
+
+
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy._subprocess")
+def test_exists(mock_subprocess, s3):
+    s3.put_object(Bucket="bucket", Key="a/b", Body=b"hello")
+    proxy = _AwsS3Proxy()
+    assert proxy.exists("s3://bucket/a/b") is True
+    assert proxy.exists("s3://bucket/a/missing") is False
+    assert mock_subprocess.check_call.call_count == 0
+
+
+def test_upload_download(s3, tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_text("hello")
+    proxy = _AwsS3Proxy()
+
+    proxy.upload(str(src), "s3://bucket/x/y.txt")
+    assert s3.get_object(Bucket="bucket", Key="x/y.txt")["Body"].read() == b"hello"
+
+    proxy.upload(str(src), "s3://bucket/dir/")
+    assert proxy.exists("s3://bucket/dir/src.txt")
+
+    dest = tmp_path / "dest.txt"
+    proxy.download("s3://bucket/x/y.txt", str(dest))
+    assert dest.read_text() == "hello"
+
+
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy._subprocess")
+def test_open_read(mock_subprocess, s3):
+    s3.put_object(Bucket="bucket", Key="a/b", Body=b"hello")
+    with _AwsS3Proxy().open_read("s3://bucket/a/b") as fh:
+        assert fh.read() == b"hello"
+    assert mock_subprocess.check_call.call_count == 0
+
+
+def test_directories(s3, tmp_path):
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_text("a")
+    (src / "nested" / "b.txt").write_text("b")
+    proxy = _AwsS3Proxy()
+
+    proxy.upload_directory(str(src), "s3://bucket/prefix")
+    keys = sorted(o["Key"] for o in s3.list_objects_v2(Bucket="bucket")["Contents"])
+    assert keys == ["prefix/a.txt", "prefix/nested/b.txt"]
+
+    dest = tmp_path / "dest"
+    proxy.download_directory("s3://bucket/prefix/", str(dest))
+    assert (dest / "a.txt").read_text() == "a"
+    assert (dest / "nested" / "b.txt").read_text() == "b"
+
+
+@_mock.patch("flytekit.configuration.aws.BACKOFF_SECONDS")
+def test_retries(mock_delay, s3):
+    mock_delay.get.return_value = 0
+    client = _native.get_client()
+    with _mock.patch.object(client.client, "head_object", side_effect=Exception("boom")) as mock_head:
+        with pytest.raises(Exception, match="boom"):
+            client.exists("s3://bucket/a")
+        assert mock_head.call_count == 4
+
+
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy.AwsS3Proxy._check_binary")
+@_mock.patch("flytekit.interfaces.data.s3.s3proxy._subprocess")
+@_mock.patch("flytekit.interfaces.data.s3.native._boto3", None)
+def test_falls_back_to_cli(mock_subprocess, mock_check, s3):
+    proxy = _AwsS3Proxy()
+    assert proxy.exists("s3://bucket/a") is True
+    assert mock_subprocess.check_call.call_count == 1
@@ -0,0 +1,84 @@
+import os
+import threading
+
+import mock
+import pytest
+
+from flytekit.common.exceptions import user as _user_exceptions
+from flytekit.interfaces.data.data_proxy import FileAccessProvider
+
+
+@pytest.fixture
+def fs(tmp_path):
+    return FileAccessProvider(local_sandbox_dir=str(tmp_path / "sandbox"))
+
+
+@pytest.fixture
+def remote(tmp_path):
+    remote = tmp_path / "remote"
+    (remote / "dir" / "nested").mkdir(parents=True)
+    (remote / "file.txt").write_text("hello")
+    (remote / "dir" / "a.txt").write_text("a")
+    (remote / "dir" / "nested" / "b.txt").write_text("b")
+    return remote
+
+
+def test_prefetched_file_is_moved_into_place(fs, remote, tmp_path):
+    fetched = []
+    future = fs.prefetch(str(remote / "file.txt"), on_fetched=fetched.append)
+    assert fs.prefetch(str(remote / "file.txt")) is future
+    future.result()
+    assert open(fetched[0]).read() == "hello"
+
+    with mock.patch.object(fs.local_access, "download") as download:
+        fs.get_data(str(remote / "file.txt"), str(tmp_path / "out" / "file.txt"))
+    download.assert_not_called()
+    assert (tmp_path / "out" / "file.txt").read_text() == "hello"
+    assert not os.path.exists(fetched[0])
+
+    # Only the first download takes the prefetched copy.
+    fs.get_data(str(remote / "file.txt"), str(tmp_path / "again.txt"))
+    assert (tmp_path / "again.txt").read_text() == "hello"
+
+
+def test_prefetched_directory_is_merged(fs, remote, tmp_path):
+    fs.prefetch(str(remote / "dir"), is_multipart=True).result()
+    target = tmp_path / "target"
+    (target / "nested").mkdir(parents=True)
+    (target / "a.txt").write_text("old")
+    with mock.patch.object(fs.local_access, "download_directory") as download_directory:
+        fs.get_data(str(remote / "dir"), str(target), is_multipart=True)
+    download_directory.assert_not_called()
+    assert (target / "a.txt").read_text() == "a"
+    assert (target / "nested" / "b.txt").read_text() == "b"
+
+
+def test_failed_prefetch_downloads_again(fs, remote, tmp_path):
+    with mock.patch.object(fs.local_access, "download", side_effect=IOError("flaky")):
+        assert isinstance(fs.prefetch(str(remote / "file.txt")).exception(), IOError)
+    fs.get_data(str(remote / "file.txt"), str(tmp_path / "out.txt"))
+    assert (tmp_path / "out.txt").read_text() == "hello"
+
+
+def test_background_uploads(fs, remote, tmp_path):
+    release = threading.Event()
+    upload = fs.remote.upload
+
+    def slow_upload(*args):
+        release.wait(5)
+        upload(*args)
+
+    with mock.patch.object(fs.remote, "upload", side_effect=slow_upload):
+        with fs.background_uploads():
+            fs.put_data(str(remote / "file.txt"), str(tmp_path / "uploaded" / "file.txt"))
+            # put_data returned before the upload went through.
+            assert not (tmp_path / "uploaded" / "file.txt").exists()
+            with fs.background_uploads():
+                fs.put_data(str(remote / "dir"), str(tmp_path / "uploaded" / "dir"), is_multipart=True)
+            release.set()
+    assert (tmp_path / "uploaded" / "file.txt").read_text() == "hello"
+    assert (tmp_path / "uploaded" / "dir" / "nested" / "b.txt").read_text() == "b"
+
+    with pytest.raises(_user_exceptions.FlyteAssertion, match="missing"):
+        with fs.background_uploads():
+            fs.put_data(str(tmp_path / "missing"), str(tmp_path / "uploaded" / "missing"))
@@ -0,0 +1,90 @@
+import os
+
+import mock as _mock
+import pytest
+
+from flytekit.interfaces.data import transfer as _transfer
+from flytekit.interfaces.data.local.local_file_proxy import LocalFileProxy
+
+
+@pytest.fixture
+def source(tmp_path):
+    src = tmp_path / "src"
+    (src / "nested").mkdir(parents=True)
+    (src / "a.txt").write_bytes(b"a" * 10)
+    (src / "nested" / "b.txt").write_bytes(b"b" * 25)
+    return src
+
+
+def test_list_local_files(source):
+    files = _transfer.list_local_files(str(source))
+    assert [(rel, size) for _, rel, size in files] == [("a.txt", 10), ("nested/b.txt", 25)]
+
+
+def test_list_local_files_not_a_dir(tmp_path):
+    with pytest.raises(ValueError):
+        _transfer.list_local_files(str(tmp_path / "missing"))
+
+
+def test_copy_tree_with_ranged_parts(source, tmp_path):
+    dest = tmp_path / "dest"
+    stats = _transfer.TransferEngine(concurrency=4, part_size=8).copy_tree(str(source), str(dest))
+    assert (dest / "a.txt").read_bytes() == b"a" * 10
+    assert (dest / "nested" / "b.txt").read_bytes() == b"b" * 25
+    # a.txt is split into 2 parts and b.txt into 4.
+    assert stats.files == 6
+    assert stats.bytes == 35
+    assert stats.throughput >= 0
+
+
+def test_copy_file(tmp_path):
+    src = tmp_path / "big"
+    src.write_bytes(os.urandom(1000))
+    _transfer.TransferEngine(part_size=64).copy_file(str(src), str(tmp_path / "copy"))
+    assert (tmp_path / "copy").read_bytes() == src.read_bytes()
+
+
+def test_upload_directory(source):
+    uploaded = {}
+    stats = _transfer.TransferEngine().upload_directory(
+        str(source), lambda path, rel: uploaded.__setitem__(rel, open(path, "rb").read())
+    )
+    assert uploaded == {"a.txt": b"a" * 10, "nested/b.txt": b"b" * 25}
+    assert stats.files == 2
+
+
+def test_download_directory(tmp_path):
+    remote = {"r/x": b"1", "r/y/z": b"22"}
+
+    def get_file(remote_path, target):
+        with open(target, "wb") as fh:
+            fh.write(remote[remote_path])
+
+    dest = tmp_path / "dest"
+    _transfer.TransferEngine().download_directory([(k, k[2:], len(v)) for k, v in remote.items()], str(dest), get_file)
+    assert (dest / "x").read_bytes() == b"1"
+    assert (dest / "y" / "z").read_bytes() == b"22"
+
+
+@_mock.patch("flytekit.interfaces.data.transfer._time.sleep")
+def test_retries(mock_sleep):
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise IOError("transient")
+
+    _transfer.TransferEngine(retries=3).run([(flaky, "flaky", 1)], "test")
+    assert len(calls) == 3
+
+    always_failing = _mock.MagicMock(side_effect=IOError("permanent"))
+    with pytest.raises(IOError, match="permanent"):
+        _transfer.TransferEngine(retries=2).run([(always_failing, "failing", 1)], "test")
+    assert always_failing.call_count == 3
+
+
+def test_local_proxy_uses_engine(source, tmp_path):
+    dest = tmp_path / "dest"
+    LocalFileProxy(str(tmp_path)).download_directory(f"file://{source}", str(dest))
+    assert (dest / "nested" / "b.txt").read_bytes() == b"b" * 25
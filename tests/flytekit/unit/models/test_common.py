@@ -1,5 +1,13 @@
+import copy
+
+import mock as _mock
+
 from flytekit.models import common as _common
+from flytekit.models import literals as _literals
+from flytekit.models import types as _types
 from flytekit.models.core import execution as _execution
+from flytekit.models.core import identifier as _identifier_models
+from flytekit.models.core import workflow as _workflow
 
 
 def test_notification_email():
@@ -88,3 +96,72 @@ def test_raw_output_data_config():
     assert obj.output_location_prefix == "s3://bucket"
     obj2 = _common.RawOutputDataConfig.from_flyte_idl(obj.to_flyte_idl())
     assert obj2 == obj
+
+
+def _identifier(name="n", version="v"):
+    return _identifier_models.Identifier(_identifier_models.ResourceType.TASK, "p", "d", name, version)
+
+
+def test_hash_and_eq_serialize_once():
+    obj, other = _identifier(), _identifier()
+    pb = obj.to_flyte_idl()
+    with _mock.patch.object(_identifier_models.Identifier, "to_flyte_idl", autospec=True, return_value=pb) as m:
+        assert obj == other
+        assert hash(obj) == hash(other)
+        assert len({obj, other}) == 1
+        assert m.call_count == 2
+
+    # Same bytes, different message.
+    assert _common.EmailNotification(["a", "b", "c"]) != _common.PagerDutyNotification(["a", "b", "c"])
+
+
+def test_mutable_entities_are_not_cached():
+    ref = _types.OutputReference("node", "a")
+    assert ref == _types.OutputReference("node", "a")
+    ref.var = "b"
+    assert ref != _types.OutputReference("node", "a")
+    assert ref == _types.OutputReference("node", "b")
+
+
+def test_nested_mutations_are_seen_by_the_parent():
+    def p(i):
+        return _literals.Literal(scalar=_literals.Scalar(primitive=_literals.Primitive(integer=i)))
+
+    lc = _literals.LiteralCollection([p(1)])
+    hash(lc)
+    lc.literals.append(p(2))
+    assert lc != _literals.LiteralCollection([p(1)])
+    assert lc == _literals.LiteralCollection([p(1), p(2)])
+    assert hash(lc) == hash(_literals.LiteralCollection([p(1), p(2)]))
+
+    tid = _identifier()
+    tn = _workflow.TaskNode(tid)
+    hash(tn)
+    tid._version = "v2"
+    assert tn != _workflow.TaskNode(_identifier())
+    assert tn == _workflow.TaskNode(_identifier(version="v2"))
+
+
+def test_copies_do_not_share_the_cache():
+    a = _identifier()
+    hash(a)
+    for copied in (copy.copy(a), copy.deepcopy(a)):
+        copied.__dict__["_name"] = "b"
+        assert copied != a
+        assert hash(copied) != hash(a)
+        assert copied == _identifier(name="b")
+    assert a == _identifier()
+
+
+def test_deep_copied_identifier_renamed_in_place():
+    a = _identifier()
+    hash(a)
+    b = copy.deepcopy(a)
+    b._name = "other"
+    assert a != b
+    assert hash(a) != hash(b)
+    assert b.to_flyte_idl().name == "other"
+
+    # Assigned in place without a copy.
+    a._version = "v2"
+    assert a == _identifier(version="v2")
@@ -489,3 +489,40 @@ def test_literal_collection(literal_value_pair):
     assert obj == obj2
     assert all(ll == lit for ll in obj.literals)
     assert len(obj.literals) == 3
+
+
+def test_literal_collection_and_map_views():
+    lit = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=5)))
+    pb = literals.LiteralCollection([lit, lit]).to_flyte_idl()
+
+    view = literals.LiteralCollection.from_flyte_idl_view(pb)
+    assert view.idl_view is pb
+    assert view.to_flyte_idl() is pb
+    assert view == literals.LiteralCollection.from_flyte_idl(pb)
+    # Unpacking hands ownership to the list of models.
+    assert view.literals == [lit, lit]
+    assert view.idl_view is None
+    view.literals.append(lit)
+    assert len(view.to_flyte_idl().literals) == 3
+
+    map_pb = literals.LiteralMap({"a": lit}).to_flyte_idl()
+    map_view = literals.LiteralMap.from_flyte_idl_view(map_pb)
+    assert map_view.to_flyte_idl() is map_pb
+    assert map_view.literals == {"a": lit}
+    assert map_view.idl_view is None
+
+
+def test_literal_view():
+    inner = literals.Literal(scalar=literals.Scalar(primitive=literals.Primitive(integer=5)))
+    pb = literals.Literal(map=literals.LiteralMap({"a": inner, "b": inner})).to_flyte_idl()
+
+    view = literals.Literal.from_flyte_idl_view(pb)
+    assert view.to_flyte_idl() is pb
+    assert view.scalar is None and view.collection is None
+    # Children are views over the same protobuf, and untouched ones serialize without being rebuilt.
+    a = view.map.literals["a"]
+    assert a.to_flyte_idl() is pb.map.literals["a"]
+    assert a.scalar.primitive.integer == 5
+    assert view.map.literals["b"].to_flyte_idl() is pb.map.literals["b"]
+    assert view == literals.Literal.from_flyte_idl(pb)
+    assert view.to_flyte_idl() == pb
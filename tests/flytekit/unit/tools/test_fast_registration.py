@@ -1,6 +1,22 @@
+import io
+import json
+import os
 import tarfile
 
-from flytekit.tools.fast_registration import filter_tar_file_fn, get_additional_distribution_loc
+import mock
+import pytest
+
+from flytekit.configuration import sdk as _sdk_config
+from flytekit.tools import fast_registration
+from flytekit.tools.fast_registration import (
+    build_package,
+    compute_digest,
+    download_distribution,
+    filter_tar_file_fn,
+    get_additional_distribution_loc,
+    install_distribution,
+    upload_package,
+)
 
 
 def testfilter_tar_file_fn():
@@ -19,3 +35,213 @@ def testfilter_tar_file_fn():
 
 def test_get_additional_distribution_loc():
     assert get_additional_distribution_loc("s3://my-s3-bucket/dir", "123abc") == "s3://my-s3-bucket/dir/123abc.tar.gz"
+
+
+def _make_source(root):
+    os.makedirs(root / "pkg" / "__pycache__")
+    (root / "pkg" / "__init__.py").write_text("")
+    (root / "pkg" / "wf.py").write_text("X = 1\n")
+    (root / "pkg" / "query.sql").write_text("select 1\n")
+    (root / "pkg" / "__pycache__" / "wf.cpython-38.pyc").write_bytes(b"stale")
+    (root / "run.sh").write_text("#!/bin/sh\n")
+    os.chmod(root / "run.sh", 0o755)
+
+
+@pytest.fixture
+def fast_config(tmp_path):
+    with mock.patch.dict(
+        os.environ,
+        {
+            _sdk_config.FAST_REGISTRATION_CACHE_PATH.env_var: str(tmp_path / "cache.json"),
+            _sdk_config.FAST_REGISTRATION_DEDUP.env_var: "true",
+        },
+    ):
+        yield
+
+
+def test_digest_covers_all_files(tmp_path, fast_config):
+    src = tmp_path / "src"
+    _make_source(src)
+    digest = compute_digest(src)
+    assert digest.startswith("fast") and len(digest) == 36
+
+    # Unchanged files are not read again, even if touched, and do not change the digest.
+    os.utime(src / "pkg" / "wf.py", ns=(0, 0))
+    with mock.patch.object(fast_registration, "_fingerprint", wraps=fast_registration._fingerprint) as fingerprint:
+        assert compute_digest(src) == digest
+    assert [os.path.basename(c.args[0]) for c in fingerprint.call_args_list] == ["wf.py"]
+
+    (src / "pkg" / "query.sql").write_text("select 2\n")
+    assert compute_digest(src) != digest
+    (src / "pkg" / "query.sql").write_text("select 1\n")
+    assert compute_digest(src) == digest
+    os.chmod(src / "pkg" / "query.sql", 0o755)
+    assert compute_digest(src) != digest
+
+
+def test_packages_are_reproducible(tmp_path, fast_config):
+    src = tmp_path / "src"
+    _make_source(src)
+    first = build_package(src, str(tmp_path / "a.tar.gz"))
+    os.utime(src / "pkg" / "wf.py", ns=(0, 0))
+    assert build_package(src, str(tmp_path / "b.tar.gz")) == first
+    assert (tmp_path / "a.tar.gz").read_bytes() == (tmp_path / "b.tar.gz").read_bytes()
+
+    with tarfile.open(tmp_path / "a.tar.gz") as tar:
+        members = tar.getmembers()
+    assert [m.name for m in members] == [
+        fast_registration.PACKAGE_MANIFEST,
+        "pkg",
+        "pkg/__init__.py",
+        "pkg/query.sql",
+        "pkg/wf.py",
+        "run.sh",
+    ]
+    assert {m.uid for m in members} == {0}
+    assert members[-1].mode == 0o755
+
+
+def test_upload_and_download_changes_only(tmp_path, fast_config, monkeypatch):
+    src, remote = tmp_path / "src", tmp_path / "remote"
+    _make_source(src)
+    os.makedirs(remote)
+    monkeypatch.chdir(tmp_path)
+
+    upload_package(src, compute_digest(src), str(remote))
+    (src / "pkg" / "wf.py").write_text("X = 2\n")
+    os.remove(src / "run.sh")
+    delta = upload_package(src, compute_digest(src), str(remote))
+
+    with tarfile.open(delta) as tar:
+        assert tar.getnames() == [fast_registration.PACKAGE_MANIFEST, "pkg/wf.py"]
+
+    dest = tmp_path / "dest"
+    os.makedirs(dest)
+    (dest / "run.sh").write_text("left over\n")
+    # The files of the base package and of the changes, less what was deleted since.
+    assert download_distribution(delta, str(dest)) == ["pkg/__init__.py", "pkg/query.sql", "pkg/wf.py"]
+    assert (dest / "pkg" / "wf.py").read_text() == "X = 2\n"
+    assert (dest / "pkg" / "query.sql").read_text() == "select 1\n"
+    assert not (dest / "run.sh").exists()
+    assert not (dest / "pkg" / "__pycache__").exists()
+    assert not (dest / fast_registration.PACKAGE_MANIFEST).exists()
+
+    # Without deduplication, the package holds everything.
+    (src / "pkg" / "wf.py").write_text("X = 3\n")
+    with mock.patch.dict(os.environ, {_sdk_config.FAST_REGISTRATION_DEDUP.env_var: "false"}):
+        whole = upload_package(src, compute_digest(src), str(remote))
+    with tarfile.open(whole) as tar:
+        assert "pkg/query.sql" in tar.getnames()
+
+
+def test_zstd_packages(tmp_path, fast_config):
+    pytest.importorskip("zstandard")
+    src = tmp_path / "src"
+    _make_source(src)
+    with mock.patch.dict(os.environ, {_sdk_config.FAST_REGISTRATION_COMPRESSION.env_var: "zstd"}):
+        archive = get_additional_distribution_loc(str(tmp_path), build_package(src, str(tmp_path / "tmp")))
+        os.replace(tmp_path / "tmp", archive)
+        assert archive.endswith(".tar.zst")
+        dest = tmp_path / "dest"
+        os.makedirs(dest)
+        download_distribution(archive, str(dest))
+    assert (dest / "pkg" / "wf.py").read_text() == "X = 1\n"
+
+
+def test_install_distribution_cache(tmp_path, fast_config):
+    src = tmp_path / "src"
+    _make_source(src)
+    archive = get_additional_distribution_loc(str(tmp_path), build_package(src, str(tmp_path / "tmp")))
+    os.replace(tmp_path / "tmp", archive)
+    cache = tmp_path / "cache"
+
+    install_distribution(archive, str(tmp_path / "first"), str(cache))
+    assert os.listdir(cache) == [os.path.basename(archive)[: -len(".tar.gz")]]
+
+    # Later installs of the same package do not download it again.
+    with mock.patch.object(fast_registration._Data, "open_data", side_effect=AssertionError):
+        installed = install_distribution(archive, str(tmp_path / "second"), str(cache))
+    assert installed == install_distribution(archive, str(tmp_path / "third"))
+    assert "pkg/wf.py" in installed
+    assert (tmp_path / "second" / "pkg" / "wf.py").read_text() == "X = 1\n"
+    assert os.access(tmp_path / "second" / "run.sh", os.X_OK)
+
+    with mock.patch.object(fast_registration, "_CACHED_DISTRIBUTIONS", 1):
+        (src / "pkg" / "wf.py").write_text("X = 2\n")
+        other = get_additional_distribution_loc(str(tmp_path), build_package(src, str(tmp_path / "tmp")))
+        os.replace(tmp_path / "tmp", other)
+        install_distribution(other, str(tmp_path / "second"), str(cache))
+    assert os.listdir(cache) == [os.path.basename(other)[: -len(".tar.gz")]]
+    assert (tmp_path / "second" / "pkg" / "wf.py").read_text() == "X = 2\n"
+
+
+def _write_tar(path, *members, deleted=None):
+    with tarfile.open(path, "w:gz") as tar:
+        if deleted is not None:
+            manifest = json.dumps({"files": {}, "deleted": deleted}).encode()
+            info = tarfile.TarInfo(fast_registration.PACKAGE_MANIFEST)
+            info.size = len(manifest)
+            tar.addfile(info, io.BytesIO(manifest))
+        for name, kind, link in members:
+            info = tarfile.TarInfo(name)
+            info.type, info.linkname = kind, link
+            data = b"" if kind != tarfile.REGTYPE else b"evil\n"
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return str(path)
+
+
+@pytest.mark.parametrize(
+    "members, deleted",
+    [
+        ([("../evil", tarfile.REGTYPE, "")], None),
+        ([("a", tarfile.SYMTYPE, "/outside")], None),
+        ([("a", tarfile.SYMTYPE, "../outside")], None),
+        ([("d", tarfile.DIRTYPE, ""), ("d/a", tarfile.SYMTYPE, "../../outside")], None),
+        ([("a", tarfile.LNKTYPE, "../outside/secret")], None),
+        ([], ["../outside/victim"]),
+        ([], ["d/../../outside/victim"]),
+        ([], ["__OUTSIDE__/victim"]),
+    ],
+)
+def test_download_refuses_to_leave_destination(tmp_path, members, deleted):
+    dest, outside = tmp_path / "dest", tmp_path / "outside"
+    os.makedirs(dest)
+    os.makedirs(outside)
+    (outside / "victim").write_text("keep")
+    if deleted:
+        deleted = [rel.replace("__OUTSIDE__", str(outside)) for rel in deleted]
+    with pytest.raises(ValueError, match="outside of the destination"):
+        download_distribution(_write_tar(tmp_path / "p.tar.gz", *members, deleted=deleted), str(dest))
+    assert (outside / "victim").read_text() == "keep"
+
+
+def test_download_refuses_to_write_through_symlinks(tmp_path):
+    dest, outside = tmp_path / "dest", tmp_path / "outside"
+    os.makedirs(dest)
+    os.makedirs(outside)
+    # A symlink in the package may only point within the destination...
+    archive = _write_tar(tmp_path / "ok.tar.gz", ("d/f", tarfile.REGTYPE, ""), ("link", tarfile.SYMTYPE, "d/f"))
+    assert download_distribution(archive, str(dest)) == ["d/f", "link"]
+    assert (dest / "link").read_text() == "evil\n"
+
+    # ...and no member may be written through one that leads outside, whether it was extracted or already there.
+    os.symlink(str(outside), str(dest / "existing"))
+    for members in (
+        [("a", tarfile.SYMTYPE, str(outside)), ("a/evil", tarfile.REGTYPE, "")],
+        [("existing/evil", tarfile.REGTYPE, "")],
+        [("existing", tarfile.REGTYPE, "")],
+    ):
+        with pytest.raises(ValueError, match="outside of the destination"):
+            download_distribution(_write_tar(tmp_path / "p.tar.gz", *members), str(dest))
+    assert os.listdir(outside) == []
+
+    # Nor may a deleted file be removed through one.
+    (outside / "victim").write_text("keep")
+    with pytest.raises(ValueError, match="outside of the destination"):
+        download_distribution(_write_tar(tmp_path / "p.tar.gz", deleted=["existing/victim"]), str(dest))
+    assert (outside / "victim").read_text() == "keep"
+
+    # Deleting the symlink itself is fine, it is within the destination.
+    download_distribution(_write_tar(tmp_path / "p.tar.gz", deleted=["existing"]), str(dest))
+    assert not os.path.lexists(dest / "existing") and (outside / "victim").exists()
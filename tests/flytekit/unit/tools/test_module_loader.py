@@ -1,11 +1,15 @@
 import os
 import sys
 
+import mock
+
 from flytekit.common import utils as _utils
+from flytekit.configuration import sdk as _sdk_config
 from flytekit.tools import module_loader
 
 
-def test_module_loading():
+def test_module_loading(tmp_path, monkeypatch):
+    monkeypatch.setenv(_sdk_config.MODULE_CACHE_PATH.env_var, str(tmp_path / "module-cache.json"))
     with _utils.AutoDeletingTempDir("mypackage") as pkg:
         path = pkg.name
         # Create directories
@@ -37,3 +41,83 @@ def test_module_loading():
         assert [
             pkg.__file__ for pkg in module_loader.iterate_modules(["top.a", "top.middle.a", "top.middle.bottom.a"])
         ] == [os.path.join(lvl, "a.py") for lvl in (top_level, middle_level, bottom_level)]
+
+
+def _write(path, source=""):
+    with open(path, "w") as fh:
+        fh.write(source)
+
+
+def test_discovery_caches_and_prefilters(tmp_path, monkeypatch):
+    root = tmp_path / "src"
+    os.makedirs(root / "discovered" / "sub")
+    os.makedirs(root / "discovered" / "data")
+    _write(root / "discovered" / "__init__.py")
+    _write(root / "discovered" / "sub" / "__init__.py")
+    _write(root / "discovered" / "plain.py", "X = 1\n")
+    _write(
+        root / "discovered" / "sub" / "tasks.py",
+        "from flytekit import task as t\n\n@t\ndef double(a: int) -> int:\n    return a * 2\n",
+    )
+    _write(root / "discovered" / "data" / "not_a_module.py", "raise ImportError\n")
+    monkeypatch.syspath_prepend(str(root))
+    cache = str(tmp_path / "cache.json")
+
+    try:
+        d = module_loader.ModuleDiscovery(cache_path=cache)
+        names = [m.__name__ for m in module_loader.iterate_modules(["discovered"], d)]
+        assert names == ["discovered", "discovered.plain", "discovered.sub", "discovered.sub.tasks"]
+        assert set(d.timings) == set(names)
+        assert d.entities(str(root / "discovered" / "sub" / "tasks.py")) == ["double"]
+        assert d.entities(str(root / "discovered" / "plain.py")) == []
+
+        # Touching a file without changing it keeps its entry, and nothing is parsed again.
+        os.utime(root / "discovered" / "plain.py", ns=(0, 0))
+        with mock.patch.object(module_loader, "_declares_entities", return_value=True) as scan:
+            d = module_loader.ModuleDiscovery(cache_path=cache, prefilter=True)
+            assert len(list(d.iterate_modules(["discovered"]))) == 4
+        # The cache was written without pre-filtering, so every module under the package is scanned once.
+        assert scan.call_count == 3
+
+        d = module_loader.ModuleDiscovery(cache_path=cache, prefilter=True)
+        with mock.patch.object(module_loader, "_declares_entities") as scan:
+            assert len(list(d.iterate_modules(["discovered"]))) == 4
+        assert scan.call_count == 0
+        assert d.entities(str(root / "discovered" / "plain.py")) == []
+
+        # Only what was walked last is kept.
+        list(module_loader.ModuleDiscovery(cache_path=cache).iterate_modules(["discovered.plain"]))
+        assert module_loader.ModuleDiscovery(cache_path=cache).entities(str(root / "discovered" / "plain.py")) is None
+    finally:
+        for name in [n for n in sys.modules if n.split(".")[0] == "discovered"]:
+            del sys.modules[name]
+
+
+def test_prefilter_skips_modules_without_entities(tmp_path, monkeypatch):
+    os.makedirs(tmp_path / "prefiltered")
+    _write(tmp_path / "prefiltered" / "__init__.py")
+    _write(tmp_path / "prefiltered" / "helpers.py", "import os\n\ndef helper():\n    return os.sep\n")
+    _write(tmp_path / "prefiltered" / "legacy.py", "from flytekit.sdk.tasks import python_task\n")
+    _write(tmp_path / "prefiltered" / "wf.py", "import flytekit\n\nLP = flytekit.LaunchPlan\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    try:
+        d = module_loader.ModuleDiscovery(prefilter=True)
+        assert [m.__name__ for m in d.iterate_modules(["prefiltered"])] == [
+            "prefiltered",
+            "prefiltered.legacy",
+            "prefiltered.wf",
+        ]
+        assert d.skipped == ["prefiltered.helpers"]
+        assert "prefiltered.helpers" not in sys.modules
+    finally:
+        for name in [n for n in sys.modules if n.split(".")[0] == "prefiltered"]:
+            del sys.modules[name]
+
+
+def test_cache_only_with_prefilter(tmp_path, monkeypatch):
+    cache = str(tmp_path / "module-cache.json")
+    monkeypatch.setenv(_sdk_config.MODULE_CACHE_PATH.env_var, cache)
+    assert module_loader.ModuleDiscovery.from_config()._cache_path is None
+    monkeypatch.setenv(_sdk_config.MODULE_PREFILTER.env_var, "true")
+    assert module_loader.ModuleDiscovery.from_config()._cache_path == cache